@@ -0,0 +1,273 @@
+/**
+ * Renderer-free hunt rules shared by main.js, m/main.js and the Node
+ * simulator (tools/simulate_hunts.js): the seeded generator, how eggs are dealt
+ * to sections and given symbols, collection/categorization bookkeeping,
+ * section completion and scoring. Nothing here touches Phaser or the DOM.
+ *
+ * Loaded as a plain <script> (defines window.HuntCore) or require()d from
+ * Node. m/hunt-core.js is a byte-for-byte copy served with the mobile build.
+ */
+(function (root, factory) {
+  if (typeof module === 'object' && module.exports) module.exports = factory();
+  else root.HuntCore = factory();
+}(typeof self !== 'undefined' ? self : this, function () {
+  'use strict';
+
+  // Normal hunts deal 3-8 eggs per section; stress hunts widen the band around the average
+  const SECTION_MIN_EGGS = 3;
+  const SECTION_MAX_EGGS = 8;
+  const SCORE_PER_EGG = 10;
+  const SCORE_ALL_FOUND = 100;
+  // EggZamRoom bottle -> symbol category it accepts
+  const BOTTLE_CATEGORIES = { Christian: 'Christian', Worldly: 'Pagan' };
+
+  /**
+   * Seeded generator (xmur3 hash into mulberry32) with the part of Phaser's
+   * RandomDataGenerator API the hunt uses: frac, between and shuffle. The
+   * browser and Node draw the same numbers for the same seed string.
+   */
+  function createRandom(seed) {
+    const text = String(seed);
+    let h = 1779033703 ^ text.length;
+    for (let i = 0; i < text.length; i++) {
+      h = Math.imul(h ^ text.charCodeAt(i), 3432918353);
+      h = (h << 13) | (h >>> 19);
+    }
+    h = Math.imul(h ^ (h >>> 16), 2246822507);
+    h = Math.imul(h ^ (h >>> 13), 3266489909);
+    let state = (h ^ (h >>> 16)) >>> 0;
+
+    const frac = () => {
+      state = (state + 0x6D2B79F5) | 0;
+      let t = Math.imul(state ^ (state >>> 15), 1 | state);
+      t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+      return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+
+    return {
+      frac,
+      // Integer in [min, max], inclusive
+      between: (min, max) => Math.floor(frac() * (max - min + 1)) + min,
+      // In place, like Phaser's
+      shuffle(array) {
+        for (let i = array.length - 1; i > 0; i--) {
+          const j = Math.floor(frac() * (i + 1));
+          const swap = array[i];
+          array[i] = array[j];
+          array[j] = swap;
+        }
+        return array;
+      }
+    };
+  }
+
+  // How many eggs each section gets; always sums to `total`
+  function sectionEggCounts(rnd, total, numSections) {
+    if (numSections <= 0) return [];
+    const average = total / numSections;
+    const min = Math.max(SECTION_MIN_EGGS, Math.floor(average * 0.5));
+    const max = Math.max(SECTION_MAX_EGGS, Math.ceil(average * 1.4));
+
+    const counts = [];
+    let remaining = total;
+    for (let i = 0; i < numSections - 1; i++) {
+      // Keep enough eggs back that every later section can still land in [min, max]
+      const later = numSections - 1 - i;
+      const count = rnd.between(Math.max(min, remaining - later * max), Math.min(max, remaining - later * min));
+      counts.push(count);
+      remaining -= count;
+    }
+    counts.push(remaining);
+    return counts;
+  }
+
+  /**
+   * Deals `total` egg ids over the sections and gives each egg a symbol.
+   * `place(count, sectionName)` returns that section's { x, y } points; without
+   * it eggs sit at 0,0 (simulations don't need positions).
+   *
+   * The draw order (counts, egg ids, symbols, then each section's placement)
+   * is part of the save format: a saved seed must keep producing this hunt.
+   */
+  function generateHunt({ rnd, sectionNames, symbols = [], total, place = null }) {
+    const counts = sectionEggCounts(rnd, total, sectionNames.length);
+    const ids = rnd.shuffle(Array.from({ length: total }, (_, i) => i + 1));
+    const shuffledSymbols = rnd.shuffle([...symbols]);
+
+    const eggData = [];
+    let next = 0;
+    const sections = sectionNames.map((name, index) => {
+      const eggs = ids.slice(next, next + counts[index]);
+      next += counts[index];
+      const points = place ? place(eggs.length, name) : null;
+      eggs.forEach((eggId, i) => {
+        eggData.push({
+          eggId: eggId,
+          section: name,
+          x: points ? Math.round(points[i].x) : 0,
+          y: points ? Math.round(points[i].y) : 0,
+          symbol: shuffledSymbols[(eggId - 1) % (shuffledSymbols.length || 1)] || null,
+          collected: false
+        });
+      });
+      return { name, eggs };
+    });
+    return { sections, eggData };
+  }
+
+  // Score after one more egg is found (foundCount includes it)
+  function collectScore(score, foundCount, total) {
+    return score + SCORE_PER_EGG + (foundCount === total ? SCORE_ALL_FOUND : 0);
+  }
+
+  // `guess` is the bottle the player chose: 'Christian' or 'Worldly'
+  function isCorrectGuess(symbol, guess) {
+    return !!symbol && BOTTLE_CATEGORIES[guess] === symbol.category;
+  }
+
+  /**
+   * The hunt's records, indexed by eggId and section so every question (is it
+   * found, how many are left here, pick an uncategorized egg) is O(1).
+   *
+   * Each egg is one record { eggId, section, x, y, symbol, collected,
+   * categorized }. collect() and categorize() return the changed record, or
+   * null when nothing changed; announcing the change is up to the caller.
+   */
+  class Hunt {
+    constructor() {
+      this.seed = null;
+      this.eggs = new Map();
+      this.sections = new Map();
+      this.found = [];
+      // Dense list + index so removal and random picks are both O(1)
+      this.uncategorized = [];
+      this.uncategorizedIndex = new Map();
+      this.categoryTally = {};
+    }
+
+    // `seed` is what generated the records, kept so a save can regenerate them
+    load(sections, eggData, seed) {
+      this.seed = seed;
+      this.eggs.clear();
+      this.sections.clear();
+      this.found.length = 0;
+      this.uncategorized.length = 0;
+      this.uncategorizedIndex.clear();
+      this.categoryTally = {};
+
+      sections.forEach(section => {
+        this.sections.set(section.name, { name: section.name, records: [], found: 0 });
+      });
+      eggData.forEach(record => {
+        record.categorized = false;
+        this.eggs.set(record.eggId, record);
+        const section = this.sections.get(record.section);
+        if (section) section.records.push(record);
+      });
+    }
+
+    restore(foundIds, categorizedIds) {
+      foundIds.forEach(eggId => {
+        const record = this.eggs.get(eggId);
+        if (record && !record.collected) this.markCollected(record);
+      });
+      categorizedIds.forEach(eggId => {
+        const record = this.eggs.get(eggId);
+        if (record && record.collected && !record.categorized) this.markCategorized(record);
+      });
+    }
+
+    get foundCount() {
+      return this.found.length;
+    }
+
+    egg(eggId) {
+      return this.eggs.get(eggId);
+    }
+
+    isCollected(eggId) {
+      const record = this.eggs.get(eggId);
+      return !!(record && record.collected);
+    }
+
+    // Records placed in `sectionName`, collected or not
+    eggsIn(sectionName) {
+      const section = this.sections.get(sectionName);
+      return section ? section.records : [];
+    }
+
+    remaining(sectionName) {
+      const section = this.sections.get(sectionName);
+      return section ? section.records.length - section.found : 0;
+    }
+
+    isSectionComplete(sectionName) {
+      const section = this.sections.get(sectionName);
+      return !!section && section.records.length > 0 && section.found === section.records.length;
+    }
+
+    // Found eggs per symbol category: { Christian: { found, categorized }, ... }
+    tally(category) {
+      if (!this.categoryTally[category]) this.categoryTally[category] = { found: 0, categorized: 0 };
+      return this.categoryTally[category];
+    }
+
+    collect(eggId) {
+      const record = this.eggs.get(eggId);
+      if (!record || record.collected) return null;
+      this.markCollected(record);
+      return record;
+    }
+
+    categorize(eggId) {
+      const record = this.eggs.get(eggId);
+      if (!record || record.categorized || !this.uncategorizedIndex.has(eggId)) return null;
+      this.markCategorized(record);
+      return record;
+    }
+
+    markCollected(record) {
+      record.collected = true;
+      this.found.push(record);
+      this.uncategorizedIndex.set(record.eggId, this.uncategorized.length);
+      this.uncategorized.push(record);
+      if (record.symbol) this.tally(record.symbol.category).found++;
+
+      const section = this.sections.get(record.section);
+      if (section) section.found++;
+    }
+
+    markCategorized(record) {
+      record.categorized = true;
+      // Swap-remove from the dense list and fix the moved record's index
+      const index = this.uncategorizedIndex.get(record.eggId);
+      const last = this.uncategorized.pop();
+      if (last !== record) {
+        this.uncategorized[index] = last;
+        this.uncategorizedIndex.set(last.eggId, index);
+      }
+      this.uncategorizedIndex.delete(record.eggId);
+      if (record.symbol) this.tally(record.symbol.category).categorized++;
+    }
+
+    // `random` defaults to Math.random; simulations pass a seeded frac
+    randomUncategorized(random = Math.random) {
+      if (!this.uncategorized.length) return null;
+      return this.uncategorized[Math.floor(random() * this.uncategorized.length)];
+    }
+  }
+
+  return {
+    SECTION_MIN_EGGS,
+    SECTION_MAX_EGGS,
+    SCORE_PER_EGG,
+    SCORE_ALL_FOUND,
+    BOTTLE_CATEGORIES,
+    createRandom,
+    sectionEggCounts,
+    generateHunt,
+    collectScore,
+    isCorrectGuess,
+    Hunt
+  };
+}));
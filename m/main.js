@@ -1,15 +1,18 @@
 /* -= main.js =- */
-// Define total eggs as a variable to avoid hardcoding
-const TOTAL_EGGS = 60;
+// Distinct egg art on disk; stress hunts reuse it cyclically
+const EGG_TEXTURE_COUNT = 60;
+// ?stress=N lifts the egg count to benchmark dense hunts (capped to keep layout sane)
+const STRESS_EGGS = parseInt(new URLSearchParams(window.location.search).get('stress'), 10);
+const TOTAL_EGGS = STRESS_EGGS > 0 ? Math.min(STRESS_EGGS, 5000) : EGG_TEXTURE_COUNT;
 
 // Define all scene classes first
 
 class MusicScene extends Phaser.Scene {
   constructor() {
     super({ key: 'MusicScene' });
-    this.musicVolume = localStorage.getItem('musicVolume') !== null ? parseFloat(localStorage.getItem('musicVolume')) : 0.5;
-    this.ambientVolume = localStorage.getItem('ambientVolume') !== null ? parseFloat(localStorage.getItem('ambientVolume')) : 0.5;
-    this.sfxVolume = localStorage.getItem('sfxVolume') !== null ? parseFloat(localStorage.getItem('sfxVolume')) : 0.5;
+    this.musicVolume = 0.5;
+    this.ambientVolume = 0.5;
+    this.sfxVolume = 0.5;
   }
 
   create() {
@@ -29,7 +32,7 @@ class MusicScene extends Phaser.Scene {
     this.scheduleAmbientSound();
 
     // Listen for volume changes via Registry
-    this.registry.events.on('changedata', (parent, key, data) => {
+    Subscriptions.on(this, this.registry.events, 'changedata', (parent, key, data) => {
       if (key === 'musicVolume') {
         this.musicVolume = data;
         const bgMusic = this.sound.get('background-music');
@@ -41,17 +44,11 @@ class MusicScene extends Phaser.Scene {
       }
     });
 
-    // Initialize from registry if available
+    // Initialize from registry (Settings seeds it from storage and persists changes, debounced)
+    Settings.get(this.game);
     if (this.registry.has('musicVolume')) this.musicVolume = this.registry.get('musicVolume');
     if (this.registry.has('ambientVolume')) this.ambientVolume = this.registry.get('ambientVolume');
     if (this.registry.has('sfxVolume')) this.sfxVolume = this.registry.get('sfxVolume');
-
-    // Save settings on change
-    this.registry.events.on('changedata', (parent, key, data) => {
-        if (['musicVolume', 'ambientVolume', 'sfxVolume'].includes(key)) {
-            localStorage.setItem(key, data);
-        }
-    });
   }
 
   scheduleAmbientSound() {
@@ -104,7 +101,7 @@ class UIScene extends Phaser.Scene {
     }
 
     // Listen for resize events to update UI positions
-    this.scale.on('resize', this.resize, this);
+    Subscriptions.on(this, this.scale, 'resize', this.resize, this);
   }
 
   resize(gameSize) {
@@ -160,18 +157,12 @@ class UIScene extends Phaser.Scene {
     gearContainer.baseScaleX = gearContainer.scaleX;
     gearContainer.baseScaleY = gearContainer.scaleY;
 
+    const animator = UiAnimator.get(this);
     gearContainer.on('pointerdown', () => {
-        this.tweens.add({
-            targets: gearContainer,
-            scaleX: gearContainer.baseScaleX * 0.9,
-            scaleY: gearContainer.baseScaleY * 0.9,
-            duration: 50,
-            ease: 'Power1',
-            yoyo: true,
-            onComplete: () => {
-                gearContainer.setScale(gearContainer.baseScaleX, gearContainer.baseScaleY);
-                this.openSettings();
-            }
+        animator.scaleTo(gearContainer, gearContainer.baseScaleX * 0.9, gearContainer.baseScaleY * 0.9, 50);
+        this.time.delayedCall(100, () => {
+            gearContainer.setScale(gearContainer.baseScaleX, gearContainer.baseScaleY);
+            this.openSettings();
         });
     });
 
@@ -248,14 +239,12 @@ class UIScene extends Phaser.Scene {
     closeBtn.setInteractive(new Phaser.Geom.Circle(0, 0, 80), Phaser.Geom.Circle.Contains);
 
     closeBtn.on('pointerdown', () => {
-        this.tweens.add({
-            targets: closeBtn, scaleX: 0.9, scaleY: 0.9, duration: 50, ease: 'Power1', yoyo: true,
-            onComplete: () => {
-                this.settingsContainer.setVisible(false);
-                this.gearIcon.setVisible(true);
-                this.input.setDefaultCursor('none');
-                closeBtn.setScale(1); // Reset
-            }
+        UiAnimator.get(this).scaleTo(closeBtn, 0.9, 0.9, 50);
+        this.time.delayedCall(100, () => {
+            this.settingsContainer.setVisible(false);
+            this.gearIcon.setVisible(true);
+            this.input.setDefaultCursor('none');
+            closeBtn.setScale(1); // Reset
         });
     });
     this.settingsContainer.add(closeBtn);
@@ -312,16 +301,17 @@ class UIScene extends Phaser.Scene {
         const clampedX = Phaser.Math.Clamp(x, startX, endX);
         handle.x = clampedX;
         const volume = (clampedX - startX) / trackWidth;
-        this.registry.set(`${type}Volume`, volume);
+        Settings.get(this.game).set(`${type}Volume`, volume);
     };
 
     handle.on('drag', (p, x) => updateVolume(x));
     track.on('pointerdown', (p) => updateVolume(p.x));
 
     // Tactile feedback
-    handle.on('pointerdown', () => this.tweens.add({ targets: handle, scale: 1.3, duration: 100, ease: 'Back.out' }));
-    handle.on('pointerup', () => this.tweens.add({ targets: handle, scale: 1, duration: 100, ease: 'Back.out' }));
-    handle.on('pointerout', () => this.tweens.add({ targets: handle, scale: 1, duration: 100, ease: 'Back.out' }));
+    const animator = UiAnimator.get(this);
+    handle.on('pointerdown', () => animator.scaleTo(handle, 1.3, 1.3, 100));
+    handle.on('pointerup', () => animator.scaleTo(handle, 1, 1, 100));
+    handle.on('pointerout', () => animator.scaleTo(handle, 1, 1, 100));
   }
 
   openSettings() {
@@ -373,10 +363,18 @@ class MainMenu extends Phaser.Scene {
       loadingText.destroy();
     });
 
+    // Large backgrounds and section stills may be evicted under memory pressure
+    // and reloaded by the scene that next needs them
+    const textureBudget = TextureBudget.get(this.game);
+    textureBudget.track(this);
+    textureBudget.markEvictable(['new-map', 'egg-zam-room']);
+
     this.load.json('symbols', 'assets/symbols.json');
     this.load.json('map_sections', 'assets/map/map_sections.json'); // NEW: Preload map_sections.json
     this.load.video('intro-video', 'assets/video/HeIsRisen-Intro.mp4');
-    this.load.video('level-complete', 'assets/video/level-complete.mp4');
+    // Counter and tooltip fonts baked by tools/bmfont.py; Text is used while they are missing
+    HudText.preload(this);
+    this.load.audio('level-complete-sfx', 'assets/audio/level-complete.mp3');
     this.load.image('level-complete-stamp', 'assets/objects/level-complete-stamp.png');
     this.load.image('finger-cursor', 'assets/cursor/pointer-finger-pointer.png');
 
@@ -391,18 +389,18 @@ class MainMenu extends Phaser.Scene {
     this.load.audio('drive2', 'assets/audio/drive2.mp3');
 
     // Preload common UI and game assets here to avoid reloading in scenes
-    this.load.image('new-map', 'assets/map/new-map.png');
+    this.load.decodedImage('new-map', 'assets/map/new-map.png');
     this.load.image('cog', 'assets/objects/cog.png');
     this.load.image('magnifying-glass', 'assets/cursor/magnifying-glass.png');
     this.load.image('egg-zit-button', 'assets/objects/egg-zit-button.png');
     this.load.image('eggs-ammin-haul', 'assets/objects/eggs-ammin-haul.png');
     this.load.image('score', 'assets/objects/score.png');
-    this.load.image('egg-zam-room', 'assets/map/egg-zam-room.png');
+    this.load.decodedImage('egg-zam-room', 'assets/map/egg-zam-room.png');
     this.load.image('egg-zamminer', 'assets/objects/egg-zamminer.png');
     this.load.image('symbol-result-summary-diag', 'assets/objects/symbol-result-summary-diag.png');
 
     // Preload all 60 eggs
-    for (let i = 1; i <= TOTAL_EGGS; i++) {
+    for (let i = 1; i <= EGG_TEXTURE_COUNT; i++) {
       this.load.image(`egg-${i}`, `assets/eggs/egg-${i}.png`);
     }
 
@@ -429,10 +427,12 @@ class MainMenu extends Phaser.Scene {
       // console.log(`MainMenu: filecomplete-json-map_sections: Key='${key}', Type='${type}'`);
       if (Array.isArray(data)) {
         data.forEach(section => {
+             textureBudget.markEvictable([`${section.name}-thumb`, `${section.name}-fallback`]);
+
              // Enqueue thumbnail explicitly
-             this.load.image(`${section.name}-thumb`, `assets/map/sections/${section.background}`);
+             this.load.decodedImage(`${section.name}-thumb`, `assets/map/sections/${section.background}`);
              // Enqueue the first fallback attempt (.jpg)
-             this.load.image(`${section.name}-fallback`, `assets/map/sections/${section.background}`);
+             this.load.decodedImage(`${section.name}-fallback`, `assets/map/sections/${section.background}`);
 
              // Preload video backgrounds
              this.load.video(`${section.name}-video`, `assets/video/${section.name}.mp4`);
@@ -458,6 +458,7 @@ class MainMenu extends Phaser.Scene {
   create() {
     try {
       this.input.setDefaultCursor('none');
+      QualityGovernor.get(this.game); // Starts sampling frame times for the whole session
 
       // Get scale factors based on game dimensions
       const scaleX = this.game.config.width / 1280;
@@ -495,8 +496,8 @@ class MainMenu extends Phaser.Scene {
           symbolsData.symbols = validSymbols;
       }
 
-      if (symbolsData.symbols.length !== TOTAL_EGGS) {
-        console.error(`MainMenu: Expected ${TOTAL_EGGS} symbols, found ${symbolsData.symbols.length}`);
+      if (symbolsData.symbols.length !== EGG_TEXTURE_COUNT) {
+        console.error(`MainMenu: Expected ${EGG_TEXTURE_COUNT} symbols, found ${symbolsData.symbols.length}`);
       }
       if (!mapSections) { console.error('Map sections missing'); return; }
       if (mapSections.length !== 11) {
@@ -504,81 +505,35 @@ class MainMenu extends Phaser.Scene {
       }
       this.registry.set('symbols', symbolsData);
 
-      // Randomly assign 3-8 eggs per section, totaling TOTAL_EGGS
-      const eggCounts = [];
-      let remainingEggs = TOTAL_EGGS;
-      const numSections = mapSections.length;
-      for (let i = 0; i < numSections - 1; i++) {
-        const maxPossible = remainingEggs - ((numSections - 1 - i) * 3);
-        const minPossible = remainingEggs - ((numSections - 1 - i) * 8);
-
-        const maxEggs = Math.min(8, maxPossible);
-        const minEggs = Math.max(3, minPossible);
-
-        const count = Phaser.Math.Between(minEggs, maxEggs);
-        eggCounts.push(count);
-        remainingEggs -= count;
-      }
-      eggCounts.push(remainingEggs);
-
-      // console.log('MainMenu: Egg distribution:', eggCounts);
-
-      // Shuffle egg IDs and symbols
-      const eggs = Phaser.Utils.Array.Shuffle(Array.from({ length: TOTAL_EGGS }, (_, i) => i + 1));
-      const shuffledSymbols = Phaser.Utils.Array.Shuffle([...symbolsData.symbols]);
-
-      // Create eggData and sections
-      const eggData = [];
-      let eggIndex = 0;
-      const sections = mapSections.map((section, index) => {
-        const sectionEggs = eggs.slice(eggIndex, eggIndex + eggCounts[index]);
-        eggIndex += eggCounts[index];
-        sectionEggs.forEach((eggId, idx) => {
-          // Fix: Mobile viewport coordinates are absolute, don't divide by scale for the max bounds.
-          // The visual lens has an offset of (-97.5, -135) relative to the physical touch pointer.
-          // This means to reach an egg at (x, y), the user must touch at (x + 97.5, y + 135).
-          // We must ensure that this required touch point never falls outside the screen bounds.
-          // Therefore, the max bounds for an egg must be at least that far from the right/bottom edges.
-          // We also must ensure that min bounds are respected relative to negative offsets.
-          // The lens offset in Mobile is X: -97.5, Y: -135 (lens is UP and LEFT of pointer).
-          // Meaning if an egg is at X=0, the user must touch at X=+97.5.
-          // Conversely, if an egg is at X=width, the user must touch at X=width+97.5 (which is OFF SCREEN).
-          // To ensure the required TOUCH is within [0, width], the EGG must be within [0 - 97.5, width - 97.5].
-          // However, we also want the egg to be visible on screen.
-          // So the EGG must be within [50, width - 150].
-
-          // Phaser.Math.Between requires max >= min. If screen is very small, we might get negative ranges.
-          // We clamp maxX and maxY to be at least minX and minY to avoid Phaser errors.
-          // Wait, the lens offset is scaling based on the *current* scale (which can be very different based on device orientation).
-          // And we must ensure the REQUIRED touch (egg.x - (-97.5 * scale)) is <= screen width.
-          // required_touch_x = egg.x + 97.5 * scale <= width => egg.x <= width - 97.5 * scale
-          // Let's add an extra safety margin. width - 150 * scale is good.
-          // BUT what if width is VERY small?
-          // Let's use strict bounds:
-          const minX = 50 * scale;
-          const maxX = Math.max(minX, this.game.config.width - (160 * scale));
-          const minY = 50 * scale;
-          const maxY = Math.max(minY, this.game.config.height - (200 * scale));
-
-          const x = Phaser.Math.Between(minX, maxX);
-          const y = Phaser.Math.Between(minY, maxY);
-
-          eggData.push({
-            eggId: eggId,
-            section: section.name,
-            x: x,
-            y: y,
-            symbol: shuffledSymbols[eggId - 1] || null,
-            collected: false
-          });
-        });
-        return { name: section.name, eggs: sectionEggs };
+      // One small localStorage read decides between resuming and a new hunt.
+      // Everything below is drawn from one seeded generator so a saved seed
+      // reproduces the same hunt without storing positions.
+      const save = HuntSave.read();
+      const seed = save ? save.seed : Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+      const rnd = HuntCore.createRandom(seed);
+      const area = this.eggPlacementArea(scale);
+      const { sections, eggData } = HuntCore.generateHunt({
+        rnd,
+        sectionNames: mapSections.map(section => section.name),
+        symbols: symbolsData.symbols,
+        total: TOTAL_EGGS,
+        place: (count) => EggPlacer.place(rnd, count, area.bounds, area.exclusions)
       });
 
-      this.registry.set('eggData', eggData);
-      this.registry.set('sections', sections);
+      // Publishes the 'sections', 'eggData' and 'foundEggs' views
+      HuntState.get(this.game).load(sections, eggData, seed);
+      const huntSave = HuntSave.get(this.game); // Saves progress from here on
       // console.log('MainMenu: Initialized eggData:', eggData);
 
+      // Seeds the volume registry from localStorage
+      Settings.get(this.game);
+
+      if (save) {
+        huntSave.restore(save);
+        this.resumeHunt();
+        return;
+      }
+
       // Debug: Log game dimensions and scale
       // console.log(`MainMenu: Game dimensions - width: ${this.game.config.width}, height: ${this.game.config.height}, scale: ${scale}`);
 
@@ -593,6 +548,7 @@ class MainMenu extends Phaser.Scene {
       // Intro Video - centered
       const introVideo = this.add.video(this.game.config.width / 2, this.game.config.height / 2, 'intro-video');
       this.introVideo = introVideo; // Store reference for resizing
+      introVideo.once('textureready', () => RumBeacon.mark(this.game, 'intro-frame'));
       introVideo.setMute(true); // Start muted to allow autoplay
       introVideo.disableInteractive(); // Ensure video ignores input
       try {
@@ -610,11 +566,7 @@ class MainMenu extends Phaser.Scene {
       if (!this.sys.game.device.os.desktop) {
         this.fingerCursor = null;
       } else {
-        this.fingerCursor = this.add.image(0, 0, 'finger-cursor')
-          .setOrigin(0, 0)
-          .setAngle(0)
-          .setDisplaySize(50 * scale, 75 * scale)
-          .setDepth(1000); // Ensure cursor is on top of everything
+        this.fingerCursor = CursorOverlay.attach(this, 1000); // Ensure cursor is on top of everything
       }
 
       // Handle both mouse and touch input, request fullscreen on first click
@@ -632,15 +584,6 @@ class MainMenu extends Phaser.Scene {
       // 3. Show "Play Now" Button
       // 4. User Tap "Play Now" -> Start Game
 
-    // Initialize volume registry early (Load from localStorage if available)
-    const savedMusic = localStorage.getItem('musicVolume');
-    const savedAmbient = localStorage.getItem('ambientVolume');
-    const savedSfx = localStorage.getItem('sfxVolume');
-
-    if (!this.registry.has('musicVolume')) this.registry.set('musicVolume', savedMusic !== null ? parseFloat(savedMusic) : 0.5);
-    if (!this.registry.has('ambientVolume')) this.registry.set('ambientVolume', savedAmbient !== null ? parseFloat(savedAmbient) : 0.5);
-    if (!this.registry.has('sfxVolume')) this.registry.set('sfxVolume', savedSfx !== null ? parseFloat(savedSfx) : 0.5);
-
       // Launch UI Scene immediately (hidden initially)
       if (!this.scene.get('UIScene').scene.isActive()) {
           this.scene.launch('UIScene');
@@ -814,10 +757,7 @@ class MainMenu extends Phaser.Scene {
               }
           }
       };
-      window.addEventListener('keydown', globalKeyHandler);
-      this.events.once('shutdown', () => {
-          window.removeEventListener('keydown', globalKeyHandler);
-      });
+      Subscriptions.on(this, window, 'keydown', globalKeyHandler);
       
       // ROBUST AUTOPLAY STRATEGY for Video (Bolt Fix: Volume scaling)
       const musicVol = this.registry.get('musicVolume');
@@ -828,8 +768,8 @@ class MainMenu extends Phaser.Scene {
               introVideo.setVolume(data * 0.5);
           }
       };
-      this.registry.events.on('changedata', updateIntroVolume);
-      
+      Subscriptions.on(this, this.registry.events, 'changedata', updateIntroVolume);
+
       // Clean up on shutdown
       this.events.once('shutdown', () => {
           if (introVideo) {
@@ -849,6 +789,57 @@ class MainMenu extends Phaser.Scene {
     }
   }
 
+  // Saved progress skips the intro and goes straight back to the map
+  resumeHunt() {
+    if (!this.scene.get('UIScene').scene.isActive()) this.scene.launch('UIScene');
+    if (!this.scene.get('MusicScene').scene.isActive()) this.scene.launch('MusicScene');
+    this.scene.start('MapScene');
+  }
+
+  // Where eggs may go, in screen pixels. The lens is drawn (-97.5, -135) * scale
+  // from the finger, so an egg at (x, y) is collected by touching
+  // (x + 97.5 * scale, y + 135 * scale). The bounds keep that touch on screen
+  // with a fingertip of margin and the egg itself clear of the top/left edge.
+  // Each HUD element (score, egg-zit button, eggs-ammin-haul) is excluded twice:
+  // where the egg would hide under it, and where collecting the egg would
+  // mean touching it.
+  eggPlacementArea(scale) {
+    const width = this.game.config.width;
+    const height = this.game.config.height;
+    const lensOffsetX = -97.5 * scale;
+    const lensOffsetY = -135 * scale;
+    const halfWidth = 25 * scale;
+    const halfHeight = 37.5 * scale;
+
+    const hud = [
+      { x: 0, y: 0, width: 200 * scale, height: 200 * scale },
+      { x: 0, y: 200 * scale, width: 150 * scale, height: 150 * scale },
+      { x: 0, y: 350 * scale, width: 137 * scale, height: 150 * scale }
+    ];
+    const exclusions = [];
+    hud.forEach(rect => {
+      const covered = {
+        x: rect.x - halfWidth,
+        y: rect.y - halfHeight,
+        width: rect.width + halfWidth * 2,
+        height: rect.height + halfHeight * 2
+      };
+      exclusions.push(covered, { ...covered, x: covered.x + lensOffsetX, y: covered.y + lensOffsetY });
+    });
+
+    const left = 50 * scale;
+    const top = 50 * scale;
+    return {
+      bounds: {
+        x: left,
+        y: top,
+        width: Math.max(0, width + lensOffsetX - 62.5 * scale - left),
+        height: Math.max(0, height + lensOffsetY - 65 * scale - top)
+      },
+      exclusions
+    };
+  }
+
   isValidSymbol(s) {
     // Sentinel: validate structure and prevent path traversal
     return s && typeof s === 'object' &&
@@ -858,10 +849,6 @@ class MainMenu extends Phaser.Scene {
   }
 
   update() {
-    if (this.fingerCursor) {
-      this.fingerCursor.setPosition(this.input.x, this.input.y);
-    }
-
     // Ensure video size is correct once texture loads
     if (this.introVideo && this.introVideo.active && this.introVideo.width > 0) {
         if (Math.abs(this.introVideo.displayWidth - this.game.config.width) > 10) {
@@ -877,24 +864,32 @@ class MapScene extends Phaser.Scene {
   }
 
   preload() {
-    this.load.image('new-map', 'assets/map/new-map.png');
+    // new-map and the thumbnails are preloaded in MainMenu; this reloads any the texture budget evicted.
     // Common assets like 'finger-cursor', 'eggs-ammin-haul', 'score' are preloaded in MainMenu
+    const mapSections = this.cache.json.get('map_sections') || [];
+    TextureBudget.get(this.game).acquire(this, ['new-map', ...mapSections.map(section => `${section.name}-thumb`)]);
+
+    // The stamp animation is only fetched when a section has just been completed
+    // (baked by tools/stamp_sheet.py); the stamp video is the fallback if it is missing
+    const huntState = HuntState.get(this.game);
+    const stampedSections = this.registry.get('stampedSections') || [];
+    const needsStamp = mapSections.some(section =>
+      huntState.isSectionComplete(section.name) && !stampedSections.includes(section.name));
+    if (needsStamp && !this.textures.exists('level-complete-sheet')) {
+      this.load.atlas('level-complete-sheet', 'assets/objects/level-complete-sheet.png', 'assets/objects/level-complete-sheet.json');
+      const onStampError = (file) => {
+        if (file.key === 'level-complete-sheet' && !this.cache.video.exists('level-complete')) {
+          this.load.video('level-complete', 'assets/video/level-complete.mp4');
+        }
+      };
+      this.load.on('loaderror', onStampError);
+      this.load.once('complete', () => this.load.off('loaderror', onStampError));
+    }
   }
 
   create() {
     this.input.setDefaultCursor('none');
 
-    // Get scale factors relative to the viewport
-    const scaleX = this.game.config.width / 1280;
-    const scaleY = this.game.config.height / 720;
-    const scale = Math.min(scaleX, scaleY);
-    this.gameScale = scale;
-
-    // Set camera bounds to match viewport
-    this.cameras.main.setBounds(0, 0, this.game.config.width, this.game.config.height);
-    this.cameras.main.setViewport(0, 0, this.game.config.width, this.game.config.height);
-    this.cameras.main.setPosition(0, 0);
-
     // NEW: Retrieve existing eggData and sections from registry
     const eggData = this.registry.get('eggData');
     const sections = this.registry.get('sections');
@@ -911,69 +906,31 @@ class MapScene extends Phaser.Scene {
     }
     this.sound.play('drive2', { volume: 0.5 });
 
-    // Add map image, fill the viewport proportionally based on native size
-    this.mapImage = this.add.image(this.game.config.width/2, this.game.config.height/2, 'new-map')
-      .setOrigin(0.5, 0.5);
-    const nativeW = this.mapImage.width || 1376;
-    const nativeH = this.mapImage.height || 768;
-    const mapScale = Math.max(this.game.config.width / nativeW, this.game.config.height / nativeH);
-    this.mapImage.setScale(mapScale);
-    // console.log(`Map display size: ${this.mapImage.displayWidth}x${this.mapImage.displayHeight}, Position: (${this.mapImage.x}, ${this.mapImage.y})`);
+    // The map fills the viewport proportionally based on its native size;
+    // thumbnails and stamps follow it, the HUD is anchored to the design space
+    this.layout = new SceneLayout(this);
+    this.gameScale = this.layout.metrics.scale;
+    this.mapImage = this.layout.add(this.add.image(0, 0, 'new-map').setOrigin(0.5, 0.5), {
+      apply: (map, m) => this.coverMap(map, m)
+    });
 
     // Create map thumbnails (videos/images)
     this.mapZones = [];
-    this.stamps = [];
 
     // We will use the original zone dimensions to calculate the center
     mapSections.forEach(section => {
-      const centerX = section.coords.x;
-      const centerY = section.coords.y;
-
-      const nativeW = this.mapImage ? (this.mapImage.width || 1376) : 1376;
-      const nativeH = this.mapImage ? (this.mapImage.height || 768) : 768;
-      const initMapScale = Math.max(this.game.config.width / nativeW, this.game.config.height / nativeH);
-
-      const mapWidth = nativeW * initMapScale;
-      const mapHeight = nativeH * initMapScale;
-      const offsetX = (this.game.config.width - mapWidth) / 2;
-      const offsetY = (this.game.config.height - mapHeight) / 2;
-
-      const thumbX = offsetX + centerX * initMapScale;
-      const thumbY = offsetY + centerY * initMapScale;
-
-      // Create container for border and drop shadow
-      const thumbContainer = this.add.container(thumbX, thumbY);
-
-      const radius = 15;
-
-      const shadow = this.add.graphics();
-      shadow.fillStyle(0x000000, 0.6);
-      shadow.fillRoundedRect(-section.coords.width / 2 + 4, -section.coords.height / 2 + 4, section.coords.width, section.coords.height, radius);
-
-      const border = this.add.graphics();
-      border.lineStyle(4, 0x8b4513, 1);
-      border.fillStyle(0xffffff, 1);
-      border.fillRoundedRect(-section.coords.width / 2 - 5, -section.coords.height / 2 - 5, section.coords.width + 10, section.coords.height + 10, radius + 2);
-      border.strokeRoundedRect(-section.coords.width / 2 - 5, -section.coords.height / 2 - 5, section.coords.width + 10, section.coords.height + 10, radius + 2);
-
-      const thumbImage = this.add.image(0, 0, `${section.name}-thumb`).setOrigin(0.5, 0.5);
-      thumbImage.setDisplaySize(section.coords.width, section.coords.height);
-
-      const maskGraphics = this.add.graphics();
-      maskGraphics.fillStyle(0xffffff);
-      maskGraphics.fillRoundedRect(-section.coords.width / 2, -section.coords.height / 2, section.coords.width, section.coords.height, radius);
-      maskGraphics.setVisible(false); // Do not show the mask itself
-
-      const mask = maskGraphics.createGeometryMask();
-      thumbImage.setMask(mask);
+      // Create container for the thumbnail card
+      const thumbContainer = this.add.container(0, 0);
 
       // Add invisible hit area graphics for reliable touch detection on mobile
       // Use an expanded hit area to make tapping on mobile much easier
       const hitArea = this.add.rectangle(0, 0, section.coords.width + 80, section.coords.height + 80, 0x000000, 0);
 
-      // IMPORTANT: maskGraphics should NOT be added to the container's children array when used as a mask
-      // because it is scaled dynamically by the container, and rendering it as a child breaks the mask visually
-      thumbContainer.add([shadow, border, thumbImage, hitArea]);
+      // Shadow, border and rounded image are baked into one texture at the current map scale
+      const thumbImage = this.add.image(0, 0, '__DEFAULT').setOrigin(0.5, 0.5);
+      bakeMapThumbnail(thumbImage, section, this.mapScale);
+
+      thumbContainer.add([thumbImage, hitArea]);
       thumbContainer.setSize(section.coords.width + 80, section.coords.height + 80);
 
       // By omitting geometry arguments and relying on the `hitArea` rectangle we added above,
@@ -981,21 +938,11 @@ class MapScene extends Phaser.Scene {
       // correctly mapping the center of the click zone to the container origin (0,0) across all scales.
       thumbContainer.setInteractive();
 
-      const thumbScale = (section.coords.width * initMapScale) / section.coords.width;
-      thumbContainer.setScale(thumbScale);
-
       const thumb = thumbContainer;
       thumb.name = section.name;
       thumb.sectionData = section;
-      thumb.maskGraphics = maskGraphics; // Store reference to update mask transforms
-
-      // Update mask initially
-      maskGraphics.setPosition(thumbX, thumbY);
-      maskGraphics.setScale(thumbScale);
-
-      // Save original scale for click interactions
-      thumb.baseScaleX = thumb.scaleX;
-      thumb.baseScaleY = thumb.scaleY;
+      thumb.thumbImage = thumbImage; // Re-baked when the map scale changes
+      this.layout.add(thumb, { apply: thumb => this.placeThumb(thumb) });
 
       addButtonInteraction(this, thumb, 'drive1');
 
@@ -1008,98 +955,47 @@ class MapScene extends Phaser.Scene {
       this.mapZones.push(thumb);
 
       // Level Complete Stamp Logic
-      const eggData = this.registry.get('eggData') || [];
-      const sectionEggs = eggData.filter(e => e.section === section.name);
-      const foundEggs = this.registry.get('foundEggs') || [];
-      const isCompleted = sectionEggs.length > 0 && sectionEggs.every(e => foundEggs.some(found => (found === e.eggId) || (found && found.eggId === e.eggId)));
+      const isCompleted = HuntState.get(this.game).isSectionComplete(section.name);
 
       let stampedSections = this.registry.get('stampedSections') || [];
 
       if (isCompleted) {
           if (!stampedSections.includes(section.name)) {
-              // FIRST TIME COMPLETE: Play the video
-              const stampVideo = this.add.video(thumb.x, thumb.y, 'level-complete');
+              // FIRST TIME COMPLETE: Play the stamp animation (video fallback)
+              // Swap to image when it finishes to free memory
+              const stampVideo = playLevelCompleteStamp(this, thumb.x, thumb.y, () => {
+                  const stampImg = this.add.image(thumb.x, thumb.y, 'level-complete-stamp');
+                  stampImg.setDepth(2);
+                  stampImg.disableInteractive();
+                  this.layout.add(stampImg, this.stampAnchor(thumb, 0));
+                  // The layout drops the destroyed animation on its next pass
+                  stampVideo.destroy();
+              });
               stampVideo.setOrigin(0.5, 0.5);
               stampVideo.setDepth(2);
               stampVideo.disableInteractive();
-              stampVideo.setBlendMode(Phaser.BlendModes.MULTIPLY);
-              const updateStampSize = () => {
-                  // Offset the video slightly up so it visually matches the stamp image
-                  stampVideo.setPosition(thumb.x, thumb.y - 40 * thumb.scaleY);
-
-                  // Scale the stamp so its height covers the thumbnail's height + 25%, maintaining its intrinsic aspect ratio
-                  // We must wait for the video metadata to load to get its intrinsic height,
-                  // but we can set a fallback or set scale immediately based on a standard 1080p/720p assumption if needed.
-                  // Wait, Phaser Video objects have a default size of 256x256 before load.
-                  // To be safe, we can apply the scale based on the thumbnail's physical displayHeight.
-                  // Since video height might be 0 initially, we use a fallback of 720 (standard height).
-                  const intrinsicHeight = stampVideo.height || 720;
-                  const targetHeight = (thumb.height * thumb.scaleY) * 1.25;
-                  const calculatedScale = targetHeight / intrinsicHeight;
-                  stampVideo.setScale(calculatedScale);
-              };
-              updateStampSize();
-
-              if (!this.stamps) this.stamps = [];
-              this.stamps.push({ video: stampVideo, thumb: thumb });
-
-              const sfxVol = this.registry.get('sfxVolume') !== undefined ? this.registry.get('sfxVolume') : 0.5;
-              stampVideo.setVolume(sfxVol);
-              stampVideo.play();
+              // Offset the animation slightly up so it visually matches the stamp image
+              this.layout.add(stampVideo, this.stampAnchor(thumb, 40));
 
               stampedSections.push(section.name);
               this.registry.set('stampedSections', stampedSections);
 
-              // Swap to image when video finishes to free memory
-              stampVideo.on('complete', () => {
-                  const stampImg = this.add.image(thumb.x, thumb.y, 'level-complete-stamp');
-                  stampImg.setDepth(2);
-
-                  // Apply the identical scale multiplier that the thumbnail is using
-                  // Cover thumbnail height + 25%, maintaining intrinsic stamp ratio
-                  const intrinsicHeight = stampImg.height || 720;
-                  const targetHeight = (thumb.height * thumb.scaleY) * 1.25;
-                  stampImg.setScale(targetHeight / intrinsicHeight);
-                  stampImg.disableInteractive();
-                  // Replace in resize array so window resizing still works
-                  const idx = this.stamps.findIndex(s => s.video === stampVideo);
-                  if (idx !== -1) {
-                      this.stamps[idx] = { video: stampImg, thumb: thumb };
-                  }
-                  stampVideo.destroy();
-              });
-
           } else {
               // ALREADY COMPLETED: Show static image directly
               const stampImg = this.add.image(thumb.x, thumb.y, 'level-complete-stamp');
               stampImg.setOrigin(0.5, 0.5);
               stampImg.setDepth(2);
               stampImg.disableInteractive();
-                  const updateStampSize = () => {
-                  stampImg.setPosition(thumb.x, thumb.y);
-
-                  // Scale the stamp so its height covers the thumbnail's height + 25%, maintaining its intrinsic aspect ratio
-                  const intrinsicHeight = stampImg.height || 720;
-                  const targetHeight = (thumb.height * thumb.scaleY) * 1.25;
-                  const calculatedScale = targetHeight / intrinsicHeight;
-                  stampImg.setScale(calculatedScale);
-              };
-              updateStampSize();
-
-              if (!this.stamps) this.stamps = [];
-              // We use "video: stampImg" so the generic resize loop works identically
-              this.stamps.push({ video: stampImg, thumb: thumb });
+              this.layout.add(stampImg, this.stampAnchor(thumb, 0));
           }
       }
-      section.zone = thumb; // keep reference for resize
     });
-    this.mapSections = mapSections;
 
     // UI elements
-    this.eggsAmminHaul = this.add.image(0, 200 * scale, 'eggs-ammin-haul')
+    this.eggsAmminHaul = this.add.image(0, 0, 'eggs-ammin-haul')
       .setOrigin(0, 0)
-      .setDisplaySize(137 * scale, 150 * scale)
       .setInteractive();
+    this.layout.add(this.eggsAmminHaul, { x: 0, y: 200, width: 137, height: 150, space: 'screen' });
 
     addButtonInteraction(this, this.eggsAmminHaul, 'menu-click');
 
@@ -1110,38 +1006,63 @@ class MapScene extends Phaser.Scene {
         });
     });
 
-    this.scoreImage = this.add.image(0, 0, 'score')
-      .setOrigin(0, 0)
-      .setDisplaySize(200 * scale, 200 * scale);
+    this.scoreImage = this.layout.add(this.add.image(0, 0, 'score').setOrigin(0, 0), { x: 0, y: 0, width: 200, height: 200, space: 'screen' });
 
     const foundEggs = this.registry.get('foundEggs').length;
     const isDesktop = this.sys.game.device.os.desktop;
-    const scoreY = isDesktop ? 125 * scale : 117 * scale;
     const scoreFontSize = isDesktop ? 32 : 42;
-    this.scoreText = this.add.text(100 * scale, scoreY, `${foundEggs}/${TOTAL_EGGS}`, {
-      fontSize: `${scoreFontSize * scale}px`,
-      fill: '#000',
-      fontStyle: 'bold',
-      fontFamily: 'Comic Sans MS',
-      stroke: '#fff',
-      strokeThickness: 6 * scale
-    }).setOrigin(0.5);
+    this.scoreText = HudText.add(this, 0, 0, `${foundEggs}/${TOTAL_EGGS}`, scoreFontSize, 6).setOrigin(0.5);
+    this.layout.add(this.scoreText, { x: 100, y: isDesktop ? 125 : 117, fontSize: scoreFontSize, strokeThickness: 6, space: 'screen' });
 
     // Cursor for desktop only
     if (!this.sys.game.device.os.desktop) {
       this.fingerCursor = null;
     } else {
-      this.fingerCursor = this.add.image(0, 0, 'finger-cursor')
-        .setOrigin(0, 0)
-        .setAngle(0)
-        .setDisplaySize(50 * scale, 75 * scale);
+      this.fingerCursor = CursorOverlay.attach(this, 1000);
     }
+
+    RumBeacon.mark(this.game, 'map-ready');
   }
 
-  update() {
-    if (this.fingerCursor) {
-      this.fingerCursor.setPosition(this.input.x, this.input.y);
-    }
+  // Fills the viewport with the map at its native aspect ratio (cover)
+  coverMap(map, m) {
+    this.cameras.main.setBounds(0, 0, m.width, m.height);
+    this.cameras.main.setViewport(0, 0, m.width, m.height);
+
+    const nativeW = map.width || 1376;
+    const nativeH = map.height || 768;
+    this.mapScale = Math.max(m.width / nativeW, m.height / nativeH);
+    this.mapOffsetX = (m.width - nativeW * this.mapScale) / 2;
+    this.mapOffsetY = (m.height - nativeH * this.mapScale) / 2;
+
+    map.setPosition(m.width / 2, m.height / 2);
+    map.setScale(this.mapScale);
+  }
+
+  // Places a thumbnail on its map_sections.json spot; anchored after the map, so mapScale is current
+  placeThumb(thumb) {
+    const coords = thumb.sectionData.coords;
+    thumb.setPosition(this.mapOffsetX + coords.x * this.mapScale, this.mapOffsetY + coords.y * this.mapScale);
+    thumb.setScale(this.mapScale);
+
+    // Re-bake the card only if its on-screen pixel size changed
+    bakeMapThumbnail(thumb.thumbImage, thumb.sectionData, this.mapScale);
+
+    // Save original scale for click interactions
+    thumb.baseScaleX = thumb.scaleX;
+    thumb.baseScaleY = thumb.scaleY;
+  }
+
+  // Covers the thumbnail's height + 25%, keeping the stamp's intrinsic ratio; `lift` is in thumbnail pixels
+  stampAnchor(thumb, lift) {
+    return {
+      apply: stamp => {
+        stamp.setPosition(thumb.x, thumb.y - lift * thumb.scaleY);
+        // Videos report 0 until their metadata loads; assume a 720p frame until then
+        const intrinsicHeight = stamp.height || 720;
+        stamp.setScale((thumb.height * thumb.scaleY) * 1.25 / intrinsicHeight);
+      }
+    };
   }
 }
 
@@ -1156,6 +1077,8 @@ class SectionHunt extends Phaser.Scene {
 
   preload() {
     // Media and Fallbacks are preloaded in MainMenu via map_sections.json.
+    // The still is pinned here and reloaded if the texture budget evicted it.
+    TextureBudget.get(this.game).acquire(this, [`${this.sectionName}-fallback`]);
 
     this.load.on('loaderror', (file) => {
       if (file.type === 'image' || file.type === 'video') {
@@ -1165,16 +1088,8 @@ class SectionHunt extends Phaser.Scene {
   }
 
   collectEgg(egg) {
-    const foundEggs = this.registry.get('foundEggs');
-    const eggDataArray = this.registry.get('eggData');
-    const eggData = eggDataArray.find(e => e.eggId === egg.getData('eggId'));
-    const eggInfo = {
-      eggId: egg.getData('eggId'),
-      symbolData: egg.getData('symbolDetails'),
-      categorized: false
-    };
-    // console.log('SectionHunt: Collecting egg with symbolData:', eggInfo.symbolData);
-    if (!foundEggs.some(e => e.eggId === eggInfo.eggId)) {
+    const huntState = HuntState.get(this.game);
+    if (huntState.collect(egg.getData('eggId'))) {
       this.sound.play('collect');
 
       // Get symbol texture if available
@@ -1184,49 +1099,34 @@ class SectionHunt extends Phaser.Scene {
       }
 
       this.showCollectionFeedback(egg.x, egg.y, egg.texture.key, symbolTexture);
-      foundEggs.push(eggInfo);
-      this.registry.set('foundEggs', foundEggs);
-      if (eggData) {
-        eggData.collected = true;
-        this.registry.set('eggData', eggDataArray);
-      }
+      this.eggVersion++;
 
       // Reset hint timer
       if (this.hintTimer) {
           this.hintTimer.reset({ delay: 90000, callback: this.showIdleHint, callbackScope: this, loop: true });
       }
 
-      let currentScore = this.registry.get('currentScore');
-      currentScore += 10;
-      if (foundEggs.length === TOTAL_EGGS) {
-        currentScore += 100;
-      }
+      const currentScore = HuntCore.collectScore(this.registry.get('currentScore'), huntState.foundCount, TOTAL_EGGS);
       this.registry.set('currentScore', currentScore);
       const highScore = this.registry.get('highScore');
       if (currentScore > highScore) {
         this.registry.set('highScore', currentScore);
         localStorage.setItem('highScore', currentScore);
       }
-      // console.log(`SectionHunt: Collected egg-${eggInfo.eggId} with symbol:`, eggInfo.symbolData ? eggInfo.symbolData.name : 'none', `Score: ${currentScore}`);
-      const foundEggsCount = foundEggs.length;
       if (this.scoreText) {
-        this.scoreText.setText(`${foundEggsCount}/${TOTAL_EGGS}`);
+        this.scoreText.setText(`${huntState.foundCount}/${TOTAL_EGGS}`);
       }
 
       this.checkLevelComplete();
-    } else {
-      // console.log(`SectionHunt: Egg-${eggInfo.eggId} already collected, skipping`);
     }
   }
 
   checkLevelComplete(immediate = false) {
-      const foundEggs = this.registry.get('foundEggs');
-      const sections = this.registry.get('sections');
-      const currentSection = sections.find(s => s.name === this.sectionName);
+      const huntState = HuntState.get(this.game);
       const scale = this.gameScale;
 
-      if (foundEggs.length === TOTAL_EGGS) {
-          const clearText = this.add.text(this.game.config.width / 2, this.game.config.height / 2, "All 60 Eggs Found! Transporting to the EggZam Room...", {
+      if (huntState.foundCount === TOTAL_EGGS) {
+          const clearText = this.add.text(this.game.config.width / 2, this.game.config.height / 2, `All ${TOTAL_EGGS} Eggs Found! Transporting to the EggZam Room...`, {
               fontSize: `${48 * scale}px`,
               fontFamily: 'Comic Sans MS',
               fill: '#ffff00',
@@ -1248,33 +1148,29 @@ class SectionHunt extends Phaser.Scene {
           return;
       }
 
-      if (currentSection) {
-          const foundIds = foundEggs.map(e => e.eggId);
-          const remainingCount = currentSection.eggs.filter(id => !foundIds.includes(id)).length;
-          if (remainingCount === 0) {
-              const clearText = this.add.text(this.game.config.width / 2, this.game.config.height / 2, "Great Job Detective!! You found all the hidden eggs on this map, the others are hidden in other maps.", {
-                  fontSize: `${40 * scale}px`,
-                  fontFamily: 'Comic Sans MS',
-                  fill: '#ffff00',
-                  backgroundColor: '#000000cc',
-                  padding: { x: 20 * scale, y: 10 * scale },
-                  stroke: '#000000',
-                  strokeThickness: 6 * scale,
-                  align: 'center',
-                  wordWrap: { width: 800 * scale, useAdvancedWrap: true }
-              }).setOrigin(0.5).setDepth(35).setScrollFactor(0);
+      if (huntState.isSectionComplete(this.sectionName)) {
+          const clearText = this.add.text(this.game.config.width / 2, this.game.config.height / 2, "Great Job Detective!! You found all the hidden eggs on this map, the others are hidden in other maps.", {
+              fontSize: `${40 * scale}px`,
+              fontFamily: 'Comic Sans MS',
+              fill: '#ffff00',
+              backgroundColor: '#000000cc',
+              padding: { x: 20 * scale, y: 10 * scale },
+              stroke: '#000000',
+              strokeThickness: 6 * scale,
+              align: 'center',
+              wordWrap: { width: 800 * scale, useAdvancedWrap: true }
+          }).setOrigin(0.5).setDepth(35).setScrollFactor(0);
 
-              this.tweens.add({
-                  targets: clearText,
-                  alpha: 0,
-                  delay: 5000,
-                  duration: 1000,
-                  onComplete: () => clearText.destroy()
-              });
+          this.tweens.add({
+              targets: clearText,
+              alpha: 0,
+              delay: 5000,
+              duration: 1000,
+              onComplete: () => clearText.destroy()
+          });
 
-              if (this.hintTimer) {
-                  this.hintTimer.remove();
-              }
+          if (this.hintTimer) {
+              this.hintTimer.remove();
           }
       }
   }
@@ -1282,46 +1178,41 @@ class SectionHunt extends Phaser.Scene {
   showCollectionFeedback(x, y, eggTexture, symbolTexture) {
     const scale = this.gameScale;
 
+    // Pooled sprites and text floated by the scene's animator; quick tapping
+    // reuses the same handful of objects instead of allocating per egg
+    if (!this.feedbackPools) {
+        this.feedbackPools = {
+            egg: new EffectPool(() => this.add.image(0, 0, eggTexture).setDepth(20)),
+            symbol: new EffectPool(() => this.add.image(0, 0, symbolTexture).setDepth(21)),
+            text: new EffectPool(() => this.add.text(0, 0, 'Found!', {
+                fontSize: `${32 * scale}px`,
+                fontFamily: 'Comic Sans MS',
+                fill: '#ffff00',
+                stroke: '#000000',
+                strokeThickness: 4 * scale
+            }).setOrigin(0.5).setDepth(22))
+        };
+    }
+    const pools = this.feedbackPools;
+    const animator = UiAnimator.get(this);
+
     // Egg Sprite
-    const eggSprite = this.add.image(x, y, eggTexture).setDepth(20).setDisplaySize(50 * scale, 75 * scale);
-    this.tweens.add({
-        targets: eggSprite,
-        y: y - (60 * scale),
-        alpha: 0,
-        duration: 1000,
-        ease: 'Power1',
-        onComplete: () => eggSprite.destroy()
-    });
+    const eggSprite = pools.egg.acquire().setTexture(eggTexture).setPosition(x, y).setDisplaySize(50 * scale, 75 * scale);
+    animator.floatOut(eggSprite, 60 * scale, 1000, pools.egg);
 
     // Symbol Sprite
     if (symbolTexture) {
-        const symSprite = this.add.image(x, y, symbolTexture).setDepth(21).setDisplaySize(50 * scale, 75 * scale);
-        this.tweens.add({
-            targets: symSprite,
-            y: y - (60 * scale),
-            alpha: 0,
-            duration: 1000,
-            ease: 'Power1',
-            onComplete: () => symSprite.destroy()
-        });
+        const symSprite = pools.symbol.acquire().setTexture(symbolTexture).setPosition(x, y).setDisplaySize(50 * scale, 75 * scale);
+        animator.floatOut(symSprite, 60 * scale, 1000, pools.symbol);
     }
 
-    const feedback = this.add.text(x, y - (40 * scale), 'Found!', {
-        fontSize: `${32 * scale}px`,
-        fontFamily: 'Comic Sans MS',
-        fill: '#ffff00',
-        stroke: '#000000',
-        strokeThickness: 4 * scale
-    }).setOrigin(0.5).setDepth(22);
-
-    this.tweens.add({
-        targets: feedback,
-        y: y - (100 * scale),
-        alpha: 0,
-        duration: 1000,
-        ease: 'Power1',
-        onComplete: () => feedback.destroy()
-    });
+    const feedback = pools.text.acquire().setPosition(x, y - (40 * scale));
+    // Text only re-rasterises when the scale changed since it was last used
+    if (feedback.feedbackScale !== scale) {
+        feedback.feedbackScale = scale;
+        feedback.setFontSize(`${32 * scale}px`).setStroke('#000000', 4 * scale);
+    }
+    animator.floatOut(feedback, 60 * scale, 1000, pools.text);
   }
 
   showIdleHint() {
@@ -1332,19 +1223,9 @@ class SectionHunt extends Phaser.Scene {
         return;
     }
 
-    const foundEggs = this.registry.get('foundEggs');
-    const sections = this.registry.get('sections');
-    // For mobile, section lookup depends on if 'sections' structure is same.
-    // m/main.js create sets registry sections: { name: section.name, eggs: sectionEggs }
-    const currentSection = sections.find(s => s.name === this.sectionName);
+    const remainingCount = HuntState.get(this.game).remaining(this.sectionName);
     const scale = this.gameScale;
 
-    if (!currentSection) return;
-
-    const eggsInSection = currentSection.eggs; // Array of IDs in this section's cluster
-    const foundIds = foundEggs.map(e => e.eggId);
-    const remainingCount = eggsInSection.filter(id => !foundIds.includes(id)).length;
-
     if (remainingCount > 0) {
         const musicScene = this.scene.get('MusicScene');
         if (musicScene) musicScene.playSFX('menu-click');
@@ -1371,15 +1252,15 @@ class SectionHunt extends Phaser.Scene {
 
   create() {
     this.input.setDefaultCursor('none');
+    this.feedbackPools = null; // Pooled objects die with the previous run of the scene
 
-    const scaleX = this.game.config.width / 1280;
-    const scaleY = this.game.config.height / 720;
-    const scale = Math.min(scaleX, scaleY);
-    this.gameScale = scale;
+    // The background stretches over the viewport; eggs, lens and HUD scale
+    // with the design space and are resized in place
+    this.layout = new SceneLayout(this);
+    this.layout.add(this.cameras.main, { apply: (camera, m) => this.fitStage(camera, m) });
 
-    this.cameras.main.setBounds(0, 0, this.game.config.width, this.game.config.height);
-    this.cameras.main.setViewport(0, 0, this.game.config.width, this.game.config.height);
-    this.cameras.main.setPosition(0, 0);
+    // WebGL magnifies the background layer in one MagnifierFX pass; Canvas keeps the RenderTexture lens
+    this.shaderLens = ShaderLens.create(this, 2);
 
     let useVideo = false;
     const videoKey = `${this.sectionName}-video`;
@@ -1387,32 +1268,35 @@ class SectionHunt extends Phaser.Scene {
     if (this.cache.video.exists(videoKey)) {
         useVideo = true;
     }
+    // Struggling devices get the still background instead of a decoding video
+    if (!QualityGovernor.get(this.game).allowsSectionVideo) useVideo = false;
 
     if (useVideo) {
         this.sectionImage = this.add.video(0, 0, videoKey)
             .setOrigin(0, 0)
-            .setDisplaySize(this.game.config.width, this.game.config.height)
             .setDepth(0)
             .disableInteractive();
+        this.layout.add(this.sectionImage, this.backgroundAnchor());
+        if (this.shaderLens) this.shaderLens.add(this.sectionImage);
 
         this.sectionImage.setMute(false);
         const ambientVol = this.registry.has('ambientVolume') ? this.registry.get('ambientVolume') : 0.5;
         this.sectionImage.setVolume(ambientVol * 0.25);
         this.sectionImage.play(true);
         this.isUsingVideo = true;
+        // Only the canvas lens redraws per video frame; the shader lens samples the live texture
+        if (!this.shaderLens) this.videoClock = new VideoFrameClock(this, this.sectionImage);
 
         const updateAmbientVolume = (parent, key, data) => {
              if (key === 'ambientVolume' && this.sectionImage && this.sectionImage.active && this.isUsingVideo) {
                  this.sectionImage.setVolume(data * 0.25);
              }
         };
-        this.registry.events.on('changedata', updateAmbientVolume);
-        this.events.once('shutdown', () => {
-             this.registry.events.off('changedata', updateAmbientVolume);
-        });
+        Subscriptions.on(this, this.registry.events, 'changedata', updateAmbientVolume);
 
         this.sectionImage.on('error', () => {
              console.warn(`SectionHunt: Video ${videoKey} playback error. Falling back.`);
+             if (this.videoClock) this.videoClock.destroy();
              this.sectionImage.destroy();
              this.isUsingVideo = false;
              this.createFallbackImage();
@@ -1423,6 +1307,7 @@ class SectionHunt extends Phaser.Scene {
         this.createFallbackImage();
     }
     this.setupEggsAndUI();
+    RumBeacon.markNextFrame(this.game, 'hunt-frame');
   }
 
   createFallbackImage() {
@@ -1459,24 +1344,50 @@ class SectionHunt extends Phaser.Scene {
     if (this.sys.settings.active) {
         this.sectionImage = this.add.image(0, 0, textureKey)
             .setOrigin(0, 0)
-            .setDisplaySize(this.game.config.width, this.game.config.height)
             .setDepth(0);
+        this.layout.add(this.sectionImage, this.backgroundAnchor());
+        if (this.shaderLens) this.shaderLens.add(this.sectionImage);
     }
     this.isUsingVideo = false;
   }
 
+  // Camera and the scale the lens and tap radius are measured in
+  fitStage(camera, m) {
+    camera.setBounds(0, 0, m.width, m.height);
+    camera.setViewport(0, 0, m.width, m.height);
+    this.gameScale = m.scale;
+  }
+
+  backgroundAnchor() {
+    return { apply: (background, m) => background.setDisplaySize(m.width, m.height) };
+  }
+
+  // Eggs keep their spot and scale their size with the design space
+  sizeEgg(egg, m) {
+    egg.setDisplaySize(50 * m.scale, 75 * m.scale);
+    if (egg.symbolSprite) egg.symbolSprite.setDisplaySize(50 * m.scale, 75 * m.scale);
+  }
+
+  // RenderTexture lens: drawn at lensResolution and stretched to 150 design pixels
+  sizeLens(zoomedView, m) {
+    const diameter = 150 * m.scale;
+    zoomedView.setSize(diameter * this.lensResolution, diameter * this.lensResolution);
+    zoomedView.setDisplaySize(diameter, diameter);
+    this.maskGraphics.clear();
+    // Draw circle centered at 0,0 relative to graphics object
+    this.maskGraphics.fillCircle(0, 0, diameter / 2);
+  }
+
   setupEggsAndUI() {
-    const scale = this.gameScale;
-    const eggData = this.registry.get('eggData') || [];
-    const sectionEggs = eggData.filter(e => e.section === this.sectionName && !e.collected);
+    const sectionEggs = HuntState.get(this.game).eggsIn(this.sectionName).filter(e => !e.collected);
     this.eggs = this.add.group();
+    this.eggVersion = 0; // Bumped whenever the set of eggs the lens can show changes
+    this.lensState = {};
     // console.log(`SectionHunt: Creating ${sectionEggs.length} uncollected eggs for ${this.sectionName}`);
 
     sectionEggs.forEach(eggData => {
-      const egg = this.add.image(eggData.x, eggData.y, `egg-${eggData.eggId}`)
-        .setInteractive()
+      const egg = this.add.image(eggData.x, eggData.y, eggTextureKey(eggData.eggId))
         .setDepth(5)
-        .setDisplaySize(50 * scale, 75 * scale)
         .setAlpha(0);
       egg.setData('eggId', eggData.eggId);
       egg.setData('symbolDetails', eggData.symbol);
@@ -1485,7 +1396,6 @@ class SectionHunt extends Phaser.Scene {
         if (this.textures.exists(textureKey)) {
           const symbolSprite = this.add.image(eggData.x, eggData.y, textureKey)
             .setDepth(6)
-            .setDisplaySize(50 * scale, 75 * scale)
             .setAlpha(0);
           egg.symbolSprite = symbolSprite;
           // console.log(`SectionHunt: Added symbol '${eggData.symbol.name}' (${textureKey}) to egg-${eggData.eggId}`);
@@ -1497,34 +1407,29 @@ class SectionHunt extends Phaser.Scene {
         // console.log(`SectionHunt: No symbol for egg-${eggData.eggId}`);
         egg.symbolSprite = null;
       }
-      egg.on('pointerdown', () => {
-        // console.log(`SectionHunt: Click on egg-${eggData.eggId} at (${egg.x}, ${egg.y})`);
-        const pointer = this.input.activePointer;
-        if (egg.getBounds().contains(pointer.worldX, pointer.worldY)) {
-          // console.log(`SectionHunt: Bounds check PASSED for egg-${eggData.eggId}`);
-          // ⚡ Bolt Optimization: Use squared distance to avoid expensive Math.sqrt calls during pointerdown events
-          const distSq = Phaser.Math.Distance.Squared(pointer.worldX, pointer.worldY, egg.x, egg.y);
-          const threshold = 150 * scale;
-          if (distSq < threshold * threshold) {
-            // console.log(`SectionHunt: Distance check PASSED for egg-${eggData.eggId}, collecting!`);
-            this.collectEgg(egg);
-            egg.destroy();
-            if (egg.symbolSprite) {
-              egg.symbolSprite.destroy();
-            }
-          } else {
-            // console.log(`SectionHunt: Distance check FAILED for egg-${eggData.eggId}. Dist: ${distance}`);
-          }
-        } else {
-          // console.log(`SectionHunt: Bounds check FAILED for egg-${eggData.eggId}`);
-        }
-      });
+      if (this.shaderLens) {
+        this.shaderLens.add(egg);
+        if (egg.symbolSprite) this.shaderLens.add(egg.symbolSprite);
+      }
+      // Eggs are caught by the scene's lens tap handler, never by touching the sprite
       this.eggs.add(egg);
+      this.layout.add(egg, { apply: (egg, m) => this.sizeEgg(egg, m) });
+    });
+
+    // Lens and tap lookups go through a grid sized to the capture radius (80 * scale)
+    this.eggGrid = new EggGrid(160 * this.gameScale);
+    this.layout.add(this.eggs, {
+      apply: (eggs, m) => {
+        this.eggGrid.rebuild(eggs.getChildren(), 160 * m.scale);
+        this.eggVersion++;
+      }
     });
+    this.lensEggs = [];
+    this.lensEggScratch = [];
+    this.tapEggs = [];
 
-    this.eggZitButton = this.add.image(0, 200 * scale, 'egg-zit-button')
+    this.eggZitButton = this.add.image(0, 0, 'egg-zit-button')
       .setOrigin(0, 0)
-      .setDisplaySize(150 * scale, 150 * scale)
       .setInteractive()
       .on('pointerdown', () => {
         // console.log('Click on eggZitButton');
@@ -1532,13 +1437,14 @@ class SectionHunt extends Phaser.Scene {
       })
       .setDepth(4)
       .setScrollFactor(0);
+    this.layout.add(this.eggZitButton, { x: 0, y: 200, width: 150, height: 150, space: 'screen' });
     addButtonInteraction(this, this.eggZitButton, 'drive1');
 
-    this.eggsAmminHaul = this.add.image(0, 350 * scale, 'eggs-ammin-haul')
+    this.eggsAmminHaul = this.add.image(0, 0, 'eggs-ammin-haul')
       .setOrigin(0, 0)
-      .setDisplaySize(137 * scale, 150 * scale)
       .setInteractive()
       .setDepth(4);
+    this.layout.add(this.eggsAmminHaul, { x: 0, y: 350, width: 137, height: 150, space: 'screen' });
 
     addButtonInteraction(this, this.eggsAmminHaul, 'menu-click');
 
@@ -1553,43 +1459,37 @@ class SectionHunt extends Phaser.Scene {
     this.sound.play('drive2', { volume: 0.5 });
     this.scoreImage = this.add.image(0, 0, 'score')
       .setOrigin(0, 0)
-      .setDisplaySize(200 * scale, 200 * scale)
       .setDepth(4)
       .setScrollFactor(0);
+    this.layout.add(this.scoreImage, { x: 0, y: 0, width: 200, height: 200, space: 'screen' });
 
     const foundEggs = this.registry.get('foundEggs').length;
     const isDesktop = this.sys.game.device.os.desktop;
-    const scoreY = isDesktop ? 125 * scale : 117 * scale;
     const scoreFontSize = isDesktop ? 32 : 42;
-    this.scoreText = this.add.text(100 * scale, scoreY, `${foundEggs}/${TOTAL_EGGS}`, {
-      fontSize: `${scoreFontSize * scale}px`,
-      fill: '#000',
-      fontStyle: 'bold',
-      fontFamily: 'Comic Sans MS',
-      stroke: '#fff',
-      strokeThickness: 6 * scale
-    }).setOrigin(0.5).setDepth(5);
+    this.scoreText = HudText.add(this, 0, 0, `${foundEggs}/${TOTAL_EGGS}`, scoreFontSize, 6).setOrigin(0.5).setDepth(5);
+    this.layout.add(this.scoreText, { x: 100, y: isDesktop ? 125 : 117, fontSize: scoreFontSize, strokeThickness: 6, space: 'screen' });
     this.lastFoundCount = foundEggs; // Bolt Optimization
 
-    const diameter = 150 * scale;
-    this.zoomedView = this.add.renderTexture(0, 0, diameter, diameter)
-      .setDepth(6)
-      .setScrollFactor(0)
-      .setOrigin(0.5, 0.5); // Center origin for easier positioning
-    this.maskGraphics = this.add.graphics()
-      .setScrollFactor(0);
-    // Draw circle centered at 0,0 relative to graphics object
-    this.maskGraphics.fillCircle(0, 0, 75 * scale);
-    this.zoomedView.setMask(this.maskGraphics.createGeometryMask());
+    if (!this.shaderLens) {
+      this.lensResolution = QualityGovernor.get(this.game).lensResolution;
+      this.zoomedView = this.add.renderTexture(0, 0, 1, 1)
+        .setDepth(6)
+        .setScrollFactor(0)
+        .setOrigin(0.5, 0.5); // Center origin for easier positioning
+      this.maskGraphics = this.add.graphics()
+        .setScrollFactor(0);
+      this.layout.add(this.zoomedView, { apply: (zoomedView, m) => this.sizeLens(zoomedView, m) });
+      this.zoomedView.setMask(this.maskGraphics.createGeometryMask());
+
+      // Bolt Optimization: Render Stamp for single-pass drawing
+      this.renderStamp = this.make.image({ x: 0, y: 0, key: this.sectionName, add: false });
+    }
 
     this.magnifyingGlass = this.add.image(0, 0, 'magnifying-glass')
       .setOrigin(1, 1) // Anchor at bottom-right (handle tip)
       .setDepth(7)
       .setScrollFactor(0);
 
-    // Bolt Optimization: Render Stamp for single-pass drawing
-    this.renderStamp = this.make.image({ x: 0, y: 0, key: this.sectionName, add: false });
-
     // Idle Hint Timer (90 seconds, with 60 second AFK check)
     this.lastInteractionTime = this.time.now;
     this.input.on('pointermove', () => {
@@ -1606,12 +1506,14 @@ class SectionHunt extends Phaser.Scene {
         loop: true
     });
 
-    this.fingerCursor = this.add.image(0, 0, 'finger-cursor')
-        .setOrigin(0, 0)
-        .setAngle(0)
-        .setDepth(8)
-        .setScrollFactor(0)
-        .setVisible(false);
+    // Shown only while hovering a button, in place of the magnifying glass
+    this.fingerCursor = CursorOverlay.attach(this, 8);
+    if (this.fingerCursor) this.fingerCursor.setVisible(false);
+
+    const onQualityChange = (parent, key) => {
+        if (key === 'qualityTier') this.applyQualityTier();
+    };
+    Subscriptions.on(this, this.registry.events, 'changedata', onQualityChange);
 
     // Check level complete immediately if returning to a completed map
     this.checkLevelComplete(true);
@@ -1629,26 +1531,38 @@ class SectionHunt extends Phaser.Scene {
       const lensX = pointer.x + lensOffsetX;
       const lensY = pointer.y + lensOffsetY;
       const captureRadius = 80 * scale; // Slightly larger than visual radius (75)
-      const captureRadiusSq = captureRadius * captureRadius;
-
-      // Check all eggs
-      this.eggs.getChildren().forEach(egg => {
-        if (egg.active && !egg.getData('collected')) { // collected check might be redundant if we destroy, but safe
-           // Bolt Optimization: Squared distance check using LENS position
-           // Tapping the screen harvests the egg under the visual lens window.
-           const distSq = Phaser.Math.Distance.Squared(lensX, lensY, egg.x, egg.y);
-
-           // Increased capture radius logic for easier finding
-           if (distSq < captureRadiusSq) {
-               this.collectEgg(egg);
-               egg.destroy();
-               if (egg.symbolSprite) egg.symbolSprite.destroy();
-           }
-        }
+
+      // Bolt Optimization: only eggs in grid cells under the LENS position are candidates.
+      // Tapping the screen harvests the egg under the visual lens window.
+      const eggsUnderLens = this.eggGrid.query(lensX, lensY, captureRadius, this.tapEggs);
+      if (eggsUnderLens.length === 0) return;
+
+      eggsUnderLens.forEach(egg => {
+        this.collectEgg(egg);
+        egg.destroy();
+        if (egg.symbolSprite) egg.symbolSprite.destroy();
       });
+      this.eggGrid.rebuild(this.eggs.getChildren());
     });
   }
 
+  applyQualityTier() {
+    const quality = QualityGovernor.get(this.game);
+
+    if (!quality.allowsSectionVideo && this.isUsingVideo && this.sectionImage) {
+        if (this.videoClock) this.videoClock.destroy();
+        this.sectionImage.destroy();
+        this.isUsingVideo = false;
+        this.createFallbackImage();
+    }
+
+    if (this.zoomedView && this.lensResolution !== quality.lensResolution) {
+        this.lensResolution = quality.lensResolution;
+        this.sizeLens(this.zoomedView, this.layout.metrics);
+        this.lensState = {}; // Force a redraw at the new resolution
+    }
+  }
+
   update() {
     const pointer = this.input.activePointer;
     const scale = this.gameScale;
@@ -1664,89 +1578,24 @@ class SectionHunt extends Phaser.Scene {
 
     // Ensure video size is correct once texture loads
     if (this.sectionImage && this.sectionImage.active && this.sectionImage.width > 0) {
-        if (Math.abs(this.sectionImage.displayWidth - this.game.config.width) > 10) {
-             this.sectionImage.setDisplaySize(this.game.config.width, this.game.config.height);
+        if (Math.abs(this.sectionImage.displayWidth - this.layout.metrics.width) > 10) {
+             this.backgroundAnchor().apply(this.sectionImage, this.layout.metrics);
         }
     }
 
-    // Update Zoomed View Position (centered on lens)
-    this.zoomedView.setPosition(lensX, lensY);
-    this.maskGraphics.setPosition(lensX, lensY);
-
-    const magnifierRadius = 75 * scale;
-    const zoom = 2;
-    const diameter = 150 * scale;
-    const viewWidth = diameter / zoom;
-    const viewHeight = diameter / zoom;
-
-    // Crucial Change: The zoomed view should show what is visually under the LENS (lensX, lensY),
-    // not directly under the finger (pointer).
-    const scrollX = lensX - viewWidth / 2;
-    const scrollY = lensY - viewHeight / 2;
-
-    this.zoomedView.clear();
+    if (!this.shaderLens) {
+        // Update Zoomed View Position (centered on lens)
+        this.zoomedView.setPosition(lensX, lensY);
+        this.maskGraphics.setPosition(lensX, lensY);
 
-    // Draw background using renderStamp to avoid dirtying scene object
-    if (this.sectionImage && this.sectionImage.active) {
-         this.renderStamp.texture = this.sectionImage.texture;
-         this.renderStamp.frame = this.sectionImage.frame;
-    } else {
-         this.renderStamp.setTexture(this.sectionName);
+        if (this.isLensDirty(lensX, lensY)) {
+            this.drawLens(lensX, lensY);
+        }
     }
 
-    // Set explicit size before scaling
-    this.renderStamp.setDisplaySize(this.game.config.width, this.game.config.height);
-
-    // Scale by 2 for zoom
-    this.renderStamp.setScale(this.renderStamp.scaleX * zoom, this.renderStamp.scaleY * zoom);
-
-    // We already scaled the stamp by zoom. So we only offset by scrollX*zoom.
-    this.renderStamp.setPosition(-scrollX * zoom, -scrollY * zoom);
-    this.renderStamp.setOrigin(0, 0);
-
-    this.zoomedView.draw(this.renderStamp, this.renderStamp.x, this.renderStamp.y);
-
-    // Single pass for visibility update and drawing
-    this.eggs.getChildren().forEach(egg => {
-      if (egg && egg.active) {
-          // Update visibility based on LENS visual position
-          // If the egg is under the lens (visual), it should be visible in the zoomed view.
-
-          // Bolt Optimization: Use squared distance to avoid sqrt calculation in loop
-          const distToLensSq = Phaser.Math.Distance.Squared(lensX, lensY, egg.x, egg.y);
-          const magnifierRadiusSq = magnifierRadius * magnifierRadius;
-
-          const alpha = distToLensSq < magnifierRadiusSq ? 1 : 0;
-          egg.setAlpha(alpha);
-          if (egg.symbolSprite) {
-            egg.symbolSprite.setAlpha(alpha);
-          }
-
-          if (egg.visible && egg.alpha > 0) {
-             // Draw Egg using renderStamp
-             this.renderStamp.setTexture(egg.texture.key, egg.frame.name);
-             this.renderStamp.setAngle(egg.angle);
-             this.renderStamp.setFlipX(egg.flipX);
-             this.renderStamp.setFlipY(egg.flipY);
-             this.renderStamp.setOrigin(0.5, 0.5);
-             this.renderStamp.setScale(egg.scaleX * zoom, egg.scaleY * zoom);
-             this.zoomedView.draw(this.renderStamp, (egg.x - scrollX) * zoom, (egg.y - scrollY) * zoom);
-
-             // Draw Symbol using renderStamp
-             if (egg.symbolSprite && egg.symbolSprite.active && egg.symbolSprite.visible) {
-                 this.renderStamp.setTexture(egg.symbolSprite.texture.key, egg.symbolSprite.frame.name);
-                 this.renderStamp.setAngle(egg.symbolSprite.angle);
-                 this.renderStamp.setFlipX(egg.symbolSprite.flipX);
-                 this.renderStamp.setFlipY(egg.symbolSprite.flipY);
-                 this.renderStamp.setScale(egg.symbolSprite.scaleX * zoom, egg.symbolSprite.scaleY * zoom);
-                 this.zoomedView.draw(this.renderStamp, (egg.symbolSprite.x - scrollX) * zoom, (egg.symbolSprite.y - scrollY) * zoom);
-             }
-          }
-      }
-    });
-
     // Handle Button Hover and Cursor Swap
     const buttons = [this.eggZitButton, this.eggsAmminHaul];
+    const animator = UiAnimator.get(this);
     let isHoveringButton = false;
 
     buttons.forEach(btn => {
@@ -1761,26 +1610,12 @@ class SectionHunt extends Phaser.Scene {
                  if (!btn.isHovered) {
                      btn.isHovered = true;
                      // Use absolute scale based on baseScale
-                     this.tweens.add({
-                         targets: btn,
-                         scaleX: btn.baseScaleX * 1.1,
-                         scaleY: btn.baseScaleY * 1.1,
-                         duration: 100,
-                         ease: 'Sine.easeInOut'
-                     });
-                 }
-             } else {
-                 if (btn.isHovered) {
-                     btn.isHovered = false;
-                     // Return to base scale
-                     this.tweens.add({
-                         targets: btn,
-                         scaleX: btn.baseScaleX,
-                         scaleY: btn.baseScaleY,
-                         duration: 100,
-                         ease: 'Sine.easeInOut'
-                     });
+                     animator.scaleTo(btn, btn.baseScaleX * 1.1, btn.baseScaleY * 1.1, 100);
                  }
+             } else if (btn.isHovered) {
+                 btn.isHovered = false;
+                 // Return to base scale
+                 animator.scaleTo(btn, btn.baseScaleX, btn.baseScaleY, 100);
              }
         }
     });
@@ -1790,11 +1625,7 @@ class SectionHunt extends Phaser.Scene {
         if (this.zoomedView) this.zoomedView.setVisible(false);
         if (this.maskGraphics) this.maskGraphics.setVisible(false);
 
-        if (this.fingerCursor) {
-            this.fingerCursor.setVisible(true);
-            this.fingerCursor.setDisplaySize(50 * scale, 75 * scale);
-            this.fingerCursor.setPosition(pointer.x, pointer.y);
-        }
+        if (this.fingerCursor) this.fingerCursor.setVisible(true);
     } else {
         if (this.magnifyingGlass) {
              this.magnifyingGlass.setVisible(true);
@@ -1806,139 +1637,275 @@ class SectionHunt extends Phaser.Scene {
         if (this.fingerCursor) this.fingerCursor.setVisible(false);
     }
 
+    if (this.shaderLens) {
+        // The lens is off while the finger cursor is up
+        const lensRadius = isHoveringButton ? 0 : 75 * scale;
+        this.shaderLens.update(lensX, lensY, lensRadius);
+        this.showLensEggs(lensX, lensY, lensRadius);
+    }
+
     const foundEggsCount = this.registry.get('foundEggs').length;
     if (this.lastFoundCount !== foundEggsCount) {
         this.scoreText.setText(`${foundEggsCount}/${TOTAL_EGGS}`);
         this.lastFoundCount = foundEggsCount;
     }
   }
-}
 
-class EggZamRoom extends Phaser.Scene {
-  constructor() {
-    super({ key: 'EggZamRoom' });
-    this.displayedEggImage = null;
-    this.displayedSymbolImage = null;
-    this.explanationText = null;
-    this.noEggsText = null;
-    this.currentEgg = null;
-    this.gameScale = 1;
-    this.background = null;
-    this.examiner = null;
-    this.symbolResultDiag = null;
-    this.eggZitButton = null;
-    this.scoreImage = null;
-    this.scoreText = null;
-    this.correctText = null;
-    this.leftBottleZone = null;
-    this.rightBottleZone = null;
-    this.fingerCursor = null;
-  }
+  // Shader lens: only the eggs the grid finds under the lens are drawn, cropped to it
+  showLensEggs(x, y, radius) {
+    const lensEggs = this.eggGrid.query(x, y, radius, this.lensEggScratch);
 
-  preload() {
-    // Assets are preloaded in MainMenu
-    this.load.on('loaderror', (file) => {
-      console.error(`EggZamRoom: Load error: Key='${file.key}', URL='${file.url}'`);
+    this.lensEggs.forEach(egg => {
+      if (egg.active && lensEggs.indexOf(egg) === -1) {
+        egg.setAlpha(0);
+        if (egg.symbolSprite) egg.symbolSprite.setAlpha(0);
+      }
     });
+    this.lensEggScratch = this.lensEggs;
+    this.lensEggs = lensEggs;
 
-    this.load.on('filecomplete', (key, type, data) => {
-      // console.log(`EggZamRoom: Successfully loaded asset: Key='${key}', Type='${type}'`);
+    lensEggs.forEach(egg => {
+      this.shaderLens.crop(egg);
+      if (egg.symbolSprite) this.shaderLens.crop(egg.symbolSprite);
     });
   }
 
-  create() {
-    this.input.setDefaultCursor('none');
-    const width = this.game.config.width;
-    const height = this.game.config.height;
-    const scaleX = width / 1280;
-    const scaleY = height / 720;
-    this.gameScale = Math.min(scaleX, scaleY);
+  // The lens only needs redrawing when it moved, the background changed
+  // (scale or video frame) or the set of eggs has changed since the last draw.
+  isLensDirty(x, y) {
+    const state = this.lensState;
+    const background = this.sectionImage && this.sectionImage.active ? this.sectionImage : null;
+    const frame = background && this.isUsingVideo && this.videoClock ? this.videoClock.frame : -1;
+    const texture = background ? background.texture.key : null;
+
+    if (state.x === x && state.y === y && state.frame === frame && state.texture === texture &&
+        state.scale === this.gameScale && state.width === this.layout.metrics.width &&
+        state.height === this.layout.metrics.height && state.eggVersion === this.eggVersion) {
+        return false;
+    }
 
-    this.cameras.main.setBounds(0, 0, width, height);
-    this.cameras.main.setViewport(0, 0, width, height);
-    this.cameras.main.setPosition(0, 0);
+    state.x = x;
+    state.y = y;
+    state.frame = frame;
+    state.texture = texture;
+    state.scale = this.gameScale;
+    state.width = this.layout.metrics.width;
+    state.height = this.layout.metrics.height;
+    state.eggVersion = this.eggVersion;
+    return true;
+  }
 
-    this.background = this.add.image(0, 0, 'egg-zam-room')
-      .setOrigin(0, 0)
-      .setDepth(0)
-      .setDisplaySize(width, height);
+  drawLens(lensX, lensY) {
+    const scale = this.gameScale;
+
+    const magnifierRadius = 75 * scale;
+    // 2x magnification; zoom is render-texture pixels per world pixel
+    const magnification = 2;
+    const zoom = magnification * this.lensResolution;
+    const diameter = 150 * scale;
+    const viewWidth = diameter / magnification;
+    const viewHeight = diameter / magnification;
+
+    // Crucial Change: The zoomed view should show what is visually under the LENS (lensX, lensY),
+    // not directly under the finger (pointer).
+    const scrollX = lensX - viewWidth / 2;
+    const scrollY = lensY - viewHeight / 2;
+
+    this.zoomedView.clear();
+
+    // Draw background using renderStamp to avoid dirtying scene object
+    if (this.sectionImage && this.sectionImage.active) {
+         this.renderStamp.texture = this.sectionImage.texture;
+         this.renderStamp.frame = this.sectionImage.frame;
+    } else {
+         this.renderStamp.setTexture(this.sectionName);
+    }
+
+    // Set explicit size before scaling
+    this.renderStamp.setDisplaySize(this.layout.metrics.width, this.layout.metrics.height);
+
+    // Scale by 2 for zoom
+    this.renderStamp.setScale(this.renderStamp.scaleX * zoom, this.renderStamp.scaleY * zoom);
+
+    // We already scaled the stamp by zoom. So we only offset by scrollX*zoom.
+    this.renderStamp.setPosition(-scrollX * zoom, -scrollY * zoom);
+    this.renderStamp.setOrigin(0, 0);
+
+    this.zoomedView.draw(this.renderStamp, this.renderStamp.x, this.renderStamp.y);
+
+    // Update visibility based on LENS visual position
+    // Bolt Optimization: the grid only hands back eggs within the magnifier radius
+    const visibleEggs = this.eggGrid.query(lensX, lensY, magnifierRadius, this.lensEggScratch);
+
+    // Hide eggs that were under the lens last draw but no longer are
+    this.lensEggs.forEach(egg => {
+      if (egg.active && visibleEggs.indexOf(egg) === -1) {
+        egg.setAlpha(0);
+        if (egg.symbolSprite) egg.symbolSprite.setAlpha(0);
+      }
+    });
+    this.lensEggScratch = this.lensEggs;
+    this.lensEggs = visibleEggs;
+
+    visibleEggs.forEach(egg => {
+      egg.setAlpha(1);
+      if (egg.symbolSprite) {
+        egg.symbolSprite.setAlpha(1);
+      }
+
+      if (egg.visible) {
+         // Draw Egg using renderStamp
+         this.renderStamp.setTexture(egg.texture.key, egg.frame.name);
+         this.renderStamp.setAngle(egg.angle);
+         this.renderStamp.setFlipX(egg.flipX);
+         this.renderStamp.setFlipY(egg.flipY);
+         this.renderStamp.setOrigin(0.5, 0.5);
+         this.renderStamp.setScale(egg.scaleX * zoom, egg.scaleY * zoom);
+         this.zoomedView.draw(this.renderStamp, (egg.x - scrollX) * zoom, (egg.y - scrollY) * zoom);
+
+         // Draw Symbol using renderStamp
+         if (egg.symbolSprite && egg.symbolSprite.active && egg.symbolSprite.visible) {
+             this.renderStamp.setTexture(egg.symbolSprite.texture.key, egg.symbolSprite.frame.name);
+             this.renderStamp.setAngle(egg.symbolSprite.angle);
+             this.renderStamp.setFlipX(egg.symbolSprite.flipX);
+             this.renderStamp.setFlipY(egg.symbolSprite.flipY);
+             this.renderStamp.setScale(egg.symbolSprite.scaleX * zoom, egg.symbolSprite.scaleY * zoom);
+             this.zoomedView.draw(this.renderStamp, (egg.symbolSprite.x - scrollX) * zoom, (egg.symbolSprite.y - scrollY) * zoom);
+         }
+      }
+    });
+  }
+}
+
+class EggZamRoom extends Phaser.Scene {
+  constructor() {
+    super({ key: 'EggZamRoom' });
+    this.displayedEggImage = null;
+    this.displayedSymbolImage = null;
+    this.explanationText = null;
+    this.noEggsText = null;
+    this.currentEgg = null;
+    this.gameScale = 1;
+    this.background = null;
+    this.examiner = null;
+    this.symbolResultDiag = null;
+    this.eggZitButton = null;
+    this.scoreImage = null;
+    this.scoreText = null;
+    this.correctText = null;
+    this.leftBottleZone = null;
+    this.rightBottleZone = null;
+    this.fingerCursor = null;
+  }
+
+  preload() {
+    // Assets are preloaded in MainMenu
+    TextureBudget.get(this.game).acquire(this, ['egg-zam-room']);
+    this.load.on('loaderror', (file) => {
+      console.error(`EggZamRoom: Load error: Key='${file.key}', URL='${file.url}'`);
+    });
+
+    this.load.on('filecomplete', (key, type, data) => {
+      // console.log(`EggZamRoom: Successfully loaded asset: Key='${key}', Type='${type}'`);
+    });
+  }
+
+  create() {
+    this.input.setDefaultCursor('none');
+    const width = this.game.config.width;
+    const height = this.game.config.height;
+    this.layout = new SceneLayout(this);
+    this.gameScale = this.layout.metrics.scale;
+
+    this.cameras.main.setBounds(0, 0, width, height);
+    this.cameras.main.setViewport(0, 0, width, height);
+    this.cameras.main.setPosition(0, 0);
 
+    // The room stretches to the viewport; the examiner, bottles and window are
+    // sized from assetScale (bigger on phones) and stand on the floor line.
     const isDesktop = this.sys.game.device.os.desktop;
-    const assetScale = isDesktop ? this.gameScale : this.gameScale * 1.75;
+    const assetScaleOf = (m) => isDesktop ? m.scale : m.scale * 1.75;
+    this.examinerRect = (m) => {
+      const assetScale = assetScaleOf(m);
+      const examinerWidth = 400 * assetScale;
+      const examinerHeight = 500 * assetScale;
+      const floorY = isDesktop ? ((740 / 720) * m.height) : m.height + (100 * assetScale); // push further down on mobile
+      return {
+        x: (640 / 1280) * m.width - (examinerWidth / 2),
+        y: floorY - examinerHeight,
+        width: examinerWidth,
+        height: examinerHeight,
+        assetScale
+      };
+    };
 
-    const tanBoxCenterX = (640 / 1280) * width;
-    const examinerWidth = 400 * assetScale;
-    const examinerHeight = 500 * assetScale;
-    const examinerX = tanBoxCenterX - (examinerWidth / 2);
-    const floorY = isDesktop ? ((740 / 720) * height) : height + (100 * assetScale); // push further down on mobile
-    const examinerY = floorY - examinerHeight;
+    this.background = this.layout.add(this.add.image(0, 0, 'egg-zam-room')
+      .setOrigin(0, 0)
+      .setDepth(0), { apply: (image, m) => image.setDisplaySize(m.width, m.height) });
 
-    this.examiner = this.add.image(examinerX, examinerY, 'egg-zamminer')
+    this.examiner = this.layout.add(this.add.image(0, 0, 'egg-zamminer')
       .setOrigin(0, 0)
-      .setDepth(2)
-      .setDisplaySize(examinerWidth, examinerHeight);
+      .setDepth(2), {
+        apply: (image, m) => {
+          const rect = this.examinerRect(m);
+          image.setPosition(rect.x, rect.y).setDisplaySize(rect.width, rect.height);
+        }
+      });
 
-    const diagX = 0.55 * width;
-    const diagY = 0.05 * height;
-    this.symbolResultDiag = this.add.image(diagX, diagY, 'symbol-result-summary-diag')
+    this.symbolResultDiag = this.layout.add(this.add.image(0, 0, 'symbol-result-summary-diag')
       .setOrigin(0, 0)
       .setDepth(1)
-      .setDisplaySize(900 * this.gameScale, 600 * this.gameScale)
-      .setAlpha(0);
+      .setAlpha(0), {
+        apply: (image, m) => image.setPosition(0.55 * m.width, 0.05 * m.height).setDisplaySize(900 * m.scale, 600 * m.scale)
+      });
 
-    this.eggZitButton = this.add.image(0, 200 * this.gameScale, 'egg-zit-button')
+    this.eggZitButton = this.add.image(0, 0, 'egg-zit-button')
       .setOrigin(0, 0)
-      .setDisplaySize(150 * this.gameScale, 131 * this.gameScale)
       .setInteractive()
       .on('pointerdown', () => this.scene.start('MapScene'))
       .setDepth(4)
       .setScrollFactor(0);
+    this.layout.add(this.eggZitButton, { x: 0, y: 200, width: 150, height: 131, space: 'screen' });
     addButtonInteraction(this, this.eggZitButton, 'drive1');
 
     this.scoreImage = this.add.image(0, 0, 'score')
       .setOrigin(0, 0)
-      .setDisplaySize(200 * this.gameScale, 200 * this.gameScale)
       .setDepth(4)
       .setScrollFactor(0);
+    this.layout.add(this.scoreImage, { x: 0, y: 0, width: 200, height: 200, space: 'screen' });
     const foundEggsCount = this.registry.get('foundEggs').length;
-    const scoreY = isDesktop ? 125 * this.gameScale : 117 * this.gameScale;
-    const correctY = isDesktop ? 150 * this.gameScale : 146 * this.gameScale;
     // Scale text up slightly more on mobile for readability
     const scoreFontSize = isDesktop ? 32 : 54;
     const correctFontSize = isDesktop ? 24 : 42;
-    this.scoreText = this.add.text(100 * this.gameScale, scoreY, `${foundEggsCount}/${TOTAL_EGGS}`, {
-      fontSize: `${scoreFontSize * this.gameScale}px`,
-      fill: '#000',
-      fontStyle: 'bold',
-      fontFamily: 'Comic Sans MS',
-      stroke: '#fff',
-      strokeThickness: (isDesktop ? 6 : 8) * this.gameScale
-    }).setOrigin(0.5).setDepth(5);
+    const strokeThickness = isDesktop ? 6 : 8;
+    this.scoreText = HudText.add(this, 0, 0, `${foundEggsCount}/${TOTAL_EGGS}`, scoreFontSize, strokeThickness)
+      .setOrigin(0.5).setDepth(5);
+    this.layout.add(this.scoreText, { x: 100, y: isDesktop ? 125 : 117, fontSize: scoreFontSize, strokeThickness, space: 'screen' });
     this.lastFoundCount = foundEggsCount; // Bolt Optimization
 
     if (!this.registry.has('correctCategorizations')) {
       this.registry.set('correctCategorizations', 0);
     }
-    this.correctText = this.add.text(100 * this.gameScale, correctY, `Correct: ${this.registry.get('correctCategorizations')}`, {
-      fontSize: `${correctFontSize * this.gameScale}px`,
-      fill: '#000',
-      fontStyle: 'bold',
-      fontFamily: 'Comic Sans MS',
-      stroke: '#fff',
-      strokeThickness: (isDesktop ? 6 : 8) * this.gameScale
-    }).setOrigin(0.5).setDepth(5);
-
-    const zoneWidth = 200 * assetScale;
-    const zoneHeight = 400 * assetScale;
-    const zoneY = examinerY + 100 * assetScale;
+    this.correctText = HudText.add(this, 0, 0, `Correct: ${this.registry.get('correctCategorizations')}`, correctFontSize, strokeThickness)
+      .setOrigin(0.5).setDepth(5);
+    this.layout.add(this.correctText, { x: 100, y: isDesktop ? 150 : 146, fontSize: correctFontSize, strokeThickness, space: 'screen' });
+
+    // Each bottle zone covers one half of the examiner, below its window
+    const bottleAnchor = (column) => ({
+      apply: (zone, m) => {
+        const rect = this.examinerRect(m);
+        zone.setPosition(rect.x + column * 200 * rect.assetScale, rect.y + 100 * rect.assetScale);
+        zone.setSize(200 * rect.assetScale, 400 * rect.assetScale);
+      }
+    });
 
-    this.leftBottleZone = this.add.zone(examinerX, zoneY, zoneWidth, zoneHeight)
+    this.leftBottleZone = this.layout.add(this.add.zone(0, 0, 1, 1)
       .setOrigin(0, 0)
-      .setInteractive();
+      .setInteractive(), bottleAnchor(0));
 
-    this.rightBottleZone = this.add.zone(examinerX + zoneWidth, zoneY, zoneWidth, zoneHeight)
+    this.rightBottleZone = this.layout.add(this.add.zone(0, 0, 1, 1)
       .setOrigin(0, 0)
-      .setInteractive();
+      .setInteractive(), bottleAnchor(1));
 
     const showExplanation = (isCorrect, guessText) => {
         if (isCorrect) {
@@ -1954,19 +1921,26 @@ class EggZamRoom extends Phaser.Scene {
               this.registry.set('highScore', currentScore);
               localStorage.setItem('highScore', currentScore);
             }
-            this.currentEgg.categorized = true;
+            HuntState.get(this.game).categorize(this.currentEgg.eggId);
         } else {
             this.sound.play('error');
         }
 
         if (this.explanationText) this.explanationText.destroy();
-        const data = this.currentEgg.symbolData;
+        const data = this.currentEgg.symbol;
         const eggId = this.currentEgg.eggId;
         const scale = this.gameScale;
         const isDesktop = this.sys.game.device.os.desktop;
         const assetScale = isDesktop ? scale : scale * 1.5;
+        const { width, height } = this.layout.metrics;
 
-        this.explanationText = this.add.container(width / 2, height / 2).setDepth(100);
+        // Built at the current scale; later resizes re-centre it and scale it by the ratio
+        this.explanationText = this.layout.add(this.add.container(0, 0).setDepth(100), {
+            apply: (container, m) => {
+                container.setPosition(m.width / 2, m.height / 2);
+                if (!this.tweens.isTweening(container)) container.setScale(m.scale / scale);
+            }
+        });
 
         const bgWidth = Math.min(width * 0.95, 800 * assetScale);
         const bgHeight = Math.min(height * 0.95, 600 * assetScale);
@@ -1983,7 +1957,7 @@ class EggZamRoom extends Phaser.Scene {
             fontSize: `${48 * assetScale}px`, fill: '#8b4513', fontStyle: 'bold', fontFamily: 'Comic Sans MS'
         }).setOrigin(0.5);
 
-        const eggImg = this.add.image(-bgWidth/2 + 90 * assetScale, -bgHeight/2 + 90 * assetScale, `egg-${eggId}`).setDisplaySize(100 * assetScale, 125 * assetScale);
+        const eggImg = this.add.image(-bgWidth/2 + 90 * assetScale, -bgHeight/2 + 90 * assetScale, eggTextureKey(eggId)).setDisplaySize(100 * assetScale, 125 * assetScale);
         const symbolImgSmall = this.add.image(-bgWidth/2 + 90 * assetScale, -bgHeight/2 + 90 * assetScale, data.filename).setDisplaySize(100 * assetScale, 125 * assetScale);
 
         const guessDisplay = this.add.text(bgWidth/2 - 40 * assetScale, -bgHeight/2 + 60 * assetScale, `Your Guess:\n${guessText}`, {
@@ -2042,13 +2016,13 @@ class EggZamRoom extends Phaser.Scene {
 
     this.leftBottleZone.on('pointerdown', () => {
       if (this.currentEgg && !this.currentEgg.categorized && !this.explanationText?.active) {
-        showExplanation(this.currentEgg.symbolData.category === 'Christian', 'Christian');
+        showExplanation(HuntCore.isCorrectGuess(this.currentEgg.symbol, 'Christian'), 'Christian');
       }
     });
 
     this.rightBottleZone.on('pointerdown', () => {
       if (this.currentEgg && !this.currentEgg.categorized && !this.explanationText?.active) {
-        showExplanation(this.currentEgg.symbolData.category === 'Pagan', 'Worldly');
+        showExplanation(HuntCore.isCorrectGuess(this.currentEgg.symbol, 'Worldly'), 'Worldly');
       }
     });
 
@@ -2057,27 +2031,22 @@ class EggZamRoom extends Phaser.Scene {
     if (!this.sys.game.device.os.desktop) {
       this.fingerCursor = null;
     } else {
-      this.fingerCursor = this.add.image(0, 0, 'finger-cursor')
-        .setOrigin(0, 0)
-        .setAngle(0)
-        .setDisplaySize(50 * this.gameScale, 75 * this.gameScale)
-        .setDepth(1000); // Ensure it renders above the popup modal (depth 100)
+      this.fingerCursor = CursorOverlay.attach(this, 1000); // Ensure it renders above the popup modal (depth 100)
     }
   }
 
   displayRandomEggInfo() {
-    const foundEggs = this.registry.get('foundEggs');
-    const width = this.game.config.width;
-    const height = this.game.config.height;
+    const huntState = HuntState.get(this.game);
+    const { width, height } = this.layout.metrics;
 
     if (this.currentEgg === null || this.currentEgg.categorized) {
-      const uncategorizedEggs = foundEggs.filter(egg => !egg.categorized);
-      if (uncategorizedEggs.length > 0) {
-        this.currentEgg = Phaser.Utils.Array.GetRandom(uncategorizedEggs);
+      const uncategorizedEgg = huntState.randomUncategorized();
+      if (uncategorizedEgg) {
+        this.currentEgg = uncategorizedEgg;
       } else {
         this.currentEgg = null;
         if (this.noEggsText) this.noEggsText.destroy();
-        const ctaText = foundEggs.length < TOTAL_EGGS
+        const ctaText = huntState.foundCount < TOTAL_EGGS
             ? "All collected eggs categorized!\nReturn to the map to find more."
             : "All eggs categorized!\nHappy Easter!";
         // Position it higher so it isn't blocked by the larger mobile machine
@@ -2092,10 +2061,23 @@ class EggZamRoom extends Phaser.Scene {
           strokeThickness: 3 * this.gameScale,
           wordWrap: { width: 480 * this.gameScale, useAdvancedWrap: true }
         }).setOrigin(0, 0).setDepth(10);
+        this.layout.add(this.noEggsText, {
+          apply: (text, m) => {
+            text.setPosition(0.36 * m.width, isDesktop ? 0.25 * m.height : 0.15 * m.height);
+            text.setStyle({ fontSize: `${(isDesktop ? 28 : 40) * m.scale}px`, strokeThickness: 3 * m.scale, wordWrap: { width: 480 * m.scale, useAdvancedWrap: true } });
+          }
+        });
 
-        if (foundEggs.length === TOTAL_EGGS) {
+        if (huntState.foundCount === TOTAL_EGGS) {
           // PLAY AGAIN Button
-          const playBtnContainer = this.add.container((0.36 * width) + (125 * this.gameScale), textY + (100 * this.gameScale)).setDepth(100);
+          const builtScale = this.gameScale;
+          const playBtnContainer = this.layout.add(this.add.container(0, 0).setDepth(100), {
+            apply: (container, m) => {
+              const y = (isDesktop ? 0.25 * m.height : 0.15 * m.height) + (100 * m.scale);
+              container.setPosition((0.36 * m.width) + (125 * m.scale), y);
+              container.setScale(m.scale / builtScale);
+            }
+          });
 
           const playBtnWidth = 250 * this.gameScale;
           const playBtnHeight = 60 * this.gameScale;
@@ -2119,6 +2101,7 @@ class EggZamRoom extends Phaser.Scene {
           playBtnContainer.setInteractive(new Phaser.Geom.Rectangle(-playBtnWidth/2, -playBtnHeight/2, playBtnWidth, playBtnHeight), Phaser.Geom.Rectangle.Contains);
 
           const triggerReload = () => {
+              HuntSave.get(this.game).clear(); // PLAY AGAIN starts a fresh hunt instead of resuming
               window.location.reload();
           };
 
@@ -2138,31 +2121,28 @@ class EggZamRoom extends Phaser.Scene {
     if (this.noEggsText) this.noEggsText.destroy();
 
     if (this.currentEgg) {
-      const { eggId, symbolData } = this.currentEgg;
+      const { eggId, symbol: symbolData } = this.currentEgg;
       const isDesktop = this.sys.game.device.os.desktop;
-      const assetScale = isDesktop ? this.gameScale : this.gameScale * 2;
-
-      const windowCenterX = 196 * assetScale;
-      const windowBottomY = 190 * assetScale;
-      const eggHeight = 125 * assetScale;
-      const symbolHeight = 125 * assetScale;
-
-      const eggPosX = this.examiner.x + windowCenterX;
-      const eggPosY = this.examiner.y + windowBottomY - (eggHeight / 2);
-      const symbolPosX = this.examiner.x + windowCenterX;
-      const symbolPosY = this.examiner.y + windowBottomY - (symbolHeight / 2);
+      // Egg and symbol sit on the bottom edge of the examiner's window
+      const windowAnchor = {
+        apply: (image, m) => {
+          const rect = this.examinerRect(m);
+          const assetScale = isDesktop ? m.scale : m.scale * 2;
+          const eggHeight = 125 * assetScale;
+          image.setPosition(rect.x + 196 * assetScale, rect.y + 190 * assetScale - (eggHeight / 2));
+          image.setDisplaySize(100 * assetScale, eggHeight);
+        }
+      };
 
-      if (this.textures.exists(`egg-${eggId}`)) {
-        this.displayedEggImage = this.add.image(eggPosX, eggPosY, `egg-${eggId}`)
+      if (this.textures.exists(eggTextureKey(eggId))) {
+        this.displayedEggImage = this.layout.add(this.add.image(0, 0, eggTextureKey(eggId))
           .setOrigin(0.5, 0.5)
-          .setDisplaySize(100 * assetScale, 125 * assetScale)
-          .setDepth(3);
+          .setDepth(3), windowAnchor);
       }
       if (symbolData && symbolData.filename && this.textures.exists(symbolData.filename)) {
-        this.displayedSymbolImage = this.add.image(symbolPosX, symbolPosY, symbolData.filename)
+        this.displayedSymbolImage = this.layout.add(this.add.image(0, 0, symbolData.filename)
           .setOrigin(0.5, 0.5)
-          .setDisplaySize(100 * assetScale, 125 * assetScale)
-          .setDepth(3);
+          .setDepth(3), windowAnchor);
       }
     }
   }
@@ -2173,137 +2153,1948 @@ class EggZamRoom extends Phaser.Scene {
       this.scoreText.setText(`${foundEggsCount}/${TOTAL_EGGS}`);
       this.lastFoundCount = foundEggsCount;
     }
-    if (this.fingerCursor) {
-      this.fingerCursor.setPosition(this.input.x, this.input.y);
-    }
   }
 }
 
-function getViewportDimensions() {
-  const isMobile = /iPhone|iPad|iPod|Android/i.test(navigator.userAgent);
-  let width, height;
-  if (isMobile) {
-    width = screen.width;
-    height = screen.height;
-    if (width < height) {
-      [width, height] = [height, width];
-    }
-  } else {
-    width = window.innerWidth;
-    height = document.documentElement.clientHeight;
+/**
+ * Scene-scoped listeners. Subscriptions.on() attaches a handler to a Phaser
+ * emitter (scale manager, registry.events, scene.events, loader, ...) or a DOM
+ * target and detaches it when the scene shuts down or is destroyed, so
+ * re-entering a scene never stacks another copy. Returns an unsubscribe
+ * function for listeners that should go away earlier.
+ *
+ * Subscriptions.counts() lists live subscriptions per emitter:event next to
+ * the emitter's own listener count, to spot leaks from the console.
+ */
+class Subscriptions {
+  static on(scene, emitter, event, fn, context) {
+    const isDom = typeof emitter.on !== 'function';
+    const handler = isDom && context ? fn.bind(context) : fn;
+    if (isDom) emitter.addEventListener(event, handler);
+    else emitter.on(event, fn, context);
+
+    const label = Subscriptions.label(scene, emitter) + ':' + event;
+    const entry = Subscriptions.live.get(label) || { emitter, event, count: 0 };
+    entry.count++;
+    Subscriptions.live.set(label, entry);
+
+    let subscribed = true;
+    const off = () => {
+      if (!subscribed) return;
+      subscribed = false;
+      if (isDom) emitter.removeEventListener(event, handler);
+      else emitter.off(event, fn, context);
+      if (--entry.count === 0) Subscriptions.live.delete(label);
+      scene.events.off('shutdown', off);
+      scene.events.off('destroy', off);
+    };
+    scene.events.once('shutdown', off);
+    scene.events.once('destroy', off);
+    return off;
   }
-  return { width, height };
-}
 
-const { width, height } = getViewportDimensions();
-const config = {
-  type: Phaser.AUTO,
-  width: width,
-  height: height,
-  scale: {
-    mode: Phaser.Scale.FIT,
-    autoCenter: Phaser.Scale.CENTER_BOTH,
-    parent: 'game-container',
-  },
-  scene: [MainMenu, MapScene, SectionHunt, EggZamRoom, MusicScene, UIScene],
-  backgroundColor: '#000000',
-};
+  static label(scene, emitter) {
+    if (emitter === scene.scale) return 'scale';
+    if (emitter === scene.registry.events) return 'registry';
+    if (emitter === scene.game.events) return 'game';
+    if (emitter === scene.events) return scene.scene.key + '.events';
+    if (emitter === window) return 'window';
+    if (emitter === document) return 'document';
+    return scene.scene.key + '.' + ((emitter.constructor && emitter.constructor.name) || 'emitter');
+  }
 
-const game = new Phaser.Game(config);
-window.game = game; // Expose for debugging/verification
+  // { 'scale:resize': { subscribed, total }, ... }; total is only known for Phaser emitters
+  static counts() {
+    const counts = {};
+    Subscriptions.live.forEach((entry, label) => {
+      counts[label] = {
+        subscribed: entry.count,
+        total: typeof entry.emitter.listenerCount === 'function' ? entry.emitter.listenerCount(entry.event) : null
+      };
+    });
+    return counts;
+  }
+}
+Subscriptions.live = new Map(); // 'emitter:event' -> { emitter, event, count }
 
+// Estimated GPU texture budgets (MB) per device class. Mobile Safari drops the
+// WebGL context long before desktop browsers do, so phones get the tightest cap.
+const TEXTURE_BUDGET_MB = { desktop: 256, tablet: 96, phone: 48 };
 
 /**
- * Parses a scripture string (e.g., "John 3:16" or "1 Peter 2:4") into a URL.
+ * Estimates GPU bytes per texture key and evicts the least recently used
+ * section textures once the device budget is exceeded. Evicted keys are queued
+ * again through the loader the next time a scene acquires them.
  */
-function parseScriptureLink(scriptureText) {
-    if (!scriptureText) return null;
+class TextureBudget {
+  static get(game) {
+    if (!game.textureBudget) game.textureBudget = new TextureBudget(game);
+    return game.textureBudget;
+  }
 
-    // Basic mapping of common book names to 3-letter codes used in the target URL
-    const bookMap = {
-        "genesis": "GEN", "exodus": "EXO", "leviticus": "LEV", "numbers": "NUM", "deuteronomy": "DEU",
-        "joshua": "JOS", "judges": "JDG", "ruth": "RUT", "1 samuel": "1SA", "2 samuel": "2SA",
-        "1 kings": "1KI", "2 kings": "2KI", "1 chronicles": "1CH", "2 chronicles": "2CH",
-        "ezra": "EZR", "nehemiah": "NEH", "esther": "EST", "job": "JOB", "psalms": "PSA", "psalm": "PSA",
-        "proverbs": "PRO", "ecclesiastes": "ECC", "song of solomon": "SNG", "isaiah": "ISA",
-        "jeremiah": "JER", "lamentations": "LAM", "ezekiel": "EZK", "daniel": "DAN", "hosea": "HOS",
-        "joel": "JOL", "amos": "AMO", "obadiah": "OBA", "jonah": "JON", "micah": "MIC",
-        "nahum": "NAM", "habakkuk": "HAB", "zephaniah": "ZEP", "haggai": "HAG", "zechariah": "ZEC",
-        "malachi": "MAL", "matthew": "MAT", "mark": "MRK", "luke": "LUK", "john": "JHN",
-        "acts": "ACT", "romans": "ROM", "1 corinthians": "1CO", "2 corinthians": "2CO",
-        "galatians": "GAL", "ephesians": "EPH", "philippians": "PHP", "colossians": "COL",
-        "1 thessalonians": "1TH", "2 thessalonians": "2TH", "1 timothy": "1TI", "2 timothy": "2TI",
-        "titus": "TIT", "philemon": "PHM", "hebrews": "HEB", "james": "JAS", "1 peter": "1PE",
-        "2 peter": "2PE", "1 john": "1JN", "2 john": "2JN", "3 john": "3JN", "jude": "JUD",
-        "revelation": "REV"
+  static deviceClass(game) {
+    const os = game.device.os;
+    // iPadOS Safari reports itself as macOS, touch points give it away
+    const isTouchMac = os.macOS && navigator.maxTouchPoints > 1;
+    if (os.desktop && !isTouchMac) return 'desktop';
+    return Math.min(screen.width, screen.height) >= 600 ? 'tablet' : 'phone';
+  }
+
+  static estimateBytes(texture) {
+    // Uncompressed RGBA, no mipmaps (our textures are not power-of-two)
+    return texture.source.reduce((sum, source) => sum + source.width * source.height * 4, 0);
+  }
+
+  constructor(game) {
+    this.game = game;
+    this.deviceClass = TextureBudget.deviceClass(game);
+    this.budgetBytes = TEXTURE_BUDGET_MB[this.deviceClass] * 1024 * 1024;
+    this.totalBytes = 0;
+    this.bytes = new Map();     // key -> estimated GPU bytes
+    this.sources = new Map();   // key -> { type, url } used to reload after eviction
+    this.lastUsed = new Map();  // key -> game time of the last acquire
+    this.pins = new Map();      // key -> number of running scenes using it
+    this.evictable = new Set();
+
+    Object.keys(game.textures.list).forEach(key => this.onAdd(key, game.textures.list[key]));
+    game.textures.on('addtexture', this.onAdd, this);
+    game.textures.on('removetexture', this.onRemove, this);
+  }
+
+  onAdd(key, texture) {
+    const bytes = TextureBudget.estimateBytes(texture);
+    this.totalBytes += bytes - (this.bytes.get(key) || 0);
+    this.bytes.set(key, bytes);
+  }
+
+  onRemove(key) {
+    this.totalBytes -= this.bytes.get(key) || 0;
+    this.bytes.delete(key);
+  }
+
+  markEvictable(keys) {
+    keys.forEach(key => this.evictable.add(key));
+  }
+
+  // Remembers where evictable textures loaded by this scene came from
+  track(scene) {
+    const onLoad = (file) => {
+      if (this.evictable.has(file.key)) this.sources.set(file.key, { type: file.type, url: file.url });
     };
+    scene.load.on('load', onLoad);
+    scene.events.once('shutdown', () => scene.load.off('load', onLoad));
+  }
 
-    // Regex to extract Book, Chapter, and Verse. Handles "1 Peter 2:4-5" or "John 3:16"
-    const match = scriptureText.match(/^(\d?\s*[A-Za-z\s]+)\s+(\d+):(\d+)/);
-    if (match) {
-        const rawBook = match[1].trim().toLowerCase();
-        const chapter = match[2];
-        const verse = match[3];
-        const bookCode = bookMap[rawBook];
+  // Call from preload(): pins the keys until the scene shuts down and queues
+  // any that were evicted so they are resident again before create(). The
+  // budget is enforced once the scene's loader has finished.
+  acquire(scene, keys) {
+    const now = this.game.loop.time;
+    this.track(scene);
+    scene.load.once('complete', () => this.enforce());
+
+    keys.forEach(key => {
+      this.pins.set(key, (this.pins.get(key) || 0) + 1);
+      this.lastUsed.set(key, now);
+
+      const source = this.sources.get(key);
+      if (!this.game.textures.exists(key) && source && typeof scene.load[source.type] === 'function') {
+        scene.load[source.type](key, source.url);
+      }
+    });
 
-        if (bookCode) {
-            return `https://mt-sin.ai/365DBR/bible.html?book=${bookCode}&chapter=${chapter}&verse=${verse}`;
-        }
+    scene.events.once('shutdown', () => {
+      keys.forEach(key => {
+        const count = (this.pins.get(key) || 1) - 1;
+        if (count > 0) this.pins.set(key, count);
+        else this.pins.delete(key);
+      });
+    });
+  }
+
+  enforce() {
+    if (this.totalBytes <= this.budgetBytes) return;
+
+    const candidates = [...this.evictable]
+      .filter(key => !this.pins.has(key) && this.bytes.has(key) && this.sources.has(key))
+      .sort((a, b) => (this.lastUsed.get(a) || 0) - (this.lastUsed.get(b) || 0));
+
+    for (const key of candidates) {
+      if (this.totalBytes <= this.budgetBytes) break;
+      // Destroys the WebGLTexture; onRemove() updates the running total
+      this.game.textures.remove(key);
     }
-    return null;
+  }
 }
 
-/**
- * Adds a "press" animation to a game object on touch.
- * @param {Phaser.Scene} scene - The scene the object belongs to.
- * @param {Phaser.GameObjects.GameObject} button - The game object to animate.
- * @param {string} [soundKey='success'] - The key of the sound to play on click.
- */
-function addButtonInteraction(scene, button, soundKey = 'success') {
-  button.on('pointerdown', () => {
-    // Try to play sound via MusicScene if available to ensure persistence
-    const musicScene = scene.scene.get('MusicScene');
-    if (musicScene && musicScene.scene.isActive()) {
-        musicScene.playSFX(soundKey);
-    } else if (soundKey && scene.sound.get(soundKey)) {
-        scene.sound.play(soundKey, { volume: 0.5 });
-    }
+// Worker source for decoding image blobs off the main thread. Loaded from a
+// Blob URL (allowed by the worker-src CSP) so it ships inside this file.
+const IMAGE_DECODE_WORKER_SOURCE = `
+self.onmessage = (event) => {
+  const { id, blob } = event.data;
+  createImageBitmap(blob, { premultiplyAlpha: 'premultiply' })
+    .then(bitmap => self.postMessage({ id, bitmap }, [bitmap]))
+    .catch(error => self.postMessage({ id, error: String(error) }));
+};
+`;
 
-    if (button.baseScaleX === undefined || !scene.tweens.isTweening(button)) {
-        // Capture ONLY if not tweening to avoid capturing a shrunken/grown state
-        button.baseScaleX = button.scaleX;
-        button.baseScaleY = button.scaleY;
+const imageDecoder = {
+  worker: undefined, // undefined = not tried yet, null = unavailable
+  pending: new Map(),
+  nextId: 1,
+
+  getWorker() {
+    if (this.worker !== undefined) return this.worker;
+    this.worker = null;
+    if (typeof Worker === 'undefined' || typeof createImageBitmap === 'undefined') return null;
+
+    try {
+      const url = URL.createObjectURL(new Blob([IMAGE_DECODE_WORKER_SOURCE], { type: 'text/javascript' }));
+      this.worker = new Worker(url);
+      URL.revokeObjectURL(url);
+      this.worker.onmessage = (event) => {
+        const { id, bitmap, error } = event.data;
+        const request = this.pending.get(id);
+        if (!request) return;
+        this.pending.delete(id);
+        if (bitmap) request.resolve(bitmap);
+        else request.reject(new Error(error));
+      };
+      this.worker.onerror = () => {
+        // Worker could not start (or crashed): decode the rest on the main thread
+        this.worker = null;
+        this.pending.forEach(request => request.reject(new Error('Decode worker failed')));
+        this.pending.clear();
+      };
+    } catch (e) {
+      console.warn('ImageDecoder: worker unavailable, decoding on the main thread.', e);
+      this.worker = null;
     }
+    return this.worker;
+  },
 
-    scene.tweens.killTweensOf(button);
-    scene.tweens.add({
-      targets: button,
-      scaleX: button.baseScaleX * 0.9,
-      scaleY: button.baseScaleY * 0.9,
-      duration: 50,
-      ease: 'Power1'
+  decodeInWorker(blob) {
+    const worker = this.getWorker();
+    if (!worker) return Promise.reject(new Error('No decode worker'));
+    const id = this.nextId++;
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      worker.postMessage({ id, blob });
     });
-  });
+  },
 
-  const restore = () => {
-    if (button.baseScaleX !== undefined && button.baseScaleY !== undefined) {
-      scene.tweens.killTweensOf(button);
-      scene.tweens.add({
-        targets: button,
-        scaleX: button.baseScaleX,
-        scaleY: button.baseScaleY,
-        duration: 100,
-        ease: 'Power1'
+  decodeWithElement(blob) {
+    const url = URL.createObjectURL(blob);
+    const image = new Image();
+    image.src = url;
+    const loaded = image.decode
+        ? image.decode()
+        : new Promise((resolve, reject) => { image.onload = resolve; image.onerror = reject; });
+    return loaded.then(() => image).finally(() => URL.revokeObjectURL(url));
+  },
+
+  // Worker createImageBitmap -> main-thread createImageBitmap (still decoded
+  // off-thread by the browser) -> <img>.decode() for browsers without it
+  decode(blob) {
+    return this.decodeInWorker(blob)
+      .catch(() => typeof createImageBitmap !== 'undefined'
+          ? createImageBitmap(blob, { premultiplyAlpha: 'premultiply' })
+          : Promise.reject(new Error('createImageBitmap unsupported')))
+      .catch(() => this.decodeWithElement(blob));
+  }
+};
+
+/**
+ * Image loader file type that fetches the image as a Blob and decodes it
+ * before the WebGL upload, so the upload in addToCache() does not stall the
+ * main thread on a synchronous decode. Use as `this.load.decodedImage(key, url)`.
+ */
+class DecodedImageFile extends Phaser.Loader.File {
+  constructor(loader, key, url, xhrSettings) {
+    super(loader, {
+      type: 'decodedImage',
+      cache: loader.textureManager,
+      extension: 'png',
+      responseType: 'blob',
+      key: key,
+      url: url,
+      xhrSettings: xhrSettings
+    });
+  }
+
+  onProcess() {
+    this.state = Phaser.Loader.FILE_PROCESSING;
+
+    imageDecoder.decode(this.xhrLoader.response)
+      .then(image => {
+        this.data = image;
+        this.onProcessComplete();
+      })
+      .catch(error => {
+        console.warn(`DecodedImageFile: Failed to decode '${this.key}' from ${this.url}`, error);
+        this.onProcessError();
       });
-    }
-  };
+  }
 
-  button.on('pointerup', restore);
-  button.on('pointerout', restore);
+  addToCache() {
+    this.cache.addImage(this.key, this.data);
+  }
 }
 
-function resizeGame() {
-  const { width, height } = getViewportDimensions();
+Phaser.Loader.FileTypesManager.register('decodedImage', function (key, url, xhrSettings) {
+  this.addFile(new DecodedImageFile(this, key, url, xhrSettings));
+  return this;
+});
+
+// Magnifies a soft-edged circle of the framebuffer in place: fragments within
+// uRadius of uCenter sample the point uZoom times closer to it. uCenter is in
+// framebuffer pixels (origin bottom-left), uRadius in pixels.
+const MAGNIFIER_FRAG = `
+#define SHADER_NAME MAGNIFIER_FS
+
+precision mediump float;
+
+uniform sampler2D uMainSampler;
+uniform vec2 uResolution;
+uniform vec2 uCenter;
+uniform float uRadius;
+uniform float uZoom;
+
+varying vec2 outTexCoord;
+
+void main()
+{
+    vec2 pixel = outTexCoord * uResolution;
+    vec2 zoomed = (uCenter + (pixel - uCenter) / uZoom) / uResolution;
+    float inside = 1.0 - smoothstep(uRadius - 1.0, uRadius, distance(pixel, uCenter));
+    gl_FragColor = mix(texture2D(uMainSampler, outTexCoord), texture2D(uMainSampler, zoomed), inside);
+}
+`;
+
+class MagnifierFX extends Phaser.Renderer.WebGL.Pipelines.PostFXPipeline {
+  constructor(game) {
+    super({ game: game, name: 'MagnifierFX', fragShader: MAGNIFIER_FRAG });
+    this.lensX = 0;
+    this.lensY = 0;
+    this.radius = 0;
+    this.zoom = 1;
+  }
+
+  setLens(x, y, radius, zoom) {
+    this.lensX = x;
+    this.lensY = y;
+    this.radius = radius;
+    this.zoom = zoom;
+  }
+
+  onPreRender() {
+    const width = this.renderer.width;
+    const height = this.renderer.height;
+    this.set2f('uResolution', width, height);
+    this.set2f('uCenter', this.lensX, height - this.lensY);
+    this.set1f('uRadius', this.radius);
+    this.set1f('uZoom', this.zoom);
+  }
+}
+
+/**
+ * Single-pass WebGL magnifier. The background and the eggs are drawn once, into
+ * a Layer whose MagnifierFX post pass redraws the lens circle from that same
+ * framebuffer at the zoom factor; the HUD and the glass draw over it untouched.
+ * Eggs stay hidden except under the lens, cropped to the patch it magnifies so
+ * none of them shows outside it. Replaces the RenderTexture + geometry mask +
+ * per-egg draw() lens; create() returns null on the Canvas renderer so
+ * callers keep that path as the fallback.
+ */
+class ShaderLens {
+  static supported(renderer) {
+    return !!renderer && renderer.type === Phaser.WEBGL && !!renderer.pipelines;
+  }
+
+  static create(scene, zoom) {
+    const renderer = scene.sys.renderer;
+    if (!ShaderLens.supported(renderer)) return null;
+    renderer.pipelines.addPostPipeline('MagnifierFX', MagnifierFX);
+    return new ShaderLens(scene, zoom);
+  }
+
+  constructor(scene, zoom) {
+    this.zoom = zoom;
+    this.x = 0;
+    this.y = 0;
+    this.radius = 0;
+    this.layer = scene.add.layer().setDepth(0).setPostPipeline(MagnifierFX);
+    this.fx = this.layer.getPostPipeline(MagnifierFX);
+  }
+
+  // Moves a background or egg sprite into the magnified layer
+  add(gameObject) {
+    this.layer.add(gameObject);
+    return gameObject;
+  }
+
+  // A radius of 0 switches the lens off
+  update(x, y, radius) {
+    this.x = x;
+    this.y = y;
+    this.radius = radius;
+    if (this.fx) this.fx.setLens(x, y, radius, this.zoom);
+  }
+
+  // Shows an egg sprite cropped to the square the lens magnifies, which sits
+  // inside the lens circle, or hides it when none of it is under the lens
+  crop(image) {
+    const half = this.radius / this.zoom;
+    const left = image.x - image.displayWidth * image.originX;
+    const top = image.y - image.displayHeight * image.originY;
+    const x0 = Phaser.Math.Clamp((this.x - half - left) / image.scaleX, 0, image.width);
+    const x1 = Phaser.Math.Clamp((this.x + half - left) / image.scaleX, 0, image.width);
+    const y0 = Phaser.Math.Clamp((this.y - half - top) / image.scaleY, 0, image.height);
+    const y1 = Phaser.Math.Clamp((this.y + half - top) / image.scaleY, 0, image.height);
+    if (x1 <= x0 || y1 <= y0) return image.setAlpha(0);
+    return image.setCrop(x0, y0, x1 - x0, y1 - y0).setAlpha(1);
+  }
+}
+/**
+ * Uniform-grid spatial index over egg positions. Rebuild it whenever eggs move
+ * (resize) or leave (collection); lens and tap checks then only visit the cells
+ * that overlap the query circle instead of every egg in the section.
+ */
+class EggGrid {
+  constructor(cellSize) {
+    this.cellSize = Math.max(1, cellSize);
+    this.cells = new Map();
+  }
+
+  cellKey(cx, cy) {
+    // Offset keeps slightly off-screen (negative) cells unique without string keys
+    return (cy + 4096) * 8192 + (cx + 4096);
+  }
+
+  rebuild(eggs, cellSize = this.cellSize) {
+    this.cellSize = Math.max(1, cellSize);
+    this.cells.clear();
+    eggs.forEach(egg => {
+      if (!egg || !egg.active) return;
+      const key = this.cellKey(Math.floor(egg.x / this.cellSize), Math.floor(egg.y / this.cellSize));
+      const cell = this.cells.get(key);
+      if (cell) cell.push(egg);
+      else this.cells.set(key, [egg]);
+    });
+  }
+
+  // Collects active eggs strictly within `radius` of (x, y) into `out`
+  query(x, y, radius, out = []) {
+    out.length = 0;
+    const radiusSq = radius * radius;
+    const minX = Math.floor((x - radius) / this.cellSize);
+    const maxX = Math.floor((x + radius) / this.cellSize);
+    const minY = Math.floor((y - radius) / this.cellSize);
+    const maxY = Math.floor((y + radius) / this.cellSize);
+    for (let cy = minY; cy <= maxY; cy++) {
+      for (let cx = minX; cx <= maxX; cx++) {
+        const cell = this.cells.get(this.cellKey(cx, cy));
+        if (!cell) continue;
+        for (let i = 0; i < cell.length; i++) {
+          const egg = cell[i];
+          if (egg.active && Phaser.Math.Distance.Squared(x, y, egg.x, egg.y) < radiusSq) out.push(egg);
+        }
+      }
+    }
+    return out;
+  }
+}
+
+// Candidates tried around each active sample before it is retired (Bridson's k)
+const POISSON_TRIES = 30;
+// A maximal Bridson set holds about 0.7 samples per r^2 of free area. The
+// radius is sized for 25% more samples than eggs so the pick below has slack.
+const POISSON_DENSITY = 0.7;
+const POISSON_HEADROOM = 1.25;
+
+/**
+ * Places a section's eggs in one pass. Bridson's Poisson-disk sampling fills
+ * the bounds, minus the exclusion rects, with samples at least `radius` apart.
+ * A random subset of them becomes the eggs, so eggs never overlap and are
+ * spread over the whole area. The radius comes from the free area and the
+ * egg count, and the background grid holds about one sample per cell, so the
+ * cost is O(count). All randomness is drawn from `rnd`, so a saved seed
+ * reproduces the layout.
+ */
+class EggPlacer {
+  // bounds/exclusions are { x, y, width, height }; returns `count` { x, y } points
+  static place(rnd, count, bounds, exclusions = []) {
+    if (count <= 0) return [];
+    const area = Math.max(1, bounds.width) * Math.max(1, bounds.height);
+    const blocked = exclusions.reduce((sum, rect) => sum + EggPlacer.overlap(bounds, rect), 0);
+    let radius = Math.sqrt(POISSON_DENSITY * Math.max(area - blocked, area * 0.1) / (count * POISSON_HEADROOM));
+
+    let samples = [];
+    for (let attempt = 0; attempt < 4; attempt++, radius *= 0.8) {
+      samples = EggPlacer.sample(rnd, bounds, exclusions, radius);
+      if (samples.length >= count) return rnd.shuffle(samples).slice(0, count);
+    }
+
+    // Only a viewport too small for the HUD gets here: keep every egg, spacing or not
+    while (samples.length < count) samples.push(EggPlacer.randomPoint(rnd, bounds, exclusions));
+    return samples;
+  }
+
+  static sample(rnd, bounds, exclusions, radius) {
+    const cellSize = radius / Math.SQRT2;
+    const columns = Math.max(1, Math.ceil(bounds.width / cellSize));
+    const rows = Math.max(1, Math.ceil(bounds.height / cellSize));
+    const grid = new Int32Array(columns * rows).fill(-1);
+    const samples = [];
+    const active = [];
+    const radiusSq = radius * radius;
+
+    const accept = (x, y) => {
+      if (x < bounds.x || y < bounds.y || x > bounds.x + bounds.width || y > bounds.y + bounds.height) return false;
+      if (EggPlacer.excluded(x, y, exclusions)) return false;
+      const cx = Math.min(columns - 1, Math.floor((x - bounds.x) / cellSize));
+      const cy = Math.min(rows - 1, Math.floor((y - bounds.y) / cellSize));
+      // Cells are r/sqrt(2) wide, so any neighbour closer than r is within 2 cells
+      for (let ny = Math.max(0, cy - 2); ny <= Math.min(rows - 1, cy + 2); ny++) {
+        for (let nx = Math.max(0, cx - 2); nx <= Math.min(columns - 1, cx + 2); nx++) {
+          const index = grid[ny * columns + nx];
+          if (index !== -1 && Phaser.Math.Distance.Squared(x, y, samples[index].x, samples[index].y) < radiusSq) return false;
+        }
+      }
+      grid[cy * columns + cx] = samples.length;
+      active.push(samples.length);
+      samples.push({ x, y });
+      return true;
+    };
+
+    // Exclusions can cut the area into pieces, so each piece gets a few seed throws
+    for (let seeds = 0; seeds < POISSON_TRIES; seeds++) {
+      accept(bounds.x + rnd.frac() * bounds.width, bounds.y + rnd.frac() * bounds.height);
+
+      while (active.length > 0) {
+        const slot = rnd.between(0, active.length - 1);
+        const origin = samples[active[slot]];
+        let placed = false;
+        for (let tries = 0; tries < POISSON_TRIES && !placed; tries++) {
+          const angle = rnd.frac() * Math.PI * 2;
+          const distance = radius * (1 + rnd.frac());
+          placed = accept(origin.x + Math.cos(angle) * distance, origin.y + Math.sin(angle) * distance);
+        }
+        if (!placed) {
+          active[slot] = active[active.length - 1];
+          active.pop();
+        }
+      }
+    }
+    return samples;
+  }
+
+  static randomPoint(rnd, bounds, exclusions) {
+    let x = bounds.x;
+    let y = bounds.y;
+    for (let tries = 0; tries < POISSON_TRIES; tries++) {
+      x = bounds.x + rnd.frac() * Math.max(0, bounds.width);
+      y = bounds.y + rnd.frac() * Math.max(0, bounds.height);
+      if (!EggPlacer.excluded(x, y, exclusions)) break;
+    }
+    return { x, y };
+  }
+
+  static excluded(x, y, exclusions) {
+    for (let i = 0; i < exclusions.length; i++) {
+      const rect = exclusions[i];
+      if (x >= rect.x && x < rect.x + rect.width && y >= rect.y && y < rect.y + rect.height) return true;
+    }
+    return false;
+  }
+
+  static overlap(a, b) {
+    const width = Math.min(a.x + a.width, b.x + b.width) - Math.max(a.x, b.x);
+    const height = Math.min(a.y + a.height, b.y + b.height) - Math.max(a.y, b.y);
+    return width > 0 && height > 0 ? width * height : 0;
+  }
+}
+
+/**
+ * Counts presented frames of a Phaser Video so the canvas lens redraws once per
+ * decoded frame rather than once per display refresh. Without
+ * requestVideoFrameCallback it falls back to polling the element's decoded-frame
+ * counter (or the playback position) once per game step.
+ */
+class VideoFrameClock {
+  constructor(scene, video) {
+    this.frame = 0;
+    this.element = video.video;
+    this.handle = null;
+    this.stopPolling = null;
+    this.active = true;
+
+    if (this.element && typeof this.element.requestVideoFrameCallback === 'function') {
+      const onFrame = () => {
+        if (!this.active) return;
+        this.frame++;
+        this.handle = this.element.requestVideoFrameCallback(onFrame);
+      };
+      this.handle = this.element.requestVideoFrameCallback(onFrame);
+    } else {
+      const element = this.element;
+      const poll = () => {
+        if (element && typeof element.webkitDecodedFrameCount === 'number') this.frame = element.webkitDecodedFrameCount;
+        else if (element && element.getVideoPlaybackQuality) this.frame = element.getVideoPlaybackQuality().totalVideoFrames;
+        else this.frame = video.getCurrentTime();
+      };
+      scene.events.on('preupdate', poll);
+      this.stopPolling = () => scene.events.off('preupdate', poll);
+    }
+    scene.events.once('shutdown', () => this.destroy());
+  }
+
+  destroy() {
+    if (!this.active) return;
+    this.active = false;
+    if (this.handle !== null && this.element && this.element.cancelVideoFrameCallback) {
+      this.element.cancelVideoFrameCallback(this.handle);
+    }
+    if (this.stopPolling) this.stopPolling();
+  }
+}
+
+// Quality tiers from richest to cheapest; each tier keeps the savings of the ones before it
+const QUALITY_TIERS = ['full', 'still-backgrounds', 'low-res-lens'];
+
+/**
+ * Watches measured frame times and steps the game down through QUALITY_TIERS
+ * when the frame budget is blown, then back up once there is headroom again.
+ * The current tier is published on the registry ('qualityTier' and
+ * 'qualityTierName') for scenes and telemetry.
+ */
+class QualityGovernor {
+  static get(game) {
+    if (!game.qualityGovernor) game.qualityGovernor = new QualityGovernor(game);
+    return game.qualityGovernor;
+  }
+
+  constructor(game) {
+    this.game = game;
+    this.tier = 0;
+    // The shader lens has no lens texture to shrink, so 'low-res-lens' would only cost a sample window there
+    const lowResLens = QUALITY_TIERS.indexOf('low-res-lens');
+    this.tiers = QUALITY_TIERS.map((name, tier) => tier)
+      .filter(tier => tier !== lowResLens || !ShaderLens.supported(game.renderer));
+    this.maxTier = this.tiers[this.tiers.length - 1];
+    this.samples = [];
+    this.windowSize = 120;      // Frames per judgement (~2s at 60fps)
+    this.slowFrameMs = 22;      // Median above this (~45fps) is over budget
+    this.fastFrameMs = 18;      // Median below this has headroom to step back up
+    this.windowsToStepUp = 3;   // Doubles each time a step up has to be undone quickly
+    this.goodWindows = 0;
+    this.cooldownUntil = 0;
+    this.steppedUpAt = -Infinity;
+
+    this.publish();
+    game.events.on('postrender', this.sample, this);
+  }
+
+  get allowsSectionVideo() {
+    return this.tier < 1;
+  }
+
+  // Fraction of the on-screen lens size the lens RenderTexture is drawn at
+  get lensResolution() {
+    return this.tier >= 2 ? 0.5 : 1;
+  }
+
+  sample() {
+    const now = performance.now();
+    const delta = this.game.loop.delta;
+    // Hidden tabs and long stalls (loading, GC) say nothing about steady-state cost
+    if (document.hidden || delta > 250) return;
+
+    this.samples.push(delta);
+    if (this.samples.length < this.windowSize) return;
+
+    this.samples.sort((a, b) => a - b);
+    const median = this.samples[this.samples.length >> 1];
+    this.samples.length = 0;
+    if (now < this.cooldownUntil) return;
+
+    const overBudget = median > this.slowFrameMs;
+    const headroom = median < this.fastFrameMs;
+
+    if (overBudget && this.tier < this.maxTier) {
+      // Stepping up only to fall straight back down means we are on the edge; wait longer next time
+      if (now - this.steppedUpAt < 10000) this.windowsToStepUp = Math.min(this.windowsToStepUp * 2, 32);
+      this.setTier(this.neighbourTier(1));
+    } else if (headroom && this.tier > 0) {
+      if (++this.goodWindows >= this.windowsToStepUp) {
+        this.steppedUpAt = now;
+        this.setTier(this.neighbourTier(-1));
+      }
+    } else {
+      this.goodWindows = 0;
+    }
+  }
+
+  // Next usable tier down (1) or up (-1) from the current one
+  neighbourTier(direction) {
+    const index = this.tiers.findIndex(tier => tier >= this.tier);
+    return this.tiers[Phaser.Math.Clamp(index + direction, 0, this.tiers.length - 1)];
+  }
+
+  setTier(tier) {
+    this.tier = Phaser.Math.Clamp(tier, 0, this.maxTier);
+    this.goodWindows = 0;
+    this.samples.length = 0;
+    this.cooldownUntil = performance.now() + 2000; // Let the change settle before judging again
+    this.publish();
+  }
+
+  publish() {
+    this.game.registry.set('qualityTier', this.tier);
+    this.game.registry.set('qualityTierName', QUALITY_TIERS[this.tier]);
+  }
+}
+
+// Bump when a field of window.__perf.snapshot() changes meaning or goes away
+const PERF_API_VERSION = 1;
+
+/**
+ * The supported way for tests, benchmarks and soak runs to read runtime cost:
+ * window.__perf. It is always present but only { version, enabled, enable,
+ * disable, reset, snapshot } until enable() (or ?perf in the URL) installs the
+ * timers, so a normal session pays nothing.
+ *
+ * Once enabled it wraps each scene's step/render, and the WebGL draw and
+ * bindTexture calls. snapshot() reports means since the last reset() plus
+ * point-in-time counts (texture memory, videos, tweens, listeners); see
+ * tools/perf_sampler.py for the reader.
+ */
+class PerfProbe {
+  static install(game) {
+    const probe = new PerfProbe(game);
+    window.__perf = {
+      version: PERF_API_VERSION,
+      get enabled() { return probe.enabled; },
+      enable: () => probe.enable(),
+      disable: () => probe.disable(),
+      reset: () => probe.reset(),
+      snapshot: () => probe.snapshot()
+    };
+    if (new URLSearchParams(window.location.search).has('perf')) {
+      game.events.once('ready', () => probe.enable());
+    }
+    return probe;
+  }
+
+  constructor(game) {
+    this.game = game;
+    this.enabled = false;
+    this.restore = []; // Undo functions for every wrapped method
+    this.scenes = new Map(); // key -> { update, render, lastUpdate, lastRender }
+    this.gpu = { drawCalls: 0, textureBinds: 0 };
+    this.frameGpu = { drawCalls: 0, textureBinds: 0 };
+    this.frames = 0;
+    this.frameMs = 0;
+    this.resetAt = performance.now();
+  }
+
+  enable() {
+    if (this.enabled) return;
+    this.enabled = true;
+    this.reset();
+
+    this.game.scene.scenes.forEach(scene => {
+      const timing = { update: 0, render: 0, lastUpdate: 0, lastRender: 0 };
+      this.scenes.set(scene.sys.settings.key, timing);
+      this.wrap(scene.sys, 'step', (original, args) => {
+        const start = performance.now();
+        original.apply(scene.sys, args);
+        timing.lastUpdate = performance.now() - start;
+        timing.update += timing.lastUpdate;
+      });
+      this.wrap(scene.sys, 'render', (original, args) => {
+        const start = performance.now();
+        original.apply(scene.sys, args);
+        timing.lastRender = performance.now() - start;
+        timing.render += timing.lastRender;
+      });
+    });
+
+    const gl = this.game.renderer && this.game.renderer.gl;
+    if (gl) {
+      const countDraw = (original, args) => { this.frameGpu.drawCalls++; return original.apply(gl, args); };
+      this.wrap(gl, 'drawArrays', countDraw);
+      this.wrap(gl, 'drawElements', countDraw);
+      this.wrap(gl, 'bindTexture', (original, args) => { this.frameGpu.textureBinds++; return original.apply(gl, args); });
+    }
+
+    const onPostRender = () => {
+      this.frames++;
+      this.frameMs += this.game.loop.delta;
+      this.gpu.drawCalls += this.frameGpu.drawCalls;
+      this.gpu.textureBinds += this.frameGpu.textureBinds;
+      this.lastGpu = { ...this.frameGpu };
+      this.frameGpu.drawCalls = 0;
+      this.frameGpu.textureBinds = 0;
+    };
+    this.game.events.on('postrender', onPostRender);
+    this.restore.push(() => this.game.events.off('postrender', onPostRender));
+  }
+
+  disable() {
+    if (!this.enabled) return;
+    this.enabled = false;
+    this.restore.reverse().forEach(undo => undo());
+    this.restore.length = 0;
+    this.scenes.clear();
+  }
+
+  // Replaces target[name] with a wrapper; undone by disable()
+  wrap(target, name, wrapper) {
+    const original = target[name];
+    const hadOwn = Object.prototype.hasOwnProperty.call(target, name);
+    target[name] = function () { return wrapper(original, arguments); };
+    this.restore.push(() => {
+      if (hadOwn) target[name] = original;
+      else delete target[name];
+    });
+  }
+
+  reset() {
+    this.scenes.forEach(timing => { timing.update = 0; timing.render = 0; });
+    this.gpu.drawCalls = 0;
+    this.gpu.textureBinds = 0;
+    this.lastGpu = { drawCalls: 0, textureBinds: 0 };
+    this.frames = 0;
+    this.frameMs = 0;
+    this.resetAt = performance.now();
+  }
+
+  snapshot() {
+    const frames = Math.max(1, this.frames);
+    const scenes = {};
+    let videos = 0;
+    this.game.scene.scenes.forEach(scene => {
+      const key = scene.sys.settings.key;
+      const timing = this.scenes.get(key);
+      const objects = scene.sys.displayList ? scene.sys.displayList.list : [];
+      const sceneVideos = objects.filter(object => object.type === 'Video').length;
+      videos += sceneVideos;
+      scenes[key] = {
+        active: scene.sys.isActive(),
+        visible: scene.sys.isVisible(),
+        updateMs: timing ? timing.update / frames : null,
+        renderMs: timing ? timing.render / frames : null,
+        lastUpdateMs: timing ? timing.lastUpdate : null,
+        lastRenderMs: timing ? timing.lastRender : null,
+        displayObjects: objects.length,
+        videos: sceneVideos,
+        tweens: scene.tweens ? scene.tweens.getTweens().length : 0,
+        uiAnimations: scene.uiAnimator ? scene.uiAnimator.running.length : 0
+      };
+    });
+
+    const budget = TextureBudget.get(this.game);
+    const listeners = Subscriptions.counts();
+    return {
+      version: PERF_API_VERSION,
+      enabled: this.enabled,
+      sampledMs: performance.now() - this.resetAt,
+      frames: this.frames,
+      frameMs: this.frames ? this.frameMs / this.frames : null,
+      qualityTier: this.game.registry.get('qualityTierName') || null,
+      scenes,
+      webgl: this.enabled && this.game.renderer && this.game.renderer.gl ? {
+        drawCalls: this.gpu.drawCalls / frames,
+        textureBinds: this.gpu.textureBinds / frames,
+        lastDrawCalls: this.lastGpu.drawCalls,
+        lastTextureBinds: this.lastGpu.textureBinds
+      } : null,
+      textures: {
+        count: budget.bytes.size,
+        estimatedMB: budget.totalBytes / (1024 * 1024),
+        budgetMB: budget.budgetBytes / (1024 * 1024),
+        deviceClass: budget.deviceClass
+      },
+      videos: {
+        gameObjects: videos,
+        elements: document.getElementsByTagName('video').length
+      },
+      listeners: {
+        subscriptions: Object.values(listeners).reduce((sum, entry) => sum + entry.subscribed, 0),
+        byEvent: listeners
+      }
+    };
+  }
+}
+
+const RUM_VERSION = 1;
+const RUM_FLUSH_MS = 30000;
+// Upper FPS edges of the histogram buckets; the last bucket is open-ended
+const RUM_FPS_BUCKETS = [10, 20, 30, 45, 55];
+// Frames are attributed to the gameplay scene created most recently
+const RUM_SCENES = ['MainMenu', 'MapScene', 'SectionHunt', 'EggZamRoom'];
+const RUM_MAX_LONG_TASKS = 100; // Durations kept per batch; the count stays exact
+
+/**
+ * Field performance data from real devices. Off unless an endpoint is set
+ * with ?rum=<path> or <meta name="rum-endpoint" content="<path>">; without one
+ * the static helpers below do nothing. The endpoint must be same-origin
+ * (connect-src 'self' covers sendBeacon), so a collector on another host or
+ * port is reached by proxying /rum to it.
+ *
+ * Records load milestones (first time only), an FPS histogram per gameplay
+ * scene and long tasks, batched into one navigator.sendBeacon every
+ * RUM_FLUSH_MS and when the page is hidden. Batches carry a random session
+ * id and the device class, nothing about the player. tools/rum_collector.py
+ * is the matching receiver.
+ */
+class RumBeacon {
+  static install(game, build) {
+    const meta = document.querySelector('meta[name="rum-endpoint"]');
+    const configured = new URLSearchParams(window.location.search).get('rum') || (meta && meta.content);
+    if (!configured || typeof navigator.sendBeacon !== 'function') return null;
+
+    let endpoint;
+    try {
+      endpoint = new URL(configured, window.location.href);
+    } catch (e) {
+      endpoint = null;
+    }
+    if (!endpoint || endpoint.origin !== window.location.origin) {
+      console.warn('RumBeacon: endpoint must be a same-origin path such as /rum, ignoring', configured);
+      return null;
+    }
+    game.rum = new RumBeacon(game, endpoint.href, build);
+    return game.rum;
+  }
+
+  static mark(game, name) {
+    if (game.rum) game.rum.mark(name);
+  }
+
+  // For "first frame of X" milestones: marks once X has actually been drawn
+  static markNextFrame(game, name) {
+    if (game.rum) game.events.once('postrender', () => game.rum.mark(name));
+  }
+
+  constructor(game, endpoint, build) {
+    this.game = game;
+    this.endpoint = endpoint;
+    this.build = build;
+    this.session = Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+    this.seq = 0;
+    this.marked = new Set();
+    this.scene = null;
+    this.timer = null;
+    this.resetBatch();
+
+    game.events.once('ready', () => {
+      RUM_SCENES.forEach(key => {
+        const scene = game.scene.getScene(key);
+        if (scene) scene.sys.events.on('create', () => { this.scene = key; });
+      });
+    });
+    game.events.on('postrender', this.sampleFrame, this);
+
+    if (typeof PerformanceObserver === 'function' && (PerformanceObserver.supportedEntryTypes || []).includes('longtask')) {
+      new PerformanceObserver(list => {
+        list.getEntries().forEach(entry => this.longTask(entry.duration));
+      }).observe({ type: 'longtask', buffered: true });
+    }
+
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush();
+    });
+    window.addEventListener('pagehide', () => this.flush());
+  }
+
+  resetBatch() {
+    this.milestones = {};
+    this.fps = {}; // scene -> counts per RUM_FPS_BUCKETS bucket
+    this.longTasks = { count: 0, totalMs: 0, durations: [] };
+  }
+
+  mark(name) {
+    if (this.marked.has(name)) return;
+    this.marked.add(name);
+    this.milestones[name] = Math.round(performance.now());
+    this.schedule();
+  }
+
+  sampleFrame() {
+    const delta = this.game.loop.delta;
+    if (!this.scene || document.hidden || delta <= 0 || delta > 1000) return;
+
+    const fps = 1000 / delta;
+    let bucket = 0;
+    while (bucket < RUM_FPS_BUCKETS.length && fps >= RUM_FPS_BUCKETS[bucket]) bucket++;
+    let counts = this.fps[this.scene];
+    if (!counts) counts = this.fps[this.scene] = new Array(RUM_FPS_BUCKETS.length + 1).fill(0);
+    counts[bucket]++;
+    this.schedule();
+  }
+
+  longTask(duration) {
+    this.longTasks.count++;
+    this.longTasks.totalMs += duration;
+    if (this.longTasks.durations.length < RUM_MAX_LONG_TASKS) this.longTasks.durations.push(Math.round(duration));
+    this.schedule();
+  }
+
+  schedule() {
+    if (this.timer === null) this.timer = setTimeout(() => this.flush(), RUM_FLUSH_MS);
+  }
+
+  flush() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    if (!Object.keys(this.milestones).length && !Object.keys(this.fps).length && !this.longTasks.count) return;
+
+    const batch = {
+      v: RUM_VERSION,
+      session: this.session,
+      seq: this.seq++,
+      build: this.build,
+      device: {
+        class: TextureBudget.deviceClass(this.game),
+        memory: navigator.deviceMemory || null,
+        cores: navigator.hardwareConcurrency || null,
+        dpr: window.devicePixelRatio || 1,
+        width: screen.width,
+        height: screen.height
+      },
+      quality: this.game.registry.get('qualityTierName') || null,
+      milestones: this.milestones,
+      fpsBuckets: RUM_FPS_BUCKETS,
+      fps: this.fps,
+      longTasks: this.longTasks
+    };
+    this.resetBatch();
+    try {
+      // A string body goes out as text/plain;charset=UTF-8
+      navigator.sendBeacon(this.endpoint, JSON.stringify(batch));
+    } catch (e) {
+      console.warn('RumBeacon: could not send batch', e);
+    }
+  }
+}
+
+
+// ?cursor=native hands the finger to the OS as a CSS cursor (no game-loop cost at all)
+const CURSOR_MODE = new URLSearchParams(window.location.search).get('cursor') === 'native' ? 'native' : 'overlay';
+
+/**
+ * Finger cursor that only does work when the pointer moves or the game resizes,
+ * instead of repositioning and resizing itself every frame.
+ */
+class CursorOverlay {
+  // Returns the finger image for `scene`, or null when the native CSS cursor is in use
+  static attach(scene, depth = 10000) {
+    if (CURSOR_MODE === 'native' && CursorOverlay.useNativeCursor(scene.game)) return null;
+
+    const finger = scene.add.image(scene.input.x, scene.input.y, 'finger-cursor')
+        .setOrigin(0, 0)
+        .setDepth(depth)
+        .setScrollFactor(0);
+
+    const follow = (pointer) => finger.setPosition(pointer.x, pointer.y);
+    const fit = () => {
+        const scale = Math.min(scene.scale.width / 1280, scene.scale.height / 720);
+        finger.setDisplaySize(50 * scale, 75 * scale);
+    };
+    fit();
+
+    Subscriptions.on(scene, scene.input, 'pointermove', follow);
+    Subscriptions.on(scene, scene.scale, 'resize', fit);
+    return finger;
+  }
+
+  // Bakes the finger texture into a small data-URL cursor on the game container
+  static useNativeCursor(game) {
+    if (CursorOverlay.nativeApplied) return true;
+    const parent = game.canvas && game.canvas.parentElement;
+    if (!parent || !game.textures.exists('finger-cursor')) return false;
+
+    const source = game.textures.get('finger-cursor').getSourceImage();
+    const canvas = document.createElement('canvas');
+    canvas.width = 40; // Browsers cap cursor images (128px); keep the finger's 4:5 ratio
+    canvas.height = 50;
+    canvas.getContext('2d').drawImage(source, 0, 0, canvas.width, canvas.height);
+
+    parent.style.setProperty('--finger-cursor', `url(${canvas.toDataURL()}) 0 0, auto`);
+    parent.classList.add('native-cursor');
+    CursorOverlay.nativeApplied = true;
+    return true;
+  }
+}
+
+// Design resolution every scene's coordinates were authored against
+const DESIGN_WIDTH = 1280;
+const DESIGN_HEIGHT = 720;
+
+/**
+ * Anchors a scene's objects to the 1280x720 design space and moves them in
+ * place when the viewport changes, so a resize never restarts the scene.
+ * Resize bursts (drag-resizing, rotation) collapse into one relayout per
+ * animation frame, and only anchors whose inputs changed are touched.
+ *
+ * An anchor is either a custom `apply(object, metrics)` or a set of design
+ * values: x/y, width/height (display size; zones resize their hit area),
+ * scale, fontSize/strokeThickness/wrapWidth for text. `space: 'screen'`
+ * scales from the top-left corner for HUD pieces instead of the letterboxed
+ * stage, which lets them skip offset-only changes.
+ */
+class SceneLayout {
+  constructor(scene) {
+    this.scene = scene;
+    this.anchors = [];
+    this.metrics = this.measure();
+    this.frame = null;
+
+    Subscriptions.on(scene, scene.scale, 'resize', this.requestLayout, this);
+    scene.events.once('shutdown', () => {
+        if (this.frame !== null) cancelAnimationFrame(this.frame);
+        this.frame = null;
+        this.anchors.length = 0;
+    });
+  }
+
+  measure() {
+    const width = this.scene.scale.width;
+    const height = this.scene.scale.height;
+    const scale = Math.min(width / DESIGN_WIDTH, height / DESIGN_HEIGHT);
+    return {
+      width,
+      height,
+      scale,
+      offsetX: (width - DESIGN_WIDTH * scale) / 2,
+      offsetY: (height - DESIGN_HEIGHT * scale) / 2
+    };
+  }
+
+  // Registers `object` and places it against the current metrics
+  add(object, anchor) {
+    this.anchors.push({ object, anchor });
+    this.place(object, anchor, this.metrics);
+    return object;
+  }
+
+  requestLayout() {
+    if (this.frame !== null) return;
+    this.frame = requestAnimationFrame(() => {
+      this.frame = null;
+      this.relayout();
+    });
+  }
+
+  relayout() {
+    const previous = this.metrics;
+    const metrics = this.measure();
+    if (metrics.width === previous.width && metrics.height === previous.height) return;
+    this.metrics = metrics;
+
+    const scaleChanged = metrics.scale !== previous.scale;
+    // Destroyed objects drop out here instead of needing an explicit remove()
+    this.anchors = this.anchors.filter(({ object }) => object.scene);
+    this.anchors.forEach(({ object, anchor }) => {
+      if (anchor.space === 'screen' && !anchor.apply && !scaleChanged) return;
+      this.place(object, anchor, metrics);
+    });
+  }
+
+  place(object, anchor, m) {
+    if (anchor.apply) {
+      anchor.apply(object, m);
+      return;
+    }
+    const originX = anchor.space === 'screen' ? 0 : m.offsetX;
+    const originY = anchor.space === 'screen' ? 0 : m.offsetY;
+
+    if (anchor.x !== undefined) {
+      object.setPosition(originX + anchor.x * m.scale, originY + anchor.y * m.scale);
+    }
+    if (anchor.width !== undefined) {
+      if (object.type === 'Zone') object.setSize(anchor.width * m.scale, anchor.height * m.scale);
+      else object.setDisplaySize(anchor.width * m.scale, anchor.height * m.scale);
+    }
+    if (anchor.scale !== undefined) object.setScale(anchor.scale * m.scale);
+    if (anchor.fontSize !== undefined) {
+      const stroke = anchor.strokeThickness !== undefined ? anchor.strokeThickness * m.scale : undefined;
+      HudText.setSize(object, anchor.fontSize * m.scale, stroke);
+    }
+    if (anchor.wrapWidth !== undefined) object.setWordWrapWidth(anchor.wrapWidth * m.scale, true);
+  }
+}
+
+// Sizes baked by tools/bmfont.py per family; keep in sync with FAMILIES there
+const HUD_FONT_SIZES = { hud: [24, 48, 96], label: [16, 32] };
+
+/**
+ * Counters and tooltip labels drawn from the BMFont atlases baked by
+ * tools/bmfont.py. setText on a BitmapText only rebuilds quads, where a Text
+ * redraws its canvas and re-uploads the texture. Until the atlases exist (or
+ * if they fail to load) the same calls return the old Comic Sans Text.
+ */
+class HudText {
+  static preload(scene) {
+    Object.entries(HUD_FONT_SIZES).forEach(([family, sizes]) => {
+      sizes.forEach(size => {
+        const key = `${family}-${size}`;
+        scene.load.bitmapFont(key, `assets/fonts/${key}.png`, `assets/fonts/${key}.xml`);
+      });
+    });
+  }
+
+  // Smallest loaded atlas at or above `size` (scaling down stays sharp), or null
+  static fontKey(scene, family, size) {
+    const loaded = HUD_FONT_SIZES[family].filter(s => scene.cache.bitmapFont.exists(`${family}-${s}`));
+    if (!loaded.length) return null;
+    return `${family}-${loaded.find(s => s >= size) || loaded[loaded.length - 1]}`;
+  }
+
+  // Black bold counter with a white stroke
+  static add(scene, x, y, text, size, strokeThickness) {
+    const key = HudText.fontKey(scene, 'hud', size);
+    if (key) return scene.add.bitmapText(x, y, key, text, size);
+    return scene.add.text(x, y, text, {
+      fontSize: `${size}px`,
+      fill: '#000',
+      fontStyle: 'bold',
+      fontFamily: 'Comic Sans MS',
+      stroke: '#fff',
+      strokeThickness
+    });
+  }
+
+  // Plain white label for the dark tooltip box
+  static addLabel(scene, x, y, text, size) {
+    const key = HudText.fontKey(scene, 'label', size);
+    if (key) return scene.add.bitmapText(x, y, key, text, size);
+    return scene.add.text(x, y, text, { fontSize: `${size}px`, fontFamily: 'Comic Sans MS', fill: '#ffffff' });
+  }
+
+  // Resizes either kind in place, switching atlas when another baked size fits better
+  static setSize(textObject, size, strokeThickness) {
+    if (textObject.type === 'BitmapText') {
+      const family = textObject.font.split('-')[0];
+      const key = HudText.fontKey(textObject.scene, family, size);
+      if (key && key !== textObject.font) textObject.setFont(key, size);
+      else textObject.setFontSize(size);
+      return textObject;
+    }
+    textObject.setFontSize(`${size}px`);
+    if (strokeThickness !== undefined) textObject.setStroke(textObject.style.stroke, strokeThickness);
+    return textObject;
+  }
+}
+
+/**
+ * Steps the small UI effects (button pops, collection floats) from the scene's
+ * update event instead of allocating a Tween per hover, press or egg. Each
+ * target owns one track that is reset and reused, so starting an effect
+ * allocates nothing. Easing matches the 'Power1' tweens these replace.
+ */
+class UiAnimator {
+  static get(scene) {
+    if (!scene.uiAnimator) scene.uiAnimator = new UiAnimator(scene);
+    return scene.uiAnimator;
+  }
+
+  static isAnimating(target) {
+    return !!(target.uiTrack && target.uiTrack.running);
+  }
+
+  constructor(scene) {
+    this.scene = scene;
+    this.running = [];
+
+    scene.events.on('update', this.step, this);
+    scene.events.once('shutdown', () => {
+        scene.events.off('update', this.step, this);
+        this.running.forEach(track => { track.running = false; });
+        this.running.length = 0;
+        scene.uiAnimator = null;
+    });
+  }
+
+  // Eases the target's scale to (scaleX, scaleY)
+  scaleTo(target, scaleX, scaleY, duration) {
+    const track = this.start(target, duration, null);
+    track.float = false;
+    track.fromX = target.scaleX;
+    track.fromY = target.scaleY;
+    track.toX = scaleX;
+    track.toY = scaleY;
+  }
+
+  // Rises `rise` px while fading out, then hands the target back to `pool`
+  floatOut(target, rise, duration, pool) {
+    const track = this.start(target, duration, pool);
+    track.float = true;
+    track.fromY = target.y;
+    track.toY = target.y - rise;
+    target.setAlpha(1);
+  }
+
+  start(target, duration, pool) {
+    let track = target.uiTrack;
+    if (!track) {
+      track = target.uiTrack = { target, running: false };
+    }
+    track.elapsed = 0;
+    track.duration = duration;
+    track.pool = pool;
+    if (!track.running) {
+      track.running = true;
+      this.running.push(track);
+    }
+    return track;
+  }
+
+  step(time, delta) {
+    for (let i = this.running.length - 1; i >= 0; i--) {
+      const track = this.running[i];
+      const target = track.target;
+      if (!target.scene) {
+        this.finish(i, track);
+        continue;
+      }
+
+      track.elapsed += delta;
+      const t = Math.min(1, track.elapsed / track.duration);
+      const eased = t * (2 - t);
+
+      if (track.float) {
+        target.y = track.fromY + (track.toY - track.fromY) * eased;
+        target.alpha = 1 - eased;
+      } else {
+        target.setScale(
+          track.fromX + (track.toX - track.fromX) * eased,
+          track.fromY + (track.toY - track.fromY) * eased
+        );
+      }
+
+      if (t === 1) {
+        this.finish(i, track);
+        if (track.pool && target.scene) track.pool.release(target);
+      }
+    }
+  }
+
+  finish(index, track) {
+    // Swap-remove keeps the running list packed without splicing
+    this.running[index] = this.running[this.running.length - 1];
+    this.running.pop();
+    track.running = false;
+  }
+}
+
+/**
+ * Recycles short-lived game objects: released objects are hidden and
+ * deactivated instead of destroyed, and handed out again by acquire().
+ */
+class EffectPool {
+  constructor(create) {
+    this.create = create;
+    this.free = [];
+  }
+
+  acquire() {
+    const item = this.free.pop() || this.create();
+    return item.setActive(true).setVisible(true);
+  }
+
+  release(item) {
+    item.setActive(false).setVisible(false);
+    this.free.push(item);
+  }
+}
+
+/**
+ * Phaser-facing wrapper around HuntCore.Hunt (hunt-core.js), the single
+ * source of truth for the hunt. It republishes the registry keys 'eggData',
+ * 'sections' and 'foundEggs' (views over the same records) for older readers
+ * and announces changes.
+ *
+ * Events: 'collect' (record), 'section-complete' (name), 'categorize' (record).
+ */
+class HuntState extends Phaser.Events.EventEmitter {
+  static get(game) {
+    if (!game.huntState) game.huntState = new HuntState(game);
+    return game.huntState;
+  }
+
+  constructor(game) {
+    super();
+    this.registry = game.registry;
+    this.hunt = new HuntCore.Hunt();
+  }
+
+  get seed() {
+    return this.hunt.seed;
+  }
+
+  // Indexes freshly generated records (see MainMenu.create) and publishes the views
+  load(sections, eggData, seed) {
+    this.hunt.load(sections, eggData, seed);
+    this.registry.set('sections', sections);
+    this.registry.set('eggData', eggData);
+    this.registry.set('foundEggs', this.hunt.found);
+  }
+
+  // Silently re-applies saved progress; events are for live play only
+  restore(foundIds, categorizedIds) {
+    this.hunt.restore(foundIds, categorizedIds);
+    this.registry.set('foundEggs', this.hunt.found);
+  }
+
+  get foundCount() {
+    return this.hunt.foundCount;
+  }
+
+  egg(eggId) {
+    return this.hunt.egg(eggId);
+  }
+
+  isCollected(eggId) {
+    return this.hunt.isCollected(eggId);
+  }
+
+  eggsIn(sectionName) {
+    return this.hunt.eggsIn(sectionName);
+  }
+
+  remaining(sectionName) {
+    return this.hunt.remaining(sectionName);
+  }
+
+  isSectionComplete(sectionName) {
+    return this.hunt.isSectionComplete(sectionName);
+  }
+
+  tally(category) {
+    return this.hunt.tally(category);
+  }
+
+  // Marks `eggId` found; returns false if it is unknown or already collected
+  collect(eggId) {
+    const record = this.hunt.collect(eggId);
+    if (!record) return false;
+
+    this.registry.set('foundEggs', this.hunt.found);
+    this.emit('collect', record);
+    if (this.hunt.isSectionComplete(record.section)) this.emit('section-complete', record.section);
+    return true;
+  }
+
+  categorize(eggId) {
+    const record = this.hunt.categorize(eggId);
+    if (!record) return false;
+
+    this.emit('categorize', record);
+    return true;
+  }
+
+  randomUncategorized() {
+    return this.hunt.randomUncategorized();
+  }
+}
+
+const SAVE_KEY = 'huntSave';
+const SAVE_VERSION = 2;
+const SAVE_THROTTLE_MS = 1000;
+
+/**
+ * Persists hunt progress as one small versioned localStorage record: the
+ * layout seed (MainMenu regenerates the same eggs from it), found and
+ * categorized flags as base64 bitsets indexed by eggId - 1, stamped sections
+ * as a bitset over the section list, and the two counters. Writes are
+ * throttled to one per SAVE_THROTTLE_MS and flushed when the page is hidden.
+ */
+class HuntSave {
+  static get(game) {
+    if (!game.huntSave) game.huntSave = new HuntSave(game);
+    return game.huntSave;
+  }
+
+  // The saved record, or null when missing, unreadable or from another format/egg count
+  static read() {
+    try {
+      const save = JSON.parse(localStorage.getItem(SAVE_KEY));
+      if (save && save.v === SAVE_VERSION && save.total === TOTAL_EGGS && typeof save.seed === 'string') return save;
+    } catch (e) {
+      console.warn('HuntSave: ignoring unreadable save', e);
+    }
+    return null;
+  }
+
+  static packBits(count, isSet) {
+    const bytes = new Uint8Array(Math.ceil(count / 8));
+    for (let i = 0; i < count; i++) {
+      if (isSet(i)) bytes[i >> 3] |= 1 << (i & 7);
+    }
+    let binary = '';
+    bytes.forEach(byte => { binary += String.fromCharCode(byte); });
+    return btoa(binary);
+  }
+
+  // Indices of the set bits
+  static unpackBits(packed, count) {
+    const indices = [];
+    const binary = atob(packed || '');
+    for (let i = 0; i < count && (i >> 3) < binary.length; i++) {
+      if (binary.charCodeAt(i >> 3) & (1 << (i & 7))) indices.push(i);
+    }
+    return indices;
+  }
+
+  constructor(game) {
+    this.registry = game.registry;
+    this.huntState = HuntState.get(game);
+    this.timer = null;
+    this.disabled = false;
+
+    const schedule = () => this.schedule();
+    this.huntState.on('collect', schedule);
+    this.huntState.on('categorize', schedule);
+    this.registry.events.on('changedata', (parent, key) => {
+      if (key === 'stampedSections' || key === 'correctCategorizations' || key === 'currentScore') schedule();
+    });
+
+    // Last chance to write before a reload, tab switch or the OS killing the page
+    const flushIfPending = () => {
+      if (this.timer !== null) this.flush();
+    };
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') flushIfPending();
+    });
+    window.addEventListener('pagehide', flushIfPending);
+  }
+
+  // Puts a saved record back into the freshly regenerated HuntState and registry
+  restore(save) {
+    const sections = this.registry.get('sections') || [];
+    this.huntState.restore(
+      HuntSave.unpackBits(save.found, TOTAL_EGGS).map(i => i + 1),
+      HuntSave.unpackBits(save.categorized, TOTAL_EGGS).map(i => i + 1)
+    );
+    this.registry.set('stampedSections', HuntSave.unpackBits(save.stamped, sections.length).map(i => sections[i].name));
+    this.registry.set('correctCategorizations', save.correct || 0);
+    if (save.score !== undefined) this.registry.set('currentScore', save.score);
+  }
+
+  schedule() {
+    if (this.disabled || this.timer !== null) return;
+    this.timer = setTimeout(() => this.flush(), SAVE_THROTTLE_MS);
+  }
+
+  flush() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    if (this.disabled || !this.huntState.seed) return;
+
+    const state = this.huntState;
+    const sections = this.registry.get('sections') || [];
+    const stamped = this.registry.get('stampedSections') || [];
+    const save = {
+      v: SAVE_VERSION,
+      total: TOTAL_EGGS,
+      seed: state.seed,
+      found: HuntSave.packBits(TOTAL_EGGS, i => state.isCollected(i + 1)),
+      categorized: HuntSave.packBits(TOTAL_EGGS, i => { const egg = state.egg(i + 1); return !!(egg && egg.categorized); }),
+      stamped: HuntSave.packBits(sections.length, i => stamped.includes(sections[i].name)),
+      correct: this.registry.get('correctCategorizations') || 0
+    };
+    if (this.registry.has('currentScore')) save.score = this.registry.get('currentScore');
+
+    try {
+      localStorage.setItem(SAVE_KEY, JSON.stringify(save));
+    } catch (e) {
+      console.warn('HuntSave: could not write save', e);
+    }
+  }
+
+  // Forgets the hunt for PLAY AGAIN; nothing is written again before the reload
+  clear() {
+    this.disabled = true;
+    clearTimeout(this.timer);
+    this.timer = null;
+    try {
+      localStorage.removeItem(SAVE_KEY);
+    } catch (e) {
+      console.warn('HuntSave: could not clear save', e);
+    }
+  }
+}
+
+const VOLUME_KEYS = ['musicVolume', 'ambientVolume', 'sfxVolume'];
+const SETTINGS_PERSIST_MS = 500;
+
+/**
+ * Owns the volume settings. Sliders call set() as often as they like; only the
+ * latest value per key is kept and published to the registry once per
+ * animation frame, so the audio/video changedata listeners run at most once a
+ * frame. Storage is written after SETTINGS_PERSIST_MS without changes, or
+ * straight away when the page is hidden.
+ */
+class Settings {
+  static get(game) {
+    if (!game.settings) game.settings = new Settings(game);
+    return game.settings;
+  }
+
+  static readStored(key, fallback = 0.5) {
+    try {
+      const stored = localStorage.getItem(key);
+      if (stored !== null && !isNaN(parseFloat(stored))) return parseFloat(stored);
+    } catch (e) {
+      console.warn('Settings: could not read', key, e);
+    }
+    return fallback;
+  }
+
+  constructor(game) {
+    this.registry = game.registry;
+    this.pending = new Map(); // key -> latest value not yet published
+    this.dirty = new Set(); // published keys not yet in storage
+    this.frame = null;
+    this.timer = null;
+
+    VOLUME_KEYS.forEach(key => {
+      if (!this.registry.has(key)) this.registry.set(key, Settings.readStored(key));
+    });
+
+    const persistIfDirty = () => {
+      this.apply();
+      if (this.dirty.size) this.persist();
+    };
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') persistIfDirty();
+    });
+    window.addEventListener('pagehide', persistIfDirty);
+  }
+
+  get(key) {
+    return this.pending.has(key) ? this.pending.get(key) : this.registry.get(key);
+  }
+
+  set(key, value) {
+    this.pending.set(key, value);
+    if (this.frame === null) this.frame = requestAnimationFrame(() => this.apply());
+  }
+
+  // Publishes the pending values; listeners see one changedata per key
+  apply() {
+    if (this.frame !== null) cancelAnimationFrame(this.frame);
+    this.frame = null;
+    if (!this.pending.size) return;
+
+    this.pending.forEach((value, key) => {
+      if (this.registry.get(key) === value) return;
+      this.registry.set(key, value);
+      this.dirty.add(key);
+    });
+    this.pending.clear();
+
+    if (this.dirty.size) {
+      clearTimeout(this.timer);
+      this.timer = setTimeout(() => this.persist(), SETTINGS_PERSIST_MS);
+    }
+  }
+
+  persist() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    this.dirty.forEach(key => {
+      try {
+        localStorage.setItem(key, this.registry.get(key));
+      } catch (e) {
+        console.warn('Settings: could not write', key, e);
+      }
+    });
+    this.dirty.clear();
+  }
+}
+
+function getViewportDimensions() {
+  const isMobile = /iPhone|iPad|iPod|Android/i.test(navigator.userAgent);
+  let width, height;
+  if (isMobile) {
+    width = screen.width;
+    height = screen.height;
+    if (width < height) {
+      [width, height] = [height, width];
+    }
+  } else {
+    width = window.innerWidth;
+    height = document.documentElement.clientHeight;
+  }
+  return { width, height };
+}
+
+const { width, height } = getViewportDimensions();
+const config = {
+  type: Phaser.AUTO,
+  width: width,
+  height: height,
+  scale: {
+    mode: Phaser.Scale.FIT,
+    autoCenter: Phaser.Scale.CENTER_BOTH,
+    parent: 'game-container',
+  },
+  scene: [MainMenu, MapScene, SectionHunt, EggZamRoom, MusicScene, UIScene],
+  backgroundColor: '#000000',
+};
+
+const game = new Phaser.Game(config);
+window.game = game; // Expose for debugging/verification
+PerfProbe.install(game); // window.__perf; inert until enabled
+RumBeacon.install(game, 'mobile'); // Field metrics, only when an endpoint is configured
+
+
+/**
+ * Parses a scripture string (e.g., "John 3:16" or "1 Peter 2:4") into a URL.
+ */
+function parseScriptureLink(scriptureText) {
+    if (!scriptureText) return null;
+
+    // Basic mapping of common book names to 3-letter codes used in the target URL
+    const bookMap = {
+        "genesis": "GEN", "exodus": "EXO", "leviticus": "LEV", "numbers": "NUM", "deuteronomy": "DEU",
+        "joshua": "JOS", "judges": "JDG", "ruth": "RUT", "1 samuel": "1SA", "2 samuel": "2SA",
+        "1 kings": "1KI", "2 kings": "2KI", "1 chronicles": "1CH", "2 chronicles": "2CH",
+        "ezra": "EZR", "nehemiah": "NEH", "esther": "EST", "job": "JOB", "psalms": "PSA", "psalm": "PSA",
+        "proverbs": "PRO", "ecclesiastes": "ECC", "song of solomon": "SNG", "isaiah": "ISA",
+        "jeremiah": "JER", "lamentations": "LAM", "ezekiel": "EZK", "daniel": "DAN", "hosea": "HOS",
+        "joel": "JOL", "amos": "AMO", "obadiah": "OBA", "jonah": "JON", "micah": "MIC",
+        "nahum": "NAM", "habakkuk": "HAB", "zephaniah": "ZEP", "haggai": "HAG", "zechariah": "ZEC",
+        "malachi": "MAL", "matthew": "MAT", "mark": "MRK", "luke": "LUK", "john": "JHN",
+        "acts": "ACT", "romans": "ROM", "1 corinthians": "1CO", "2 corinthians": "2CO",
+        "galatians": "GAL", "ephesians": "EPH", "philippians": "PHP", "colossians": "COL",
+        "1 thessalonians": "1TH", "2 thessalonians": "2TH", "1 timothy": "1TI", "2 timothy": "2TI",
+        "titus": "TIT", "philemon": "PHM", "hebrews": "HEB", "james": "JAS", "1 peter": "1PE",
+        "2 peter": "2PE", "1 john": "1JN", "2 john": "2JN", "3 john": "3JN", "jude": "JUD",
+        "revelation": "REV"
+    };
+
+    // Regex to extract Book, Chapter, and Verse. Handles "1 Peter 2:4-5" or "John 3:16"
+    const match = scriptureText.match(/^(\d?\s*[A-Za-z\s]+)\s+(\d+):(\d+)/);
+    if (match) {
+        const rawBook = match[1].trim().toLowerCase();
+        const chapter = match[2];
+        const verse = match[3];
+        const bookCode = bookMap[rawBook];
+
+        if (bookCode) {
+            return `https://mt-sin.ai/365DBR/bible.html?book=${bookCode}&chapter=${chapter}&verse=${verse}`;
+        }
+    }
+    return null;
+}
+
+/**
+ * Bakes a map thumbnail card (drop shadow, brown-bordered white card and the
+ * rounded section image) into one canvas texture at its on-screen pixel size,
+ * then applies it to `image`. MapScene then draws a plain sprite per section
+ * instead of two Graphics plus a geometry mask. Re-baking at an unchanged pixel
+ * size only re-applies the texture.
+ * @param {Phaser.GameObjects.Image} image - The thumbnail image inside the section container.
+ * @param {Object} section - Map section entry with `name` and `coords`.
+ * @param {number} scale - Map units to screen pixels (the container's scale).
+ */
+function bakeMapThumbnail(image, section, scale) {
+  const textures = image.scene.textures;
+  const { width: w, height: h } = section.coords;
+  const pad = 7; // Border (5px + half the 4px stroke) and the 4px shadow offset fit in this margin
+  const radius = 15;
+  const key = `${section.name}-thumb-baked`;
+  const pixelW = Math.max(1, Math.round((w + pad * 2) * scale));
+  const pixelH = Math.max(1, Math.round((h + pad * 2) * scale));
+
+  let texture = textures.exists(key) ? textures.get(key) : null;
+  if (!texture || texture.width !== pixelW || texture.height !== pixelH) {
+    if (texture) texture.setSize(pixelW, pixelH);
+    else texture = textures.createCanvas(key, pixelW, pixelH);
+
+    const ctx = texture.getContext();
+    ctx.setTransform(1, 0, 0, 1, 0, 0);
+    ctx.clearRect(0, 0, pixelW, pixelH);
+    // Draw in map units around the card centre, exactly like the old Graphics did
+    ctx.setTransform(pixelW / (w + pad * 2), 0, 0, pixelH / (h + pad * 2), pixelW / 2, pixelH / 2);
+
+    traceRoundedRect(ctx, -w / 2 + 4, -h / 2 + 4, w, h, radius);
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.6)';
+    ctx.fill();
+
+    traceRoundedRect(ctx, -w / 2 - 5, -h / 2 - 5, w + 10, h + 10, radius + 2);
+    ctx.fillStyle = '#ffffff';
+    ctx.fill();
+    ctx.lineWidth = 4;
+    ctx.strokeStyle = '#8b4513';
+    ctx.stroke();
+
+    const thumbKey = `${section.name}-thumb`;
+    if (textures.exists(thumbKey)) {
+      ctx.save();
+      traceRoundedRect(ctx, -w / 2, -h / 2, w, h, radius);
+      ctx.clip();
+      ctx.drawImage(textures.get(thumbKey).getSourceImage(), -w / 2, -h / 2, w, h);
+      ctx.restore();
+    }
+    texture.refresh();
+  }
+
+  image.setTexture(key);
+  image.setDisplaySize(w + pad * 2, h + pad * 2);
+}
+
+/**
+ * Adds a rounded-rectangle path to a 2D context (CanvasRenderingContext2D.roundRect
+ * is missing on older Safari).
+ */
+function traceRoundedRect(ctx, x, y, width, height, radius) {
+  ctx.beginPath();
+  ctx.moveTo(x + radius, y);
+  ctx.arcTo(x + width, y, x + width, y + height, radius);
+  ctx.arcTo(x + width, y + height, x, y + height, radius);
+  ctx.arcTo(x, y + height, x, y, radius);
+  ctx.arcTo(x, y, x + width, y, radius);
+  ctx.closePath();
+}
+
+/**
+ * Starts the level-complete stamp for a newly finished section. Uses the baked
+ * sprite-sheet animation (tools/stamp_sheet.py) when MapScene loaded it, so
+ * completed sections never spin up video decoders; otherwise falls back to the
+ * MULTIPLY blended stamp video. The sheet is released once the last stamp has
+ * played (or the scene shuts down), so it only holds GPU memory while in use.
+ * @param {Phaser.Scene} scene - The MapScene.
+ * @param {number} x - Stamp x position.
+ * @param {number} y - Stamp y position.
+ * @param {Function} onComplete - Called once the stamp finishes playing.
+ * @returns {Phaser.GameObjects.Sprite|Phaser.GameObjects.Video} The playing stamp.
+ */
+function playLevelCompleteStamp(scene, x, y, onComplete) {
+  const sfxVol = scene.registry.get('sfxVolume') !== undefined ? scene.registry.get('sfxVolume') : 0.5;
+
+  if (scene.textures.exists('level-complete-sheet')) {
+    if (!scene.anims.exists('level-complete-stamp-anim')) {
+      const meta = scene.textures.get('level-complete-sheet').customData.meta;
+      const frameMs = 1000 / meta.frameRate;
+      scene.anims.create({
+        key: 'level-complete-stamp-anim',
+        // Held frames were collapsed when baking; duration is the time added to frameMs
+        frames: meta.durations.map((duration, index) => ({
+          key: 'level-complete-sheet',
+          frame: `stamp-${String(index).padStart(3, '0')}`,
+          duration: duration - frameMs
+        })),
+        frameRate: meta.frameRate,
+        repeat: 0
+      });
+      scene.events.once('shutdown', () => releaseLevelCompleteSheet(scene));
+    }
+    scene.levelCompleteStamps = (scene.levelCompleteStamps || 0) + 1;
+    const stamp = scene.add.sprite(x, y, 'level-complete-sheet');
+    stamp.once('animationcomplete', () => {
+      onComplete();
+      scene.levelCompleteStamps--;
+      if (scene.levelCompleteStamps === 0) releaseLevelCompleteSheet(scene);
+    });
+    stamp.play('level-complete-stamp-anim');
+    if (scene.cache.audio.exists('level-complete-sfx')) {
+      scene.sound.play('level-complete-sfx', { volume: sfxVol });
+    }
+    return stamp;
+  }
+
+  const stampVideo = scene.add.video(x, y, 'level-complete');
+  stampVideo.setBlendMode(Phaser.BlendModes.MULTIPLY);
+  stampVideo.setVolume(sfxVol);
+  stampVideo.once('complete', onComplete);
+  stampVideo.play();
+  return stampVideo;
+}
+
+/**
+ * Drops the stamp animation and its sheet from the GPU; MapScene reloads the
+ * sheet the next time a section is completed.
+ * @param {Phaser.Scene} scene - The MapScene.
+ */
+function releaseLevelCompleteSheet(scene) {
+  scene.levelCompleteStamps = 0;
+  if (scene.anims.exists('level-complete-stamp-anim')) scene.anims.remove('level-complete-stamp-anim');
+  if (scene.textures.exists('level-complete-sheet')) scene.textures.remove('level-complete-sheet');
+}
+
+/**
+ * Texture key for an egg id. Ids past the shipped art (stress mode) wrap around.
+ * @param {number} eggId - 1-based egg id.
+ * @returns {string} The texture key, e.g. 'egg-7'.
+ */
+function eggTextureKey(eggId) {
+  return `egg-${((eggId - 1) % EGG_TEXTURE_COUNT) + 1}`;
+}
+
+/**
+ * Adds a "press" animation to a game object on touch.
+ * @param {Phaser.Scene} scene - The scene the object belongs to.
+ * @param {Phaser.GameObjects.GameObject} button - The game object to animate.
+ * @param {string} [soundKey='success'] - The key of the sound to play on click.
+ */
+function addButtonInteraction(scene, button, soundKey = 'success') {
+  const animator = UiAnimator.get(scene);
+
+  button.on('pointerdown', () => {
+    // Try to play sound via MusicScene if available to ensure persistence
+    const musicScene = scene.scene.get('MusicScene');
+    if (musicScene && musicScene.scene.isActive()) {
+        musicScene.playSFX(soundKey);
+    } else if (soundKey && scene.sound.get(soundKey)) {
+        scene.sound.play(soundKey, { volume: 0.5 });
+    }
+
+    if (button.baseScaleX === undefined || !(UiAnimator.isAnimating(button) || scene.tweens.isTweening(button))) {
+        // Capture ONLY if not animating to avoid capturing a shrunken/grown state
+        button.baseScaleX = button.scaleX;
+        button.baseScaleY = button.scaleY;
+    }
+
+    scene.tweens.killTweensOf(button);
+    animator.scaleTo(button, button.baseScaleX * 0.9, button.baseScaleY * 0.9, 50);
+  });
+
+  const restore = () => {
+    if (button.baseScaleX !== undefined && button.baseScaleY !== undefined) {
+      scene.tweens.killTweensOf(button);
+      animator.scaleTo(button, button.baseScaleX, button.baseScaleY, 100);
+    }
+  };
+
+  button.on('pointerup', restore);
+  button.on('pointerout', restore);
+}
+
+let resizeFrame = null;
+let lastResize = null;
+
+/**
+ * Coalesces resize and orientationchange bursts (a rotation fires several of
+ * each) into a single resizeGame() on the next animation frame.
+ */
+function scheduleResize() {
+  if (resizeFrame !== null) return;
+  resizeFrame = requestAnimationFrame(() => {
+    resizeFrame = null;
+    resizeGame();
+  });
+}
+
+function resizeGame() {
+  const { width, height } = getViewportDimensions();
+  if (lastResize && lastResize.width === width && lastResize.height === height) return;
+  lastResize = { width, height };
   game.scale.resize(width, height);
   const canvas = game.canvas;
   canvas.style.width = '100%';
@@ -2343,220 +4134,21 @@ function resizeGame() {
         }
       }
     }
-    if (scene.scene.key === 'MapScene') {
-      if (scene.mapImage) {
-        const nativeW = scene.mapImage.width || 1376;
-        const nativeH = scene.mapImage.height || 768;
-        const mapScale = Math.max(width / nativeW, height / nativeH);
-        scene.mapImage.setPosition(width/2, height/2);
-        scene.mapImage.setScale(mapScale);
-      }
-      if (scene.mapSections) {
-        scene.mapSections.forEach(section => {
-          if (section.zone) {
-            const centerX = section.coords.x;
-            const centerY = section.coords.y;
-
-            const nativeW = scene.mapImage ? (scene.mapImage.width || 1376) : 1376;
-            const nativeH = scene.mapImage ? (scene.mapImage.height || 768) : 768;
-            const mapScale = Math.max(width / nativeW, height / nativeH);
-
-            const mapWidth = nativeW * mapScale;
-            const mapHeight = nativeH * mapScale;
-            const offsetX = (width - mapWidth) / 2;
-            const offsetY = (height - mapHeight) / 2;
-
-            const thumbX = offsetX + centerX * mapScale;
-            const thumbY = offsetY + centerY * mapScale;
-
-            section.zone.setPosition(thumbX, thumbY);
-
-            const targetW = section.coords.width * mapScale;
-            const thumbScale = targetW / section.coords.width;
-            section.zone.setScale(thumbScale);
-
-            if (section.zone.maskGraphics) {
-                section.zone.maskGraphics.setPosition(thumbX, thumbY);
-                section.zone.maskGraphics.setScale(thumbScale);
-            }
-
-            section.zone.baseScaleX = section.zone.scaleX;
-            section.zone.baseScaleY = section.zone.scaleY;
-          }
-        });
-
-        if (scene.stamps) {
-            scene.stamps.forEach(item => {
-                if (item.video && item.video.active && item.thumb && item.thumb.active) {
-                    // Only apply the 40px upward offset to the stampVideo (Phaser.Video), not the final stampImg
-                    const isVideo = item.video.type === 'Video';
-                    const offsetY = isVideo ? -40 * item.thumb.scaleY : 0;
-                    item.video.setPosition(item.thumb.x, item.thumb.y + offsetY);
-
-                    // Cover thumbnail height + 25%, maintaining intrinsic stamp ratio
-                  const intrinsicHeight = item.video.height || 720;
-                  const targetHeight = (item.thumb.height * item.thumb.scaleY) * 1.25;
-                  item.video.setScale(targetHeight / intrinsicHeight);
-                }
-            });
-        }
-      }
-      if (scene.eggsAmminHaul) {
-        scene.eggsAmminHaul.setPosition(0, 200 * scale);
-        scene.eggsAmminHaul.setDisplaySize(137 * scale, 150 * scale);
-      }
-      if (scene.scoreImage) {
-        scene.scoreImage.setDisplaySize(200 * scale, 200 * scale);
-      }
-      if (scene.scoreText) {
-        const isDesktop = scene.sys.game.device.os.desktop;
-        const scoreY = isDesktop ? 125 * scale : 117 * scale;
-        scene.scoreText.setPosition(100 * scale, scoreY);
-        scene.scoreText.setStyle({
-          fontSize: `${(isDesktop ? 32 : 42) * scale}px`,
-          strokeThickness: 6 * scale
-        });
-        const foundEggsCount = scene.registry.get('foundEggs').length;
-        scene.scoreText.setText(`${foundEggsCount}/${TOTAL_EGGS}`);
-      }
-      if (scene.fingerCursor) {
-        scene.fingerCursor.setDisplaySize(50 * scale, 75 * scale);
-      }
-    }
-    if (scene.scene.key === 'SectionHunt') {
-      if (scene.sectionImage) {
-        scene.sectionImage.setDisplaySize(width, height);
-      }
-      if (scene.eggs) {
-        scene.eggs.getChildren().forEach(egg => {
-          if (egg && egg.active) {
-            egg.setDisplaySize(50 * scale, 75 * scale);
-            if (egg.symbolSprite) {
-              egg.symbolSprite.setDisplaySize(50 * scale, 75 * scale);
-            }
-          }
-        });
-      }
-      if (scene.eggZitButton) {
-        scene.eggZitButton.setPosition(0, 200 * scale);
-        scene.eggZitButton.setDisplaySize(150 * scale, 150 * scale);
-      }
-      if (scene.eggsAmminHaul) {
-        scene.eggsAmminHaul.setPosition(0, 350 * scale);
-        scene.eggsAmminHaul.setDisplaySize(137 * scale, 150 * scale);
-      }
-      if (scene.scoreImage) {
-        scene.scoreImage.setDisplaySize(200 * scale, 200 * scale);
-      }
-      if (scene.scoreText) {
-        const isDesktop = scene.sys.game.device.os.desktop;
-        const scoreY = isDesktop ? 125 * scale : 117 * scale;
-        scene.scoreText.setPosition(100 * scale, scoreY);
-        scene.scoreText.setStyle({
-          fontSize: `${(isDesktop ? 32 : 42) * scale}px`,
-          strokeThickness: 6 * scale
-        });
-        const foundEggsCount = scene.registry.get('foundEggs').length;
-        scene.scoreText.setText(`${foundEggsCount}/${TOTAL_EGGS}`);
-      }
-      if (scene.zoomedView) {
-        // Position set in update
-        const diameter = 150 * scale;
-        scene.zoomedView.setSize(diameter, diameter);
-      }
-      if (scene.maskGraphics) {
-        scene.maskGraphics.clear();
-        scene.maskGraphics.fillCircle(0, 0, 75 * scale);
-      }
-      if (scene.magnifyingGlass) {
-        scene.magnifyingGlass.setDisplaySize(150 * scale, 187.5 * scale);
-        scene.magnifyingGlass.setPosition(scene.input.x, scene.input.y);
-      }
-    }
     if (scene.scene.key === 'UIScene') {
       scene.resize({ width, height });
     }
-    if (scene.scene.key === 'EggZamRoom') {
-      const isDesktop = scene.sys.game.device.os.desktop;
-      const assetScale = isDesktop ? scale : scale * 1.75;
-
-      if (scene.background) scene.background.setDisplaySize(width, height);
-      if (scene.examiner) {
-        const tanBoxCenterX = (640 / 1280) * width;
-        const examinerWidth = 400 * assetScale;
-        const examinerHeight = 500 * assetScale;
-        const examinerX = tanBoxCenterX - (examinerWidth / 2);
-        const floorY = isDesktop ? ((740 / 720) * height) : height + (100 * assetScale);
-        const examinerY = floorY - examinerHeight;
-        scene.examiner.setPosition(examinerX, examinerY);
-        scene.examiner.setDisplaySize(examinerWidth, examinerHeight);
-      }
-      if (scene.symbolResultDiag) {
-        scene.symbolResultDiag.setPosition(0.55 * width, 0.05 * height);
-        scene.symbolResultDiag.setDisplaySize(900 * scale, 600 * scale);
-      }
-      if (scene.eggZitButton) {
-        scene.eggZitButton.setPosition(0, 200 * scale);
-        scene.eggZitButton.setDisplaySize(150 * scale, 131 * scale);
-      }
-      if (scene.scoreImage) {
-        scene.scoreImage.setDisplaySize(200 * scale, 200 * scale);
-      }
-      if (scene.scoreText) {
-        const foundEggsCount = scene.registry.get('foundEggs').length;
-        scene.scoreText.setText(`${foundEggsCount}/${TOTAL_EGGS}`);
-        const scoreY = isDesktop ? 125 * scale : 117 * scale;
-        scene.scoreText.setPosition(100 * scale, scoreY);
-        scene.scoreText.setStyle({ fontSize: `${(isDesktop ? 32 : 54) * scale}px`, strokeThickness: (isDesktop ? 6 : 8) * scale });
-      }
-      if (scene.correctText) {
-        const correctY = isDesktop ? 150 * scale : 146 * scale;
-        scene.correctText.setPosition(100 * scale, correctY);
-        scene.correctText.setStyle({ fontSize: `${(isDesktop ? 24 : 42) * scale}px`, strokeThickness: (isDesktop ? 6 : 8) * scale });
-      }
-      if (scene.leftBottleZone) {
-        const examinerX = (640 / 1280) * width - (400 * assetScale / 2);
-        const floorY = isDesktop ? ((740 / 720) * height) : height + (50 * assetScale);
-        const examinerY = floorY - (500 * assetScale);
-        scene.leftBottleZone.setPosition(examinerX, examinerY + (100 * assetScale));
-        scene.leftBottleZone.setSize(200 * assetScale, 400 * assetScale);
-      }
-      if (scene.rightBottleZone) {
-        const examinerX = (640 / 1280) * width - (400 * assetScale / 2);
-        const floorY = isDesktop ? ((740 / 720) * height) : height + (50 * assetScale);
-        const examinerY = floorY - (500 * assetScale);
-        scene.rightBottleZone.setPosition(examinerX + (200 * assetScale), examinerY + (100 * assetScale));
-        scene.rightBottleZone.setSize(200 * assetScale, 400 * assetScale);
-      }
-      if (scene.displayedEggImage) {
-        const windowCenterX = 196 * assetScale;
-        const windowBottomY = 190 * assetScale;
-        const eggHeight = 125 * assetScale;
-        scene.displayedEggImage.setPosition(scene.examiner.x + windowCenterX, scene.examiner.y + windowBottomY - (eggHeight / 2));
-        scene.displayedEggImage.setDisplaySize(100 * assetScale, 125 * assetScale);
-      }
-      if (scene.displayedSymbolImage) {
-        const windowCenterX = 196 * assetScale;
-        const windowBottomY = 190 * assetScale;
-        const symbolHeight = 125 * assetScale;
-        scene.displayedSymbolImage.setPosition(scene.examiner.x + windowCenterX, scene.examiner.y + windowBottomY - (symbolHeight / 2));
-        scene.displayedSymbolImage.setDisplaySize(100 * assetScale, 125 * assetScale);
-      }
-      if (scene.noEggsText) {
-        const isDesktop = scene.sys.game.device.os.desktop;
-        const textY = isDesktop ? 0.25 * height : 0.15 * height;
-        scene.noEggsText.setPosition(0.36 * width, textY);
-        scene.noEggsText.setStyle({ fontSize: `${(isDesktop ? 28 : 40) * scale}px`, strokeThickness: 3 * scale, wordWrap: { width: 480 * scale, useAdvancedWrap: true } });
-      }
-      if (scene.fingerCursor) scene.fingerCursor.setDisplaySize(50 * scale, 75 * scale);
+    if (scene.layout) {
+      // MapScene, SectionHunt and EggZamRoom move their anchored objects in place;
+      // only the ones whose inputs changed are touched
+      scene.layout.relayout();
     }
   });
 }
 
 game.events.on('ready', () => {
   resizeGame();
-  window.addEventListener('resize', resizeGame);
-  window.addEventListener('orientationchange', resizeGame);
+  window.addEventListener('resize', scheduleResize);
+  window.addEventListener('orientationchange', scheduleResize);
 });
 
 // Auto-focus the game container for screen readers and keyboard accessibility
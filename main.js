@@ -1,42 +1,16 @@
 // Define all scene classes first
-const TOTAL_EGGS = 60;
-
-class CursorScene extends Phaser.Scene {
-  constructor() {
-    super({ key: 'CursorScene', active: false });
-  }
-
-  create() {
-    // If not loaded yet (e.g. boot), wait?
-    // Assets are loaded in MainMenu. CursorScene starts active but MainMenu preloads.
-    // If MainMenu hasn't loaded 'finger-cursor', this will fail.
-    // Better to launch CursorScene FROM MainMenu after preload.
-    this.fingerCursor = this.add.image(0, 0, 'finger-cursor')
-        .setOrigin(0, 0)
-        .setDepth(10000); // Always on top
-  }
-
-  update() {
-    const pointer = this.input.activePointer;
-    if (this.fingerCursor) {
-        this.fingerCursor.setPosition(pointer.x, pointer.y);
-        // Ensure size is maintained (scale with window?)
-        // Simple fixed size or ratio
-        const scale = Math.min(this.scale.width / 1280, this.scale.height / 720);
-        this.fingerCursor.setDisplaySize(50 * scale, 75 * scale);
-
-        // Hide system cursor explicitly here just in case
-        this.input.setDefaultCursor('none');
-    }
-  }
-}
+// Distinct egg art on disk; stress hunts reuse it cyclically
+const EGG_TEXTURE_COUNT = 60;
+// ?stress=N lifts the egg count to benchmark dense hunts (capped to keep layout sane)
+const STRESS_EGGS = parseInt(new URLSearchParams(window.location.search).get('stress'), 10);
+const TOTAL_EGGS = STRESS_EGGS > 0 ? Math.min(STRESS_EGGS, 5000) : EGG_TEXTURE_COUNT;
 
 class MusicScene extends Phaser.Scene {
   constructor() {
     super({ key: 'MusicScene' });
-    this.musicVolume = localStorage.getItem('musicVolume') !== null ? parseFloat(localStorage.getItem('musicVolume')) : 0.5;
-    this.ambientVolume = localStorage.getItem('ambientVolume') !== null ? parseFloat(localStorage.getItem('ambientVolume')) : 0.5;
-    this.sfxVolume = localStorage.getItem('sfxVolume') !== null ? parseFloat(localStorage.getItem('sfxVolume')) : 0.5;
+    this.musicVolume = 0.5;
+    this.ambientVolume = 0.5;
+    this.sfxVolume = 0.5;
   }
 
   create() {
@@ -56,7 +30,7 @@ class MusicScene extends Phaser.Scene {
     this.scheduleAmbientSound();
 
     // Listen for volume changes via Registry
-    this.registry.events.on('changedata', (parent, key, data) => {
+    Subscriptions.on(this, this.registry.events, 'changedata', (parent, key, data) => {
       if (key === 'musicVolume') {
         this.musicVolume = data;
         const bgMusic = this.sound.get('background-music');
@@ -68,17 +42,11 @@ class MusicScene extends Phaser.Scene {
       }
     });
 
-    // Initialize from registry if available
+    // Initialize from registry (Settings seeds it from storage and persists changes, debounced)
+    Settings.get(this.game);
     if (this.registry.has('musicVolume')) this.musicVolume = this.registry.get('musicVolume');
     if (this.registry.has('ambientVolume')) this.ambientVolume = this.registry.get('ambientVolume');
     if (this.registry.has('sfxVolume')) this.sfxVolume = this.registry.get('sfxVolume');
-
-    // Save settings on change
-    this.registry.events.on('changedata', (parent, key, data) => {
-        if (['musicVolume', 'ambientVolume', 'sfxVolume'].includes(key)) {
-            localStorage.setItem(key, data);
-        }
-    });
   }
 
   scheduleAmbientSound() {
@@ -111,6 +79,9 @@ class UIScene extends Phaser.Scene {
     this.createGearIcon();
     this.createSettingsPanel();
 
+    // UIScene sits above every game scene, so it hosts the finger cursor
+    this.fingerCursor = CursorOverlay.attach(this);
+
     // Add ESC and ENTER key support to toggle settings
     const toggleSettings = () => {
         if (this.settingsContainer.visible) {
@@ -133,7 +104,7 @@ class UIScene extends Phaser.Scene {
     this.input.keyboard.on('keydown-ESC', toggleSettings);
     this.input.keyboard.on('keydown-ENTER', closeSettings);
 
-    this.scale.on('resize', this.resize, this);
+    Subscriptions.on(this, this.scale, 'resize', this.resize, this);
   }
 
   resize(gameSize) {
@@ -190,13 +161,9 @@ class UIScene extends Phaser.Scene {
     gearContainer.baseScaleX = gearContainer.scaleX;
     gearContainer.baseScaleY = gearContainer.scaleY;
 
-    gearContainer.on('pointerover', () => this.tweens.add({
-        targets: gearContainer, scaleX: gearContainer.baseScaleX * 1.2, scaleY: gearContainer.baseScaleY * 1.2, duration: 100, ease: 'Sine.easeInOut'
-    }));
-
-    gearContainer.on('pointerout', () => this.tweens.add({
-        targets: gearContainer, scaleX: gearContainer.baseScaleX, scaleY: gearContainer.baseScaleY, duration: 100, ease: 'Sine.easeInOut'
-    }));
+    const animator = UiAnimator.get(this);
+    gearContainer.on('pointerover', () => animator.scaleTo(gearContainer, gearContainer.baseScaleX * 1.2, gearContainer.baseScaleY * 1.2, 100));
+    gearContainer.on('pointerout', () => animator.scaleTo(gearContainer, gearContainer.baseScaleX, gearContainer.baseScaleY, 100));
 
     gearContainer.on('pointerdown', () => {
         const musicScene = this.scene.get('MusicScene');
@@ -204,18 +171,10 @@ class UIScene extends Phaser.Scene {
             musicScene.playSFX('menu-click');
         }
 
-        this.tweens.add({
-            targets: gearContainer,
-            scaleX: gearContainer.baseScaleX * 0.9,
-            scaleY: gearContainer.baseScaleY * 0.9,
-            duration: 50,
-            ease: 'Power1',
-            onComplete: () => {
-                this.time.delayedCall(50, () => {
-                    this.openSettings();
-                    gearContainer.setScale(gearContainer.baseScaleX, gearContainer.baseScaleY); // Reset scale for next time
-                });
-            }
+        animator.scaleTo(gearContainer, gearContainer.baseScaleX * 0.9, gearContainer.baseScaleY * 0.9, 50);
+        this.time.delayedCall(100, () => {
+            this.openSettings();
+            gearContainer.setScale(gearContainer.baseScaleX, gearContainer.baseScaleY); // Reset scale for next time
         });
     });
 
@@ -279,26 +238,15 @@ class UIScene extends Phaser.Scene {
     closeBtn.setInteractive(new Phaser.Geom.Circle(0, 0, closeSize / 2), Phaser.Geom.Circle.Contains);
 
     // Hover effects
+    const animator = UiAnimator.get(this);
     closeBtn.on('pointerover', () => {
         this.input.setDefaultCursor('pointer');
-        this.tweens.add({
-            targets: closeBtn,
-            scaleX: 1.1,
-            scaleY: 1.1,
-            duration: 100,
-            ease: 'Sine.easeInOut'
-        });
+        animator.scaleTo(closeBtn, 1.1, 1.1, 100);
     });
 
     closeBtn.on('pointerout', () => {
         this.input.setDefaultCursor('default');
-        this.tweens.add({
-            targets: closeBtn,
-            scaleX: 1.0,
-            scaleY: 1.0,
-            duration: 100,
-            ease: 'Sine.easeInOut'
-        });
+        animator.scaleTo(closeBtn, 1, 1, 100);
     });
 
     closeBtn.on('pointerdown', () => {
@@ -350,7 +298,7 @@ class UIScene extends Phaser.Scene {
     const updateVolume = (x) => {
         const clampedX = Phaser.Math.Clamp(x, startX, endX);
         handleContainer.x = clampedX;
-        this.registry.set(`${type}Volume`, (clampedX - startX) / 200);
+        Settings.get(this.game).set(`${type}Volume`, (clampedX - startX) / 200);
     };
 
     handleContainer.on('drag', (p, x) => updateVolume(x));
@@ -400,21 +348,29 @@ class MainMenu extends Phaser.Scene {
         progressBar.fillRect(width / 2 - 150, height / 2 - 15, 300 * value, 30);
     });
 
+    // Large backgrounds and section stills may be evicted under memory pressure
+    // and reloaded by the scene that next needs them
+    const textureBudget = TextureBudget.get(this.game);
+    textureBudget.track(this);
+    textureBudget.markEvictable(['new-map', 'egg-zam-room']);
+
     this.load.json('symbols', 'assets/symbols.json');
     this.load.json('map_sections', 'assets/map/map_sections.json');
     this.load.video('intro-video', 'assets/video/HeIsRisen-Intro.mp4');
-    this.load.video('level-complete', 'assets/video/level-complete.mp4');
+    // Counter and tooltip fonts baked by tools/bmfont.py; Text is used while they are missing
+    HudText.preload(this);
+    this.load.audio('level-complete-sfx', 'assets/audio/level-complete.mp3');
     this.load.image('level-complete-stamp', 'assets/objects/level-complete-stamp.png');
     this.load.image('finger-cursor', 'assets/cursor/pointer-finger-pointer.png');
 
     // Preload common UI and game assets here to avoid reloading in scenes
-    this.load.image('new-map', 'assets/map/new-map.png');
+    this.load.decodedImage('new-map', 'assets/map/new-map.png');
     this.load.image('cog', 'assets/objects/cog.png');
     this.load.image('eggs-ammin-haul', 'assets/objects/eggs-ammin-haul.png');
     this.load.image('score', 'assets/objects/score.png');
     this.load.image('magnifying-glass', 'assets/cursor/magnifying-glass.png');
     this.load.image('egg-zit-button', 'assets/objects/egg-zit-button.png');
-    this.load.image('egg-zam-room', 'assets/map/egg-zam-room.png');
+    this.load.decodedImage('egg-zam-room', 'assets/map/egg-zam-room.png');
     this.load.image('egg-zamminer', 'assets/objects/egg-zamminer.png');
     this.load.image('symbol-result-summary-diag', 'assets/objects/symbol-result-summary-diag.png');
 
@@ -432,10 +388,12 @@ class MainMenu extends Phaser.Scene {
       // console.log(`MainMenu: filecomplete-json-map_sections: Key='${key}', Type='${type}'`);
       if (Array.isArray(data)) {
         data.forEach(section => {
+             textureBudget.markEvictable([`${section.name}-thumb`, `${section.name}-fallback`]);
+
              // Enqueue thumbnail (.jpg) explicitly as thumb to avoid fallback errors
-             this.load.image(`${section.name}-thumb`, `assets/map/sections/${section.background}`);
+             this.load.decodedImage(`${section.name}-thumb`, `assets/map/sections/${section.background}`);
              // Keep the fallback key mapping to the same jpg, but thumb is cleaner for map.
-             this.load.image(`${section.name}-fallback`, `assets/map/sections/${section.background}`);
+             this.load.decodedImage(`${section.name}-fallback`, `assets/map/sections/${section.background}`);
 
              // Preload video backgrounds
              this.load.video(`${section.name}-video`, `assets/video/${section.name}.mp4`);
@@ -446,8 +404,8 @@ class MainMenu extends Phaser.Scene {
 
     this.load.on('filecomplete-json-symbols', (key, type, data) => {
       // console.log(`MainMenu: filecomplete-json-symbols: Key='${key}', Type='${type}'`);
-      // Preload all 60 eggs
-      for (let i = 1; i <= TOTAL_EGGS; i++) {
+      // Preload all 60 eggs (stress hunts reuse them)
+      for (let i = 1; i <= EGG_TEXTURE_COUNT; i++) {
         this.load.image(`egg-${i}`, `assets/eggs/egg-${i}.png`);
       }
       // Preload all symbols
@@ -487,6 +445,16 @@ class MainMenu extends Phaser.Scene {
 
   create() {
     this.input.setDefaultCursor('none');
+    QualityGovernor.get(this.game); // Starts sampling frame times for the whole session
+
+    // Seeds the volume registry from localStorage
+    Settings.get(this.game);
+
+    // One small localStorage read decides between resuming and a new hunt
+    if (this.initHuntState(HuntSave.read())) {
+        this.resumeHunt();
+        return;
+    }
 
     const width = this.scale.width;
     const height = this.scale.height;
@@ -501,6 +469,7 @@ class MainMenu extends Phaser.Scene {
         console.warn('Video autoplay synchronous error:', e);
     }
     this.introVideo = introVideo; // Store reference for resizing
+    introVideo.once('textureready', () => RumBeacon.mark(this.game, 'intro-frame'));
 
     // Fit video to cover screen
     // Note: introVideo.width might be 0 initially if not fully loaded metadata
@@ -555,27 +524,13 @@ class MainMenu extends Phaser.Scene {
     startBtnContainer.setSize(buttonWidth, buttonHeight);
     startBtnContainer.setInteractive(new Phaser.Geom.Rectangle(-buttonWidth, -buttonHeight, buttonWidth * 2, buttonHeight * 2), Phaser.Geom.Rectangle.Contains);
 
-    // Cursor handled by CursorScene
-
-    // Initialize volume registry (Load from localStorage if available)
-    const savedMusic = localStorage.getItem('musicVolume');
-    const savedAmbient = localStorage.getItem('ambientVolume');
-    const savedSfx = localStorage.getItem('sfxVolume');
-
-    if (!this.registry.has('musicVolume')) this.registry.set('musicVolume', savedMusic !== null ? parseFloat(savedMusic) : 0.5);
-    if (!this.registry.has('ambientVolume')) this.registry.set('ambientVolume', savedAmbient !== null ? parseFloat(savedAmbient) : 0.5);
-    if (!this.registry.has('sfxVolume')) this.registry.set('sfxVolume', savedSfx !== null ? parseFloat(savedSfx) : 0.5);
+    // Cursor handled by UIScene's CursorOverlay
 
     // Launch UI Scene
     if (!this.scene.get('UIScene').scene.isActive()) {
         this.scene.launch('UIScene');
     }
 
-    // Launch Cursor Scene if not active (and assets loaded)
-    if (!this.scene.get('CursorScene').scene.isActive()) {
-        this.scene.launch('CursorScene');
-        this.scene.bringToTop('CursorScene');
-    }
 
     // Intro Logic State
     let introState = 'waiting'; // waiting -> playing -> ready
@@ -675,10 +630,7 @@ class MainMenu extends Phaser.Scene {
             }
         }
     };
-    window.addEventListener('keydown', globalKeyHandler);
-    this.events.once('shutdown', () => {
-        window.removeEventListener('keydown', globalKeyHandler);
-    });
+    Subscriptions.on(this, window, 'keydown', globalKeyHandler);
 
     // Update intro volume if changed in settings
     const updateIntroVolume = (parent, key, data) => {
@@ -686,9 +638,8 @@ class MainMenu extends Phaser.Scene {
             this.introVideo.setVolume(data);
         }
     };
-    this.registry.events.on('changedata', updateIntroVolume);
+    Subscriptions.on(this, this.registry.events, 'changedata', updateIntroVolume);
     this.events.once('shutdown', () => {
-        this.registry.events.off('changedata', updateIntroVolume);
         if (this.introVideo) {
             this.introVideo.stop();
             this.introVideo.destroy();
@@ -696,7 +647,7 @@ class MainMenu extends Phaser.Scene {
     });
 
     // Handle Resize
-    this.scale.on('resize', this.resize, this);
+    Subscriptions.on(this, this.scale, 'resize', this.resize, this);
 
     // Safety: Check video dimensions after a short delay to ensure metadata loaded
     this.time.delayedCall(100, () => {
@@ -705,7 +656,17 @@ class MainMenu extends Phaser.Scene {
             this.resize(this.scale);
         }
     });
+  }
 
+  /**
+   * Generates the hunt (egg counts, placement and symbols) from a seed and
+   * indexes it in HuntState. With a save the saved seed is reused and its
+   * progress re-applied.
+   * @param {Object|null} save - Record from HuntSave.read().
+   * @returns {boolean} Whether saved progress was restored.
+   */
+  initHuntState(save) {
+    let restored = false;
     const symbolsData = this.cache.json.get('symbols');
     if (symbolsData) {
       if (symbolsData.symbols && Array.isArray(symbolsData.symbols)) {
@@ -716,55 +677,76 @@ class MainMenu extends Phaser.Scene {
 
     const mapSections = this.cache.json.get('map_sections');
     if (mapSections && !this.registry.has('eggData')) {
-        const eggCounts = [];
-        let remainingEggs = TOTAL_EGGS;
-        const numSections = mapSections.length;
-
-        for (let i = 0; i < numSections - 1; i++) {
-            const maxPossible = remainingEggs - ((numSections - 1 - i) * 3);
-            const minPossible = remainingEggs - ((numSections - 1 - i) * 8);
-            const max = Math.min(8, maxPossible);
-            const min = Math.max(3, minPossible);
-            const count = Phaser.Math.Between(min, max);
-            eggCounts.push(count);
-            remainingEggs -= count;
-        }
-        eggCounts.push(remainingEggs);
-
-        const eggs = Phaser.Utils.Array.Shuffle(Array.from({ length: TOTAL_EGGS }, (_, i) => i + 1));
-        const sections = mapSections.map(section => ({ name: section.name, eggs: [] }));
-
-        let eggIndex = 0;
-        const shuffledSymbols = Phaser.Utils.Array.Shuffle([...(symbolsData ? symbolsData.symbols : [])]);
-        const eggData = [];
-
-        sections.forEach((section, index) => {
-          section.eggs = eggs.slice(eggIndex, eggIndex + eggCounts[index]);
-          eggIndex += eggCounts[index];
-
-          section.eggs.forEach(eggId => {
-              const originalX = Phaser.Math.Between(200, 1270);
-              const originalY = Phaser.Math.Between(100, 710);
-
-              eggData.push({
-                  eggId: eggId,
-                  section: section.name,
-                  x: originalX,
-                  y: originalY,
-                  symbol: shuffledSymbols[eggId - 1] || null,
-                  collected: false
-              });
-          });
+        // Everything below is drawn from one seeded generator so a saved seed
+        // reproduces the same hunt without storing positions
+        const seed = save ? save.seed : Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+        const rnd = HuntCore.createRandom(seed);
+        const area = this.eggPlacementArea();
+        const { sections, eggData } = HuntCore.generateHunt({
+            rnd,
+            sectionNames: mapSections.map(section => section.name),
+            symbols: symbolsData ? symbolsData.symbols : [],
+            total: TOTAL_EGGS,
+            place: (count) => EggPlacer.place(rnd, count, area.bounds, area.exclusions)
         });
 
-        this.registry.set('sections', sections);
-        this.registry.set('eggData', eggData);
+        // Publishes the 'sections', 'eggData' and 'foundEggs' views
+        HuntState.get(this.game).load(sections, eggData, seed);
+        const huntSave = HuntSave.get(this.game); // Saves progress from here on
+        if (save) {
+            huntSave.restore(save);
+            restored = true;
+        }
     }
 
-    if (!this.registry.has('foundEggs')) {
-      this.registry.set('foundEggs', []);
-      this.registry.set('stampedSections', []);
-    }
+    if (!this.registry.has('foundEggs')) this.registry.set('foundEggs', []);
+    if (!this.registry.has('stampedSections')) this.registry.set('stampedSections', []);
+
+    return restored;
+  }
+
+  // Where eggs may go, in the 1280x720 design space SectionHunt scales to cover
+  // the screen. Bounds are the part of that space visible in the current
+  // viewport, inset so a whole egg (50x75 screen px) and a margin show; the HUD column
+  // (score, egg-zit button, eggs-ammin-haul) is excluded so no egg hides
+  // under it or sits in the corner that ignores clicks.
+  eggPlacementArea() {
+    const width = this.scale.width;
+    const height = this.scale.height;
+    const coverScale = Math.max(width / 1280, height / 720);
+    const uiScale = Math.min(width / 1280, height / 720);
+    const offsetX = (width - 1280 * coverScale) / 2;
+    const offsetY = (height - 720 * coverScale) / 2;
+    const halfWidth = 35 / coverScale;
+    const halfHeight = 50 / coverScale;
+
+    const left = Math.max(0, -offsetX / coverScale) + halfWidth;
+    const top = Math.max(0, -offsetY / coverScale) + halfHeight;
+    const right = Math.min(1280, (width - offsetX) / coverScale) - halfWidth;
+    const bottom = Math.min(720, (height - offsetY) / coverScale) - halfHeight;
+
+    // Screen-space HUD rects (see SectionHunt.create), mapped into design space
+    const hud = [
+      { x: 0, y: 0, width: 200, height: 200 },
+      { x: 0, y: 200, width: 150, height: 150 },
+      { x: 0, y: 350, width: 137, height: 150 }
+    ];
+    return {
+      bounds: { x: left, y: top, width: right - left, height: bottom - top },
+      exclusions: hud.map(rect => ({
+        x: (rect.x * uiScale - offsetX) / coverScale - halfWidth,
+        y: (rect.y * uiScale - offsetY) / coverScale - halfHeight,
+        width: rect.width * uiScale / coverScale + halfWidth * 2,
+        height: rect.height * uiScale / coverScale + halfHeight * 2
+      }))
+    };
+  }
+
+  // Saved progress skips the intro and goes straight back to the map
+  resumeHunt() {
+    if (!this.scene.get('UIScene').scene.isActive()) this.scene.launch('UIScene');
+    if (!this.scene.get('MusicScene').scene.isActive()) this.scene.launch('MusicScene');
+    this.scene.start('MapScene');
   }
 
   resize(gameSize) {
@@ -835,17 +817,31 @@ class MapScene extends Phaser.Scene {
     super({ key: 'MapScene' });
   }
 
+  preload() {
+    const mapSections = this.cache.json.get('map_sections') || [];
+    TextureBudget.get(this.game).acquire(this, ['new-map', ...mapSections.map(section => `${section.name}-thumb`)]);
+
+    // The stamp animation is only fetched when a section has just been completed
+    // (baked by tools/stamp_sheet.py); the stamp video is the fallback if it is missing
+    const huntState = HuntState.get(this.game);
+    const stampedSections = this.registry.get('stampedSections') || [];
+    const needsStamp = mapSections.some(section =>
+      huntState.isSectionComplete(section.name) && !stampedSections.includes(section.name));
+    if (needsStamp && !this.textures.exists('level-complete-sheet')) {
+      this.load.atlas('level-complete-sheet', 'assets/objects/level-complete-sheet.png', 'assets/objects/level-complete-sheet.json');
+      const onStampError = (file) => {
+        if (file.key === 'level-complete-sheet' && !this.cache.video.exists('level-complete')) {
+          this.load.video('level-complete', 'assets/video/level-complete.mp4');
+        }
+      };
+      this.load.on('loaderror', onStampError);
+      this.load.once('complete', () => this.load.off('loaderror', onStampError));
+    }
+  }
+
   create() {
     this.input.setDefaultCursor('none');
 
-    // Scale logic
-    const width = this.scale.width;
-    const height = this.scale.height;
-
-    // We want to fit the map 1280x720 into the screen while maintaining aspect ratio?
-    // Or cover? The user requested "full screen maximized viewport".
-    // For the map, "cover" makes sense to fill the screen.
-
     const mapSections = this.cache.json.get('map_sections');
 
     if (!this.scene.get('MusicScene').scene.isActive()) {
@@ -853,56 +849,27 @@ class MapScene extends Phaser.Scene {
     }
     this.sound.play('drive2', { volume: 0.5 });
 
-    this.mapImage = this.add.image(width/2, height/2, 'new-map');
-    this.updateLayout(width, height);
+    // The map covers the viewport at its native size; thumbnails and stamps
+    // follow it, the HUD is anchored to the design space like EggZamRoom's
+    this.layout = new SceneLayout(this);
+    this.mapImage = this.layout.add(this.add.image(0, 0, 'new-map'), { apply: (map, m) => this.coverMap(map, m) });
 
-    // Create map thumbnails (videos/images)
     this.mapZones = [];
-    this.stamps = [];
 
     // We will use the original zone dimensions to calculate the center
     mapSections.forEach(section => {
-      const centerX = section.coords.x;
-      const centerY = section.coords.y;
-
-      // Create container for border and drop shadow
+      // Create container for the thumbnail card
       const thumbContainer = this.add.container(0, 0);
 
-      // Rounded Rectangle mask for the image
-      const radius = 15;
-
-      // Shadow
-      const shadow = this.add.graphics();
-      shadow.fillStyle(0x000000, 0.6);
-      shadow.fillRoundedRect(-section.coords.width / 2 + 4, -section.coords.height / 2 + 4, section.coords.width, section.coords.height, radius);
-
-      // Border (white background with brown stroke)
-      const border = this.add.graphics();
-      border.lineStyle(4, 0x8b4513, 1); // Brown border
-      border.fillStyle(0xffffff, 1);
-      border.fillRoundedRect(-section.coords.width / 2 - 5, -section.coords.height / 2 - 5, section.coords.width + 10, section.coords.height + 10, radius + 2);
-      border.strokeRoundedRect(-section.coords.width / 2 - 5, -section.coords.height / 2 - 5, section.coords.width + 10, section.coords.height + 10, radius + 2);
-
-      // Add the static thumbnail image
-      const thumbImage = this.add.image(0, 0, `${section.name}-thumb`).setOrigin(0.5, 0.5);
-      thumbImage.setDisplaySize(section.coords.width, section.coords.height);
-
-      // Create mask for the image to give it rounded corners
-      const maskGraphics = this.add.graphics();
-      maskGraphics.fillStyle(0xffffff);
-      maskGraphics.fillRoundedRect(-section.coords.width / 2, -section.coords.height / 2, section.coords.width, section.coords.height, radius);
-      maskGraphics.setVisible(false); // Do not show the mask itself
-
-      const mask = maskGraphics.createGeometryMask();
-      thumbImage.setMask(mask);
+      // Shadow, border and rounded image are baked into one texture at the current map scale
+      const thumbImage = this.add.image(0, 0, '__DEFAULT').setOrigin(0.5, 0.5);
+      bakeMapThumbnail(thumbImage, section, this.mapScale);
 
       // Add invisible hit area graphics for reliable click detection
       // Use an expanded hit area to make clicking slightly more forgiving
       const hitArea = this.add.rectangle(0, 0, section.coords.width + 40, section.coords.height + 40, 0x000000, 0);
 
-      // IMPORTANT: maskGraphics should NOT be added to the container's children array when used as a mask
-      // because it is scaled dynamically by the container, and rendering it as a child breaks the mask visually
-      thumbContainer.add([shadow, border, thumbImage, hitArea]);
+      thumbContainer.add([thumbImage, hitArea]);
       thumbContainer.setSize(section.coords.width + 40, section.coords.height + 40);
 
       // By omitting geometry arguments and relying on the `hitArea` rectangle we added above,
@@ -913,14 +880,8 @@ class MapScene extends Phaser.Scene {
       const thumb = thumbContainer;
       thumb.name = section.name;
       thumb.sectionData = section;
-      thumb.maskGraphics = maskGraphics; // Store reference to update mask transforms
-
-      // The baseScale will be set in resizeGame()/updateLayout once dimensions are known,
-      // but let's initialize it safely here just in case.
-      thumb.baseScale = 1;
-
-      // Update mask initially if position is already set
-      // (though for main.js it gets set in updateLayout immediately after)
+      thumb.thumbImage = thumbImage; // Re-baked when the map scale changes
+      this.layout.add(thumb, { apply: thumb => this.placeThumb(thumb) });
 
       thumb.on('pointerover', () => {
           this.input.setDefaultCursor('pointer');
@@ -952,87 +913,38 @@ class MapScene extends Phaser.Scene {
       this.mapZones.push(thumb);
 
       // Level Complete Stamp Logic
-      const eggData = this.registry.get('eggData') || [];
-      const sectionEggs = eggData.filter(e => e.section === section.name);
-      const foundEggs = this.registry.get('foundEggs') || [];
-      const isCompleted = sectionEggs.length > 0 && sectionEggs.every(e => foundEggs.some(found => (found === e.eggId) || (found && found.eggId === e.eggId)));
+      const isCompleted = HuntState.get(this.game).isSectionComplete(section.name);
 
       let stampedSections = this.registry.get('stampedSections') || [];
 
       if (isCompleted) {
           if (!stampedSections.includes(section.name)) {
-              // FIRST TIME COMPLETE: Play the video
-              const stampVideo = this.add.video(thumb.x, thumb.y, 'level-complete');
+              // FIRST TIME COMPLETE: Play the stamp animation (video fallback)
+              // Swap to image when it finishes to free memory
+              const stampVideo = playLevelCompleteStamp(this, thumb.x, thumb.y, () => {
+                  const stampImg = this.add.image(thumb.x, thumb.y, 'level-complete-stamp');
+                  stampImg.setDepth(2);
+                  stampImg.disableInteractive();
+                  this.layout.add(stampImg, this.stampAnchor(thumb, 0));
+                  // The layout drops the destroyed animation on its next pass
+                  stampVideo.destroy();
+              });
               stampVideo.setOrigin(0.5, 0.5);
               stampVideo.setDepth(2);
               stampVideo.disableInteractive();
-              stampVideo.setBlendMode(Phaser.BlendModes.MULTIPLY);
-              const updateStampSize = () => {
-                  // Offset the video slightly up so it visually matches the stamp image
-                  stampVideo.setPosition(thumb.x, thumb.y - 40 * thumb.scaleY);
-
-                  // Scale the stamp so its height covers the thumbnail's height + 25%, maintaining its intrinsic aspect ratio
-                  // We must wait for the video metadata to load to get its intrinsic height,
-                  // but we can set a fallback or set scale immediately based on a standard 1080p/720p assumption if needed.
-                  // Wait, Phaser Video objects have a default size of 256x256 before load.
-                  // To be safe, we can apply the scale based on the thumbnail's physical displayHeight.
-                  // Since video height might be 0 initially, we use a fallback of 720 (standard height).
-                  const intrinsicHeight = stampVideo.height || 720;
-                  const targetHeight = (thumb.height * thumb.scaleY) * 1.25;
-                  const calculatedScale = targetHeight / intrinsicHeight;
-                  stampVideo.setScale(calculatedScale);
-              };
-              updateStampSize();
-
-              if (!this.stamps) this.stamps = [];
-              this.stamps.push({ video: stampVideo, thumb: thumb });
-
-              const sfxVol = this.registry.get('sfxVolume') !== undefined ? this.registry.get('sfxVolume') : 0.5;
-              stampVideo.setVolume(sfxVol);
-              stampVideo.play();
+              // Offset the animation slightly up so it visually matches the stamp image
+              this.layout.add(stampVideo, this.stampAnchor(thumb, 40));
 
               stampedSections.push(section.name);
               this.registry.set('stampedSections', stampedSections);
 
-              // Swap to image when video finishes to free memory
-              stampVideo.on('complete', () => {
-                  const stampImg = this.add.image(thumb.x, thumb.y, 'level-complete-stamp');
-                  stampImg.setDepth(2);
-
-                  // Apply the identical scale multiplier that the thumbnail is using
-                  // Cover thumbnail height + 25%, maintaining intrinsic stamp ratio
-                  const intrinsicHeight = stampImg.height || 720;
-                  const targetHeight = (thumb.height * thumb.scaleY) * 1.25;
-                  stampImg.setScale(targetHeight / intrinsicHeight);
-                  stampImg.disableInteractive();
-                  // Replace in resize array so window resizing still works
-                  const idx = this.stamps.findIndex(s => s.video === stampVideo);
-                  if (idx !== -1) {
-                      this.stamps[idx] = { video: stampImg, thumb: thumb };
-                  }
-                  stampVideo.destroy();
-              });
-
           } else {
               // ALREADY COMPLETED: Show static image directly
               const stampImg = this.add.image(thumb.x, thumb.y, 'level-complete-stamp');
               stampImg.setOrigin(0.5, 0.5);
               stampImg.setDepth(2);
               stampImg.disableInteractive();
-                  const updateStampSize = () => {
-                  stampImg.setPosition(thumb.x, thumb.y);
-
-                  // Scale the stamp so its height covers the thumbnail's height + 25%, maintaining its intrinsic aspect ratio
-                  const intrinsicHeight = stampImg.height || 720;
-                  const targetHeight = (thumb.height * thumb.scaleY) * 1.25;
-                  const calculatedScale = targetHeight / intrinsicHeight;
-                  stampImg.setScale(calculatedScale);
-              };
-              updateStampSize();
-
-              if (!this.stamps) this.stamps = [];
-              // We use "video: stampImg" so the generic resize loop works identically
-              this.stamps.push({ video: stampImg, thumb: thumb });
+              this.layout.add(stampImg, this.stampAnchor(thumb, 0));
           }
       }
     });
@@ -1041,6 +953,7 @@ class MapScene extends Phaser.Scene {
         .setOrigin(0, 0)
         .setInteractive()
         .setDepth(100); // Ensure it is above map zones
+    this.layout.add(this.eggsAmminHaul, { x: 0, y: 200, width: 137, height: 150, space: 'screen' });
     addButtonInteraction(this, this.eggsAmminHaul, 'menu-click');
     addTooltip(this, this.eggsAmminHaul, 'View Collection');
     this.eggsAmminHaul.on('pointerdown', () => {
@@ -1049,106 +962,53 @@ class MapScene extends Phaser.Scene {
          });
     });
 
-    this.scoreImage = this.add.image(0, 0, 'score').setOrigin(0, 0);
+    this.scoreImage = this.layout.add(this.add.image(0, 0, 'score').setOrigin(0, 0), { x: 0, y: 0, scale: 1, space: 'screen' });
     const foundEggs = this.registry.get('foundEggs').length;
-    this.scoreText = this.add.text(0, 0, `${foundEggs}/${TOTAL_EGGS}`, { fontSize: '42px', fill: '#000', fontStyle: 'bold', fontFamily: 'Comic Sans MS', stroke: '#fff', strokeThickness: 6 });
-
-    // Initial Layout update
-    this.updateLayout(width, height);
-
-    this.scale.on('resize', this.resize, this);
-  }
+    this.scoreText = HudText.add(this, 0, 0, `${foundEggs}/${TOTAL_EGGS}`, 42, 6);
+    this.layout.add(this.scoreText, { x: 50, y: 98, fontSize: 42, strokeThickness: 6, space: 'screen' });
 
-  resize(gameSize) {
-      this.updateLayout(gameSize.width, gameSize.height);
+    RumBeacon.mark(this.game, 'map-ready');
   }
 
-  updateLayout(width, height) {
-      if (this.cameras && this.cameras.main) {
-          this.cameras.main.setViewport(0, 0, width, height);
-      }
+  // Scales the map to COVER the viewport based on its native size, not forced 1280x720
+  coverMap(map, m) {
+      this.cameras.main.setViewport(0, 0, m.width, m.height);
 
-      // Calculate scale to COVER based on native map size, not forced 1280x720
-      const nativeWidth = this.mapImage.width || 1376;
-      const nativeHeight = this.mapImage.height || 768;
-      const scaleX = width / nativeWidth;
-      const scaleY = height / nativeHeight;
-      const scale = Math.max(scaleX, scaleY);
-
-      // Center map
-      this.mapImage.setPosition(width/2, height/2);
-      this.mapImage.setScale(scale);
-
-      // Calculate offset for map centering based on the native resolution mapping.
-      const mapWidth = nativeWidth * scale;
-      const mapHeight = nativeHeight * scale;
-      const offsetX = (width - mapWidth) / 2;
-      const offsetY = (height - mapHeight) / 2;
-
-      // Update Zones
-      if (this.mapZones) {
-          this.mapZones.forEach(thumb => {
-              const d = thumb.sectionData.coords;
-              const centerX = d.x;
-              const centerY = d.y;
-
-              thumb.setPosition(offsetX + centerX * scale, offsetY + centerY * scale);
-
-              // We use the custom width and height properties specified in map_sections.json
-              // to accurately set the size of each thumbnail while maintaining proper ratio.
-              const targetW = d.width * scale;
-              const targetH = d.height * scale;
-
-              // Container uses scale, not setDisplaySize
-              const thumbScale = targetW / d.width;
-              thumb.setScale(thumbScale);
-
-              // Update mask transform to match the container
-              if (thumb.maskGraphics) {
-                  thumb.maskGraphics.setPosition(offsetX + centerX * scale, offsetY + centerY * scale);
-                  thumb.maskGraphics.setScale(thumbScale);
-              }
+      const nativeWidth = map.width || 1376;
+      const nativeHeight = map.height || 768;
+      this.mapScale = Math.max(m.width / nativeWidth, m.height / nativeHeight);
+      this.mapOffsetX = (m.width - nativeWidth * this.mapScale) / 2;
+      this.mapOffsetY = (m.height - nativeHeight * this.mapScale) / 2;
 
-              // Update base scale for hover animations AFTER scaling
-              thumb.baseScale = thumb.scaleX;
-          });
-      }
+      map.setPosition(m.width / 2, m.height / 2);
+      map.setScale(this.mapScale);
+  }
 
-      if (this.stamps) {
-          this.stamps.forEach(item => {
-              if (item.video && item.video.active && item.thumb && item.thumb.active) {
-                  // Only apply the 40px upward offset to the stampVideo (Phaser.Video), not the final stampImg
-                  const isVideo = item.video.type === 'Video';
-                  const offsetY = isVideo ? -40 * item.thumb.scaleY : 0;
-                  item.video.setPosition(item.thumb.x, item.thumb.y + offsetY);
-
-                  // Cover thumbnail height + 25%, maintaining intrinsic stamp ratio
-                  const intrinsicHeight = item.video.height || 720;
-                  const targetHeight = (item.thumb.height * item.thumb.scaleY) * 1.25;
-                  item.video.setScale(targetHeight / intrinsicHeight);
-              }
-          });
-      }
+  // Places a thumbnail on its map_sections.json spot; anchored after the map, so mapScale is current
+  placeThumb(thumb) {
+      const d = thumb.sectionData.coords;
+      thumb.setPosition(this.mapOffsetX + d.x * this.mapScale, this.mapOffsetY + d.y * this.mapScale);
 
-      // UI Elements - Scale with MIN to stay on screen and proportional
-      const uiScale = Math.min(scaleX, scaleY);
+      // Container uses scale, not setDisplaySize
+      thumb.setScale(this.mapScale);
 
-      if (this.eggsAmminHaul) {
-          this.eggsAmminHaul.setDisplaySize(137 * uiScale, 150 * uiScale);
-          this.eggsAmminHaul.baseScaleX = this.eggsAmminHaul.scaleX;
-          this.eggsAmminHaul.baseScaleY = this.eggsAmminHaul.scaleY;
-          this.eggsAmminHaul.setPosition(0, 200 * uiScale);
-      }
+      // Re-bake the card only if its on-screen pixel size changed
+      bakeMapThumbnail(thumb.thumbImage, thumb.sectionData, this.mapScale);
 
-      if (this.scoreImage) {
-          this.scoreImage.setScale(uiScale);
-          this.scoreImage.setPosition(0, 0);
-      }
+      // Base scale for hover animations
+      thumb.baseScale = thumb.scaleX;
+  }
 
-      if (this.scoreText) {
-          this.scoreText.setScale(uiScale);
-          this.scoreText.setPosition(50 * uiScale, 98 * uiScale);
-      }
+  // Covers the thumbnail's height + 25%, keeping the stamp's intrinsic ratio; `lift` is in thumbnail pixels
+  stampAnchor(thumb, lift) {
+      return {
+          apply: stamp => {
+              stamp.setPosition(thumb.x, thumb.y - lift * thumb.scaleY);
+              // Videos report 0 until their metadata loads; assume a 720p frame until then
+              const intrinsicHeight = stamp.height || 720;
+              stamp.setScale((thumb.height * thumb.scaleY) * 1.25 / intrinsicHeight);
+          }
+      };
   }
 
   update() {
@@ -1164,17 +1024,12 @@ class SectionHunt extends Phaser.Scene {
     this.sectionName = data.sectionName;
   }
 
-  collectEgg(egg) {
-    const foundEggs = this.registry.get('foundEggs');
-    const eggDataArray = this.registry.get('eggData');
-    const eggData = {
-      eggId: egg.getData('eggId'),
-      symbolData: egg.getData('symbolDetails'),
-      categorized: false
-    };
-    const globalEggData = eggDataArray.find(e => e.eggId === eggData.eggId);
+  preload() {
+    TextureBudget.get(this.game).acquire(this, [`${this.sectionName}-fallback`]);
+  }
 
-    if (!foundEggs.some(e => e.eggId === eggData.eggId)) {
+  collectEgg(egg) {
+    if (HuntState.get(this.game).collect(egg.getData('eggId'))) {
       this.sound.play('collect');
 
       let symbolTexture = null;
@@ -1183,14 +1038,7 @@ class SectionHunt extends Phaser.Scene {
       }
 
       this.showCollectionFeedback(egg.x, egg.y, egg.texture.key, symbolTexture);
-      foundEggs.push(eggData);
-      this.registry.set('foundEggs', foundEggs);
-
-      if (globalEggData) {
-          globalEggData.collected = true;
-          this.registry.set('eggData', eggDataArray);
-      }
-
+      this.eggVersion++;
       this.updateScore();
 
       if (this.hintTimer) {
@@ -1202,12 +1050,10 @@ class SectionHunt extends Phaser.Scene {
   }
 
   checkLevelComplete(immediate = false) {
-      const foundEggs = this.registry.get('foundEggs');
-      const sections = this.registry.get('sections');
-      const currentSection = sections.find(s => s.name === this.sectionName);
+      const huntState = HuntState.get(this.game);
 
-      if (foundEggs.length === TOTAL_EGGS) {
-          const clearText = this.add.text(this.scale.width / 2, this.scale.height / 2, "All 60 Eggs Found! Transporting to the EggZam Room...", {
+      if (huntState.foundCount === TOTAL_EGGS) {
+          const clearText = this.add.text(this.scale.width / 2, this.scale.height / 2, `All ${TOTAL_EGGS} Eggs Found! Transporting to the EggZam Room...`, {
               fontSize: '48px',
               fontFamily: 'Comic Sans MS',
               fill: '#ffff00',
@@ -1229,78 +1075,64 @@ class SectionHunt extends Phaser.Scene {
           return;
       }
 
-      if (currentSection) {
-          const foundIds = foundEggs.map(e => e.eggId);
-          const remainingCount = currentSection.eggs.filter(id => !foundIds.includes(id)).length;
-          if (remainingCount === 0) {
-              const clearText = this.add.text(this.scale.width / 2, this.scale.height / 2, "Great Job Detective!! You found all the hidden eggs on this map, the others are hidden in other maps.", {
-                  fontSize: '40px',
-                  fontFamily: 'Comic Sans MS',
-                  fill: '#ffff00',
-                  backgroundColor: '#000000cc',
-                  padding: { x: 20, y: 10 },
-                  stroke: '#000000',
-                  strokeThickness: 6,
-                  align: 'center',
-                  wordWrap: { width: 800, useAdvancedWrap: true }
-              }).setOrigin(0.5).setDepth(35).setScrollFactor(0);
-
-              this.tweens.add({
-                  targets: clearText,
-                  alpha: 0,
-                  delay: 5000,
-                  duration: 1000,
-                  onComplete: () => clearText.destroy()
-              });
+      if (huntState.isSectionComplete(this.sectionName)) {
+          const clearText = this.add.text(this.scale.width / 2, this.scale.height / 2, "Great Job Detective!! You found all the hidden eggs on this map, the others are hidden in other maps.", {
+              fontSize: '40px',
+              fontFamily: 'Comic Sans MS',
+              fill: '#ffff00',
+              backgroundColor: '#000000cc',
+              padding: { x: 20, y: 10 },
+              stroke: '#000000',
+              strokeThickness: 6,
+              align: 'center',
+              wordWrap: { width: 800, useAdvancedWrap: true }
+          }).setOrigin(0.5).setDepth(35).setScrollFactor(0);
 
-              if (this.hintTimer) {
-                  this.hintTimer.remove();
-              }
+          this.tweens.add({
+              targets: clearText,
+              alpha: 0,
+              delay: 5000,
+              duration: 1000,
+              onComplete: () => clearText.destroy()
+          });
+
+          if (this.hintTimer) {
+              this.hintTimer.remove();
           }
       }
   }
 
   showCollectionFeedback(x, y, eggTexture, symbolTexture) {
+    // Pooled sprites and text floated by the scene's animator; quick tapping
+    // reuses the same handful of objects instead of allocating per egg
+    if (!this.feedbackPools) {
+        this.feedbackPools = {
+            egg: new EffectPool(() => this.add.image(0, 0, eggTexture).setDepth(20)),
+            symbol: new EffectPool(() => this.add.image(0, 0, symbolTexture).setDepth(21)),
+            text: new EffectPool(() => this.add.text(0, 0, 'Found!', {
+                fontSize: '32px',
+                fontFamily: 'Comic Sans MS',
+                fill: '#ffff00',
+                stroke: '#000000',
+                strokeThickness: 4
+            }).setOrigin(0.5).setDepth(22))
+        };
+    }
+    const pools = this.feedbackPools;
+    const animator = UiAnimator.get(this);
+
     // Show Egg Sprite
-    const eggSprite = this.add.image(x, y, eggTexture).setDepth(20).setDisplaySize(50, 75);
-    this.tweens.add({
-        targets: eggSprite,
-        y: y - 60,
-        alpha: 0,
-        duration: 1000,
-        ease: 'Power1',
-        onComplete: () => eggSprite.destroy()
-    });
+    const eggSprite = pools.egg.acquire().setTexture(eggTexture).setPosition(x, y).setDisplaySize(50, 75);
+    animator.floatOut(eggSprite, 60, 1000, pools.egg);
 
     // Show Symbol Sprite if exists
     if (symbolTexture) {
-        const symSprite = this.add.image(x, y, symbolTexture).setDepth(21).setDisplaySize(50, 75);
-        this.tweens.add({
-            targets: symSprite,
-            y: y - 60,
-            alpha: 0,
-            duration: 1000,
-            ease: 'Power1',
-            onComplete: () => symSprite.destroy()
-        });
+        const symSprite = pools.symbol.acquire().setTexture(symbolTexture).setPosition(x, y).setDisplaySize(50, 75);
+        animator.floatOut(symSprite, 60, 1000, pools.symbol);
     }
 
-    const feedback = this.add.text(x, y - 40, 'Found!', {
-        fontSize: '32px',
-        fontFamily: 'Comic Sans MS',
-        fill: '#ffff00',
-        stroke: '#000000',
-        strokeThickness: 4
-    }).setOrigin(0.5).setDepth(22);
-
-    this.tweens.add({
-        targets: feedback,
-        y: y - 100,
-        alpha: 0,
-        duration: 1000,
-        ease: 'Power1',
-        onComplete: () => feedback.destroy()
-    });
+    const feedback = pools.text.acquire().setPosition(x, y - 40);
+    animator.floatOut(feedback, 60, 1000, pools.text);
   }
 
   showIdleHint() {
@@ -1311,15 +1143,7 @@ class SectionHunt extends Phaser.Scene {
         return;
     }
 
-    const foundEggs = this.registry.get('foundEggs');
-    const sections = this.registry.get('sections');
-    const currentSection = sections.find(s => s.name === this.sectionName);
-
-    if (!currentSection) return;
-
-    const eggsInSection = currentSection.eggs; // Array of IDs
-    const foundIds = foundEggs.map(e => e.eggId);
-    const remainingCount = eggsInSection.filter(id => !foundIds.includes(id)).length;
+    const remainingCount = HuntState.get(this.game).remaining(this.sectionName);
 
     if (remainingCount > 0) {
         const musicScene = this.scene.get('MusicScene');
@@ -1347,19 +1171,15 @@ class SectionHunt extends Phaser.Scene {
 
   create() {
     this.input.setDefaultCursor('none');
+    this.feedbackPools = null; // Pooled objects die with the previous run of the scene
 
-    // Scale logic
-    const width = this.scale.width;
-    const height = this.scale.height;
-    const scaleX = width / 1280;
-    const scaleY = height / 720;
-    const scale = Math.max(scaleX, scaleY); // Cover
-
-    this.bgScale = scale;
-    this.bgOffsetX = (width - 1280 * scale) / 2;
-    this.bgOffsetY = (height - 720 * scale) / 2;
+    // The background covers the viewport; eggs are pinned to their design
+    // spot on it and the HUD is anchored to the design space
+    this.layout = new SceneLayout(this);
+    this.layout.add(this.cameras.main, { apply: (camera, m) => this.coverStage(camera, m) });
 
-    this.cameras.main.setViewport(0, 0, width, height);
+    // WebGL magnifies the background layer in one MagnifierFX pass; Canvas keeps the RenderTexture lens
+    this.shaderLens = ShaderLens.create(this, 2);
 
     // Check if video exists in cache
     const videoKey = `${this.sectionName}-video`;
@@ -1374,14 +1194,18 @@ class SectionHunt extends Phaser.Scene {
         // Actually, checking if the texture exists might be safer if Phaser generated one.
         useVideo = true;
     }
+    // Struggling devices get the still background instead of a decoding video
+    const quality = QualityGovernor.get(this.game);
+    if (!quality.allowsSectionVideo) useVideo = false;
 
     if (useVideo) {
         // Use Video Background
-        this.sectionVideo = this.add.video(width/2, height/2, videoKey)
-            .setDisplaySize(1280 * scale, 720 * scale)
-            .setDepth(0);
+        this.sectionVideo = this.layout.add(this.add.video(0, 0, videoKey).setDepth(0), this.backgroundAnchor());
+        if (this.shaderLens) this.shaderLens.add(this.sectionVideo);
 
         this.sectionVideo.play(true); // Loop
+        // Only the canvas lens redraws per video frame; the shader lens samples the live texture
+        if (!this.shaderLens) this.videoClock = new VideoFrameClock(this, this.sectionVideo);
         this.sectionVideo.setMute(false); // Enable background video audio
         // Initialize volume from Ambient setting (reduced to 25% due to loud video mixing)
         const ambientVol = this.registry.has('ambientVolume') ? this.registry.get('ambientVolume') : 0.5;
@@ -1394,10 +1218,7 @@ class SectionHunt extends Phaser.Scene {
                  this.sectionVideo.setVolume(data * 0.25);
              }
         };
-        this.registry.events.on('changedata', updateAmbientVolume);
-        this.events.once('shutdown', () => {
-             this.registry.events.off('changedata', updateAmbientVolume);
-        });
+        Subscriptions.on(this, this.registry.events, 'changedata', updateAmbientVolume);
 
         // Video has started loading. We assume it works unless it errors.
         // We attach an error handler to fallback if playback fails later.
@@ -1405,6 +1226,7 @@ class SectionHunt extends Phaser.Scene {
 
         this.sectionVideo.on('error', () => {
              console.warn(`SectionHunt: Video ${videoKey} playback error. Falling back.`);
+             if (this.videoClock) this.videoClock.destroy();
              this.sectionVideo.destroy();
              this.isUsingVideo = false;
              this.createFallbackImage();
@@ -1415,50 +1237,66 @@ class SectionHunt extends Phaser.Scene {
         this.createFallbackImage();
     }
 
-    const eggDataArray = this.registry.get('eggData') || [];
-    const sectionEggsData = eggDataArray.filter(e => e.section === this.sectionName && !e.collected);
+    const sectionEggsData = HuntState.get(this.game).eggsIn(this.sectionName).filter(e => !e.collected);
 
     this.eggs = this.add.group();
+    this.eggVersion = 0; // Bumped whenever the set of eggs the lens can show changes
+    this.lensState = {};
 
     sectionEggsData.forEach(eggData => {
-        // Calculate egg position relative to the SCALED background
-        const scale = this.bgScale;
-        const x = this.bgOffsetX + (eggData.x * scale);
-        const y = this.bgOffsetY + (eggData.y * scale);
-
-        const egg = this.add.image(x, y, `egg-${eggData.eggId}`)
+        const egg = this.add.image(0, 0, eggTextureKey(eggData.eggId))
           .setDepth(5)
           .setDisplaySize(50, 75)
           .setAlpha(0); // Invisible until magnified
 
         egg.setData('eggId', eggData.eggId);
+        egg.setData('designX', eggData.x);
+        egg.setData('designY', eggData.y);
         const symbol = eggData.symbol;
         egg.setData('symbolDetails', symbol);
 
         if (symbol && symbol.filename && this.textures.exists(symbol.filename)) {
-            const symbolSprite = this.add.image(x, y, symbol.filename)
+            const symbolSprite = this.add.image(0, 0, symbol.filename)
               .setDepth(6)
               .setDisplaySize(50, 75)
               .setAlpha(0);
             egg.symbolSprite = symbolSprite;
         }
+
+        if (this.shaderLens) {
+            this.shaderLens.add(egg);
+            if (egg.symbolSprite) this.shaderLens.add(egg.symbolSprite);
+        }
         // Note: We removed the individual click handler on egg to use global lens click logic
         this.eggs.add(egg);
+        this.layout.add(egg, { apply: egg => this.pinEgg(egg) });
     });
 
-    // UI Elements (Scaled by MIN to fit)
-    const uiScale = Math.min(scaleX, scaleY);
+    // Lens and tap lookups go through a grid sized to the lens (radius 50); anchored after the eggs
+    this.eggGrid = new EggGrid(100);
+    this.layout.add(this.eggs, {
+        apply: eggs => {
+            this.eggGrid.rebuild(eggs.getChildren());
+            this.eggVersion++;
+        }
+    });
+    this.lensEggs = [];
+    this.lensEggScratch = [];
+    this.tapEggs = [];
 
-    this.eggZitButton = this.add.image(0, 200 * uiScale, 'egg-zit-button').setOrigin(0, 0).setDisplaySize(150 * uiScale, 150 * uiScale)
+    // UI Elements (Scaled by MIN to fit)
+    this.eggZitButton = this.add.image(0, 0, 'egg-zit-button').setOrigin(0, 0)
       .setInteractive()
       .setDepth(4).setScrollFactor(0);
+    this.layout.add(this.eggZitButton, { x: 0, y: 200, width: 150, height: 150, space: 'screen' });
     this.eggZitButton.on('pointerdown', () => this.scene.start('MapScene'));
     addButtonInteraction(this, this.eggZitButton, 'drive1');
     addTooltip(this, this.eggZitButton, 'Back to Map');
 
-    this.eggsAmminHaul = this.add.image(0, 350 * uiScale, 'eggs-ammin-haul').setOrigin(0, 0).setDisplaySize(137 * uiScale, 150 * uiScale)
+    this.eggsAmminHaul = this.add.image(0, 0, 'eggs-ammin-haul').setOrigin(0, 0)
       .setInteractive()
       .setDepth(4).setScrollFactor(0);
+    this.layout.add(this.eggsAmminHaul, { x: 0, y: 350, width: 137, height: 150, space: 'screen' });
     this.eggsAmminHaul.on('pointerdown', () => {
         this.time.delayedCall(100, () => {
              this.scene.start('EggZamRoom');
@@ -1469,36 +1307,35 @@ class SectionHunt extends Phaser.Scene {
 
     this.sound.play('drive2', { volume: 0.5 });
 
-    this.scoreImage = this.add.image(0, 0, 'score').setOrigin(0, 0).setDisplaySize(200 * uiScale, 200 * uiScale).setDepth(4).setScrollFactor(0);
+    this.scoreImage = this.add.image(0, 0, 'score').setOrigin(0, 0).setDepth(4).setScrollFactor(0);
+    this.layout.add(this.scoreImage, { x: 0, y: 0, width: 200, height: 200, space: 'screen' });
     const foundEggs = this.registry.get('foundEggs').length;
-    this.scoreText = this.add.text(50 * uiScale, 98 * uiScale, `${foundEggs}/${TOTAL_EGGS}`, {
-        fontSize: `${42 * uiScale}px`,
-        fill: '#000',
-        fontStyle: 'bold',
-        fontFamily: 'Comic Sans MS',
-        stroke: '#fff',
-        strokeThickness: 6 * uiScale
-    }).setDepth(5);
+    this.scoreText = HudText.add(this, 0, 0, `${foundEggs}/${TOTAL_EGGS}`, 42, 6).setDepth(5);
+    this.layout.add(this.scoreText, { x: 50, y: 98, fontSize: 42, strokeThickness: 6, space: 'screen' });
 
     this.lastFoundCount = foundEggs;
 
-    // Fixed size Render Texture for Magnifier (Lens)
-    const lensDiameter = 100;
-    this.zoomedView = this.add.renderTexture(0, 0, lensDiameter, lensDiameter).setDepth(6).setScrollFactor(0);
-    this.zoomedView.setOrigin(0.5, 0.5); // Center origin
+    if (!this.shaderLens) {
+        // Fixed size Render Texture for Magnifier (Lens), drawn at lensResolution and stretched to size
+        const lensDiameter = 100;
+        this.lensResolution = quality.lensResolution;
+        this.zoomedView = this.add.renderTexture(0, 0, lensDiameter * this.lensResolution, lensDiameter * this.lensResolution)
+            .setDisplaySize(lensDiameter, lensDiameter).setDepth(6).setScrollFactor(0);
+        this.zoomedView.setOrigin(0.5, 0.5); // Center origin
 
-    this.maskGraphics = this.add.graphics().fillCircle(0, 0, lensDiameter / 2).setScrollFactor(0);
-    this.zoomedView.setMask(this.maskGraphics.createGeometryMask());
+        this.maskGraphics = this.add.graphics().fillCircle(0, 0, lensDiameter / 2).setScrollFactor(0);
+        this.zoomedView.setMask(this.maskGraphics.createGeometryMask());
 
-    this.magnifyingGlass = this.add.image(0, 0, 'magnifying-glass').setOrigin(0.25, 0.2).setDepth(7).setScrollFactor(0);
+        // Render Stamp (reused for drawing video/bg/eggs into lens)
+        // Key: if using video, we swap texture dynamically. If image, we set it here.
+        const key = this.isUsingVideo ? 'placeholder-bg' : (this.sectionImage ? this.sectionImage.texture.key : this.sectionName);
+        this.renderStamp = this.make.image({ x: 0, y: 0, key: key, add: false });
 
-    // Render Stamp (reused for drawing video/bg/eggs into lens)
-    // Key: if using video, we swap texture dynamically. If image, we set it here.
-    const key = this.isUsingVideo ? 'placeholder-bg' : (this.sectionImage ? this.sectionImage.texture.key : this.sectionName);
-    this.renderStamp = this.make.image({ x: 0, y: 0, key: key, add: false });
+        // Stamp for eggs
+        this.eggStamp = this.make.image({ x: 0, y: 0, key: 'egg-1', add: false });
+    }
 
-    // Stamp for eggs
-    this.eggStamp = this.make.image({ x: 0, y: 0, key: 'egg-1', add: false });
+    this.magnifyingGlass = this.add.image(0, 0, 'magnifying-glass').setOrigin(0.25, 0.2).setDepth(7).setScrollFactor(0);
 
     // Idle Hint Timer
     this.lastInteractionTime = this.time.now;
@@ -1519,28 +1356,52 @@ class SectionHunt extends Phaser.Scene {
     // Global click handler for egg collection within the lens
     this.input.on('pointerdown', (pointer) => {
         // If clicking UI, ignore
+        const uiScale = this.layout.metrics.scale;
         if (pointer.y < 200 * uiScale && pointer.x < 200 * uiScale) return; // Approximate UI blocking
 
-        const captureRadiusSq = 50 * 50; // Lens capture radius
-
-        this.eggs.getChildren().forEach(egg => {
-            if (egg.active) {
-                // Check if egg is under the mouse (center of lens)
-                const distSq = Phaser.Math.Distance.Squared(pointer.x, pointer.y, egg.x, egg.y);
-                if (distSq < captureRadiusSq) {
-                     this.collectEgg(egg);
-                     egg.destroy();
-                     if (egg.symbolSprite) egg.symbolSprite.destroy();
-                     this.updateScore();
-                }
-            }
+        const captureRadius = 50; // Lens capture radius
+
+        // Only eggs in the grid cells under the lens are candidates
+        const eggsUnderLens = this.eggGrid.query(pointer.x, pointer.y, captureRadius, this.tapEggs);
+        if (eggsUnderLens.length === 0) return;
+
+        eggsUnderLens.forEach(egg => {
+            this.collectEgg(egg);
+            egg.destroy();
+            if (egg.symbolSprite) egg.symbolSprite.destroy();
+            this.updateScore();
         });
+        this.eggGrid.rebuild(this.eggs.getChildren());
     });
 
-    this.scale.on('resize', this.resize, this);
+    const onQualityChange = (parent, key) => {
+        if (key === 'qualityTier') this.applyQualityTier();
+    };
+    Subscriptions.on(this, this.registry.events, 'changedata', onQualityChange);
 
     // Check level complete immediately if returning to a completed map
     this.checkLevelComplete(true);
+
+    RumBeacon.markNextFrame(this.game, 'hunt-frame');
+  }
+
+  applyQualityTier() {
+    const quality = QualityGovernor.get(this.game);
+
+    if (!quality.allowsSectionVideo && this.isUsingVideo && this.sectionVideo) {
+        if (this.videoClock) this.videoClock.destroy();
+        this.sectionVideo.destroy();
+        this.sectionVideo = null;
+        this.createFallbackImage();
+    }
+
+    if (this.zoomedView && this.lensResolution !== quality.lensResolution) {
+        const lensDiameter = 100;
+        this.lensResolution = quality.lensResolution;
+        this.zoomedView.setSize(lensDiameter * this.lensResolution, lensDiameter * this.lensResolution);
+        this.zoomedView.setDisplaySize(lensDiameter, lensDiameter);
+        this.lensState = {}; // Force a redraw at the new resolution
+    }
   }
 
   updateScore() {
@@ -1548,41 +1409,29 @@ class SectionHunt extends Phaser.Scene {
       if (this.scoreText) this.scoreText.setText(`${foundEggs}/${TOTAL_EGGS}`);
   }
 
-  resize(gameSize) {
-      const width = gameSize.width;
-      const height = gameSize.height;
+  // Cover-fits the 1280x720 background; bgScale/bgOffset are what the eggs and the lens read
+  coverStage(camera, m) {
+      camera.setViewport(0, 0, m.width, m.height);
 
-      if (this.cameras && this.cameras.main) {
-          this.cameras.main.setViewport(0, 0, width, height);
-      }
+      this.bgScale = Math.max(m.width / 1280, m.height / 720);
+      this.bgOffsetX = (m.width - 1280 * this.bgScale) / 2;
+      this.bgOffsetY = (m.height - 720 * this.bgScale) / 2;
+  }
 
-      const scaleX = width / 1280;
-      const scaleY = height / 720;
-      // SWITCH TO FIT (Contain) to prevent cutting off bottom
-      const scale = Math.min(scaleX, scaleY);
-
-      this.bgScale = scale;
-      this.bgOffsetX = (width - 1280 * scale) / 2;
-      this.bgOffsetY = (height - 720 * scale) / 2;
-
-      if (this.isUsingVideo && this.sectionVideo) {
-          this.sectionVideo.setPosition(width/2, height/2);
-          this.sectionVideo.setDisplaySize(1280 * scale, 720 * scale);
-      } else if (this.sectionImage) {
-          this.sectionImage.setPosition(width/2, height/2);
-          this.sectionImage.setDisplaySize(1280 * scale, 720 * scale);
-      }
+  backgroundAnchor() {
+      return {
+          apply: (background, m) => background
+              .setPosition(m.width / 2, m.height / 2)
+              .setDisplaySize(1280 * this.bgScale, 720 * this.bgScale)
+      };
+  }
 
-      // UI Resize
-      const uiScale = Math.min(scaleX, scaleY);
-      this.eggZitButton.setPosition(0, 200 * uiScale).setDisplaySize(150 * uiScale, 150 * uiScale);
-      this.eggZitButton.baseScaleX = this.eggZitButton.scaleX;
-      this.eggZitButton.baseScaleY = this.eggZitButton.scaleY;
-      this.eggsAmminHaul.setPosition(0, 350 * uiScale).setDisplaySize(137 * uiScale, 150 * uiScale);
-      this.eggsAmminHaul.baseScaleX = this.eggsAmminHaul.scaleX;
-      this.eggsAmminHaul.baseScaleY = this.eggsAmminHaul.scaleY;
-      this.scoreImage.setDisplaySize(200 * uiScale, 200 * uiScale);
-      this.scoreText.setPosition(50 * uiScale, 98 * uiScale).setFontSize(`${42 * uiScale}px`);
+  // Keeps an egg (and its symbol) pinned to its spot on the rescaled background
+  pinEgg(egg) {
+      const x = this.bgOffsetX + egg.getData('designX') * this.bgScale;
+      const y = this.bgOffsetY + egg.getData('designY') * this.bgScale;
+      egg.setPosition(x, y);
+      if (egg.symbolSprite) egg.symbolSprite.setPosition(x, y);
   }
 
   createFallbackImage() {
@@ -1619,9 +1468,8 @@ class SectionHunt extends Phaser.Scene {
 
     // Ensure scene is still active before adding
     if (this.sys.settings.active) {
-        this.sectionImage = this.add.image(this.cameras.main.centerX, this.cameras.main.centerY, textureKey)
-            .setDisplaySize(1280 * this.bgScale, 720 * this.bgScale)
-            .setDepth(0);
+        this.sectionImage = this.layout.add(this.add.image(0, 0, textureKey).setDepth(0), this.backgroundAnchor());
+        if (this.shaderLens) this.shaderLens.add(this.sectionImage);
     }
     this.isUsingVideo = false;
   }
@@ -1640,14 +1488,77 @@ class SectionHunt extends Phaser.Scene {
     const glassOffsetY = -30;
 
     this.magnifyingGlass.setPosition(pointer.x + glassOffsetX, pointer.y + glassOffsetY);
-    this.zoomedView.setPosition(pointer.x, pointer.y);
-    this.maskGraphics.setPosition(pointer.x, pointer.y);
 
-    // Zoom logic
-    const zoom = 2;
+    if (this.shaderLens) {
+        this.shaderLens.update(pointer.x, pointer.y, 50);
+        this.showLensEggs(pointer.x, pointer.y, 50);
+    } else {
+        this.zoomedView.setPosition(pointer.x, pointer.y);
+        this.maskGraphics.setPosition(pointer.x, pointer.y);
+
+        if (this.isLensDirty(pointer.x, pointer.y)) {
+            this.drawLens(pointer);
+        }
+    }
+
+    // A video anchored before its metadata loaded has no size yet; place it once frames arrive
+    if (this.isUsingVideo && this.sectionVideo && this.sectionVideo.active && this.sectionVideo.width > 0 &&
+        Math.abs(this.sectionVideo.displayWidth - 1280 * this.bgScale) > 5) {
+        this.backgroundAnchor().apply(this.sectionVideo, this.layout.metrics);
+    }
+  }
+
+  // Shader lens: only the eggs the grid finds under the lens are drawn, cropped to it
+  showLensEggs(x, y, radius) {
+    const lensEggs = this.eggGrid.query(x, y, radius, this.lensEggScratch);
+
+    this.lensEggs.forEach(egg => {
+      if (egg.active && lensEggs.indexOf(egg) === -1) {
+        egg.setAlpha(0);
+        if (egg.symbolSprite) egg.symbolSprite.setAlpha(0);
+      }
+    });
+    this.lensEggScratch = this.lensEggs;
+    this.lensEggs = lensEggs;
+
+    lensEggs.forEach(egg => {
+      this.shaderLens.crop(egg);
+      if (egg.symbolSprite) this.shaderLens.crop(egg.symbolSprite);
+    });
+  }
+
+  // The lens only needs redrawing when the pointer, the background (scale or
+  // video frame) or the set of eggs has changed since the last draw.
+  isLensDirty(x, y) {
+    const state = this.lensState;
+    const video = this.isUsingVideo && this.sectionVideo && this.sectionVideo.active ? this.sectionVideo : null;
+    const frame = video && this.videoClock ? this.videoClock.frame : -1;
+    const texture = this.sectionImage ? this.sectionImage.texture.key : null;
+
+    if (state.x === x && state.y === y && state.frame === frame && state.texture === texture &&
+        state.scale === this.bgScale && state.offsetX === this.bgOffsetX && state.offsetY === this.bgOffsetY &&
+        state.eggVersion === this.eggVersion) {
+        return false;
+    }
+
+    state.x = x;
+    state.y = y;
+    state.frame = frame;
+    state.texture = texture;
+    state.scale = this.bgScale;
+    state.offsetX = this.bgOffsetX;
+    state.offsetY = this.bgOffsetY;
+    state.eggVersion = this.eggVersion;
+    return true;
+  }
+
+  drawLens(pointer) {
+    // Zoom logic: 2x magnification; zoom is render-texture pixels per world pixel
+    const magnification = 2;
+    const zoom = magnification * this.lensResolution;
     const lensDiameter = 100;
-    const viewWidth = lensDiameter / zoom;
-    const viewHeight = lensDiameter / zoom;
+    const viewWidth = lensDiameter / magnification;
+    const viewHeight = lensDiameter / magnification;
 
     // The "camera" of the render texture should be looking at the world coordinates
     // corresponding to the pointer's position.
@@ -1686,69 +1597,47 @@ class SectionHunt extends Phaser.Scene {
     this.zoomedView.draw(this.renderStamp, drawX, drawY);
 
     // Draw Eggs
-    // Visibility check: If egg is within the visual lens radius (pointer)
-    const lensRadiusSq = (lensDiameter / 2) * (lensDiameter / 2);
-
-    this.eggs.getChildren().forEach(egg => {
-      if (egg && egg.active) {
-        // Check distance to the POINTER (center of lens view)
-        const distSq = Phaser.Math.Distance.Squared(pointer.x, pointer.y, egg.x, egg.y);
-        const alpha = distSq < lensRadiusSq ? 1 : 0;
-
-        egg.setAlpha(alpha);
-        if (egg.symbolSprite) egg.symbolSprite.setAlpha(alpha);
-
-        if (alpha > 0) {
-            // Draw egg into render texture
-            this.eggStamp.setTexture(egg.texture.key, egg.frame.name);
-            this.eggStamp.setAngle(egg.angle);
-            this.eggStamp.setFlipX(egg.flipX);
-            this.eggStamp.setFlipY(egg.flipY);
-            this.eggStamp.setOrigin(0.5, 0.5);
-
-            // Scale egg by zoom factor
-            this.eggStamp.setScale(egg.scaleX * zoom, egg.scaleY * zoom);
-
-            // Calculate position in RT
-            const eggDrawX = (egg.x - scrollX) * zoom;
-            const eggDrawY = (egg.y - scrollY) * zoom;
-
-            this.zoomedView.draw(this.eggStamp, eggDrawX, eggDrawY);
-
-            if (egg.symbolSprite && egg.symbolSprite.active) {
-                this.eggStamp.setTexture(egg.symbolSprite.texture.key, egg.symbolSprite.frame.name);
-                this.eggStamp.setScale(egg.symbolSprite.scaleX * zoom, egg.symbolSprite.scaleY * zoom);
-                const symDrawX = (egg.symbolSprite.x - scrollX) * zoom;
-                const symDrawY = (egg.symbolSprite.y - scrollY) * zoom;
-                this.zoomedView.draw(this.eggStamp, symDrawX, symDrawY);
-            }
-        }
+    // Visibility check: only eggs the grid finds within the lens radius (pointer) are shown
+    const visibleEggs = this.eggGrid.query(pointer.x, pointer.y, lensDiameter / 2, this.lensEggScratch);
+
+    // Hide eggs that were under the lens last draw but no longer are
+    this.lensEggs.forEach(egg => {
+      if (egg.active && visibleEggs.indexOf(egg) === -1) {
+        egg.setAlpha(0);
+        if (egg.symbolSprite) egg.symbolSprite.setAlpha(0);
       }
     });
-
-    // Robust scaling check for Video in SectionHunt
-    if (this.isUsingVideo && this.sectionVideo && this.sectionVideo.active) {
-        if (this.sectionVideo.width > 0 && this.sectionVideo.height > 0) {
-             // Check if scale matches Cover requirement
-             const width = this.scale.width;
-             const height = this.scale.height;
-             const scaleX = width / 1280;
-             const scaleY = height / 720;
-             const targetScale = Math.max(scaleX, scaleY);
-             const targetDisplayW = 1280 * targetScale;
-
-             if (Math.abs(this.sectionVideo.displayWidth - targetDisplayW) > 5) {
-                 // console.log(`SectionHunt: Fixing video scale. Screen: ${width}x${height}, TargetW: ${targetDisplayW}`);
-                 this.sectionVideo.setDisplaySize(1280 * targetScale, 720 * targetScale);
-                 this.sectionVideo.setPosition(width/2, height/2);
-
-                 // Update globals used by lens
-                 this.bgScale = targetScale;
-                 this.bgOffsetX = (width - 1280 * targetScale) / 2;
-                 this.bgOffsetY = (height - 720 * targetScale) / 2;
-             }
+    this.lensEggScratch = this.lensEggs;
+    this.lensEggs = visibleEggs;
+
+    visibleEggs.forEach(egg => {
+        egg.setAlpha(1);
+        if (egg.symbolSprite) egg.symbolSprite.setAlpha(1);
+
+        // Draw egg into render texture
+        this.eggStamp.setTexture(egg.texture.key, egg.frame.name);
+        this.eggStamp.setAngle(egg.angle);
+        this.eggStamp.setFlipX(egg.flipX);
+        this.eggStamp.setFlipY(egg.flipY);
+        this.eggStamp.setOrigin(0.5, 0.5);
+
+        // Scale egg by zoom factor
+        this.eggStamp.setScale(egg.scaleX * zoom, egg.scaleY * zoom);
+
+        // Calculate position in RT
+        const eggDrawX = (egg.x - scrollX) * zoom;
+        const eggDrawY = (egg.y - scrollY) * zoom;
+
+        this.zoomedView.draw(this.eggStamp, eggDrawX, eggDrawY);
+
+        if (egg.symbolSprite && egg.symbolSprite.active) {
+            this.eggStamp.setTexture(egg.symbolSprite.texture.key, egg.symbolSprite.frame.name);
+            this.eggStamp.setScale(egg.symbolSprite.scaleX * zoom, egg.symbolSprite.scaleY * zoom);
+            const symDrawX = (egg.symbolSprite.x - scrollX) * zoom;
+            const symDrawY = (egg.symbolSprite.y - scrollY) * zoom;
+            this.zoomedView.draw(this.eggStamp, symDrawX, symDrawY);
         }
-    }
+    });
   }
 }
 
@@ -1760,93 +1649,62 @@ class EggZamRoom extends Phaser.Scene {
     this.explanationText = null;
     this.noEggsText = null;
     this.currentEgg = null;
+    this.leftBottleZone = null;
+    this.rightBottleZone = null;
+  }
+
+  preload() {
+    TextureBudget.get(this.game).acquire(this, ['egg-zam-room']);
   }
 
   create() {
     this.input.setDefaultCursor('none');
 
-    // Scale logic
-    const width = this.scale.width;
-    const height = this.scale.height;
-    const scaleX = width / 1280;
-    const scaleY = height / 720;
-    const scale = Math.min(scaleX, scaleY); // Fit logic for minigame usually better, but let's try cover or contained fit
-    // Background is 1280x720. Let's FIT.
-    const bgScale = Math.min(scaleX, scaleY);
-
-    // Position background centered
-    this.add.image(width/2, height/2, 'egg-zam-room')
-      .setDisplaySize(1280 * bgScale, 720 * bgScale)
-      .setDepth(0);
-
-    const examiner = this.add.image(0, 0, 'egg-zamminer').setOrigin(0, 0).setDepth(2);
-    // Original pos: 390, 250. Size? Default.
-    // Let's assume original design was 1280x720 fixed.
-    // We scale everything by 'scale' (min) to ensure UI fits on screen.
-    // But we need to center the "game area" in the viewport.
-
-    const uiScale = Math.min(scaleX, scaleY);
-    const offsetX = (width - 1280 * uiScale) / 2;
-    const offsetY = (height - 720 * uiScale) / 2;
-
-    // Examiner
-    examiner.setPosition(offsetX + 390 * uiScale, offsetY + 250 * uiScale);
-    examiner.setScale(uiScale);
-
-    this.examiner = examiner; // Store for relative positioning
-
-    this.add.image(offsetX + 200 * uiScale, offsetY + 50 * uiScale, 'symbol-result-summary-diag')
+    // Every piece is anchored in the 1280x720 design space (contained fit,
+    // centred in the viewport) so resizes move objects instead of restarting.
+    this.layout = new SceneLayout(this);
+
+    this.layout.add(this.add.image(0, 0, 'egg-zam-room').setDepth(0), { x: 640, y: 360, width: 1280, height: 720 });
+
+    this.examiner = this.layout.add(this.add.image(0, 0, 'egg-zamminer').setOrigin(0, 0).setDepth(2), { x: 390, y: 250, scale: 1 });
+
+    this.layout.add(this.add.image(0, 0, 'symbol-result-summary-diag')
       .setOrigin(0, 0)
-      .setDisplaySize(900 * uiScale, 600 * uiScale)
       .setDepth(1)
-      .setAlpha(0);
+      .setAlpha(0), { x: 200, y: 50, width: 900, height: 600 });
 
-    const eggZitButton = this.add.image(0, 200 * uiScale, 'egg-zit-button')
+    const eggZitButton = this.add.image(0, 0, 'egg-zit-button')
       .setOrigin(0, 0)
-      .setDisplaySize(150 * uiScale, 131 * uiScale)
       .setInteractive()
       .on('pointerdown', () => this.scene.start('MapScene'))
       .setDepth(4).setScrollFactor(0);
+    this.layout.add(eggZitButton, { x: 0, y: 200, width: 150, height: 131, space: 'screen' });
     addButtonInteraction(this, eggZitButton, 'drive1');
     addTooltip(this, eggZitButton, 'Back to Map');
 
-    this.add.image(0, 0, 'score')
+    this.layout.add(this.add.image(0, 0, 'score')
       .setOrigin(0, 0)
-      .setDisplaySize(200 * uiScale, 200 * uiScale)
-      .setDepth(4).setScrollFactor(0);
+      .setDepth(4).setScrollFactor(0), { x: 0, y: 0, width: 200, height: 200, space: 'screen' });
 
     const foundEggsCount = this.registry.get('foundEggs').length;
-    this.scoreText = this.add.text(50 * uiScale, 98 * uiScale, `${foundEggsCount}/${TOTAL_EGGS}`, {
-      fontSize: `${42 * uiScale}px`,
-      fill: '#000',
-      fontStyle: 'bold',
-      fontFamily: 'Comic Sans MS',
-      stroke: '#fff',
-      strokeThickness: 6 * uiScale
-    }).setDepth(5);
+    this.scoreText = HudText.add(this, 0, 0, `${foundEggsCount}/${TOTAL_EGGS}`, 42, 6).setDepth(5);
+    this.layout.add(this.scoreText, { x: 50, y: 98, fontSize: 42, strokeThickness: 6, space: 'screen' });
     this.lastFoundCount = foundEggsCount;
 
     if (!this.registry.has('correctCategorizations')) {
       this.registry.set('correctCategorizations', 0);
     }
 
-    this.correctText = this.add.text(100 * uiScale, 150 * uiScale, `Correct: ${this.registry.get('correctCategorizations')}`, {
-      fontSize: `${32 * uiScale}px`,
-      fill: '#000',
-      fontStyle: 'bold',
-      fontFamily: 'Comic Sans MS',
-      stroke: '#fff',
-      strokeThickness: 6 * uiScale
-    }).setDepth(5).setOrigin(0.5);
+    this.correctText = HudText.add(this, 0, 0, `Correct: ${this.registry.get('correctCategorizations')}`, 32, 6)
+      .setDepth(5).setOrigin(0.5);
+    this.layout.add(this.correctText, { x: 100, y: 150, fontSize: 32, strokeThickness: 6, space: 'screen' });
 
     // Create hover graphics for highlighting bottles
     this.hoverGraphics = this.add.graphics().setDepth(10);
 
-    // Zones need to be positioned relative to the SCALED examiner/room
-    // Original: 450, 300, 100x200
-    const leftBottleZone = this.add.zone(offsetX + 450 * uiScale, offsetY + 300 * uiScale, 100 * uiScale, 200 * uiScale).setOrigin(0, 0).setInteractive();
-    // Original: 750, 300, 100x200
-    const rightBottleZone = this.add.zone(offsetX + 750 * uiScale, offsetY + 300 * uiScale, 100 * uiScale, 200 * uiScale).setOrigin(0, 0).setInteractive();
+    // Zones follow the examiner's bottles (design 450,300 and 750,300, 100x200)
+    this.leftBottleZone = this.layout.add(this.add.zone(0, 0, 100, 200).setOrigin(0, 0).setInteractive(), { x: 450, y: 300, width: 100, height: 200 });
+    this.rightBottleZone = this.layout.add(this.add.zone(0, 0, 100, 200).setOrigin(0, 0).setInteractive(), { x: 750, y: 300, width: 100, height: 200 });
 
     const addZoneHover = (zone) => {
         zone.on('pointerover', () => {
@@ -1862,8 +1720,8 @@ class EggZamRoom extends Phaser.Scene {
         });
     };
 
-    addZoneHover(leftBottleZone);
-    addZoneHover(rightBottleZone);
+    addZoneHover(this.leftBottleZone);
+    addZoneHover(this.rightBottleZone);
 
     const showExplanation = (isCorrect, guessText) => {
         if (isCorrect) {
@@ -1871,16 +1729,23 @@ class EggZamRoom extends Phaser.Scene {
             const correctCount = this.registry.get('correctCategorizations') + 1;
             this.registry.set('correctCategorizations', correctCount);
             this.correctText.setText(`Correct: ${correctCount}`);
-            this.currentEgg.categorized = true;
+            HuntState.get(this.game).categorize(this.currentEgg.eggId);
         } else {
             this.sound.play('error');
         }
 
         if (this.explanationText) this.explanationText.destroy();
-        const data = this.currentEgg.symbolData;
+        const data = this.currentEgg.symbol;
         const eggId = this.currentEgg.eggId;
+        const uiScale = this.layout.metrics.scale;
 
-        this.explanationText = this.add.container(offsetX + 640 * uiScale, offsetY + 360 * uiScale).setDepth(100);
+        // Built at the current scale; later resizes re-centre it and scale it by the ratio
+        this.explanationText = this.layout.add(this.add.container(0, 0).setDepth(100), {
+            apply: (container, m) => {
+                container.setPosition(m.offsetX + 640 * m.scale, m.offsetY + 360 * m.scale);
+                if (!this.tweens.isTweening(container)) container.setScale(m.scale / uiScale);
+            }
+        });
 
         const bgWidth = 800 * uiScale;
         const bgHeight = 600 * uiScale;
@@ -1897,7 +1762,7 @@ class EggZamRoom extends Phaser.Scene {
             fontSize: `${48 * uiScale}px`, fill: '#8b4513', fontStyle: 'bold', fontFamily: 'Comic Sans MS'
         }).setOrigin(0.5);
 
-        const eggImg = this.add.image(-bgWidth/2 + 90 * uiScale, -bgHeight/2 + 90 * uiScale, `egg-${eggId}`).setDisplaySize(100 * uiScale, 125 * uiScale);
+        const eggImg = this.add.image(-bgWidth/2 + 90 * uiScale, -bgHeight/2 + 90 * uiScale, eggTextureKey(eggId)).setDisplaySize(100 * uiScale, 125 * uiScale);
         const symbolImgSmall = this.add.image(-bgWidth/2 + 90 * uiScale, -bgHeight/2 + 90 * uiScale, data.filename).setDisplaySize(100 * uiScale, 125 * uiScale);
 
         const guessDisplay = this.add.text(bgWidth/2 - 40 * uiScale, -bgHeight/2 + 60 * uiScale, `Your Guess:\n${guessText}`, {
@@ -1948,45 +1813,39 @@ class EggZamRoom extends Phaser.Scene {
                     if (!isCorrect) {
                         this.currentEgg = null; // Un-set so it can be re-drawn
                     }
-                    this.displayRandomEggInfo(offsetX, offsetY, uiScale);
+                    this.displayRandomEggInfo();
                 }
             });
         });
     };
 
-    leftBottleZone.on('pointerdown', () => {
+    this.leftBottleZone.on('pointerdown', () => {
       if (this.currentEgg && !this.currentEgg.categorized && !this.explanationText?.active) {
-        showExplanation(this.currentEgg.symbolData.category === 'Christian', 'Christian');
+        showExplanation(HuntCore.isCorrectGuess(this.currentEgg.symbol, 'Christian'), 'Christian');
       }
     });
 
-    rightBottleZone.on('pointerdown', () => {
+    this.rightBottleZone.on('pointerdown', () => {
       if (this.currentEgg && !this.currentEgg.categorized && !this.explanationText?.active) {
-        showExplanation(this.currentEgg.symbolData.category === 'Pagan', 'Worldly');
+        showExplanation(HuntCore.isCorrectGuess(this.currentEgg.symbol, 'Worldly'), 'Worldly');
       }
     });
 
-    this.displayRandomEggInfo(offsetX, offsetY, uiScale);
-
-    // Store scale params for update/resize if needed (or just restart scene on resize)
-    this.uiParams = { offsetX, offsetY, uiScale };
-
-    this.scale.on('resize', () => {
-        this.scene.restart(); // Simplest way to handle resizing complex UI layouts
-    });
+    this.displayRandomEggInfo();
   }
 
-  displayRandomEggInfo(offsetX, offsetY, scale) {
-    const foundEggs = this.registry.get('foundEggs');
+  displayRandomEggInfo() {
+    const huntState = HuntState.get(this.game);
+    const scale = this.layout.metrics.scale;
 
     if (this.currentEgg === null || this.currentEgg.categorized) {
-      const uncategorizedEggs = foundEggs.filter(egg => !egg.categorized);
-      if (uncategorizedEggs.length > 0) {
-        this.currentEgg = Phaser.Utils.Array.GetRandom(uncategorizedEggs);
+      const uncategorizedEgg = huntState.randomUncategorized();
+      if (uncategorizedEgg) {
+        this.currentEgg = uncategorizedEgg;
       } else {
         this.currentEgg = null;
         if (this.noEggsText) this.noEggsText.destroy();
-        this.noEggsText = this.add.text(offsetX + 420 * scale, offsetY + 220 * scale, "All eggs have been categorized!", {
+        this.noEggsText = this.add.text(0, 0, "All eggs have been categorized!", {
           fontSize: `${28 * scale}px`,
           fill: '#000',
           fontStyle: 'bold',
@@ -1995,10 +1854,18 @@ class EggZamRoom extends Phaser.Scene {
           strokeThickness: 3 * scale,
           wordWrap: { width: 480 * scale, useAdvancedWrap: true }
         }).setOrigin(0, 0);
+        this.layout.add(this.noEggsText, { x: 420, y: 220, fontSize: 28, strokeThickness: 3, wrapWidth: 480 });
 
-        if (foundEggs.length === TOTAL_EGGS) {
+        if (huntState.foundCount === TOTAL_EGGS) {
           // PLAY AGAIN Button
-          const playBtnContainer = this.add.container(offsetX + 420 * scale, offsetY + 300 * scale).setDepth(100);
+          const playBtnContainer = this.add.container(0, 0).setDepth(100);
+          this.layout.add(playBtnContainer, {
+              apply: (container, m) => {
+                  container.layoutScale = m.scale / scale;
+                  container.setPosition(m.offsetX + 420 * m.scale, m.offsetY + 300 * m.scale);
+                  container.setScale(container.layoutScale);
+              }
+          });
 
           const playBtnWidth = 250 * scale;
           const playBtnHeight = 60 * scale;
@@ -2023,16 +1890,17 @@ class EggZamRoom extends Phaser.Scene {
 
           playBtnContainer.on('pointerover', () => {
               this.input.setDefaultCursor('pointer');
-              playBtnContainer.setScale(1.05);
+              playBtnContainer.setScale(playBtnContainer.layoutScale * 1.05);
           });
 
           playBtnContainer.on('pointerout', () => {
               this.input.setDefaultCursor('default');
-              playBtnContainer.setScale(1);
+              playBtnContainer.setScale(playBtnContainer.layoutScale);
           });
 
           const triggerReload = () => {
               this.input.setDefaultCursor('default');
+              HuntSave.get(this.game).clear(); // PLAY AGAIN starts a fresh hunt instead of resuming
               window.location.reload();
           };
 
@@ -2051,21 +1919,15 @@ class EggZamRoom extends Phaser.Scene {
     if (this.noEggsText) this.noEggsText.destroy();
 
     if (this.currentEgg) {
-      const { eggId, symbolData } = this.currentEgg;
-      const eggPosX = offsetX + 630 * scale;
-      const eggPosY = offsetY + 350 * scale;
-      const symbolPosX = eggPosX;
-      const symbolPosY = eggPosY;
-
-      if (this.textures.exists(`egg-${eggId}`)) {
-        this.displayedEggImage = this.add.image(eggPosX, eggPosY, `egg-${eggId}`)
-          .setDisplaySize(100 * scale, 125 * scale)
-          .setDepth(3);
+      const { eggId, symbol: symbolData } = this.currentEgg;
+      // Egg and symbol share the examiner's window (design 630,350)
+      const windowAnchor = { x: 630, y: 350, width: 100, height: 125 };
+
+      if (this.textures.exists(eggTextureKey(eggId))) {
+        this.displayedEggImage = this.layout.add(this.add.image(0, 0, eggTextureKey(eggId)).setDepth(3), windowAnchor);
       }
       if (symbolData && symbolData.filename && this.textures.exists(symbolData.filename)) {
-        this.displayedSymbolImage = this.add.image(symbolPosX, symbolPosY, symbolData.filename)
-          .setDisplaySize(100 * scale, 125 * scale)
-          .setDepth(3);
+        this.displayedSymbolImage = this.layout.add(this.add.image(0, 0, symbolData.filename).setDepth(3), windowAnchor);
       }
     }
   }
@@ -2083,6 +1945,8 @@ class EggZamRoom extends Phaser.Scene {
  * Adds a "pop" animation to a game object on hover.
  */
 function addButtonInteraction(scene, button, soundKey = 'success') {
+  const animator = UiAnimator.get(scene);
+
   button.on('pointerover', () => {
     if (!button.isHovered) {
         button.baseScaleX = button.scaleX;
@@ -2091,26 +1955,14 @@ function addButtonInteraction(scene, button, soundKey = 'success') {
     button.isHovered = true;
 
     scene.tweens.killTweensOf(button);
-    scene.tweens.add({
-      targets: button,
-      scaleX: button.baseScaleX * 1.1,
-      scaleY: button.baseScaleY * 1.1,
-      duration: 100,
-      ease: 'Power1'
-    });
+    animator.scaleTo(button, button.baseScaleX * 1.1, button.baseScaleY * 1.1, 100);
   });
 
   button.on('pointerout', () => {
     button.isHovered = false;
     scene.tweens.killTweensOf(button);
     if (button.baseScaleX !== undefined && button.baseScaleY !== undefined) {
-      scene.tweens.add({
-        targets: button,
-        scaleX: button.baseScaleX,
-        scaleY: button.baseScaleY,
-        duration: 100,
-        ease: 'Power1'
-      });
+      animator.scaleTo(button, button.baseScaleX, button.baseScaleY, 100);
     }
   });
 
@@ -2126,57 +1978,189 @@ function addButtonInteraction(scene, button, soundKey = 'success') {
     }
 
     scene.tweens.killTweensOf(button);
-    scene.tweens.add({
-      targets: button,
-      scaleX: button.baseScaleX * 0.9,
-      scaleY: button.baseScaleY * 0.9,
-      duration: 50,
-      ease: 'Power1'
-    });
+    animator.scaleTo(button, button.baseScaleX * 0.9, button.baseScaleY * 0.9, 50);
   });
 
   button.on('pointerup', () => {
     if (button.baseScaleX !== undefined && button.baseScaleY !== undefined) {
       scene.tweens.killTweensOf(button);
-      scene.tweens.add({
-        targets: button,
-        scaleX: button.baseScaleX * 1.1,
-        scaleY: button.baseScaleY * 1.1,
-        duration: 100,
-        ease: 'Power1'
-      });
+      animator.scaleTo(button, button.baseScaleX * 1.1, button.baseScaleY * 1.1, 100);
     }
   });
 }
 
 /**
- * Parses a scripture string (e.g., "John 3:16" or "1 Peter 2:4") into a URL.
+ * Bakes a map thumbnail card (drop shadow, brown-bordered white card and the
+ * rounded section image) into one canvas texture at its on-screen pixel size,
+ * then applies it to `image`. MapScene then draws a plain sprite per section
+ * instead of two Graphics plus a geometry mask. Re-baking at an unchanged pixel
+ * size only re-applies the texture.
+ * @param {Phaser.GameObjects.Image} image - The thumbnail image inside the section container.
+ * @param {Object} section - Map section entry with `name` and `coords`.
+ * @param {number} scale - Map units to screen pixels (the container's scale).
  */
-function parseScriptureLink(scriptureText) {
-    if (!scriptureText) return null;
+function bakeMapThumbnail(image, section, scale) {
+  const textures = image.scene.textures;
+  const { width: w, height: h } = section.coords;
+  const pad = 7; // Border (5px + half the 4px stroke) and the 4px shadow offset fit in this margin
+  const radius = 15;
+  const key = `${section.name}-thumb-baked`;
+  const pixelW = Math.max(1, Math.round((w + pad * 2) * scale));
+  const pixelH = Math.max(1, Math.round((h + pad * 2) * scale));
+
+  let texture = textures.exists(key) ? textures.get(key) : null;
+  if (!texture || texture.width !== pixelW || texture.height !== pixelH) {
+    if (texture) texture.setSize(pixelW, pixelH);
+    else texture = textures.createCanvas(key, pixelW, pixelH);
+
+    const ctx = texture.getContext();
+    ctx.setTransform(1, 0, 0, 1, 0, 0);
+    ctx.clearRect(0, 0, pixelW, pixelH);
+    // Draw in map units around the card centre, exactly like the old Graphics did
+    ctx.setTransform(pixelW / (w + pad * 2), 0, 0, pixelH / (h + pad * 2), pixelW / 2, pixelH / 2);
+
+    traceRoundedRect(ctx, -w / 2 + 4, -h / 2 + 4, w, h, radius);
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.6)';
+    ctx.fill();
+
+    traceRoundedRect(ctx, -w / 2 - 5, -h / 2 - 5, w + 10, h + 10, radius + 2);
+    ctx.fillStyle = '#ffffff';
+    ctx.fill();
+    ctx.lineWidth = 4;
+    ctx.strokeStyle = '#8b4513';
+    ctx.stroke();
+
+    const thumbKey = `${section.name}-thumb`;
+    if (textures.exists(thumbKey)) {
+      ctx.save();
+      traceRoundedRect(ctx, -w / 2, -h / 2, w, h, radius);
+      ctx.clip();
+      ctx.drawImage(textures.get(thumbKey).getSourceImage(), -w / 2, -h / 2, w, h);
+      ctx.restore();
+    }
+    texture.refresh();
+  }
 
-    // Basic mapping of common book names to 3-letter codes used in the target URL
-    const bookMap = {
-        "genesis": "GEN", "exodus": "EXO", "leviticus": "LEV", "numbers": "NUM", "deuteronomy": "DEU",
-        "joshua": "JOS", "judges": "JDG", "ruth": "RUT", "1 samuel": "1SA", "2 samuel": "2SA",
-        "1 kings": "1KI", "2 kings": "2KI", "1 chronicles": "1CH", "2 chronicles": "2CH",
-        "ezra": "EZR", "nehemiah": "NEH", "esther": "EST", "job": "JOB", "psalms": "PSA", "psalm": "PSA",
-        "proverbs": "PRO", "ecclesiastes": "ECC", "song of solomon": "SNG", "isaiah": "ISA",
-        "jeremiah": "JER", "lamentations": "LAM", "ezekiel": "EZK", "daniel": "DAN", "hosea": "HOS",
-        "joel": "JOL", "amos": "AMO", "obadiah": "OBA", "jonah": "JON", "micah": "MIC",
-        "nahum": "NAM", "habakkuk": "HAB", "zephaniah": "ZEP", "haggai": "HAG", "zechariah": "ZEC",
-        "malachi": "MAL", "matthew": "MAT", "mark": "MRK", "luke": "LUK", "john": "JHN",
-        "acts": "ACT", "romans": "ROM", "1 corinthians": "1CO", "2 corinthians": "2CO",
-        "galatians": "GAL", "ephesians": "EPH", "philippians": "PHP", "colossians": "COL",
-        "1 thessalonians": "1TH", "2 thessalonians": "2TH", "1 timothy": "1TI", "2 timothy": "2TI",
-        "titus": "TIT", "philemon": "PHM", "hebrews": "HEB", "james": "JAS", "1 peter": "1PE",
-        "2 peter": "2PE", "1 john": "1JN", "2 john": "2JN", "3 john": "3JN", "jude": "JUD",
-        "revelation": "REV"
-    };
+  image.setTexture(key);
+  image.setDisplaySize(w + pad * 2, h + pad * 2);
+}
 
-    // Regex to extract Book, Chapter, and Verse. Handles "1 Peter 2:4-5" or "John 3:16"
-    const match = scriptureText.match(/^(\d?\s*[A-Za-z\s]+)\s+(\d+):(\d+)/);
-    if (match) {
+/**
+ * Adds a rounded-rectangle path to a 2D context (CanvasRenderingContext2D.roundRect
+ * is missing on older Safari).
+ */
+function traceRoundedRect(ctx, x, y, width, height, radius) {
+  ctx.beginPath();
+  ctx.moveTo(x + radius, y);
+  ctx.arcTo(x + width, y, x + width, y + height, radius);
+  ctx.arcTo(x + width, y + height, x, y + height, radius);
+  ctx.arcTo(x, y + height, x, y, radius);
+  ctx.arcTo(x, y, x + width, y, radius);
+  ctx.closePath();
+}
+
+/**
+ * Starts the level-complete stamp for a newly finished section. Uses the baked
+ * sprite-sheet animation (tools/stamp_sheet.py) when MapScene loaded it, so
+ * completed sections never spin up video decoders; otherwise falls back to the
+ * MULTIPLY blended stamp video. The sheet is released once the last stamp has
+ * played (or the scene shuts down), so it only holds GPU memory while in use.
+ * @param {Phaser.Scene} scene - The MapScene.
+ * @param {number} x - Stamp x position.
+ * @param {number} y - Stamp y position.
+ * @param {Function} onComplete - Called once the stamp finishes playing.
+ * @returns {Phaser.GameObjects.Sprite|Phaser.GameObjects.Video} The playing stamp.
+ */
+function playLevelCompleteStamp(scene, x, y, onComplete) {
+  const sfxVol = scene.registry.get('sfxVolume') !== undefined ? scene.registry.get('sfxVolume') : 0.5;
+
+  if (scene.textures.exists('level-complete-sheet')) {
+    if (!scene.anims.exists('level-complete-stamp-anim')) {
+      const meta = scene.textures.get('level-complete-sheet').customData.meta;
+      const frameMs = 1000 / meta.frameRate;
+      scene.anims.create({
+        key: 'level-complete-stamp-anim',
+        // Held frames were collapsed when baking; duration is the time added to frameMs
+        frames: meta.durations.map((duration, index) => ({
+          key: 'level-complete-sheet',
+          frame: `stamp-${String(index).padStart(3, '0')}`,
+          duration: duration - frameMs
+        })),
+        frameRate: meta.frameRate,
+        repeat: 0
+      });
+      scene.events.once('shutdown', () => releaseLevelCompleteSheet(scene));
+    }
+    scene.levelCompleteStamps = (scene.levelCompleteStamps || 0) + 1;
+    const stamp = scene.add.sprite(x, y, 'level-complete-sheet');
+    stamp.once('animationcomplete', () => {
+      onComplete();
+      scene.levelCompleteStamps--;
+      if (scene.levelCompleteStamps === 0) releaseLevelCompleteSheet(scene);
+    });
+    stamp.play('level-complete-stamp-anim');
+    if (scene.cache.audio.exists('level-complete-sfx')) {
+      scene.sound.play('level-complete-sfx', { volume: sfxVol });
+    }
+    return stamp;
+  }
+
+  const stampVideo = scene.add.video(x, y, 'level-complete');
+  stampVideo.setBlendMode(Phaser.BlendModes.MULTIPLY);
+  stampVideo.setVolume(sfxVol);
+  stampVideo.once('complete', onComplete);
+  stampVideo.play();
+  return stampVideo;
+}
+
+/**
+ * Drops the stamp animation and its sheet from the GPU; MapScene reloads the
+ * sheet the next time a section is completed.
+ * @param {Phaser.Scene} scene - The MapScene.
+ */
+function releaseLevelCompleteSheet(scene) {
+  scene.levelCompleteStamps = 0;
+  if (scene.anims.exists('level-complete-stamp-anim')) scene.anims.remove('level-complete-stamp-anim');
+  if (scene.textures.exists('level-complete-sheet')) scene.textures.remove('level-complete-sheet');
+}
+
+/**
+ * Texture key for an egg id. Ids past the shipped art (stress mode) wrap around.
+ * @param {number} eggId - 1-based egg id.
+ * @returns {string} The texture key, e.g. 'egg-7'.
+ */
+function eggTextureKey(eggId) {
+  return `egg-${((eggId - 1) % EGG_TEXTURE_COUNT) + 1}`;
+}
+
+/**
+ * Parses a scripture string (e.g., "John 3:16" or "1 Peter 2:4") into a URL.
+ */
+function parseScriptureLink(scriptureText) {
+    if (!scriptureText) return null;
+
+    // Basic mapping of common book names to 3-letter codes used in the target URL
+    const bookMap = {
+        "genesis": "GEN", "exodus": "EXO", "leviticus": "LEV", "numbers": "NUM", "deuteronomy": "DEU",
+        "joshua": "JOS", "judges": "JDG", "ruth": "RUT", "1 samuel": "1SA", "2 samuel": "2SA",
+        "1 kings": "1KI", "2 kings": "2KI", "1 chronicles": "1CH", "2 chronicles": "2CH",
+        "ezra": "EZR", "nehemiah": "NEH", "esther": "EST", "job": "JOB", "psalms": "PSA", "psalm": "PSA",
+        "proverbs": "PRO", "ecclesiastes": "ECC", "song of solomon": "SNG", "isaiah": "ISA",
+        "jeremiah": "JER", "lamentations": "LAM", "ezekiel": "EZK", "daniel": "DAN", "hosea": "HOS",
+        "joel": "JOL", "amos": "AMO", "obadiah": "OBA", "jonah": "JON", "micah": "MIC",
+        "nahum": "NAM", "habakkuk": "HAB", "zephaniah": "ZEP", "haggai": "HAG", "zechariah": "ZEC",
+        "malachi": "MAL", "matthew": "MAT", "mark": "MRK", "luke": "LUK", "john": "JHN",
+        "acts": "ACT", "romans": "ROM", "1 corinthians": "1CO", "2 corinthians": "2CO",
+        "galatians": "GAL", "ephesians": "EPH", "philippians": "PHP", "colossians": "COL",
+        "1 thessalonians": "1TH", "2 thessalonians": "2TH", "1 timothy": "1TI", "2 timothy": "2TI",
+        "titus": "TIT", "philemon": "PHM", "hebrews": "HEB", "james": "JAS", "1 peter": "1PE",
+        "2 peter": "2PE", "1 john": "1JN", "2 john": "2JN", "3 john": "3JN", "jude": "JUD",
+        "revelation": "REV"
+    };
+
+    // Regex to extract Book, Chapter, and Verse. Handles "1 Peter 2:4-5" or "John 3:16"
+    const match = scriptureText.match(/^(\d?\s*[A-Za-z\s]+)\s+(\d+):(\d+)/);
+    if (match) {
         const rawBook = match[1].trim().toLowerCase();
         const chapter = match[2];
         const verse = match[3];
@@ -2193,71 +2177,1744 @@ function parseScriptureLink(scriptureText) {
  * Adds a tooltip to a game object on hover.
  */
 function addTooltip(scene, object, text) {
-  let tooltipContainer = null;
+  object.on('pointerover', (pointer) => Tooltip.get(scene).show(object, text, pointer));
+
+  object.on('pointermove', (pointer) => {
+    const tooltip = Tooltip.get(scene);
+    if (tooltip.owner === object) tooltip.move(pointer);
+  });
 
-  object.on('pointerover', (pointer) => {
-    if (tooltipContainer) return;
+  const hide = () => {
+    if (scene.tooltip) scene.tooltip.hide(object);
+  };
+  object.on('pointerout', hide);
+  object.once('destroy', hide);
+}
 
-    const padding = 8;
-    const style = {
-      fontSize: '16px',
-      fontFamily: 'Comic Sans MS',
-      fill: '#ffffff'
+/**
+ * Scene-scoped listeners. Subscriptions.on() attaches a handler to a Phaser
+ * emitter (scale manager, registry.events, scene.events, loader, ...) or a DOM
+ * target and detaches it when the scene shuts down or is destroyed, so
+ * re-entering a scene never stacks another copy. Returns an unsubscribe
+ * function for listeners that should go away earlier.
+ *
+ * Subscriptions.counts() lists live subscriptions per emitter:event next to
+ * the emitter's own listener count, to spot leaks from the console.
+ */
+class Subscriptions {
+  static on(scene, emitter, event, fn, context) {
+    const isDom = typeof emitter.on !== 'function';
+    const handler = isDom && context ? fn.bind(context) : fn;
+    if (isDom) emitter.addEventListener(event, handler);
+    else emitter.on(event, fn, context);
+
+    const label = Subscriptions.label(scene, emitter) + ':' + event;
+    const entry = Subscriptions.live.get(label) || { emitter, event, count: 0 };
+    entry.count++;
+    Subscriptions.live.set(label, entry);
+
+    let subscribed = true;
+    const off = () => {
+      if (!subscribed) return;
+      subscribed = false;
+      if (isDom) emitter.removeEventListener(event, handler);
+      else emitter.off(event, fn, context);
+      if (--entry.count === 0) Subscriptions.live.delete(label);
+      scene.events.off('shutdown', off);
+      scene.events.off('destroy', off);
+    };
+    scene.events.once('shutdown', off);
+    scene.events.once('destroy', off);
+    return off;
+  }
+
+  static label(scene, emitter) {
+    if (emitter === scene.scale) return 'scale';
+    if (emitter === scene.registry.events) return 'registry';
+    if (emitter === scene.game.events) return 'game';
+    if (emitter === scene.events) return scene.scene.key + '.events';
+    if (emitter === window) return 'window';
+    if (emitter === document) return 'document';
+    return scene.scene.key + '.' + ((emitter.constructor && emitter.constructor.name) || 'emitter');
+  }
+
+  // { 'scale:resize': { subscribed, total }, ... }; total is only known for Phaser emitters
+  static counts() {
+    const counts = {};
+    Subscriptions.live.forEach((entry, label) => {
+      counts[label] = {
+        subscribed: entry.count,
+        total: typeof entry.emitter.listenerCount === 'function' ? entry.emitter.listenerCount(entry.event) : null
+      };
+    });
+    return counts;
+  }
+}
+Subscriptions.live = new Map(); // 'emitter:event' -> { emitter, event, count }
+
+// Estimated GPU texture budgets (MB) per device class. Mobile Safari drops the
+// WebGL context long before desktop browsers do, so phones get the tightest cap.
+const TEXTURE_BUDGET_MB = { desktop: 256, tablet: 96, phone: 48 };
+
+/**
+ * Estimates GPU bytes per texture key and evicts the least recently used
+ * section textures once the device budget is exceeded. Evicted keys are queued
+ * again through the loader the next time a scene acquires them.
+ */
+class TextureBudget {
+  static get(game) {
+    if (!game.textureBudget) game.textureBudget = new TextureBudget(game);
+    return game.textureBudget;
+  }
+
+  static deviceClass(game) {
+    const os = game.device.os;
+    // iPadOS Safari reports itself as macOS, touch points give it away
+    const isTouchMac = os.macOS && navigator.maxTouchPoints > 1;
+    if (os.desktop && !isTouchMac) return 'desktop';
+    return Math.min(screen.width, screen.height) >= 600 ? 'tablet' : 'phone';
+  }
+
+  static estimateBytes(texture) {
+    // Uncompressed RGBA, no mipmaps (our textures are not power-of-two)
+    return texture.source.reduce((sum, source) => sum + source.width * source.height * 4, 0);
+  }
+
+  constructor(game) {
+    this.game = game;
+    this.deviceClass = TextureBudget.deviceClass(game);
+    this.budgetBytes = TEXTURE_BUDGET_MB[this.deviceClass] * 1024 * 1024;
+    this.totalBytes = 0;
+    this.bytes = new Map();     // key -> estimated GPU bytes
+    this.sources = new Map();   // key -> { type, url } used to reload after eviction
+    this.lastUsed = new Map();  // key -> game time of the last acquire
+    this.pins = new Map();      // key -> number of running scenes using it
+    this.evictable = new Set();
+
+    Object.keys(game.textures.list).forEach(key => this.onAdd(key, game.textures.list[key]));
+    game.textures.on('addtexture', this.onAdd, this);
+    game.textures.on('removetexture', this.onRemove, this);
+  }
+
+  onAdd(key, texture) {
+    const bytes = TextureBudget.estimateBytes(texture);
+    this.totalBytes += bytes - (this.bytes.get(key) || 0);
+    this.bytes.set(key, bytes);
+  }
+
+  onRemove(key) {
+    this.totalBytes -= this.bytes.get(key) || 0;
+    this.bytes.delete(key);
+  }
+
+  markEvictable(keys) {
+    keys.forEach(key => this.evictable.add(key));
+  }
+
+  // Remembers where evictable textures loaded by this scene came from
+  track(scene) {
+    const onLoad = (file) => {
+      if (this.evictable.has(file.key)) this.sources.set(file.key, { type: file.type, url: file.url });
     };
+    scene.load.on('load', onLoad);
+    scene.events.once('shutdown', () => scene.load.off('load', onLoad));
+  }
+
+  // Call from preload(): pins the keys until the scene shuts down and queues
+  // any that were evicted so they are resident again before create(). The
+  // budget is enforced once the scene's loader has finished.
+  acquire(scene, keys) {
+    const now = this.game.loop.time;
+    this.track(scene);
+    scene.load.once('complete', () => this.enforce());
+
+    keys.forEach(key => {
+      this.pins.set(key, (this.pins.get(key) || 0) + 1);
+      this.lastUsed.set(key, now);
+
+      const source = this.sources.get(key);
+      if (!this.game.textures.exists(key) && source && typeof scene.load[source.type] === 'function') {
+        scene.load[source.type](key, source.url);
+      }
+    });
 
-    const textObj = scene.add.text(0, 0, text, style);
-    const width = textObj.width + padding * 2;
-    const height = textObj.height + padding * 2;
+    scene.events.once('shutdown', () => {
+      keys.forEach(key => {
+        const count = (this.pins.get(key) || 1) - 1;
+        if (count > 0) this.pins.set(key, count);
+        else this.pins.delete(key);
+      });
+    });
+  }
+
+  enforce() {
+    if (this.totalBytes <= this.budgetBytes) return;
+
+    const candidates = [...this.evictable]
+      .filter(key => !this.pins.has(key) && this.bytes.has(key) && this.sources.has(key))
+      .sort((a, b) => (this.lastUsed.get(a) || 0) - (this.lastUsed.get(b) || 0));
+
+    for (const key of candidates) {
+      if (this.totalBytes <= this.budgetBytes) break;
+      // Destroys the WebGLTexture; onRemove() updates the running total
+      this.game.textures.remove(key);
+    }
+  }
+}
 
-    const bg = scene.add.graphics();
-    bg.fillStyle(0x000000, 0.8);
-    bg.fillRoundedRect(-width/2, -height/2, width, height, 5);
+// Worker source for decoding image blobs off the main thread. Loaded from a
+// Blob URL (allowed by the worker-src CSP) so it ships inside this file.
+const IMAGE_DECODE_WORKER_SOURCE = `
+self.onmessage = (event) => {
+  const { id, blob } = event.data;
+  createImageBitmap(blob, { premultiplyAlpha: 'premultiply' })
+    .then(bitmap => self.postMessage({ id, bitmap }, [bitmap]))
+    .catch(error => self.postMessage({ id, error: String(error) }));
+};
+`;
 
-    textObj.setOrigin(0.5, 0.5);
+const imageDecoder = {
+  worker: undefined, // undefined = not tried yet, null = unavailable
+  pending: new Map(),
+  nextId: 1,
 
-    // Position slightly above the pointer
-    // Use pointer.x/y for screen coordinates since tooltip is fixed to screen
-    tooltipContainer = scene.add.container(pointer.x, pointer.y - 30, [bg, textObj]);
-    tooltipContainer.setDepth(1000);
-    tooltipContainer.setScrollFactor(0);
+  getWorker() {
+    if (this.worker !== undefined) return this.worker;
+    this.worker = null;
+    if (typeof Worker === 'undefined' || typeof createImageBitmap === 'undefined') return null;
 
-    // Basic bounds check
-    const cam = scene.cameras.main;
-    if (tooltipContainer.x + width/2 > cam.width) {
-        tooltipContainer.x = cam.width - width/2 - 5;
+    try {
+      const url = URL.createObjectURL(new Blob([IMAGE_DECODE_WORKER_SOURCE], { type: 'text/javascript' }));
+      this.worker = new Worker(url);
+      URL.revokeObjectURL(url);
+      this.worker.onmessage = (event) => {
+        const { id, bitmap, error } = event.data;
+        const request = this.pending.get(id);
+        if (!request) return;
+        this.pending.delete(id);
+        if (bitmap) request.resolve(bitmap);
+        else request.reject(new Error(error));
+      };
+      this.worker.onerror = () => {
+        // Worker could not start (or crashed): decode the rest on the main thread
+        this.worker = null;
+        this.pending.forEach(request => request.reject(new Error('Decode worker failed')));
+        this.pending.clear();
+      };
+    } catch (e) {
+      console.warn('ImageDecoder: worker unavailable, decoding on the main thread.', e);
+      this.worker = null;
     }
-    if (tooltipContainer.x - width/2 < 0) {
-        tooltipContainer.x = width/2 + 5;
+    return this.worker;
+  },
+
+  decodeInWorker(blob) {
+    const worker = this.getWorker();
+    if (!worker) return Promise.reject(new Error('No decode worker'));
+    const id = this.nextId++;
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      worker.postMessage({ id, blob });
+    });
+  },
+
+  decodeWithElement(blob) {
+    const url = URL.createObjectURL(blob);
+    const image = new Image();
+    image.src = url;
+    const loaded = image.decode
+        ? image.decode()
+        : new Promise((resolve, reject) => { image.onload = resolve; image.onerror = reject; });
+    return loaded.then(() => image).finally(() => URL.revokeObjectURL(url));
+  },
+
+  // Worker createImageBitmap -> main-thread createImageBitmap (still decoded
+  // off-thread by the browser) -> <img>.decode() for browsers without it
+  decode(blob) {
+    return this.decodeInWorker(blob)
+      .catch(() => typeof createImageBitmap !== 'undefined'
+          ? createImageBitmap(blob, { premultiplyAlpha: 'premultiply' })
+          : Promise.reject(new Error('createImageBitmap unsupported')))
+      .catch(() => this.decodeWithElement(blob));
+  }
+};
+
+/**
+ * Image loader file type that fetches the image as a Blob and decodes it
+ * before the WebGL upload, so the upload in addToCache() does not stall the
+ * main thread on a synchronous decode. Use as `this.load.decodedImage(key, url)`.
+ */
+class DecodedImageFile extends Phaser.Loader.File {
+  constructor(loader, key, url, xhrSettings) {
+    super(loader, {
+      type: 'decodedImage',
+      cache: loader.textureManager,
+      extension: 'png',
+      responseType: 'blob',
+      key: key,
+      url: url,
+      xhrSettings: xhrSettings
+    });
+  }
+
+  onProcess() {
+    this.state = Phaser.Loader.FILE_PROCESSING;
+
+    imageDecoder.decode(this.xhrLoader.response)
+      .then(image => {
+        this.data = image;
+        this.onProcessComplete();
+      })
+      .catch(error => {
+        console.warn(`DecodedImageFile: Failed to decode '${this.key}' from ${this.url}`, error);
+        this.onProcessError();
+      });
+  }
+
+  addToCache() {
+    this.cache.addImage(this.key, this.data);
+  }
+}
+
+Phaser.Loader.FileTypesManager.register('decodedImage', function (key, url, xhrSettings) {
+  this.addFile(new DecodedImageFile(this, key, url, xhrSettings));
+  return this;
+});
+
+// Magnifies a soft-edged circle of the framebuffer in place: fragments within
+// uRadius of uCenter sample the point uZoom times closer to it. uCenter is in
+// framebuffer pixels (origin bottom-left), uRadius in pixels.
+const MAGNIFIER_FRAG = `
+#define SHADER_NAME MAGNIFIER_FS
+
+precision mediump float;
+
+uniform sampler2D uMainSampler;
+uniform vec2 uResolution;
+uniform vec2 uCenter;
+uniform float uRadius;
+uniform float uZoom;
+
+varying vec2 outTexCoord;
+
+void main()
+{
+    vec2 pixel = outTexCoord * uResolution;
+    vec2 zoomed = (uCenter + (pixel - uCenter) / uZoom) / uResolution;
+    float inside = 1.0 - smoothstep(uRadius - 1.0, uRadius, distance(pixel, uCenter));
+    gl_FragColor = mix(texture2D(uMainSampler, outTexCoord), texture2D(uMainSampler, zoomed), inside);
+}
+`;
+
+class MagnifierFX extends Phaser.Renderer.WebGL.Pipelines.PostFXPipeline {
+  constructor(game) {
+    super({ game: game, name: 'MagnifierFX', fragShader: MAGNIFIER_FRAG });
+    this.lensX = 0;
+    this.lensY = 0;
+    this.radius = 0;
+    this.zoom = 1;
+  }
+
+  setLens(x, y, radius, zoom) {
+    this.lensX = x;
+    this.lensY = y;
+    this.radius = radius;
+    this.zoom = zoom;
+  }
+
+  onPreRender() {
+    const width = this.renderer.width;
+    const height = this.renderer.height;
+    this.set2f('uResolution', width, height);
+    this.set2f('uCenter', this.lensX, height - this.lensY);
+    this.set1f('uRadius', this.radius);
+    this.set1f('uZoom', this.zoom);
+  }
+}
+
+/**
+ * Single-pass WebGL magnifier. The background and the eggs are drawn once, into
+ * a Layer whose MagnifierFX post pass redraws the lens circle from that same
+ * framebuffer at the zoom factor; the HUD and the glass draw over it untouched.
+ * Eggs stay hidden except under the lens, cropped to the patch it magnifies so
+ * none of them shows outside it. Replaces the RenderTexture + geometry mask +
+ * per-egg draw() lens; create() returns null on the Canvas renderer so
+ * callers keep that path as the fallback.
+ */
+class ShaderLens {
+  static supported(renderer) {
+    return !!renderer && renderer.type === Phaser.WEBGL && !!renderer.pipelines;
+  }
+
+  static create(scene, zoom) {
+    const renderer = scene.sys.renderer;
+    if (!ShaderLens.supported(renderer)) return null;
+    renderer.pipelines.addPostPipeline('MagnifierFX', MagnifierFX);
+    return new ShaderLens(scene, zoom);
+  }
+
+  constructor(scene, zoom) {
+    this.zoom = zoom;
+    this.x = 0;
+    this.y = 0;
+    this.radius = 0;
+    this.layer = scene.add.layer().setDepth(0).setPostPipeline(MagnifierFX);
+    this.fx = this.layer.getPostPipeline(MagnifierFX);
+  }
+
+  // Moves a background or egg sprite into the magnified layer
+  add(gameObject) {
+    this.layer.add(gameObject);
+    return gameObject;
+  }
+
+  // A radius of 0 switches the lens off
+  update(x, y, radius) {
+    this.x = x;
+    this.y = y;
+    this.radius = radius;
+    if (this.fx) this.fx.setLens(x, y, radius, this.zoom);
+  }
+
+  // Shows an egg sprite cropped to the square the lens magnifies, which sits
+  // inside the lens circle, or hides it when none of it is under the lens
+  crop(image) {
+    const half = this.radius / this.zoom;
+    const left = image.x - image.displayWidth * image.originX;
+    const top = image.y - image.displayHeight * image.originY;
+    const x0 = Phaser.Math.Clamp((this.x - half - left) / image.scaleX, 0, image.width);
+    const x1 = Phaser.Math.Clamp((this.x + half - left) / image.scaleX, 0, image.width);
+    const y0 = Phaser.Math.Clamp((this.y - half - top) / image.scaleY, 0, image.height);
+    const y1 = Phaser.Math.Clamp((this.y + half - top) / image.scaleY, 0, image.height);
+    if (x1 <= x0 || y1 <= y0) return image.setAlpha(0);
+    return image.setCrop(x0, y0, x1 - x0, y1 - y0).setAlpha(1);
+  }
+}
+/**
+ * Uniform-grid spatial index over egg positions. Rebuild it whenever eggs move
+ * (resize) or leave (collection); lens and tap checks then only visit the cells
+ * that overlap the query circle instead of every egg in the section.
+ */
+class EggGrid {
+  constructor(cellSize) {
+    this.cellSize = Math.max(1, cellSize);
+    this.cells = new Map();
+  }
+
+  cellKey(cx, cy) {
+    // Offset keeps slightly off-screen (negative) cells unique without string keys
+    return (cy + 4096) * 8192 + (cx + 4096);
+  }
+
+  rebuild(eggs, cellSize = this.cellSize) {
+    this.cellSize = Math.max(1, cellSize);
+    this.cells.clear();
+    eggs.forEach(egg => {
+      if (!egg || !egg.active) return;
+      const key = this.cellKey(Math.floor(egg.x / this.cellSize), Math.floor(egg.y / this.cellSize));
+      const cell = this.cells.get(key);
+      if (cell) cell.push(egg);
+      else this.cells.set(key, [egg]);
+    });
+  }
+
+  // Collects active eggs strictly within `radius` of (x, y) into `out`
+  query(x, y, radius, out = []) {
+    out.length = 0;
+    const radiusSq = radius * radius;
+    const minX = Math.floor((x - radius) / this.cellSize);
+    const maxX = Math.floor((x + radius) / this.cellSize);
+    const minY = Math.floor((y - radius) / this.cellSize);
+    const maxY = Math.floor((y + radius) / this.cellSize);
+    for (let cy = minY; cy <= maxY; cy++) {
+      for (let cx = minX; cx <= maxX; cx++) {
+        const cell = this.cells.get(this.cellKey(cx, cy));
+        if (!cell) continue;
+        for (let i = 0; i < cell.length; i++) {
+          const egg = cell[i];
+          if (egg.active && Phaser.Math.Distance.Squared(x, y, egg.x, egg.y) < radiusSq) out.push(egg);
+        }
+      }
     }
-    if (tooltipContainer.y - height/2 < 0) {
-        tooltipContainer.y = pointer.y + 40; // Flip below
+    return out;
+  }
+}
+
+// Candidates tried around each active sample before it is retired (Bridson's k)
+const POISSON_TRIES = 30;
+// A maximal Bridson set holds about 0.7 samples per r^2 of free area. The
+// radius is sized for 25% more samples than eggs so the pick below has slack.
+const POISSON_DENSITY = 0.7;
+const POISSON_HEADROOM = 1.25;
+
+/**
+ * Places a section's eggs in one pass. Bridson's Poisson-disk sampling fills
+ * the bounds, minus the exclusion rects, with samples at least `radius` apart.
+ * A random subset of them becomes the eggs, so eggs never overlap and are
+ * spread over the whole area. The radius comes from the free area and the
+ * egg count, and the background grid holds about one sample per cell, so the
+ * cost is O(count). All randomness is drawn from `rnd`, so a saved seed
+ * reproduces the layout.
+ */
+class EggPlacer {
+  // bounds/exclusions are { x, y, width, height }; returns `count` { x, y } points
+  static place(rnd, count, bounds, exclusions = []) {
+    if (count <= 0) return [];
+    const area = Math.max(1, bounds.width) * Math.max(1, bounds.height);
+    const blocked = exclusions.reduce((sum, rect) => sum + EggPlacer.overlap(bounds, rect), 0);
+    let radius = Math.sqrt(POISSON_DENSITY * Math.max(area - blocked, area * 0.1) / (count * POISSON_HEADROOM));
+
+    let samples = [];
+    for (let attempt = 0; attempt < 4; attempt++, radius *= 0.8) {
+      samples = EggPlacer.sample(rnd, bounds, exclusions, radius);
+      if (samples.length >= count) return rnd.shuffle(samples).slice(0, count);
     }
-  });
 
-  object.on('pointermove', (pointer) => {
-    if (tooltipContainer) {
-        tooltipContainer.setPosition(pointer.x, pointer.y - 30);
+    // Only a viewport too small for the HUD gets here: keep every egg, spacing or not
+    while (samples.length < count) samples.push(EggPlacer.randomPoint(rnd, bounds, exclusions));
+    return samples;
+  }
+
+  static sample(rnd, bounds, exclusions, radius) {
+    const cellSize = radius / Math.SQRT2;
+    const columns = Math.max(1, Math.ceil(bounds.width / cellSize));
+    const rows = Math.max(1, Math.ceil(bounds.height / cellSize));
+    const grid = new Int32Array(columns * rows).fill(-1);
+    const samples = [];
+    const active = [];
+    const radiusSq = radius * radius;
+
+    const accept = (x, y) => {
+      if (x < bounds.x || y < bounds.y || x > bounds.x + bounds.width || y > bounds.y + bounds.height) return false;
+      if (EggPlacer.excluded(x, y, exclusions)) return false;
+      const cx = Math.min(columns - 1, Math.floor((x - bounds.x) / cellSize));
+      const cy = Math.min(rows - 1, Math.floor((y - bounds.y) / cellSize));
+      // Cells are r/sqrt(2) wide, so any neighbour closer than r is within 2 cells
+      for (let ny = Math.max(0, cy - 2); ny <= Math.min(rows - 1, cy + 2); ny++) {
+        for (let nx = Math.max(0, cx - 2); nx <= Math.min(columns - 1, cx + 2); nx++) {
+          const index = grid[ny * columns + nx];
+          if (index !== -1 && Phaser.Math.Distance.Squared(x, y, samples[index].x, samples[index].y) < radiusSq) return false;
+        }
+      }
+      grid[cy * columns + cx] = samples.length;
+      active.push(samples.length);
+      samples.push({ x, y });
+      return true;
+    };
 
-        const height = tooltipContainer.getBounds().height;
-        if (pointer.y - 30 - height/2 < 0) {
-             tooltipContainer.y = pointer.y + 40;
+    // Exclusions can cut the area into pieces, so each piece gets a few seed throws
+    for (let seeds = 0; seeds < POISSON_TRIES; seeds++) {
+      accept(bounds.x + rnd.frac() * bounds.width, bounds.y + rnd.frac() * bounds.height);
+
+      while (active.length > 0) {
+        const slot = rnd.between(0, active.length - 1);
+        const origin = samples[active[slot]];
+        let placed = false;
+        for (let tries = 0; tries < POISSON_TRIES && !placed; tries++) {
+          const angle = rnd.frac() * Math.PI * 2;
+          const distance = radius * (1 + rnd.frac());
+          placed = accept(origin.x + Math.cos(angle) * distance, origin.y + Math.sin(angle) * distance);
+        }
+        if (!placed) {
+          active[slot] = active[active.length - 1];
+          active.pop();
         }
+      }
     }
-  });
+    return samples;
+  }
 
-  object.on('pointerout', () => {
-    if (tooltipContainer) {
-      tooltipContainer.destroy();
-      tooltipContainer = null;
+  static randomPoint(rnd, bounds, exclusions) {
+    let x = bounds.x;
+    let y = bounds.y;
+    for (let tries = 0; tries < POISSON_TRIES; tries++) {
+      x = bounds.x + rnd.frac() * Math.max(0, bounds.width);
+      y = bounds.y + rnd.frac() * Math.max(0, bounds.height);
+      if (!EggPlacer.excluded(x, y, exclusions)) break;
     }
-  });
+    return { x, y };
+  }
+
+  static excluded(x, y, exclusions) {
+    for (let i = 0; i < exclusions.length; i++) {
+      const rect = exclusions[i];
+      if (x >= rect.x && x < rect.x + rect.width && y >= rect.y && y < rect.y + rect.height) return true;
+    }
+    return false;
+  }
+
+  static overlap(a, b) {
+    const width = Math.min(a.x + a.width, b.x + b.width) - Math.max(a.x, b.x);
+    const height = Math.min(a.y + a.height, b.y + b.height) - Math.max(a.y, b.y);
+    return width > 0 && height > 0 ? width * height : 0;
+  }
+}
+
+/**
+ * Counts presented frames of a Phaser Video so the canvas lens redraws once per
+ * decoded frame rather than once per display refresh. Without
+ * requestVideoFrameCallback it falls back to polling the element's decoded-frame
+ * counter (or the playback position) once per game step.
+ */
+class VideoFrameClock {
+  constructor(scene, video) {
+    this.frame = 0;
+    this.element = video.video;
+    this.handle = null;
+    this.stopPolling = null;
+    this.active = true;
+
+    if (this.element && typeof this.element.requestVideoFrameCallback === 'function') {
+      const onFrame = () => {
+        if (!this.active) return;
+        this.frame++;
+        this.handle = this.element.requestVideoFrameCallback(onFrame);
+      };
+      this.handle = this.element.requestVideoFrameCallback(onFrame);
+    } else {
+      const element = this.element;
+      const poll = () => {
+        if (element && typeof element.webkitDecodedFrameCount === 'number') this.frame = element.webkitDecodedFrameCount;
+        else if (element && element.getVideoPlaybackQuality) this.frame = element.getVideoPlaybackQuality().totalVideoFrames;
+        else this.frame = video.getCurrentTime();
+      };
+      scene.events.on('preupdate', poll);
+      this.stopPolling = () => scene.events.off('preupdate', poll);
+    }
+    scene.events.once('shutdown', () => this.destroy());
+  }
+
+  destroy() {
+    if (!this.active) return;
+    this.active = false;
+    if (this.handle !== null && this.element && this.element.cancelVideoFrameCallback) {
+      this.element.cancelVideoFrameCallback(this.handle);
+    }
+    if (this.stopPolling) this.stopPolling();
+  }
+}
+
+// Quality tiers from richest to cheapest; each tier keeps the savings of the ones before it
+const QUALITY_TIERS = ['full', 'still-backgrounds', 'low-res-lens'];
+
+/**
+ * Watches measured frame times and steps the game down through QUALITY_TIERS
+ * when the frame budget is blown, then back up once there is headroom again.
+ * The current tier is published on the registry ('qualityTier' and
+ * 'qualityTierName') for scenes and telemetry.
+ */
+class QualityGovernor {
+  static get(game) {
+    if (!game.qualityGovernor) game.qualityGovernor = new QualityGovernor(game);
+    return game.qualityGovernor;
+  }
 
-  object.once('destroy', () => {
-      if (tooltipContainer) {
-          tooltipContainer.destroy();
-          tooltipContainer = null;
+  constructor(game) {
+    this.game = game;
+    this.tier = 0;
+    // The shader lens has no lens texture to shrink, so 'low-res-lens' would only cost a sample window there
+    const lowResLens = QUALITY_TIERS.indexOf('low-res-lens');
+    this.tiers = QUALITY_TIERS.map((name, tier) => tier)
+      .filter(tier => tier !== lowResLens || !ShaderLens.supported(game.renderer));
+    this.maxTier = this.tiers[this.tiers.length - 1];
+    this.samples = [];
+    this.windowSize = 120;      // Frames per judgement (~2s at 60fps)
+    this.slowFrameMs = 22;      // Median above this (~45fps) is over budget
+    this.fastFrameMs = 18;      // Median below this has headroom to step back up
+    this.windowsToStepUp = 3;   // Doubles each time a step up has to be undone quickly
+    this.goodWindows = 0;
+    this.cooldownUntil = 0;
+    this.steppedUpAt = -Infinity;
+
+    this.publish();
+    game.events.on('postrender', this.sample, this);
+  }
+
+  get allowsSectionVideo() {
+    return this.tier < 1;
+  }
+
+  // Fraction of the on-screen lens size the lens RenderTexture is drawn at
+  get lensResolution() {
+    return this.tier >= 2 ? 0.5 : 1;
+  }
+
+  sample() {
+    const now = performance.now();
+    const delta = this.game.loop.delta;
+    // Hidden tabs and long stalls (loading, GC) say nothing about steady-state cost
+    if (document.hidden || delta > 250) return;
+
+    this.samples.push(delta);
+    if (this.samples.length < this.windowSize) return;
+
+    this.samples.sort((a, b) => a - b);
+    const median = this.samples[this.samples.length >> 1];
+    this.samples.length = 0;
+    if (now < this.cooldownUntil) return;
+
+    const overBudget = median > this.slowFrameMs;
+    const headroom = median < this.fastFrameMs;
+
+    if (overBudget && this.tier < this.maxTier) {
+      // Stepping up only to fall straight back down means we are on the edge; wait longer next time
+      if (now - this.steppedUpAt < 10000) this.windowsToStepUp = Math.min(this.windowsToStepUp * 2, 32);
+      this.setTier(this.neighbourTier(1));
+    } else if (headroom && this.tier > 0) {
+      if (++this.goodWindows >= this.windowsToStepUp) {
+        this.steppedUpAt = now;
+        this.setTier(this.neighbourTier(-1));
       }
-  });
+    } else {
+      this.goodWindows = 0;
+    }
+  }
+
+  // Next usable tier down (1) or up (-1) from the current one
+  neighbourTier(direction) {
+    const index = this.tiers.findIndex(tier => tier >= this.tier);
+    return this.tiers[Phaser.Math.Clamp(index + direction, 0, this.tiers.length - 1)];
+  }
+
+  setTier(tier) {
+    this.tier = Phaser.Math.Clamp(tier, 0, this.maxTier);
+    this.goodWindows = 0;
+    this.samples.length = 0;
+    this.cooldownUntil = performance.now() + 2000; // Let the change settle before judging again
+    this.publish();
+  }
+
+  publish() {
+    this.game.registry.set('qualityTier', this.tier);
+    this.game.registry.set('qualityTierName', QUALITY_TIERS[this.tier]);
+  }
+}
+
+// Bump when a field of window.__perf.snapshot() changes meaning or goes away
+const PERF_API_VERSION = 1;
+
+/**
+ * The supported way for tests, benchmarks and soak runs to read runtime cost:
+ * window.__perf. It is always present but only { version, enabled, enable,
+ * disable, reset, snapshot } until enable() (or ?perf in the URL) installs the
+ * timers, so a normal session pays nothing.
+ *
+ * Once enabled it wraps each scene's step/render, and the WebGL draw and
+ * bindTexture calls. snapshot() reports means since the last reset() plus
+ * point-in-time counts (texture memory, videos, tweens, listeners); see
+ * tools/perf_sampler.py for the reader.
+ */
+class PerfProbe {
+  static install(game) {
+    const probe = new PerfProbe(game);
+    window.__perf = {
+      version: PERF_API_VERSION,
+      get enabled() { return probe.enabled; },
+      enable: () => probe.enable(),
+      disable: () => probe.disable(),
+      reset: () => probe.reset(),
+      snapshot: () => probe.snapshot()
+    };
+    if (new URLSearchParams(window.location.search).has('perf')) {
+      game.events.once('ready', () => probe.enable());
+    }
+    return probe;
+  }
+
+  constructor(game) {
+    this.game = game;
+    this.enabled = false;
+    this.restore = []; // Undo functions for every wrapped method
+    this.scenes = new Map(); // key -> { update, render, lastUpdate, lastRender }
+    this.gpu = { drawCalls: 0, textureBinds: 0 };
+    this.frameGpu = { drawCalls: 0, textureBinds: 0 };
+    this.frames = 0;
+    this.frameMs = 0;
+    this.resetAt = performance.now();
+  }
+
+  enable() {
+    if (this.enabled) return;
+    this.enabled = true;
+    this.reset();
+
+    this.game.scene.scenes.forEach(scene => {
+      const timing = { update: 0, render: 0, lastUpdate: 0, lastRender: 0 };
+      this.scenes.set(scene.sys.settings.key, timing);
+      this.wrap(scene.sys, 'step', (original, args) => {
+        const start = performance.now();
+        original.apply(scene.sys, args);
+        timing.lastUpdate = performance.now() - start;
+        timing.update += timing.lastUpdate;
+      });
+      this.wrap(scene.sys, 'render', (original, args) => {
+        const start = performance.now();
+        original.apply(scene.sys, args);
+        timing.lastRender = performance.now() - start;
+        timing.render += timing.lastRender;
+      });
+    });
+
+    const gl = this.game.renderer && this.game.renderer.gl;
+    if (gl) {
+      const countDraw = (original, args) => { this.frameGpu.drawCalls++; return original.apply(gl, args); };
+      this.wrap(gl, 'drawArrays', countDraw);
+      this.wrap(gl, 'drawElements', countDraw);
+      this.wrap(gl, 'bindTexture', (original, args) => { this.frameGpu.textureBinds++; return original.apply(gl, args); });
+    }
+
+    const onPostRender = () => {
+      this.frames++;
+      this.frameMs += this.game.loop.delta;
+      this.gpu.drawCalls += this.frameGpu.drawCalls;
+      this.gpu.textureBinds += this.frameGpu.textureBinds;
+      this.lastGpu = { ...this.frameGpu };
+      this.frameGpu.drawCalls = 0;
+      this.frameGpu.textureBinds = 0;
+    };
+    this.game.events.on('postrender', onPostRender);
+    this.restore.push(() => this.game.events.off('postrender', onPostRender));
+  }
+
+  disable() {
+    if (!this.enabled) return;
+    this.enabled = false;
+    this.restore.reverse().forEach(undo => undo());
+    this.restore.length = 0;
+    this.scenes.clear();
+  }
+
+  // Replaces target[name] with a wrapper; undone by disable()
+  wrap(target, name, wrapper) {
+    const original = target[name];
+    const hadOwn = Object.prototype.hasOwnProperty.call(target, name);
+    target[name] = function () { return wrapper(original, arguments); };
+    this.restore.push(() => {
+      if (hadOwn) target[name] = original;
+      else delete target[name];
+    });
+  }
+
+  reset() {
+    this.scenes.forEach(timing => { timing.update = 0; timing.render = 0; });
+    this.gpu.drawCalls = 0;
+    this.gpu.textureBinds = 0;
+    this.lastGpu = { drawCalls: 0, textureBinds: 0 };
+    this.frames = 0;
+    this.frameMs = 0;
+    this.resetAt = performance.now();
+  }
+
+  snapshot() {
+    const frames = Math.max(1, this.frames);
+    const scenes = {};
+    let videos = 0;
+    this.game.scene.scenes.forEach(scene => {
+      const key = scene.sys.settings.key;
+      const timing = this.scenes.get(key);
+      const objects = scene.sys.displayList ? scene.sys.displayList.list : [];
+      const sceneVideos = objects.filter(object => object.type === 'Video').length;
+      videos += sceneVideos;
+      scenes[key] = {
+        active: scene.sys.isActive(),
+        visible: scene.sys.isVisible(),
+        updateMs: timing ? timing.update / frames : null,
+        renderMs: timing ? timing.render / frames : null,
+        lastUpdateMs: timing ? timing.lastUpdate : null,
+        lastRenderMs: timing ? timing.lastRender : null,
+        displayObjects: objects.length,
+        videos: sceneVideos,
+        tweens: scene.tweens ? scene.tweens.getTweens().length : 0,
+        uiAnimations: scene.uiAnimator ? scene.uiAnimator.running.length : 0
+      };
+    });
+
+    const budget = TextureBudget.get(this.game);
+    const listeners = Subscriptions.counts();
+    return {
+      version: PERF_API_VERSION,
+      enabled: this.enabled,
+      sampledMs: performance.now() - this.resetAt,
+      frames: this.frames,
+      frameMs: this.frames ? this.frameMs / this.frames : null,
+      qualityTier: this.game.registry.get('qualityTierName') || null,
+      scenes,
+      webgl: this.enabled && this.game.renderer && this.game.renderer.gl ? {
+        drawCalls: this.gpu.drawCalls / frames,
+        textureBinds: this.gpu.textureBinds / frames,
+        lastDrawCalls: this.lastGpu.drawCalls,
+        lastTextureBinds: this.lastGpu.textureBinds
+      } : null,
+      textures: {
+        count: budget.bytes.size,
+        estimatedMB: budget.totalBytes / (1024 * 1024),
+        budgetMB: budget.budgetBytes / (1024 * 1024),
+        deviceClass: budget.deviceClass
+      },
+      videos: {
+        gameObjects: videos,
+        elements: document.getElementsByTagName('video').length
+      },
+      listeners: {
+        subscriptions: Object.values(listeners).reduce((sum, entry) => sum + entry.subscribed, 0),
+        byEvent: listeners
+      }
+    };
+  }
+}
+
+const RUM_VERSION = 1;
+const RUM_FLUSH_MS = 30000;
+// Upper FPS edges of the histogram buckets; the last bucket is open-ended
+const RUM_FPS_BUCKETS = [10, 20, 30, 45, 55];
+// Frames are attributed to the gameplay scene created most recently
+const RUM_SCENES = ['MainMenu', 'MapScene', 'SectionHunt', 'EggZamRoom'];
+const RUM_MAX_LONG_TASKS = 100; // Durations kept per batch; the count stays exact
+
+/**
+ * Field performance data from real devices. Off unless an endpoint is set
+ * with ?rum=<path> or <meta name="rum-endpoint" content="<path>">; without one
+ * the static helpers below do nothing. The endpoint must be same-origin
+ * (connect-src 'self' covers sendBeacon), so a collector on another host or
+ * port is reached by proxying /rum to it.
+ *
+ * Records load milestones (first time only), an FPS histogram per gameplay
+ * scene and long tasks, batched into one navigator.sendBeacon every
+ * RUM_FLUSH_MS and when the page is hidden. Batches carry a random session
+ * id and the device class, nothing about the player. tools/rum_collector.py
+ * is the matching receiver.
+ */
+class RumBeacon {
+  static install(game, build) {
+    const meta = document.querySelector('meta[name="rum-endpoint"]');
+    const configured = new URLSearchParams(window.location.search).get('rum') || (meta && meta.content);
+    if (!configured || typeof navigator.sendBeacon !== 'function') return null;
+
+    let endpoint;
+    try {
+      endpoint = new URL(configured, window.location.href);
+    } catch (e) {
+      endpoint = null;
+    }
+    if (!endpoint || endpoint.origin !== window.location.origin) {
+      console.warn('RumBeacon: endpoint must be a same-origin path such as /rum, ignoring', configured);
+      return null;
+    }
+    game.rum = new RumBeacon(game, endpoint.href, build);
+    return game.rum;
+  }
+
+  static mark(game, name) {
+    if (game.rum) game.rum.mark(name);
+  }
+
+  // For "first frame of X" milestones: marks once X has actually been drawn
+  static markNextFrame(game, name) {
+    if (game.rum) game.events.once('postrender', () => game.rum.mark(name));
+  }
+
+  constructor(game, endpoint, build) {
+    this.game = game;
+    this.endpoint = endpoint;
+    this.build = build;
+    this.session = Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+    this.seq = 0;
+    this.marked = new Set();
+    this.scene = null;
+    this.timer = null;
+    this.resetBatch();
+
+    game.events.once('ready', () => {
+      RUM_SCENES.forEach(key => {
+        const scene = game.scene.getScene(key);
+        if (scene) scene.sys.events.on('create', () => { this.scene = key; });
+      });
+    });
+    game.events.on('postrender', this.sampleFrame, this);
+
+    if (typeof PerformanceObserver === 'function' && (PerformanceObserver.supportedEntryTypes || []).includes('longtask')) {
+      new PerformanceObserver(list => {
+        list.getEntries().forEach(entry => this.longTask(entry.duration));
+      }).observe({ type: 'longtask', buffered: true });
+    }
+
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') this.flush();
+    });
+    window.addEventListener('pagehide', () => this.flush());
+  }
+
+  resetBatch() {
+    this.milestones = {};
+    this.fps = {}; // scene -> counts per RUM_FPS_BUCKETS bucket
+    this.longTasks = { count: 0, totalMs: 0, durations: [] };
+  }
+
+  mark(name) {
+    if (this.marked.has(name)) return;
+    this.marked.add(name);
+    this.milestones[name] = Math.round(performance.now());
+    this.schedule();
+  }
+
+  sampleFrame() {
+    const delta = this.game.loop.delta;
+    if (!this.scene || document.hidden || delta <= 0 || delta > 1000) return;
+
+    const fps = 1000 / delta;
+    let bucket = 0;
+    while (bucket < RUM_FPS_BUCKETS.length && fps >= RUM_FPS_BUCKETS[bucket]) bucket++;
+    let counts = this.fps[this.scene];
+    if (!counts) counts = this.fps[this.scene] = new Array(RUM_FPS_BUCKETS.length + 1).fill(0);
+    counts[bucket]++;
+    this.schedule();
+  }
+
+  longTask(duration) {
+    this.longTasks.count++;
+    this.longTasks.totalMs += duration;
+    if (this.longTasks.durations.length < RUM_MAX_LONG_TASKS) this.longTasks.durations.push(Math.round(duration));
+    this.schedule();
+  }
+
+  schedule() {
+    if (this.timer === null) this.timer = setTimeout(() => this.flush(), RUM_FLUSH_MS);
+  }
+
+  flush() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    if (!Object.keys(this.milestones).length && !Object.keys(this.fps).length && !this.longTasks.count) return;
+
+    const batch = {
+      v: RUM_VERSION,
+      session: this.session,
+      seq: this.seq++,
+      build: this.build,
+      device: {
+        class: TextureBudget.deviceClass(this.game),
+        memory: navigator.deviceMemory || null,
+        cores: navigator.hardwareConcurrency || null,
+        dpr: window.devicePixelRatio || 1,
+        width: screen.width,
+        height: screen.height
+      },
+      quality: this.game.registry.get('qualityTierName') || null,
+      milestones: this.milestones,
+      fpsBuckets: RUM_FPS_BUCKETS,
+      fps: this.fps,
+      longTasks: this.longTasks
+    };
+    this.resetBatch();
+    try {
+      // A string body goes out as text/plain;charset=UTF-8
+      navigator.sendBeacon(this.endpoint, JSON.stringify(batch));
+    } catch (e) {
+      console.warn('RumBeacon: could not send batch', e);
+    }
+  }
+}
+
+
+// ?cursor=native hands the finger to the OS as a CSS cursor (no game-loop cost at all)
+const CURSOR_MODE = new URLSearchParams(window.location.search).get('cursor') === 'native' ? 'native' : 'overlay';
+
+/**
+ * Finger cursor that only does work when the pointer moves or the game resizes,
+ * instead of repositioning and resizing itself every frame.
+ */
+class CursorOverlay {
+  // Returns the finger image for `scene`, or null when the native CSS cursor is in use
+  static attach(scene, depth = 10000) {
+    if (CURSOR_MODE === 'native' && CursorOverlay.useNativeCursor(scene.game)) return null;
+
+    const finger = scene.add.image(scene.input.x, scene.input.y, 'finger-cursor')
+        .setOrigin(0, 0)
+        .setDepth(depth)
+        .setScrollFactor(0);
+
+    const follow = (pointer) => finger.setPosition(pointer.x, pointer.y);
+    const fit = () => {
+        const scale = Math.min(scene.scale.width / 1280, scene.scale.height / 720);
+        finger.setDisplaySize(50 * scale, 75 * scale);
+    };
+    fit();
+
+    Subscriptions.on(scene, scene.input, 'pointermove', follow);
+    Subscriptions.on(scene, scene.scale, 'resize', fit);
+    return finger;
+  }
+
+  // Bakes the finger texture into a small data-URL cursor on the game container
+  static useNativeCursor(game) {
+    if (CursorOverlay.nativeApplied) return true;
+    const parent = game.canvas && game.canvas.parentElement;
+    if (!parent || !game.textures.exists('finger-cursor')) return false;
+
+    const source = game.textures.get('finger-cursor').getSourceImage();
+    const canvas = document.createElement('canvas');
+    canvas.width = 40; // Browsers cap cursor images (128px); keep the finger's 4:5 ratio
+    canvas.height = 50;
+    canvas.getContext('2d').drawImage(source, 0, 0, canvas.width, canvas.height);
+
+    parent.style.setProperty('--finger-cursor', `url(${canvas.toDataURL()}) 0 0, auto`);
+    parent.classList.add('native-cursor');
+    CursorOverlay.nativeApplied = true;
+    return true;
+  }
+}
+
+// Design resolution every scene's coordinates were authored against
+const DESIGN_WIDTH = 1280;
+const DESIGN_HEIGHT = 720;
+
+/**
+ * Anchors a scene's objects to the 1280x720 design space and moves them in
+ * place when the viewport changes, so a resize never restarts the scene.
+ * Resize bursts (drag-resizing, rotation) collapse into one relayout per
+ * animation frame, and only anchors whose inputs changed are touched.
+ *
+ * An anchor is either a custom `apply(object, metrics)` or a set of design
+ * values: x/y, width/height (display size; zones resize their hit area),
+ * scale, fontSize/strokeThickness/wrapWidth for text. `space: 'screen'`
+ * scales from the top-left corner for HUD pieces instead of the letterboxed
+ * stage, which lets them skip offset-only changes.
+ */
+class SceneLayout {
+  constructor(scene) {
+    this.scene = scene;
+    this.anchors = [];
+    this.metrics = this.measure();
+    this.frame = null;
+
+    Subscriptions.on(scene, scene.scale, 'resize', this.requestLayout, this);
+    scene.events.once('shutdown', () => {
+        if (this.frame !== null) cancelAnimationFrame(this.frame);
+        this.frame = null;
+        this.anchors.length = 0;
+    });
+  }
+
+  measure() {
+    const width = this.scene.scale.width;
+    const height = this.scene.scale.height;
+    const scale = Math.min(width / DESIGN_WIDTH, height / DESIGN_HEIGHT);
+    return {
+      width,
+      height,
+      scale,
+      offsetX: (width - DESIGN_WIDTH * scale) / 2,
+      offsetY: (height - DESIGN_HEIGHT * scale) / 2
+    };
+  }
+
+  // Registers `object` and places it against the current metrics
+  add(object, anchor) {
+    this.anchors.push({ object, anchor });
+    this.place(object, anchor, this.metrics);
+    return object;
+  }
+
+  requestLayout() {
+    if (this.frame !== null) return;
+    this.frame = requestAnimationFrame(() => {
+      this.frame = null;
+      this.relayout();
+    });
+  }
+
+  relayout() {
+    const previous = this.metrics;
+    const metrics = this.measure();
+    if (metrics.width === previous.width && metrics.height === previous.height) return;
+    this.metrics = metrics;
+
+    const scaleChanged = metrics.scale !== previous.scale;
+    // Destroyed objects drop out here instead of needing an explicit remove()
+    this.anchors = this.anchors.filter(({ object }) => object.scene);
+    this.anchors.forEach(({ object, anchor }) => {
+      if (anchor.space === 'screen' && !anchor.apply && !scaleChanged) return;
+      this.place(object, anchor, metrics);
+    });
+  }
+
+  place(object, anchor, m) {
+    if (anchor.apply) {
+      anchor.apply(object, m);
+      return;
+    }
+    const originX = anchor.space === 'screen' ? 0 : m.offsetX;
+    const originY = anchor.space === 'screen' ? 0 : m.offsetY;
+
+    if (anchor.x !== undefined) {
+      object.setPosition(originX + anchor.x * m.scale, originY + anchor.y * m.scale);
+    }
+    if (anchor.width !== undefined) {
+      if (object.type === 'Zone') object.setSize(anchor.width * m.scale, anchor.height * m.scale);
+      else object.setDisplaySize(anchor.width * m.scale, anchor.height * m.scale);
+    }
+    if (anchor.scale !== undefined) object.setScale(anchor.scale * m.scale);
+    if (anchor.fontSize !== undefined) {
+      const stroke = anchor.strokeThickness !== undefined ? anchor.strokeThickness * m.scale : undefined;
+      HudText.setSize(object, anchor.fontSize * m.scale, stroke);
+    }
+    if (anchor.wrapWidth !== undefined) object.setWordWrapWidth(anchor.wrapWidth * m.scale, true);
+  }
+}
+
+// Sizes baked by tools/bmfont.py per family; keep in sync with FAMILIES there
+const HUD_FONT_SIZES = { hud: [24, 48, 96], label: [16, 32] };
+
+/**
+ * Counters and tooltip labels drawn from the BMFont atlases baked by
+ * tools/bmfont.py. setText on a BitmapText only rebuilds quads, where a Text
+ * redraws its canvas and re-uploads the texture. Until the atlases exist (or
+ * if they fail to load) the same calls return the old Comic Sans Text.
+ */
+class HudText {
+  static preload(scene) {
+    Object.entries(HUD_FONT_SIZES).forEach(([family, sizes]) => {
+      sizes.forEach(size => {
+        const key = `${family}-${size}`;
+        scene.load.bitmapFont(key, `assets/fonts/${key}.png`, `assets/fonts/${key}.xml`);
+      });
+    });
+  }
+
+  // Smallest loaded atlas at or above `size` (scaling down stays sharp), or null
+  static fontKey(scene, family, size) {
+    const loaded = HUD_FONT_SIZES[family].filter(s => scene.cache.bitmapFont.exists(`${family}-${s}`));
+    if (!loaded.length) return null;
+    return `${family}-${loaded.find(s => s >= size) || loaded[loaded.length - 1]}`;
+  }
+
+  // Black bold counter with a white stroke
+  static add(scene, x, y, text, size, strokeThickness) {
+    const key = HudText.fontKey(scene, 'hud', size);
+    if (key) return scene.add.bitmapText(x, y, key, text, size);
+    return scene.add.text(x, y, text, {
+      fontSize: `${size}px`,
+      fill: '#000',
+      fontStyle: 'bold',
+      fontFamily: 'Comic Sans MS',
+      stroke: '#fff',
+      strokeThickness
+    });
+  }
+
+  // Plain white label for the dark tooltip box
+  static addLabel(scene, x, y, text, size) {
+    const key = HudText.fontKey(scene, 'label', size);
+    if (key) return scene.add.bitmapText(x, y, key, text, size);
+    return scene.add.text(x, y, text, { fontSize: `${size}px`, fontFamily: 'Comic Sans MS', fill: '#ffffff' });
+  }
+
+  // Resizes either kind in place, switching atlas when another baked size fits better
+  static setSize(textObject, size, strokeThickness) {
+    if (textObject.type === 'BitmapText') {
+      const family = textObject.font.split('-')[0];
+      const key = HudText.fontKey(textObject.scene, family, size);
+      if (key && key !== textObject.font) textObject.setFont(key, size);
+      else textObject.setFontSize(size);
+      return textObject;
+    }
+    textObject.setFontSize(`${size}px`);
+    if (strokeThickness !== undefined) textObject.setStroke(textObject.style.stroke, strokeThickness);
+    return textObject;
+  }
+}
+
+/**
+ * Steps the small UI effects (button pops, collection floats) from the scene's
+ * update event instead of allocating a Tween per hover, press or egg. Each
+ * target owns one track that is reset and reused, so starting an effect
+ * allocates nothing. Easing matches the 'Power1' tweens these replace.
+ */
+class UiAnimator {
+  static get(scene) {
+    if (!scene.uiAnimator) scene.uiAnimator = new UiAnimator(scene);
+    return scene.uiAnimator;
+  }
+
+  static isAnimating(target) {
+    return !!(target.uiTrack && target.uiTrack.running);
+  }
+
+  constructor(scene) {
+    this.scene = scene;
+    this.running = [];
+
+    scene.events.on('update', this.step, this);
+    scene.events.once('shutdown', () => {
+        scene.events.off('update', this.step, this);
+        this.running.forEach(track => { track.running = false; });
+        this.running.length = 0;
+        scene.uiAnimator = null;
+    });
+  }
+
+  // Eases the target's scale to (scaleX, scaleY)
+  scaleTo(target, scaleX, scaleY, duration) {
+    const track = this.start(target, duration, null);
+    track.float = false;
+    track.fromX = target.scaleX;
+    track.fromY = target.scaleY;
+    track.toX = scaleX;
+    track.toY = scaleY;
+  }
+
+  // Rises `rise` px while fading out, then hands the target back to `pool`
+  floatOut(target, rise, duration, pool) {
+    const track = this.start(target, duration, pool);
+    track.float = true;
+    track.fromY = target.y;
+    track.toY = target.y - rise;
+    target.setAlpha(1);
+  }
+
+  start(target, duration, pool) {
+    let track = target.uiTrack;
+    if (!track) {
+      track = target.uiTrack = { target, running: false };
+    }
+    track.elapsed = 0;
+    track.duration = duration;
+    track.pool = pool;
+    if (!track.running) {
+      track.running = true;
+      this.running.push(track);
+    }
+    return track;
+  }
+
+  step(time, delta) {
+    for (let i = this.running.length - 1; i >= 0; i--) {
+      const track = this.running[i];
+      const target = track.target;
+      if (!target.scene) {
+        this.finish(i, track);
+        continue;
+      }
+
+      track.elapsed += delta;
+      const t = Math.min(1, track.elapsed / track.duration);
+      const eased = t * (2 - t);
+
+      if (track.float) {
+        target.y = track.fromY + (track.toY - track.fromY) * eased;
+        target.alpha = 1 - eased;
+      } else {
+        target.setScale(
+          track.fromX + (track.toX - track.fromX) * eased,
+          track.fromY + (track.toY - track.fromY) * eased
+        );
+      }
+
+      if (t === 1) {
+        this.finish(i, track);
+        if (track.pool && target.scene) track.pool.release(target);
+      }
+    }
+  }
+
+  finish(index, track) {
+    // Swap-remove keeps the running list packed without splicing
+    this.running[index] = this.running[this.running.length - 1];
+    this.running.pop();
+    track.running = false;
+  }
+}
+
+/**
+ * Recycles short-lived game objects: released objects are hidden and
+ * deactivated instead of destroyed, and handed out again by acquire().
+ */
+class EffectPool {
+  constructor(create) {
+    this.create = create;
+    this.free = [];
+  }
+
+  acquire() {
+    const item = this.free.pop() || this.create();
+    return item.setActive(true).setVisible(true);
+  }
+
+  release(item) {
+    item.setActive(false).setVisible(false);
+    this.free.push(item);
+  }
+}
+
+/**
+ * One tooltip per scene, shown and re-labelled on hover instead of building a
+ * text, a background and a container every time the pointer enters a button.
+ * The background is only redrawn when the label's size changes.
+ */
+class Tooltip {
+  static get(scene) {
+    if (!scene.tooltip || !scene.tooltip.container.scene) scene.tooltip = new Tooltip(scene);
+    return scene.tooltip;
+  }
+
+  constructor(scene) {
+    this.scene = scene;
+    this.owner = null;
+    this.text = null;
+    this.bg = scene.add.graphics();
+    this.label = HudText.addLabel(scene, 0, 0, '', 16).setOrigin(0.5, 0.5);
+    this.container = scene.add.container(0, 0, [this.bg, this.label])
+        .setDepth(1000)
+        .setScrollFactor(0)
+        .setVisible(false);
+    this.width = 0;
+    this.height = 0;
+  }
+
+  show(owner, text, pointer) {
+    const padding = 8;
+    this.owner = owner;
+    if (text !== this.text) {
+      this.text = text;
+      this.label.setText(text);
+    }
+
+    const width = this.label.width + padding * 2;
+    const height = this.label.height + padding * 2;
+    if (width !== this.width || height !== this.height) {
+      this.width = width;
+      this.height = height;
+      this.bg.clear();
+      this.bg.fillStyle(0x000000, 0.8);
+      this.bg.fillRoundedRect(-width/2, -height/2, width, height, 5);
+    }
+
+    this.container.setVisible(true);
+    this.move(pointer);
+  }
+
+  // Follows the pointer, slightly above it, kept inside the camera
+  move(pointer) {
+    const cam = this.scene.cameras.main;
+    let x = pointer.x;
+    let y = pointer.y - 30;
+    if (x + this.width/2 > cam.width) x = cam.width - this.width/2 - 5;
+    if (x - this.width/2 < 0) x = this.width/2 + 5;
+    if (y - this.height/2 < 0) y = pointer.y + 40; // Flip below
+    this.container.setPosition(x, y);
+  }
+
+  hide(owner) {
+    if (this.owner !== owner) return;
+    this.owner = null;
+    this.container.setVisible(false);
+  }
+}
+
+/**
+ * Phaser-facing wrapper around HuntCore.Hunt (hunt-core.js), the single
+ * source of truth for the hunt. It republishes the registry keys 'eggData',
+ * 'sections' and 'foundEggs' (views over the same records) for older readers
+ * and announces changes.
+ *
+ * Events: 'collect' (record), 'section-complete' (name), 'categorize' (record).
+ */
+class HuntState extends Phaser.Events.EventEmitter {
+  static get(game) {
+    if (!game.huntState) game.huntState = new HuntState(game);
+    return game.huntState;
+  }
+
+  constructor(game) {
+    super();
+    this.registry = game.registry;
+    this.hunt = new HuntCore.Hunt();
+  }
+
+  get seed() {
+    return this.hunt.seed;
+  }
+
+  // Indexes freshly generated records (see MainMenu.create) and publishes the views
+  load(sections, eggData, seed) {
+    this.hunt.load(sections, eggData, seed);
+    this.registry.set('sections', sections);
+    this.registry.set('eggData', eggData);
+    this.registry.set('foundEggs', this.hunt.found);
+  }
+
+  // Silently re-applies saved progress; events are for live play only
+  restore(foundIds, categorizedIds) {
+    this.hunt.restore(foundIds, categorizedIds);
+    this.registry.set('foundEggs', this.hunt.found);
+  }
+
+  get foundCount() {
+    return this.hunt.foundCount;
+  }
+
+  egg(eggId) {
+    return this.hunt.egg(eggId);
+  }
+
+  isCollected(eggId) {
+    return this.hunt.isCollected(eggId);
+  }
+
+  eggsIn(sectionName) {
+    return this.hunt.eggsIn(sectionName);
+  }
+
+  remaining(sectionName) {
+    return this.hunt.remaining(sectionName);
+  }
+
+  isSectionComplete(sectionName) {
+    return this.hunt.isSectionComplete(sectionName);
+  }
+
+  tally(category) {
+    return this.hunt.tally(category);
+  }
+
+  // Marks `eggId` found; returns false if it is unknown or already collected
+  collect(eggId) {
+    const record = this.hunt.collect(eggId);
+    if (!record) return false;
+
+    this.registry.set('foundEggs', this.hunt.found);
+    this.emit('collect', record);
+    if (this.hunt.isSectionComplete(record.section)) this.emit('section-complete', record.section);
+    return true;
+  }
+
+  categorize(eggId) {
+    const record = this.hunt.categorize(eggId);
+    if (!record) return false;
+
+    this.emit('categorize', record);
+    return true;
+  }
+
+  randomUncategorized() {
+    return this.hunt.randomUncategorized();
+  }
+}
+
+const SAVE_KEY = 'huntSave';
+const SAVE_VERSION = 2;
+const SAVE_THROTTLE_MS = 1000;
+
+/**
+ * Persists hunt progress as one small versioned localStorage record: the
+ * layout seed (MainMenu regenerates the same eggs from it), found and
+ * categorized flags as base64 bitsets indexed by eggId - 1, stamped sections
+ * as a bitset over the section list, and the two counters. Writes are
+ * throttled to one per SAVE_THROTTLE_MS and flushed when the page is hidden.
+ */
+class HuntSave {
+  static get(game) {
+    if (!game.huntSave) game.huntSave = new HuntSave(game);
+    return game.huntSave;
+  }
+
+  // The saved record, or null when missing, unreadable or from another format/egg count
+  static read() {
+    try {
+      const save = JSON.parse(localStorage.getItem(SAVE_KEY));
+      if (save && save.v === SAVE_VERSION && save.total === TOTAL_EGGS && typeof save.seed === 'string') return save;
+    } catch (e) {
+      console.warn('HuntSave: ignoring unreadable save', e);
+    }
+    return null;
+  }
+
+  static packBits(count, isSet) {
+    const bytes = new Uint8Array(Math.ceil(count / 8));
+    for (let i = 0; i < count; i++) {
+      if (isSet(i)) bytes[i >> 3] |= 1 << (i & 7);
+    }
+    let binary = '';
+    bytes.forEach(byte => { binary += String.fromCharCode(byte); });
+    return btoa(binary);
+  }
+
+  // Indices of the set bits
+  static unpackBits(packed, count) {
+    const indices = [];
+    const binary = atob(packed || '');
+    for (let i = 0; i < count && (i >> 3) < binary.length; i++) {
+      if (binary.charCodeAt(i >> 3) & (1 << (i & 7))) indices.push(i);
+    }
+    return indices;
+  }
+
+  constructor(game) {
+    this.registry = game.registry;
+    this.huntState = HuntState.get(game);
+    this.timer = null;
+    this.disabled = false;
+
+    const schedule = () => this.schedule();
+    this.huntState.on('collect', schedule);
+    this.huntState.on('categorize', schedule);
+    this.registry.events.on('changedata', (parent, key) => {
+      if (key === 'stampedSections' || key === 'correctCategorizations' || key === 'currentScore') schedule();
+    });
+
+    // Last chance to write before a reload, tab switch or the OS killing the page
+    const flushIfPending = () => {
+      if (this.timer !== null) this.flush();
+    };
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') flushIfPending();
+    });
+    window.addEventListener('pagehide', flushIfPending);
+  }
+
+  // Puts a saved record back into the freshly regenerated HuntState and registry
+  restore(save) {
+    const sections = this.registry.get('sections') || [];
+    this.huntState.restore(
+      HuntSave.unpackBits(save.found, TOTAL_EGGS).map(i => i + 1),
+      HuntSave.unpackBits(save.categorized, TOTAL_EGGS).map(i => i + 1)
+    );
+    this.registry.set('stampedSections', HuntSave.unpackBits(save.stamped, sections.length).map(i => sections[i].name));
+    this.registry.set('correctCategorizations', save.correct || 0);
+    if (save.score !== undefined) this.registry.set('currentScore', save.score);
+  }
+
+  schedule() {
+    if (this.disabled || this.timer !== null) return;
+    this.timer = setTimeout(() => this.flush(), SAVE_THROTTLE_MS);
+  }
+
+  flush() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    if (this.disabled || !this.huntState.seed) return;
+
+    const state = this.huntState;
+    const sections = this.registry.get('sections') || [];
+    const stamped = this.registry.get('stampedSections') || [];
+    const save = {
+      v: SAVE_VERSION,
+      total: TOTAL_EGGS,
+      seed: state.seed,
+      found: HuntSave.packBits(TOTAL_EGGS, i => state.isCollected(i + 1)),
+      categorized: HuntSave.packBits(TOTAL_EGGS, i => { const egg = state.egg(i + 1); return !!(egg && egg.categorized); }),
+      stamped: HuntSave.packBits(sections.length, i => stamped.includes(sections[i].name)),
+      correct: this.registry.get('correctCategorizations') || 0
+    };
+    if (this.registry.has('currentScore')) save.score = this.registry.get('currentScore');
+
+    try {
+      localStorage.setItem(SAVE_KEY, JSON.stringify(save));
+    } catch (e) {
+      console.warn('HuntSave: could not write save', e);
+    }
+  }
+
+  // Forgets the hunt for PLAY AGAIN; nothing is written again before the reload
+  clear() {
+    this.disabled = true;
+    clearTimeout(this.timer);
+    this.timer = null;
+    try {
+      localStorage.removeItem(SAVE_KEY);
+    } catch (e) {
+      console.warn('HuntSave: could not clear save', e);
+    }
+  }
+}
+
+const VOLUME_KEYS = ['musicVolume', 'ambientVolume', 'sfxVolume'];
+const SETTINGS_PERSIST_MS = 500;
+
+/**
+ * Owns the volume settings. Sliders call set() as often as they like; only the
+ * latest value per key is kept and published to the registry once per
+ * animation frame, so the audio/video changedata listeners run at most once a
+ * frame. Storage is written after SETTINGS_PERSIST_MS without changes, or
+ * straight away when the page is hidden.
+ */
+class Settings {
+  static get(game) {
+    if (!game.settings) game.settings = new Settings(game);
+    return game.settings;
+  }
+
+  static readStored(key, fallback = 0.5) {
+    try {
+      const stored = localStorage.getItem(key);
+      if (stored !== null && !isNaN(parseFloat(stored))) return parseFloat(stored);
+    } catch (e) {
+      console.warn('Settings: could not read', key, e);
+    }
+    return fallback;
+  }
+
+  constructor(game) {
+    this.registry = game.registry;
+    this.pending = new Map(); // key -> latest value not yet published
+    this.dirty = new Set(); // published keys not yet in storage
+    this.frame = null;
+    this.timer = null;
+
+    VOLUME_KEYS.forEach(key => {
+      if (!this.registry.has(key)) this.registry.set(key, Settings.readStored(key));
+    });
+
+    const persistIfDirty = () => {
+      this.apply();
+      if (this.dirty.size) this.persist();
+    };
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') persistIfDirty();
+    });
+    window.addEventListener('pagehide', persistIfDirty);
+  }
+
+  get(key) {
+    return this.pending.has(key) ? this.pending.get(key) : this.registry.get(key);
+  }
+
+  set(key, value) {
+    this.pending.set(key, value);
+    if (this.frame === null) this.frame = requestAnimationFrame(() => this.apply());
+  }
+
+  // Publishes the pending values; listeners see one changedata per key
+  apply() {
+    if (this.frame !== null) cancelAnimationFrame(this.frame);
+    this.frame = null;
+    if (!this.pending.size) return;
+
+    this.pending.forEach((value, key) => {
+      if (this.registry.get(key) === value) return;
+      this.registry.set(key, value);
+      this.dirty.add(key);
+    });
+    this.pending.clear();
+
+    if (this.dirty.size) {
+      clearTimeout(this.timer);
+      this.timer = setTimeout(() => this.persist(), SETTINGS_PERSIST_MS);
+    }
+  }
+
+  persist() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    this.dirty.forEach(key => {
+      try {
+        localStorage.setItem(key, this.registry.get(key));
+      } catch (e) {
+        console.warn('Settings: could not write', key, e);
+      }
+    });
+    this.dirty.clear();
+  }
 }
 
 // Game configuration
@@ -2269,7 +3926,7 @@ const config = {
       width: '100%',
       height: '100%'
   },
-  scene: [MainMenu, MapScene, SectionHunt, EggZamRoom, MusicScene, UIScene, CursorScene],
+  scene: [MainMenu, MapScene, SectionHunt, EggZamRoom, MusicScene, UIScene],
   parent: 'game',
   backgroundColor: '#000000',
 };
@@ -2277,6 +3934,8 @@ const config = {
 // Initialize the game
 const game = new Phaser.Game(config);
 window.game = game;
+PerfProbe.install(game); // window.__perf; inert until enabled
+RumBeacon.install(game, 'desktop'); // Field metrics, only when an endpoint is configured
 
 // Auto-focus the game container for screen readers and keyboard accessibility
 window.addEventListener('load', () => {
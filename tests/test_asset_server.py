@@ -0,0 +1,174 @@
+import gzip
+import http.client
+import os
+import re
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from asset_server import (IMMUTABLE, REVALIDATE, accepted_encodings, make_server, parse_range, precompress,
+                          security_headers)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEPLOYABLE = ('main.js', 'main.0123abcd.js', 'intro.mp4', 'm', 'assets')
+
+SCRIPT = b'const eggs = [' + b'1, ' * 2000 + b'];\n'
+VIDEO = bytes(range(256)) * 64
+FONT = b'<?xml version="1.0"?>\n<font>' + b'<char id="65" x="0" y="0" width="24" height="24"/>' * 100 + b'</font>\n'
+
+
+def serve(tmp_path):
+    (tmp_path / 'main.js').write_bytes(SCRIPT)
+    (tmp_path / 'main.0123abcd.js').write_bytes(SCRIPT)
+    (tmp_path / 'm').mkdir()
+    (tmp_path / 'm' / 'index.html').write_bytes(b'<html></html>')
+    (tmp_path / 'intro.mp4').write_bytes(VIDEO)
+    (tmp_path / 'assets' / 'fonts').mkdir(parents=True)
+    (tmp_path / 'assets' / 'fonts' / 'hud-24.xml').write_bytes(FONT)
+    (tmp_path.parent / 'secret.txt').write_bytes(b'secret')
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'config').write_bytes(b'[core]')
+    (tmp_path / '.htaccess').write_bytes(b'Header set X-Frame-Options "SAMEORIGIN"')
+    (tmp_path / 'm' / '.env').write_bytes(b'KEY=1')
+    (tmp_path / 'tools').mkdir()
+    (tmp_path / 'tools' / 'build.js').write_bytes(SCRIPT)
+    assert precompress(str(tmp_path), log=lambda message: None, deployable=DEPLOYABLE) == 3
+    assert not (tmp_path / 'tools' / 'build.js.gz').exists()
+
+    server = make_server(str(tmp_path), port=0, deployable=DEPLOYABLE)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def request(server, path, method='GET', **headers):
+    connection = http.client.HTTPConnection(*server.server_address[:2])
+    connection.request(method, path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_header_parsing():
+    assert accepted_encodings('gzip, deflate, br;q=0.8') == {'gzip', 'deflate', 'br'}
+    assert accepted_encodings('br;q=0, gzip') == {'gzip'}
+    assert accepted_encodings(None) == set()
+    # A malformed weight is ignored rather than failing the request
+    assert accepted_encodings('gzip;q=abc, br;q=0') == {'gzip'}
+    assert parse_range('bytes=0-99', 1000) == (0, 99)
+    assert parse_range('bytes=900-', 1000) == (900, 999)
+    assert parse_range('bytes=-100', 1000) == (900, 999)
+    assert parse_range('bytes=500-5000', 1000) == (500, 999)
+    assert parse_range('bytes=1000-', 1000) == 'unsatisfiable'
+    assert parse_range('bytes=0-1,5-9', 1000) is None
+    assert parse_range('items=0-1', 1000) is None
+
+
+def test_precompressed_bodies_and_etags(tmp_path):
+    server = serve(tmp_path)
+    try:
+        plain, body = request(server, '/main.js')
+        assert body == SCRIPT
+        assert plain.getheader('Content-Encoding') is None
+        assert plain.getheader('Cache-Control') == REVALIDATE
+        assert plain.getheader('Vary') == 'Accept-Encoding'
+
+        packed, body = request(server, '/main.js', **{'Accept-Encoding': 'gzip, deflate'})
+        assert packed.getheader('Content-Encoding') == 'gzip'
+        assert gzip.decompress(body) == SCRIPT
+        assert len(body) < len(SCRIPT)
+        assert packed.getheader('ETag') != plain.getheader('ETag')
+
+        again, body = request(server, '/main.js', **{'If-None-Match': plain.getheader('ETag')})
+        assert again.status == 304
+        assert body == b''
+
+        font, body = request(server, '/assets/fonts/hud-24.xml', **{'Accept-Encoding': 'gzip;q=abc'})
+        assert font.getheader('Content-Type') == 'application/xml; charset=utf-8'
+        assert font.getheader('Content-Encoding') == 'gzip'
+        assert gzip.decompress(body) == FONT
+
+        fingerprinted, _ = request(server, '/main.0123abcd.js', method='HEAD')
+        assert fingerprinted.getheader('Cache-Control') == IMMUTABLE
+        assert fingerprinted.getheader('Content-Length') == str(len(SCRIPT))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_ranges_directories_and_escapes(tmp_path):
+    server = serve(tmp_path)
+    try:
+        head, body = request(server, '/intro.mp4', Range='bytes=100-199')
+        assert head.status == 206
+        assert head.getheader('Content-Type') == 'video/mp4'
+        assert head.getheader('Content-Range') == 'bytes 100-199/%d' % len(VIDEO)
+        assert body == VIDEO[100:200]
+
+        tail, body = request(server, '/intro.mp4', Range='bytes=-10')
+        assert body == VIDEO[-10:]
+
+        # A stale If-Range validator gets the whole file
+        whole, body = request(server, '/intro.mp4', Range='bytes=0-9', **{'If-Range': '"old"'})
+        assert whole.status == 200
+        assert body == VIDEO
+
+        beyond, _ = request(server, '/intro.mp4', Range='bytes=%d-' % len(VIDEO))
+        assert beyond.status == 416
+        assert beyond.getheader('Content-Range') == 'bytes */%d' % len(VIDEO)
+
+        redirect, _ = request(server, '/m')
+        assert redirect.status == 301
+        assert redirect.getheader('Location') == '/m/'
+        index, body = request(server, '/m/')
+        assert body == b'<html></html>'
+
+        assert request(server, '/../secret.txt')[0].status == 404
+        assert request(server, '/%2e%2e/secret.txt')[0].status == 404
+        assert request(server, '/missing.js')[0].status == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_only_the_deployable_tree_is_served(tmp_path):
+    server = serve(tmp_path)
+    try:
+        for path in ('/.git/config', '/.htaccess', '/m/.env', '/tools/build.js', '/%2egit/config', '/m/..%2f.htaccess'):
+            assert request(server, path)[0].status == 404, path
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_security_headers_match_htaccess(tmp_path):
+    with open(os.path.join(ROOT, '.htaccess')) as f:
+        expected = dict(re.findall(r'^\s*Header (?:always )?set ([\w-]+) "(.*)"\s*$', f.read(), re.M))
+    sent = dict(security_headers(https=True))
+    for name, value in sent.items():
+        assert expected[name].split() == value.split(), name
+    assert 'upgrade-insecure-requests' not in dict(security_headers())['Content-Security-Policy']
+
+    server = serve(tmp_path)
+    try:
+        for path in ('/main.js', '/missing.js'):
+            response, _ = request(server, path)
+            for name, value in security_headers():
+                assert response.getheader(name) == value, (path, name)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_header_parsing()
+    for test in (test_precompressed_bodies_and_etags, test_ranges_directories_and_escapes,
+                 test_only_the_deployable_tree_is_served, test_security_headers_match_htaccess):
+        with tempfile.TemporaryDirectory() as directory:
+            (pathlib.Path(directory) / 'site').mkdir()
+            test(pathlib.Path(directory) / 'site')
+    print("Asset server tests passed")
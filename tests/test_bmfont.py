@@ -0,0 +1,41 @@
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from bmfont import bmfont_xml, shelf_pack
+
+
+def test_shelf_pack_rows_do_not_overlap():
+    sizes = [(30, 40), (50, 20), (40, 35), (50, 10)]
+    positions, width, height = shelf_pack(sizes, 100, padding=2)
+    assert positions == [(0, 0), (32, 0), (0, 42), (42, 42)]
+    assert width <= 100
+    assert height == 128  # 42 + 35 rounded up to a power of two
+
+    boxes = [(x, y, x + w, y + h) for (x, y), (w, h) in zip(positions, sizes)]
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            assert a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1], (a, b)
+
+
+def test_bmfont_xml_is_parseable():
+    glyphs = [
+        {'id': 32, 'x': 0, 'y': 0, 'width': 0, 'height': 0, 'xoffset': 0, 'yoffset': 0, 'xadvance': 12},
+        {'id': 47, 'x': 2, 'y': 0, 'width': 14, 'height': 40, 'xoffset': 1, 'yoffset': 6, 'xadvance': 15},
+    ]
+    xml = bmfont_xml('Comic Sans MS', 48, 70, 55, (256, 64), 'hud-48.png', glyphs, outline=7)
+    font = ET.fromstring(xml)
+    assert font.find('info').get('size') == '48'
+    assert font.find('common').get('lineHeight') == '70'
+    assert font.find('pages/page').get('file') == 'hud-48.png'
+    chars = font.findall('chars/char')
+    assert [c.get('id') for c in chars] == ['32', '47']
+    assert chars[1].get('yoffset') == '6'
+
+
+if __name__ == "__main__":
+    test_shelf_pack_rows_do_not_overlap()
+    test_bmfont_xml_is_parseable()
+    print("bmfont tests passed")
@@ -0,0 +1,78 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from cpu_profile import class_ranges, collapse, compare, frame_name, function_report, load_class_ranges
+
+SOURCE = """const A = 1;
+class SectionHunt extends Phaser.Scene {
+  update() {
+  }
+}
+
+function resizeGame() {
+}
+"""
+RANGES = {'main.js': class_ranges(SOURCE)}
+
+
+def frame(node_id, name, url='', line=-1, children=()):
+    return {'id': node_id, 'callFrame': {'functionName': name, 'url': url, 'lineNumber': line},
+            'children': list(children)}
+
+
+def test_frames_are_named_after_their_class():
+    assert RANGES['main.js'] == [(1, 4, 'SectionHunt')]
+    assert frame_name({'functionName': 'update', 'url': 'http://h/main.js', 'lineNumber': 2}, RANGES) == \
+        'SectionHunt.update (main.js)'
+    assert frame_name({'functionName': 'resizeGame', 'url': 'http://h/main.js', 'lineNumber': 6}, RANGES) == \
+        'resizeGame (main.js)'
+    assert frame_name({'functionName': 'step', 'url': 'https://cdn/phaser.min.js?v=1', 'lineNumber': 0}, RANGES) == \
+        'step (phaser.min.js)'
+    assert frame_name({'functionName': '(idle)', 'url': ''}, RANGES) == '(idle)'
+
+
+def test_real_sources_have_the_scene_classes():
+    names = {name for _, _, name in load_class_ranges()['main.js']}
+    assert {'SectionHunt', 'EggZamRoom', 'MapScene'} <= names
+
+
+def test_collapse_and_compare():
+    profile = {
+        'nodes': [
+            frame(1, '(root)', children=[2, 5]),
+            frame(2, 'step', 'https://cdn/phaser.min.js', 0, children=[3]),
+            frame(3, 'update', 'http://h/main.js', 2, children=[4]),
+            frame(4, 'resizeGame', 'http://h/main.js', 6),
+            frame(5, '(idle)'),
+        ],
+        # Each sample is charged the delta to the next one
+        'samples': [3, 3, 4, 5, 2],
+        'timeDeltas': [0, 1000, 1000, 3000, 4000, 1000],
+    }
+    stacks, functions = collapse(profile, RANGES)
+    assert stacks == {
+        'step (phaser.min.js);SectionHunt.update (main.js)': 2000,
+        'step (phaser.min.js);SectionHunt.update (main.js);resizeGame (main.js)': 3000,
+        '(idle)': 4000,
+        'step (phaser.min.js)': 1000,
+    }
+    report = function_report(functions)
+    assert report['totalMs'] == 10.0
+    assert report['idleMs'] == 4.0
+    assert report['functions']['resizeGame (main.js)'] == {'selfMs': 3.0, 'share': 30.0}
+
+    baseline = {'functions': {'resizeGame (main.js)': {'share': 10.0}, 'SectionHunt.update (main.js)': {'share': 19.0}}}
+    regressions = compare(report, baseline)
+    # update grew 1 point (~5%), under the relative threshold; Phaser frames are not ours
+    assert [row['function'] for row in regressions] == ['resizeGame (main.js)']
+    assert regressions[0]['growth'] == 20.0
+    assert compare(report, report) == []
+
+
+if __name__ == "__main__":
+    test_frames_are_named_after_their_class()
+    test_real_sources_have_the_scene_classes()
+    test_collapse_and_compare()
+    print("CPU profile tests passed")
@@ -0,0 +1,59 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_mobile_copy_matches():
+    with open(os.path.join(ROOT, 'hunt-core.js'), 'rb') as desktop, open(os.path.join(ROOT, 'm', 'hunt-core.js'), 'rb') as mobile:
+        assert desktop.read() == mobile.read(), 'm/hunt-core.js must be a copy of hunt-core.js'
+
+
+def run_simulation(*args):
+    if shutil.which('node') is None:
+        pytest.skip('node is not installed')
+    result = subprocess.run(
+        ['node', os.path.join(ROOT, 'tools', 'simulate_hunts.js'), '--json'] + list(args),
+        capture_output=True, text=True, check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return json.loads(result.stdout)
+
+
+def test_simulated_sessions_keep_the_rules():
+    summary = run_simulation('--sessions', '500')
+    assert summary['failedSessions'] == 0, summary['failureSamples']
+    assert set(int(count) for count in summary['eggsPerSection']) <= set(range(3, 9))
+    assert sum(summary['meanEggsBySectionOrder']) == pytest.approx(60)
+
+
+def test_stress_hunts_and_wrong_guesses():
+    summary = run_simulation('--sessions', '20', '--total', '1000', '--accuracy', '0.3')
+    assert summary['failedSessions'] == 0, summary['failureSamples']
+    # Every egg is eventually categorized, so there are at least as many guesses as eggs
+    assert summary['meanGuessesPerSession'] >= 1000
+
+
+def test_help_and_unknown_options():
+    if shutil.which('node') is None:
+        pytest.skip('node is not installed')
+    script = os.path.join(ROOT, 'tools', 'simulate_hunts.js')
+    shown = subprocess.run(['node', script, '--help'], capture_output=True, text=True, check=False)
+    assert shown.returncode == 0
+    assert shown.stdout.startswith('Usage:')
+    wrong = subprocess.run(['node', script, '--sesions', '5'], capture_output=True, text=True, check=False)
+    assert wrong.returncode == 2
+    assert 'Unknown option --sesions' in wrong.stderr and 'Usage:' in wrong.stderr
+    assert 'at parseArgs' not in wrong.stderr
+
+
+if __name__ == "__main__":
+    test_mobile_copy_matches()
+    test_simulated_sessions_keep_the_rules()
+    test_stress_hunts_and_wrong_guesses()
+    test_help_and_unknown_options()
+    print("hunt_core tests passed")
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from lens_reachability import FALLBACK_DEVICES, analyze, configurations, game_size
+
+
+def test_game_size_forces_landscape_for_mobile_user_agents():
+    phone = FALLBACK_DEVICES['iPhone 12']
+    assert game_size(phone, landscape=False) == (844, 390, 390, 664)
+    assert game_size(phone, landscape=True) == (844, 390, 664, 390)
+
+    desktop = FALLBACK_DEVICES['Desktop Chrome']
+    assert game_size(desktop, landscape=True) == (1280, 720, 1280, 720)
+    assert game_size(desktop, landscape=False) == (720, 1280, 720, 1280)
+
+
+def test_placement_area_is_always_reachable():
+    pytest.importorskip('numpy')
+    results = analyze(configurations(FALLBACK_DEVICES), grid=48)
+    assert len(results) == 2 * len(FALLBACK_DEVICES)
+    for result in results:
+        assert result['unreachable'] == 0, result
+        assert result['placeable'] > 0, result
+
+    tiny = analyze([{'device': 'watch', 'orientation': 'landscape', 'width': 120, 'height': 40,
+                     'viewport_width': 120, 'viewport_height': 40}], grid=48)[0]
+    assert 'small-target' in tiny['flags']
+
+
+if __name__ == "__main__":
+    test_game_size_forces_landscape_for_mobile_user_agents()
+    test_placement_area_is_always_reachable()
+    print("lens_reachability tests passed")
@@ -0,0 +1,60 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from perf_sampler import API_VERSION, check_version, percentile, summarize
+
+
+def snapshot(frames, frame_ms, draw_calls, listeners, texture_mb, update_ms=1.0):
+    return {
+        'version': API_VERSION,
+        'frames': frames,
+        'frameMs': frame_ms,
+        'webgl': {'drawCalls': draw_calls, 'textureBinds': draw_calls and draw_calls * 2},
+        'scenes': {
+            'MapScene': {'active': True, 'updateMs': update_ms, 'renderMs': 2.0, 'tweens': 3},
+            'EggZamRoom': {'active': False, 'updateMs': None, 'renderMs': None, 'tweens': 0},
+        },
+        'listeners': {'subscriptions': listeners},
+        'textures': {'estimatedMB': texture_mb},
+        'videos': {'elements': 1},
+    }
+
+
+def test_percentile_ignores_missing_values():
+    assert percentile([5, None, 1, 3], 0.5) == 3
+    assert percentile([None], 0.5) is None
+    assert percentile([1, 2, 3, 4, 100], 0.95) == 100
+
+
+def test_summarize_skips_idle_intervals_and_reports_growth():
+    samples = [
+        snapshot(60, 16.7, 20, 10, 40.0),
+        snapshot(0, None, None, 10, 40.0),  # hidden tab: no frames
+        snapshot(60, 17.0, 24, 12, 44.0, update_ms=3.0),
+        snapshot(30, 33.0, 22, 14, 48.0, update_ms=2.0),
+    ]
+    summary = summarize(samples)
+    assert summary['samples'] == 4
+    assert summary['frameMs'] == {'p50': 17.0, 'p95': 33.0}
+    assert summary['drawCalls']['p50'] == 22
+    assert list(summary['scenes']) == ['MapScene']
+    assert summary['scenes']['MapScene']['updateMs'] == 2.0
+    assert summary['growth'] == {'listeners': 4, 'textureMB': 8.0, 'videoElements': 0}
+
+
+def test_check_version_rejects_other_versions():
+    check_version({'version': API_VERSION})
+    try:
+        check_version({'version': API_VERSION + 1})
+    except RuntimeError:
+        return
+    raise AssertionError('a newer window.__perf must be rejected')
+
+
+if __name__ == "__main__":
+    test_percentile_ignores_missing_values()
+    test_summarize_skips_idle_intervals_and_reports_growth()
+    test_check_version_rejects_other_versions()
+    print("perf_sampler tests passed")
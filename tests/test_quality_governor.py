@@ -0,0 +1,64 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from asset_server import make_server
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median interval between rendered frames over `frames` frames, with the governor's own judging paused
+FRAME_INTERVAL = """(frames) => new Promise(resolve => {
+    const game = window.game;
+    const stamps = [];
+    const onFrame = () => {
+        stamps.push(performance.now());
+        if (stamps.length <= frames) return;
+        game.events.off('postrender', onFrame);
+        const gaps = stamps.slice(1).map((t, i) => t - stamps[i]).sort((a, b) => a - b);
+        resolve(gaps[gaps.length >> 1]);
+    };
+    game.events.on('postrender', onFrame);
+})"""
+
+
+def test_cheapest_tier_keeps_the_frame_rate():
+    sync_api = pytest.importorskip('playwright.sync_api')
+    server = make_server(ROOT, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with sync_api.sync_playwright() as p:
+            browser = p.chromium.launch()
+            page = browser.new_page()
+            page.goto('http://127.0.0.1:%d/' % server.server_address[1])
+            page.wait_for_function('() => window.game && window.game.qualityGovernor', timeout=30000)
+            # Keep the governor from re-judging the tiers while we measure
+            page.evaluate('() => { window.game.qualityGovernor.windowSize = Infinity; }')
+
+            full = page.evaluate(FRAME_INTERVAL, 60)
+            page.evaluate('() => window.game.qualityGovernor.setTier(window.game.qualityGovernor.maxTier)')
+            page.wait_for_timeout(200)
+            cheapest = page.evaluate(FRAME_INTERVAL, 60)
+            name = page.evaluate("() => window.game.registry.get('qualityTierName')")
+
+            # The governor skips 'low-res-lens' on WebGL, where the shader lens ignores it
+            tiers = page.evaluate('() => window.game.qualityGovernor.tiers')
+            renderer = page.evaluate('() => window.game.renderer.type === Phaser.WEBGL')
+            browser.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Quality tiers trade resolution and background video, never the loop rate
+    assert full < 25, full
+    assert cheapest < 25, cheapest
+    assert (2 not in tiers) == renderer
+    assert name == ('still-backgrounds' if renderer else 'low-res-lens'), name
+
+
+if __name__ == "__main__":
+    test_cheapest_tier_keeps_the_frame_rate()
+    print("Quality governor tests passed")
@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from rum_collector import RumStore, bucket_labels, histogram_percentile, make_server, percentile
+
+FPS_BUCKETS = [10, 20, 30, 45, 55]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def batch(session, device_class, seq=0, milestones=None, fps=None, long_tasks=()):
+    return {
+        'v': 1, 'session': session, 'seq': seq, 'build': 'mobile',
+        'device': {'class': device_class, 'memory': 4, 'cores': 8, 'dpr': 3, 'width': 390, 'height': 844},
+        'quality': 'full',
+        'milestones': milestones or {},
+        'fpsBuckets': FPS_BUCKETS,
+        'fps': fps or {},
+        'longTasks': {'count': len(long_tasks), 'totalMs': sum(long_tasks), 'durations': list(long_tasks)},
+    }
+
+
+def test_helpers():
+    assert bucket_labels(FPS_BUCKETS) == ['<10', '10-20', '20-30', '30-45', '45-55', '55+']
+    assert percentile([30, 10, 20, 40], 0.5) == 20
+    assert percentile([], 0.5) is None
+    assert histogram_percentile({'<10': 1, '10-20': 1, '55+': 98}, 0.01) == '<10'
+    assert histogram_percentile({'<10': 1, '10-20': 1, '55+': 98}, 0.5) == '55+'
+
+
+def test_store_aggregates_per_device_class():
+    store = RumStore()
+    store.add(batch('a', 'phone', milestones={'intro-frame': 900, 'map-ready': 3000},
+                    fps={'SectionHunt': [0, 2, 8, 10, 20, 60]}, long_tasks=(120, 80)))
+    # Later batch of the same session: milestones are first-time only, frames add up
+    store.add(batch('a', 'phone', seq=1, milestones={'hunt-frame': 5200}, fps={'SectionHunt': [0, 0, 0, 0, 0, 100]}))
+    store.add(batch('b', 'phone', milestones={'intro-frame': 1500}, long_tasks=(300,)))
+    store.add(batch('c', 'desktop', milestones={'intro-frame': 400}))
+
+    report = store.report()
+    phone = report['phone']
+    assert phone['sessions'] == 2
+    assert phone['milestones']['intro-frame'] == {'count': 2, 'p50': 900, 'p75': 1500, 'p95': 1500}
+    assert phone['milestones']['hunt-frame']['p50'] == 5200
+    hunt = phone['fps']['SectionHunt']
+    assert hunt['frames'] == 200
+    assert hunt['histogram']['55+'] == 160
+    assert hunt['p5'] == '20-30'
+    assert phone['longTasks']['perSessionP95'] == 2
+    assert phone['longTasks']['durationP95'] == 300
+    assert report['desktop']['milestones']['intro-frame']['p50'] == 400
+
+
+def test_server_accepts_beacons_and_rejects_garbage():
+    store = RumStore()
+    server = make_server(store, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = 'http://127.0.0.1:%d' % server.server_address[1]
+    try:
+        # sendBeacon with a string body arrives as text/plain
+        request = urllib.request.Request(base + '/rum', data=json.dumps(batch('s', 'tablet', milestones={'map-ready': 2500})).encode(),
+                                         headers={'Content-Type': 'text/plain;charset=UTF-8'})
+        assert urllib.request.urlopen(request).status == 204
+
+        for body in (b'not json', json.dumps({'v': 99}).encode()):
+            try:
+                urllib.request.urlopen(urllib.request.Request(base + '/rum', data=body))
+                raise AssertionError('malformed batch was accepted')
+            except urllib.error.HTTPError as error:
+                assert error.code == 400
+
+        report = json.loads(urllib.request.urlopen(base + '/report').read())
+        assert report['tablet']['milestones']['map-ready']['p50'] == 2500
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def serve(store, static_root=None):
+    server = make_server(store, port=0, static_root=static_root)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://127.0.0.1:%d' % server.server_address[1]
+
+
+def test_static_game_shares_the_collector_origin():
+    store = RumStore()
+    server, base = serve(store, static_root=ROOT)
+    try:
+        page = urllib.request.urlopen(base + '/index.html').read().decode('utf-8')
+        # connect-src 'self' is what lets the page beacon to /rum on this origin
+        assert "connect-src 'self'" in page
+        assert b'class RumBeacon' in urllib.request.urlopen(base + '/main.js').read()
+        assert urllib.request.urlopen(base + '/report').read() == b'{}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Without --static nothing but the collector is exposed
+    server, base = serve(RumStore())
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(base + '/index.html')
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_beacon_from_the_page_reaches_the_collector():
+    """End to end: the real game, its CSP and navigator.sendBeacon, into RumStore."""
+    sync_api = pytest.importorskip('playwright.sync_api')
+    store = RumStore()
+    server, base = serve(store, static_root=ROOT)
+    try:
+        with sync_api.sync_playwright() as p:
+            browser = p.chromium.launch()
+            page = browser.new_page()
+            violations = []
+            page.on('console', lambda message: violations.append(message.text)
+                    if 'Content Security Policy' in message.text else None)
+
+            # A cross-origin collector is refused up front instead of being blocked by CSP later
+            page.goto(base + '/?rum=http://127.0.0.1:9/rum')
+            page.wait_for_function('() => window.game && window.game.isBooted', timeout=30000)
+            assert page.evaluate('() => window.game.rum') is None
+
+            page.goto(base + '/?rum=/rum')
+            page.wait_for_function('() => window.game && window.game.rum', timeout=30000)
+            page.evaluate("() => { window.game.rum.mark('e2e'); window.game.rum.flush(); }")
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and 'e2e' not in store.report().get('desktop', {}).get('milestones', {}):
+                time.sleep(0.1)
+            browser.close()
+
+        assert store.report()['desktop']['milestones']['e2e']['count'] == 1
+        assert violations == []
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    test_helpers()
+    test_store_aggregates_per_device_class()
+    test_server_accepts_beacons_and_rejects_garbage()
+    test_static_game_shares_the_collector_origin()
+    print("rum_collector tests passed")
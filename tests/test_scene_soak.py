@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+import scene_soak
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def snapshot(objects):
+    """Minimal V8 heap snapshot holding `objects` as (type, name, self_size)."""
+    types = ['hidden', 'object', 'closure', 'native', 'string']
+    strings = sorted({name for _, name, _ in objects})
+    nodes = []
+    for node_type, name, size in objects:
+        nodes += [types.index(node_type), strings.index(name), 0, size, 0]
+    return {
+        'snapshot': {'meta': {'node_fields': ['type', 'name', 'id', 'self_size', 'edge_count'],
+                              'node_types': [types, 'string', 'number', 'number', 'number']}},
+        'nodes': nodes,
+        'strings': strings,
+    }
+
+
+def test_sustained_growth_separates_leaks_from_noise():
+    flat = [100 + (i % 5) for i in range(100)]
+    assert not scene_soak.sustained_growth(flat, tolerance=3)[0]
+
+    # A one-off jump (a texture cached on the first visit) is not a leak
+    step = [100] * 50 + [120] * 50
+    assert not scene_soak.sustained_growth(step, tolerance=3)[0]
+
+    # One video element per cycle that is never released is
+    leaking, details = scene_soak.sustained_growth([2 + i // 10 for i in range(100)], tolerance=1)
+    assert leaking
+    assert details['rise'] > 1
+
+    # Growth under the tolerance is reported but passes
+    assert not scene_soak.sustained_growth([i * 0.01 for i in range(100)], tolerance=5)[0]
+    assert not scene_soak.sustained_growth([1, 2, 3], tolerance=0)[0]
+
+
+def test_heap_diff_names_the_growing_constructor():
+    before = scene_soak.heap_summary(snapshot([
+        ('object', 'Video', 400), ('object', 'Image', 100), ('closure', 'onResize', 32), ('string', 'x', 8),
+    ]))
+    assert before == {'Video': [1, 400], 'Image': [1, 100], '(closure) onResize': [1, 32]}
+
+    after = scene_soak.heap_summary(snapshot(
+        [('object', 'Video', 400)] * 5 + [('object', 'Image', 100), ('closure', 'onResize', 32)] + [('closure', 'onResize', 32)] * 2
+    ))
+    growth = scene_soak.diff_summaries(before, after)
+    assert [row['name'] for row in growth] == ['Video', '(closure) onResize']
+    assert growth[0]['countDelta'] == 4
+    assert growth[0]['bytesDelta'] == 1600
+
+
+def soak(path, mobile):
+    """Runs SOAK_CYCLES cycles against a local server; the soak takes minutes, so it is opt-in."""
+    cycles = int(os.environ.get('SOAK_CYCLES', '0'))
+    if not cycles:
+        pytest.skip('set SOAK_CYCLES to run the scene-cycling soak')
+    sync_api = pytest.importorskip('playwright.sync_api')
+
+    server = subprocess.Popen(['npx', 'http-server', '-p', '8080', '-c-1'], cwd=ROOT,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(2)
+    try:
+        with sync_api.sync_playwright() as p:
+            browser = p.chromium.launch(args=['--autoplay-policy=no-user-gesture-required'])
+            if mobile:
+                context = browser.new_context(**p.devices['iPhone 12'])
+            else:
+                context = browser.new_context(viewport={'width': 1280, 'height': 720})
+            page = context.new_page()
+            page.goto('http://127.0.0.1:8080' + path)
+            out_dir = os.path.join(ROOT, 'test-results', 'soak-' + ('mobile' if mobile else 'desktop'))
+            failures, _ = scene_soak.run_soak(page, context.new_cdp_session(page), cycles, out_dir)
+            browser.close()
+    finally:
+        server.terminate()
+    assert not failures, '; '.join(failures)
+
+
+def test_soak_desktop():
+    soak('/', mobile=False)
+
+
+def test_soak_mobile():
+    soak('/m/', mobile=True)
+
+
+if __name__ == "__main__":
+    test_sustained_growth_separates_leaks_from_noise()
+    test_heap_diff_names_the_growing_constructor()
+    print("Scene soak tests passed")
@@ -0,0 +1,65 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tools'))
+
+from stamp_sheet import atlas_layout, collapse_frames, is_backdrop, pack_frames, unmultiply_white
+
+
+def test_unmultiply_white_round_trips_over_white():
+    assert unmultiply_white(255, 255, 255) == (0, 0, 0, 0)
+    assert unmultiply_white(0, 0, 0) == (0, 0, 0, 255)
+
+    for pixel in [(200, 40, 40), (128, 128, 128), (250, 10, 90)]:
+        r, g, b, a = unmultiply_white(*pixel)
+        # Compositing the result over white must give back the original pixel
+        composite = tuple(round(c * a / 255 + 255 * (1 - a / 255)) for c in (r, g, b))
+        assert all(abs(x - y) <= 1 for x, y in zip(composite, pixel)), (pixel, composite)
+
+
+def test_checkerboard_is_backdrop():
+    assert is_backdrop(255, 255, 255)
+    assert is_backdrop(200, 201, 199)
+    assert not is_backdrop(60, 60, 60)       # dark outline
+    assert not is_backdrop(230, 180, 60)     # gold stamp handle
+
+
+def test_collapse_frames_merges_holds_and_drops_the_last():
+    frames = ['a', 'b', 'b', 'b', 'c', 'd', 'd', 'd']
+    collapsed = collapse_frames(frames, 100, same=lambda x, y: x == y)
+    assert collapsed == [('a', 100), ('b', 300), ('c', 100), ('d', 100)]
+    assert collapse_frames([], 100, same=lambda x, y: x == y) == []
+
+
+def test_pack_frames_does_not_overlap():
+    sizes = [(40, 30), (10, 50), (25, 25), (60, 10), (5, 5)]
+    positions, (width, height) = pack_frames(sizes)
+    boxes = [(x, y, x + w, y + h) for (x, y), (w, h) in zip(positions, sizes)]
+    for i, a in enumerate(boxes):
+        assert a[2] <= width and a[3] <= height
+        for b in boxes[i + 1:]:
+            assert a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1], (a, b)
+    # Packed, not laid out one frame per row
+    assert height < sum(h for w, h in sizes)
+
+
+def test_atlas_layout_trimmed_frames():
+    atlas = atlas_layout([(0, 0, (10, 20, 50, 60), 100), (41, 0, (0, 0, 256, 144), 300)], (256, 144), (297, 144), 10)
+    assert atlas['meta']['size'] == {'w': 297, 'h': 144}
+    assert atlas['meta']['frameRate'] == 10
+    assert atlas['meta']['durations'] == [100, 300]
+    first = atlas['frames']['stamp-000']
+    assert first['trimmed'] is True
+    assert first['frame'] == {'x': 0, 'y': 0, 'w': 40, 'h': 40}
+    assert first['spriteSourceSize'] == {'x': 10, 'y': 20, 'w': 40, 'h': 40}
+    assert first['sourceSize'] == {'w': 256, 'h': 144}
+    assert atlas['frames']['stamp-001']['trimmed'] is False
+
+
+if __name__ == "__main__":
+    test_unmultiply_white_round_trips_over_white()
+    test_checkerboard_is_backdrop()
+    test_collapse_frames_merges_holds_and_drops_the_last()
+    test_pack_frames_does_not_overlap()
+    test_atlas_layout_trimmed_frames()
+    print("stamp_sheet tests passed")
@@ -0,0 +1,353 @@
+"""Static file server for self-hosted installs, tuned for many devices on one small box.
+
+`npm start` (http-server -c-1) disables caching, so every device downloads
+every MP4, PNG and script on every visit. This server is standard library
+only and keeps per-request work and bytes down:
+
+    precompressed  foo.js.br / foo.js.gz next to foo.js are served when the
+                   client accepts them (never compressed per request).
+                   --precompress writes them for JS, JSON, CSS, SVG, HTML and
+                   XML (the BMFont descriptors); .br needs the optional
+                   `brotli` module.
+    ETags          strong, from a content hash computed once per file version
+                   and cached by (size, mtime). If-None-Match answers 304.
+    caching        fingerprinted names (main.3f9a1c2e.js) are immutable for a
+                   year. Everything else is `no-cache`: devices revalidate and
+                   get a 304 instead of the body.
+    ranges         single byte ranges (bytes=a-b, a-, -n) answer 206, with
+                   If-Range. Video scrubbing and loop restarts don't resend
+                   the file.
+    zero-copy      bodies go out through socket.sendfile (os.sendfile on Linux).
+
+Every response carries the security headers .htaccess sets (CSP with
+frame-ancestors, X-Frame-Options, nosniff, Referrer-Policy,
+Permissions-Policy). Only the deployable tree is served: index.html, the
+scripts and styles, assets/ and m/. Dot-files (.git, .htaccess), tools/
+and tests/ answer 404. CSP `upgrade-insecure-requests` is only added with
+--https, because it would break a plain-HTTP classroom server.
+
+Usage:
+    python tools/asset_server.py [--root .] [--host 127.0.0.1] [--port 8080] [--precompress] [--https]
+Use --host 0.0.0.0 to serve other devices on the network.
+"""
+import argparse
+import email.utils
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+COMPRESSIBLE = {'.js', '.json', '.css', '.svg', '.html', '.xml'}
+# Preference order when the client accepts several
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+# name.<8+ hex>.ext, as emitted by fingerprinting build steps
+FINGERPRINT = re.compile(r'\.[0-9a-f]{8,}\.[a-z0-9]+$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+CHUNK = 1024 * 1024
+# Top-level entries a deployment needs; everything else under --root stays private
+DEPLOYABLE = ('index.html', 'main.js', 'hunt-core.js', 'styles.css', 'assets', 'm')
+
+# Same policy and headers as .htaccess (tests/test_asset_server.py checks they stay in sync)
+CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net; "
+    "style-src 'self' 'unsafe-inline'; img-src 'self' data: blob:; connect-src 'self'; "
+    "worker-src 'self' blob:; object-src 'none'; base-uri 'self'; form-action 'self'; frame-ancestors 'self';"
+)
+SECURITY_HEADERS = (
+    ('X-Frame-Options', 'SAMEORIGIN'),
+    ('X-Content-Type-Options', 'nosniff'),
+    ('Permissions-Policy', 'geolocation=(self), microphone=(), camera=(), payment=(), usb=(), '
+                           'interest-cohort=(), browsing-topics=(), publickey-credentials-get=(self)'),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+)
+
+mimetypes.add_type('text/javascript', '.js')
+mimetypes.add_type('application/json', '.json')
+mimetypes.add_type('image/svg+xml', '.svg')
+mimetypes.add_type('video/mp4', '.mp4')
+mimetypes.add_type('application/xml', '.xml')
+mimetypes.add_type('application/manifest+json', '.webmanifest')
+
+
+def accepted_encodings(header):
+    """Codings from an Accept-Encoding header that are not refused with q=0."""
+    accepted = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                refused = float(q[2:] or 0) == 0
+            except ValueError:
+                refused = False  # A malformed weight is ignored, as if it were q=1
+            if refused:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def parse_range(header, size):
+    """(start, end) inclusive for a single byte range, None to send the whole file, or 'unsatisfiable'.
+
+    Multi-range requests get the whole file, which RFC 9110 allows and which
+    no media element asks for.
+    """
+    if not header or not header.startswith('bytes=') or ',' in header:
+        return None
+    first, dash, last = header[6:].strip().partition('-')
+    if not dash:
+        return None
+    try:
+        if not first:
+            length = int(last)
+            if length <= 0:
+                return 'unsatisfiable'
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        return 'unsatisfiable'
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+def cache_control(path):
+    return IMMUTABLE if FINGERPRINT.search(os.path.basename(path)) else REVALIDATE
+
+
+class ETagCache:
+    """Strong ETags from a SHA-256 of the content, hashed once per (size, mtime) version."""
+
+    def __init__(self):
+        self.tags = {}
+        self.lock = threading.Lock()
+
+    def get(self, path, stat):
+        key = (stat.st_size, stat.st_mtime_ns)
+        with self.lock:
+            cached = self.tags.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(CHUNK), b''):
+                digest.update(block)
+        tag = '"%s"' % digest.hexdigest()[:32]
+        with self.lock:
+            self.tags[path] = (key, tag)
+        return tag
+
+
+def security_headers(https=False):
+    policy = CONTENT_SECURITY_POLICY + (' upgrade-insecure-requests;' if https else '')
+    return (('Content-Security-Policy', policy),) + SECURITY_HEADERS
+
+
+def precompress(root, log=print, deployable=DEPLOYABLE):
+    """Writes .gz (and .br when `brotli` is installed) beside each stale compressible file."""
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        log('brotli module not installed; writing .gz only')
+
+    written = 0
+    for directory, dirs, files in os.walk(root):
+        top = directory == root
+        dirs[:] = [d for d in dirs if not d.startswith('.') and (not top or d in deployable)]
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE or (top and name not in deployable):
+                continue
+            path = os.path.join(directory, name)
+            source_mtime = os.stat(path).st_mtime_ns
+            with open(path, 'rb') as f:
+                data = f.read()
+            targets = [('.gz', lambda body: gzip.compress(body, compresslevel=9, mtime=0))]
+            if brotli:
+                targets.append(('.br', lambda body: brotli.compress(body, quality=11)))
+            for suffix, compress in targets:
+                target = path + suffix
+                if os.path.exists(target) and os.stat(target).st_mtime_ns >= source_mtime:
+                    continue
+                body = compress(data)
+                # Not worth a second file when it barely shrinks
+                if len(body) >= len(data) * 0.95:
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(body)
+                written += 1
+    return written
+
+
+def make_handler(root, deployable=DEPLOYABLE, https=False):
+    root = os.path.realpath(root)
+    etags = ETagCache()
+    headers_for_all = security_headers(https)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        server_version = 'HeIsRisenAssets/1'
+
+        def do_GET(self):
+            self.serve(send_body=True)
+
+        def do_HEAD(self):
+            self.serve(send_body=False)
+
+        def end_headers(self):
+            for name, value in headers_for_all:
+                self.send_header(name, value)
+            super().end_headers()
+
+        def translate(self, url_path):
+            """Filesystem path under root, or None for dot-paths and anything outside the deployable tree."""
+            parts = [p for p in unquote(url_path).split('/') if p]
+            if any(p.startswith('.') or '\\' in p for p in parts):
+                return None
+            path = os.path.realpath(os.path.join(root, *parts))
+            if path != root and not path.startswith(root + os.sep):
+                return None
+            return path
+
+        def deployable(self, path):
+            relative = os.path.relpath(path, root).split(os.sep)
+            return relative[0] in deployable and not any(p.startswith('.') for p in relative)
+
+        def fail(self, status, headers=()):
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            # A 304's length would have to be the full body's, so it gets none
+            if status != HTTPStatus.NOT_MODIFIED:
+                self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def serve(self, send_body):
+            url_path = urlsplit(self.path).path
+            path = self.translate(url_path)
+            if path is None:
+                return self.fail(HTTPStatus.NOT_FOUND)
+            if os.path.isdir(path):
+                if not url_path.endswith('/'):
+                    return self.fail(HTTPStatus.MOVED_PERMANENTLY, [('Location', url_path + '/')])
+                path = os.path.join(path, 'index.html')
+            if not os.path.isfile(path) or not self.deployable(path):
+                return self.fail(HTTPStatus.NOT_FOUND)
+
+            extension = os.path.splitext(path)[1].lower()
+            content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+            if content_type.startswith('text/') or content_type in ('application/json', 'application/xml', 'image/svg+xml'):
+                content_type += '; charset=utf-8'
+
+            # Pick a precompressed sibling the client accepts, if it is not older than the source
+            body_path, coding = path, None
+            compressible = extension in COMPRESSIBLE
+            if compressible:
+                accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+                source_mtime = os.stat(path).st_mtime_ns
+                for name, suffix in ENCODINGS:
+                    candidate = path + suffix
+                    if name in accepted and os.path.isfile(candidate) and os.stat(candidate).st_mtime_ns >= source_mtime:
+                        body_path, coding = candidate, name
+                        break
+
+            try:
+                f = open(body_path, 'rb')
+            except OSError:
+                return self.fail(HTTPStatus.NOT_FOUND)
+            with f:
+                stat = os.fstat(f.fileno())
+                size = stat.st_size
+                etag = etags.get(body_path, stat)
+
+                headers = [
+                    ('Content-Type', content_type),
+                    ('ETag', etag),
+                    ('Last-Modified', email.utils.formatdate(stat.st_mtime, usegmt=True)),
+                    ('Cache-Control', cache_control(path)),
+                ]
+                if compressible:
+                    headers.append(('Vary', 'Accept-Encoding'))
+                if coding:
+                    headers.append(('Content-Encoding', coding))
+                else:
+                    headers.append(('Accept-Ranges', 'bytes'))
+
+                if_none_match = self.headers.get('If-None-Match')
+                if if_none_match and (if_none_match.strip() == '*' or etag in [t.strip() for t in if_none_match.split(',')]):
+                    return self.fail(HTTPStatus.NOT_MODIFIED, [h for h in headers if h[0] != 'Content-Type'])
+
+                start, end, status = 0, size - 1, HTTPStatus.OK
+                # Ranges address the identity body; an If-Range that doesn't match means "send it all"
+                if not coding and self.headers.get('If-Range', etag) == etag:
+                    requested = parse_range(self.headers.get('Range'), size)
+                    if requested == 'unsatisfiable':
+                        return self.fail(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+                                         headers + [('Content-Range', 'bytes */%d' % size)])
+                    if requested:
+                        start, end = requested
+                        status = HTTPStatus.PARTIAL_CONTENT
+                        headers.append(('Content-Range', 'bytes %d-%d/%d' % (start, end, size)))
+
+                length = max(0, end - start + 1)
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(length))
+                self.end_headers()
+                if send_body and length:
+                    self.wfile.flush()
+                    # Kernel-side copy on Linux; falls back to read/send elsewhere
+                    self.connection.sendfile(f, offset=start, count=length)
+
+        def log_message(self, format, *args):
+            if self.server.verbose:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def make_server(root, host='127.0.0.1', port=8080, verbose=False, deployable=DEPLOYABLE, https=False):
+    """Server for `root`; port 0 picks a free port. `https` is for when TLS terminates in front of it."""
+    server = ThreadingHTTPServer((host, port), make_handler(root, deployable, https))
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--root', default='.')
+    parser.add_argument('--host', default='127.0.0.1', help='0.0.0.0 to serve other devices')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--precompress', action='store_true', help='write .gz/.br siblings before serving')
+    parser.add_argument('--https', action='store_true',
+                        help='clients reach this server over HTTPS (a TLS proxy in front); adds upgrade-insecure-requests')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args()
+
+    if args.precompress:
+        print('Precompressed %d files' % precompress(args.root))
+
+    server = make_server(args.root, args.host, args.port, args.verbose, https=args.https)
+    print('Serving %s on http://%s:%d/' % ((os.path.abspath(args.root),) + server.server_address[:2]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
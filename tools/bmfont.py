@@ -0,0 +1,170 @@
+"""Bake the HUD and tooltip fonts into BMFont atlases for Phaser BitmapText.
+
+The score counters and tooltips were Phaser Text objects: every setText or
+setStyle redrew a canvas with Comic Sans and re-uploaded it as a texture, and
+phones without Comic Sans fell back to whatever the browser picked. This tool
+renders the printable ASCII glyphs once per size with Pillow, shelf-packs them
+into a PNG and writes the matching BMFont XML, so the game only moves quads.
+
+Two families are baked, matching the styles they replace:
+    hud    black bold glyphs with a white stroke (score / correct counters)
+    label  plain white glyphs (tooltips, drawn on a dark box)
+
+Outputs (written to assets/ and mirrored into m/assets/):
+    fonts/hud-24.png, fonts/hud-24.xml, ... one pair per family and size
+
+Usage:
+    python tools/bmfont.py --font /path/to/comicbd.ttf [--face "Comic Sans MS"]
+
+The committed atlases are baked from Fredoka One (SIL OFL, licence in
+assets/fonts/OFL.txt), because Comic Sans MS may not be redistributed:
+    python tools/bmfont.py --font FredokaOne-Regular.ttf --face "Fredoka One"
+
+Requires Pillow.
+"""
+import argparse
+import os
+from xml.sax.saxutils import quoteattr
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_ROOTS = [os.path.join(ROOT, 'assets'), os.path.join(ROOT, 'm', 'assets')]
+CHARS = ''.join(chr(code) for code in range(32, 127))
+ATLAS_WIDTH = 1024
+PADDING = 2
+
+# family -> sizes, fill, stroke colour, stroke width as a fraction of the size.
+# The runtime picks the smallest size at or above what it needs (HUD_FONT_SIZES
+# in main.js), so keep these lists in sync with it.
+FAMILIES = {
+    'hud': {'sizes': [24, 48, 96], 'fill': (0, 0, 0, 255), 'stroke': (255, 255, 255, 255), 'stroke_ratio': 1 / 7},
+    'label': {'sizes': [16, 32], 'fill': (255, 255, 255, 255), 'stroke': None, 'stroke_ratio': 0},
+}
+
+# Common install locations for Comic Sans MS Bold; --font overrides
+DEFAULT_FONTS = [
+    '/usr/share/fonts/truetype/msttcorefonts/comicbd.ttf',
+    '/usr/share/fonts/truetype/msttcorefonts/Comic_Sans_MS_Bold.ttf',
+    '/Library/Fonts/Comic Sans MS Bold.ttf',
+    'C:/Windows/Fonts/comicbd.ttf',
+]
+
+
+def shelf_pack(sizes, max_width, padding=PADDING):
+    """Place (w, h) boxes left to right in rows; return positions and sheet size.
+
+    Rows are as tall as their tallest box. The sheet height is rounded up to a
+    power of two so older mobile GPUs can mipmap/repeat it if needed.
+    """
+    positions = []
+    x = y = row_height = 0
+    used_width = 0
+    for width, height in sizes:
+        if x and x + width + padding > max_width:
+            y += row_height + padding
+            x = row_height = 0
+        positions.append((x, y))
+        x += width + padding
+        used_width = max(used_width, x)
+        row_height = max(row_height, height)
+    sheet_height = 1
+    while sheet_height < y + row_height:
+        sheet_height *= 2
+    return positions, min(max_width, used_width), sheet_height
+
+
+def bmfont_xml(face, size, line_height, base, sheet_size, page_file, glyphs, outline=0):
+    """Serialise glyph metrics as the BMFont XML that Phaser's loader parses.
+
+    `glyphs` is a list of dicts with id, x, y, width, height, xoffset,
+    yoffset and xadvance.
+    """
+    lines = [
+        '<?xml version="1.0"?>',
+        '<font>',
+        '  <info face=%s size="%d" bold="1" italic="0" charset="" unicode="1" stretchH="100" smooth="1" aa="1" padding="0,0,0,0" spacing="%d,%d" outline="%d"/>'
+        % (quoteattr(face), size, PADDING, PADDING, outline),
+        '  <common lineHeight="%d" base="%d" scaleW="%d" scaleH="%d" pages="1" packed="0"/>'
+        % (line_height, base, sheet_size[0], sheet_size[1]),
+        '  <pages>',
+        '    <page id="0" file=%s/>' % quoteattr(page_file),
+        '  </pages>',
+        '  <chars count="%d">' % len(glyphs),
+    ]
+    for glyph in glyphs:
+        lines.append(
+            '    <char id="%(id)d" x="%(x)d" y="%(y)d" width="%(width)d" height="%(height)d" '
+            'xoffset="%(xoffset)d" yoffset="%(yoffset)d" xadvance="%(xadvance)d" page="0" chnl="15"/>' % glyph
+        )
+    lines += ['  </chars>', '</font>', '']
+    return '\n'.join(lines)
+
+
+def render_family(font_path, face, name, family):
+    """Yield (file stem, PIL image, xml) for every size of one family."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    for size in family['sizes']:
+        font = ImageFont.truetype(font_path, size)
+        stroke = int(round(size * family['stroke_ratio']))
+        ascent, descent = font.getmetrics()
+
+        rendered = []
+        for char in CHARS:
+            left, top, right, bottom = font.getbbox(char, stroke_width=stroke)
+            width, height = max(0, right - left), max(0, bottom - top)
+            glyph = Image.new('RGBA', (max(1, width), max(1, height)), (0, 0, 0, 0))
+            if width and height:
+                ImageDraw.Draw(glyph).text(
+                    (-left, -top), char, font=font, fill=family['fill'],
+                    stroke_width=stroke, stroke_fill=family['stroke'],
+                )
+            rendered.append((char, glyph, left, top, width, height))
+
+        positions, sheet_width, sheet_height = shelf_pack(
+            [(width, height) for _, _, _, _, width, height in rendered], ATLAS_WIDTH
+        )
+        sheet = Image.new('RGBA', (sheet_width, sheet_height), (0, 0, 0, 0))
+        glyphs = []
+        for (char, glyph, left, top, width, height), (x, y) in zip(rendered, positions):
+            if width and height:
+                sheet.paste(glyph, (x, y))
+            glyphs.append({
+                'id': ord(char), 'x': x, 'y': y, 'width': width, 'height': height,
+                # The stroke grows outward from the ascender line, so shift everything down by it
+                'xoffset': left + stroke, 'yoffset': top + stroke,
+                'xadvance': int(round(font.getlength(char))) + stroke,
+            })
+
+        stem = '%s-%d' % (name, size)
+        xml = bmfont_xml(
+            face, size, ascent + descent + 2 * stroke, ascent + stroke,
+            (sheet_width, sheet_height), stem + '.png', glyphs, outline=stroke,
+        )
+        yield stem, sheet, xml
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--font', help='TTF/OTF to rasterise (defaults to an installed Comic Sans MS Bold)')
+    parser.add_argument('--face', default='Comic Sans MS')
+    args = parser.parse_args()
+
+    font_path = args.font or next((path for path in DEFAULT_FONTS if os.path.exists(path)), None)
+    if not font_path or not os.path.exists(font_path):
+        raise SystemExit('No font found; pass --font /path/to/font.ttf')
+
+    for name, family in FAMILIES.items():
+        for stem, sheet, xml in render_family(font_path, args.face, name, family):
+            for root in OUTPUT_ROOTS:
+                if not os.path.isdir(root):
+                    continue
+                fonts = os.path.join(root, 'fonts')
+                os.makedirs(fonts, exist_ok=True)
+                sheet.save(os.path.join(fonts, stem + '.png'), optimize=True)
+                with open(os.path.join(fonts, stem + '.xml'), 'w') as f:
+                    f.write(xml)
+            print('Baked %s (%dx%d)' % (stem, sheet.width, sheet.height))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+"""Record a CPU profile of a scripted play-through and diff self time against a baseline.
+
+The play-through is the same every run. It boots the game on a fixed hunt
+seed, so the egg layout repeats. It waits on the map, visits three sections
+and collects their eggs with real pointer input (sweeping the lens between
+eggs), then sorts every found egg in EggZamRoom. A CDP sampling profile
+covers the whole run.
+
+Outputs, written to --out:
+    profile.cpuprofile   raw profile (opens in Chrome DevTools' Performance panel)
+    stacks.folded        collapsed stacks, one `frame;frame;frame self_us` per line,
+                         for flamegraph.pl, speedscope or inferno
+    functions.json       self time per function, as ms and as a share of the run
+
+Our own functions are named after their class, like `SectionHunt.update
+(main.js)`, `resizeGame (m/main.js)` or `EggZamRoom.displayRandomEggInfo
+(main.js)`. Line numbers are left out so a baseline survives unrelated edits.
+Phaser and browser frames keep their own names.
+
+With --baseline the run is compared to a stored functions.json. The
+comparison uses each function's share of total time, so runs on different
+machines compare. A function regresses when its share grows by more than
+--threshold (relative) and by at least --min-share points. The regressions
+are printed and the exit status is 1. --update-baseline writes this run as
+the new baseline instead.
+
+Usage:
+    python tools/cpu_profile.py [--url http://127.0.0.1:8080/] [--mobile] [--out test-results/cpu]
+                                [--baseline perf/cpu-desktop.json] [--update-baseline]
+
+Requires Playwright with Chromium, and a server for the game
+(e.g. `npx http-server -p 8080 -c-1`).
+"""
+import argparse
+import json
+import os
+import re
+import time
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Scripts whose functions are ours and get class-qualified names
+OWN_SCRIPTS = ('main.js', 'm/main.js', 'hunt-core.js', 'm/hunt-core.js')
+PROFILE_SEED = 'cpu-profile'
+SAMPLING_INTERVAL_US = 200
+SECTIONS_TO_PLAY = 3
+
+# A save for PROFILE_SEED with nothing found, so MainMenu resumes into the same hunt every run
+SEED_SAVE = """(() => {
+    const stress = parseInt(new URLSearchParams(location.search).get('stress'), 10);
+    localStorage.setItem('huntSave', JSON.stringify({
+        v: 2, total: stress > 0 ? Math.min(stress, 5000) : 60, seed: %s,
+        found: '', categorized: '', stamped: '', correct: 0
+    }));
+})()""" % json.dumps(PROFILE_SEED)
+
+# Resolves after `target` has created and a few frames have rendered
+START_SCENE = """([target, data]) => new Promise(resolve => {
+    const game = window.game;
+    const current = game.scene.getScenes(true).find(s => ['MapScene', 'SectionHunt', 'EggZamRoom'].includes(s.sys.settings.key));
+    game.scene.getScene(target).sys.events.once('create', () => {
+        let frames = 30;
+        const tick = () => (--frames > 0 ? requestAnimationFrame(tick) : resolve());
+        requestAnimationFrame(tick);
+    });
+    current.scene.start(target, data);
+})"""
+
+# Page coordinates that put the lens over each egg still in the section (the mobile lens sits up-left of the finger)
+EGG_TARGETS = """(mobile) => {
+    const game = window.game;
+    const scene = game.scene.getScene('SectionHunt');
+    const rect = game.canvas.getBoundingClientRect();
+    const sx = rect.width / game.scale.width;
+    const sy = rect.height / game.scale.height;
+    const dx = mobile ? 97.5 * scene.gameScale : 0;
+    const dy = mobile ? 135 * scene.gameScale : 0;
+    return scene.eggs.getChildren().filter(egg => egg.active)
+        .map(egg => ({ x: rect.left + (egg.x + dx) * sx, y: rect.top + (egg.y + dy) * sy }))
+        .filter(p => p.x >= 0 && p.y >= 0 && p.x < innerWidth && p.y < innerHeight);
+}"""
+
+# The bottle that accepts the current egg (or null when sorting is done) and the dialog centre
+SORT_TARGET = """() => {
+    const game = window.game;
+    const scene = game.scene.getScene('EggZamRoom');
+    const egg = scene.currentEgg;
+    if (!egg || (scene.explanationText && scene.explanationText.active)) return null;
+    const zone = egg.symbol && egg.symbol.category === 'Pagan' ? scene.rightBottleZone : scene.leftBottleZone;
+    const rect = game.canvas.getBoundingClientRect();
+    const sx = rect.width / game.scale.width;
+    const sy = rect.height / game.scale.height;
+    const bounds = zone.getBounds();
+    return {
+        bottle: { x: rect.left + bounds.centerX * sx, y: rect.top + bounds.centerY * sy },
+        dialog: { x: rect.left + rect.width / 2, y: rect.top + rect.height / 2 }
+    };
+}"""
+
+
+def class_ranges(source):
+    """[(first line, last line, class name)] for top-level classes (0-based lines, as V8 reports them)."""
+    ranges = []
+    current = None
+    for number, line in enumerate(source.splitlines()):
+        match = re.match(r'class (\w+)', line)
+        if match:
+            current = (number, match.group(1))
+        elif current and line.startswith('}'):
+            ranges.append((current[0], number, current[1]))
+            current = None
+    return ranges
+
+
+def load_class_ranges(root=ROOT):
+    ranges = {}
+    for script in OWN_SCRIPTS:
+        path = os.path.join(root, script)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                ranges[script] = class_ranges(f.read())
+    return ranges
+
+
+def script_name(url):
+    path = urlparse(url).path.lstrip('/')
+    return path if path in OWN_SCRIPTS else None
+
+
+def frame_name(call_frame, ranges):
+    """`Class.method (script)` for our code, `name (file)` for everything else."""
+    name = call_frame['functionName'] or '(anonymous)'
+    url = call_frame.get('url', '')
+    script = script_name(url)
+    if script is None:
+        if not url:
+            return name
+        return '%s (%s)' % (name, url.rsplit('/', 1)[-1].split('?')[0] or url)
+    line = call_frame.get('lineNumber', -1)
+    for first, last, cls in ranges.get(script, ()):
+        if first <= line <= last:
+            return '%s.%s (%s)' % (cls, name, script)
+    return '%s (%s)' % (name, script)
+
+
+def self_times(profile):
+    """{node id: self microseconds}, giving each sample the time until the next one."""
+    samples = profile.get('samples', [])
+    deltas = profile.get('timeDeltas', [])
+    times = {}
+    for i, node_id in enumerate(samples):
+        delta = deltas[i + 1] if i + 1 < len(deltas) else 0
+        times[node_id] = times.get(node_id, 0) + max(0, delta)
+    return times
+
+
+def collapse(profile, ranges):
+    """({'a;b;c': self_us}, {function: self_us}) from a CDP Profiler.stop profile."""
+    nodes = {node['id']: node for node in profile['nodes']}
+    parents = {}
+    for node in profile['nodes']:
+        for child in node.get('children', ()):
+            parents[child] = node['id']
+
+    stacks = {}
+    functions = {}
+    for node_id, micros in self_times(profile).items():
+        if not micros:
+            continue
+        frames = []
+        current = node_id
+        while current is not None:
+            name = frame_name(nodes[current]['callFrame'], ranges)
+            if name != '(root)':
+                frames.append(name.replace(';', ','))
+            current = parents.get(current)
+        stack = ';'.join(reversed(frames)) or '(root)'
+        stacks[stack] = stacks.get(stack, 0) + micros
+        leaf = frames[0] if frames else '(root)'
+        functions[leaf] = functions.get(leaf, 0) + micros
+    return stacks, functions
+
+
+def function_report(functions):
+    """functions.json content: totals plus ms and share per function, largest first."""
+    total = sum(functions.values()) or 1
+    idle = sum(micros for name, micros in functions.items() if name in ('(idle)', '(program)', '(garbage collector)'))
+    return {
+        'totalMs': round(total / 1000, 1),
+        'idleMs': round(idle / 1000, 1),
+        'functions': {
+            name: {'selfMs': round(micros / 1000, 2), 'share': round(100 * micros / total, 3)}
+            for name, micros in sorted(functions.items(), key=lambda item: -item[1])
+        },
+    }
+
+
+def is_own(name):
+    return any(name.endswith('(%s)' % script) for script in OWN_SCRIPTS)
+
+
+def compare(report, baseline, threshold=0.25, min_share=0.5, own_only=True):
+    """Functions whose share of the run grew past both limits, worst first."""
+    regressions = []
+    old_functions = baseline.get('functions', {})
+    for name, entry in report['functions'].items():
+        if own_only and not is_own(name):
+            continue
+        old_share = old_functions.get(name, {}).get('share', 0.0)
+        growth = entry['share'] - old_share
+        if growth >= min_share and (old_share == 0 or growth / old_share > threshold):
+            regressions.append({'function': name, 'share': entry['share'], 'baselineShare': old_share,
+                                'selfMs': entry['selfMs'], 'growth': round(growth, 3)})
+    regressions.sort(key=lambda row: -row['growth'])
+    return regressions
+
+
+def write_outputs(out_dir, profile, stacks, report):
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, 'profile.cpuprofile'), 'w') as f:
+        json.dump(profile, f)
+    with open(os.path.join(out_dir, 'stacks.folded'), 'w') as f:
+        for stack, micros in sorted(stacks.items()):
+            f.write('%s %d\n' % (stack, micros))
+    with open(os.path.join(out_dir, 'functions.json'), 'w') as f:
+        json.dump(report, f, indent=1)
+
+
+def play_section(page, section, mobile):
+    page.evaluate(START_SCENE, ['SectionHunt', {'sectionName': section}])
+    for target in page.evaluate(EGG_TARGETS, mobile):
+        # Sweeping the lens across the scene is the hot path (SectionHunt.update and the lens redraw)
+        page.mouse.move(target['x'], target['y'], steps=15)
+        if mobile:
+            page.touchscreen.tap(target['x'], target['y'])
+        else:
+            page.mouse.click(target['x'], target['y'])
+        time.sleep(0.2)
+
+
+def sort_eggs(page, limit=200):
+    page.evaluate(START_SCENE, ['EggZamRoom', None])
+    for _ in range(limit):
+        target = page.evaluate(SORT_TARGET)
+        if target is None:
+            break
+        page.mouse.click(target['bottle']['x'], target['bottle']['y'])
+        time.sleep(0.5)  # explanation tween
+        page.mouse.click(target['dialog']['x'], target['dialog']['y'])
+        time.sleep(0.4)
+
+
+def play_through(page, mobile=False, sections=SECTIONS_TO_PLAY):
+    """The canonical run, from a page whose SEED_SAVE init script is installed."""
+    page.wait_for_function("() => window.game && window.game.scene.getScene('MapScene').sys.isActive()", timeout=60000)
+    time.sleep(1)
+    names = page.evaluate("() => window.game.registry.get('sections').map(s => s.name)")
+    for section in names[:sections]:
+        play_section(page, section, mobile)
+        page.evaluate(START_SCENE, ['MapScene', None])
+    sort_eggs(page)
+    page.evaluate(START_SCENE, ['MapScene', None])
+
+
+def record(page, cdp, mobile=False):
+    """Runs play_through under the CDP sampling profiler and returns the profile."""
+    cdp.send('Profiler.enable')
+    cdp.send('Profiler.setSamplingInterval', {'interval': SAMPLING_INTERVAL_US})
+    cdp.send('Profiler.start')
+    try:
+        play_through(page, mobile)
+    finally:
+        profile = cdp.send('Profiler.stop')['profile']
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8080/')
+    parser.add_argument('--mobile', action='store_true', help='emulate an iPhone 12; point --url at the m/ build')
+    parser.add_argument('--out', default=os.path.join('test-results', 'cpu'))
+    parser.add_argument('--baseline', help='functions.json from an earlier run to compare against')
+    parser.add_argument('--update-baseline', action='store_true', help='write this run to --baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='relative share growth that regresses')
+    parser.add_argument('--min-share', type=float, default=0.5, help='and the share points it must grow by')
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(args=['--autoplay-policy=no-user-gesture-required'])
+        context = browser.new_context(**p.devices['iPhone 12']) if args.mobile else browser.new_context(
+            viewport={'width': 1280, 'height': 720})
+        context.add_init_script(SEED_SAVE)
+        page = context.new_page()
+        page.goto(args.url)
+        profile = record(page, context.new_cdp_session(page), args.mobile)
+        browser.close()
+
+    stacks, functions = collapse(profile, load_class_ranges())
+    report = function_report(functions)
+    write_outputs(args.out, profile, stacks, report)
+
+    own = [(name, entry) for name, entry in report['functions'].items() if is_own(name)]
+    print('%.0f ms profiled, %.0f ms idle; top functions of ours:' % (report['totalMs'], report['idleMs']))
+    for name, entry in own[:10]:
+        print('  %6.1f ms  %5.2f%%  %s' % (entry['selfMs'], entry['share'], name))
+
+    if args.baseline and args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=1)
+        print('Baseline written to %s' % args.baseline)
+    elif args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold, args.min_share)
+        for row in regressions:
+            print('REGRESSION %s: %.2f%% of the run (baseline %.2f%%)' % (row['function'], row['share'], row['baselineShare']))
+        if regressions:
+            raise SystemExit(1)
+        print('No regressions against %s' % args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""Check that every mobile egg can be seen and collected, for each device, without a browser.
+
+tests/test_collect_eggs.py finds off-screen eggs one Playwright session at a
+time: it starts a browser, reads eggData and taps at egg - lens offset. This
+tool reproduces the geometry m/main.js uses and evaluates it for every device
+descriptor in both orientations at once:
+
+    getViewportDimensions()   mobile user agents get the screen size, forced landscape
+    gameScale                 min(width / 1280, height / 720)
+    lens offset               the lens is drawn (-97.5, -135) * gameScale from the finger
+    egg bounds                MainMenu.eggPlacementArea(): bounds minus HUD exclusions
+
+A grid of egg positions is tested per configuration with NumPy. An egg is
+visible when it is fully on the canvas and clear of the HUD. It is reachable
+when its touch point (egg - lens offset) is on the canvas and not on a HUD
+element. A configuration is flagged when:
+    unreachable    some position the placement solver may pick is not visible and reachable
+    no-room        the placement area is empty
+    small-target   the capture circle is under 44 CSS px across after Scale.FIT
+
+Usage:
+    python tools/lens_reachability.py [--devices deviceDescriptorsSource.json] [--grid 96] [--all]
+
+Device descriptors come from --devices, or from the JSON the installed
+Playwright package ships, or from a small built-in list. Exits with status 1
+when any configuration is flagged. Requires NumPy.
+"""
+import argparse
+import json
+import os
+import re
+
+MOBILE_UA = re.compile(r'iPhone|iPad|iPod|Android', re.IGNORECASE)
+DESIGN_WIDTH, DESIGN_HEIGHT = 1280, 720
+
+# Mirrors of the m/main.js constants, in design pixels (multiplied by gameScale)
+LENS_OFFSET = (-97.5, -135.0)
+EGG_SIZE = (50.0, 75.0)
+CAPTURE_RADIUS = 80.0
+HUD_RECTS = [  # x, y, width, height: score, egg-zit button, eggs-ammin-haul
+    (0.0, 0.0, 200.0, 200.0),
+    (0.0, 200.0, 150.0, 150.0),
+    (0.0, 350.0, 137.0, 150.0),
+]
+PLACEMENT_MARGINS = (50.0, 50.0, 62.5, 65.0)  # left, top, right (after the lens offset), bottom
+MIN_TOUCH_TARGET_CSS = 44.0
+
+# Used when neither --devices nor Playwright is available (Playwright's numbers)
+FALLBACK_DEVICES = {
+    'iPhone SE': {'userAgent': 'iPhone', 'screen': {'width': 320, 'height': 568}, 'viewport': {'width': 320, 'height': 460}},
+    'iPhone 12': {'userAgent': 'iPhone', 'screen': {'width': 390, 'height': 844}, 'viewport': {'width': 390, 'height': 664}},
+    'iPhone 14 Pro Max': {'userAgent': 'iPhone', 'screen': {'width': 430, 'height': 932}, 'viewport': {'width': 430, 'height': 740}},
+    'Pixel 5': {'userAgent': 'Android', 'screen': {'width': 393, 'height': 851}, 'viewport': {'width': 393, 'height': 727}},
+    'Galaxy S9+': {'userAgent': 'Android', 'screen': {'width': 320, 'height': 658}, 'viewport': {'width': 320, 'height': 658}},
+    'iPad Mini': {'userAgent': 'iPad', 'screen': {'width': 768, 'height': 1024}, 'viewport': {'width': 768, 'height': 1024}},
+    'Desktop Chrome': {'userAgent': 'Windows', 'viewport': {'width': 1280, 'height': 720}},
+}
+
+
+def load_descriptors(path=None):
+    """Return {name: descriptor}, preferring `path`, then Playwright's own list."""
+    if path is None:
+        try:
+            import playwright
+            candidate = os.path.join(os.path.dirname(playwright.__file__), 'driver', 'package', 'lib',
+                                     'server', 'deviceDescriptorsSource.json')
+            if os.path.exists(candidate):
+                path = candidate
+        except ImportError:
+            pass
+    if path is None:
+        return dict(FALLBACK_DEVICES)
+    with open(path) as f:
+        descriptors = json.load(f)
+    # Orientations are generated below, so Playwright's rotated duplicates are dropped
+    return {name: d for name, d in descriptors.items() if not name.endswith(' landscape')}
+
+
+def game_size(descriptor, landscape):
+    """(game width, game height, viewport width, viewport height) for one orientation.
+
+    The game size follows getViewportDimensions(); the viewport is the CSS box
+    Scale.FIT shrinks the canvas into.
+    """
+    viewport = descriptor['viewport']
+    short, long = sorted((viewport['width'], viewport['height']))
+    viewport_width, viewport_height = (long, short) if landscape else (short, long)
+
+    if MOBILE_UA.search(descriptor.get('userAgent', '')):
+        screen = descriptor.get('screen') or viewport
+        width, height = max(screen['width'], screen['height']), min(screen['width'], screen['height'])
+    else:
+        width, height = viewport_width, viewport_height
+    return width, height, viewport_width, viewport_height
+
+
+def configurations(descriptors):
+    """One row per device and orientation."""
+    rows = []
+    for name, descriptor in sorted(descriptors.items()):
+        for landscape in (False, True):
+            width, height, viewport_width, viewport_height = game_size(descriptor, landscape)
+            rows.append({
+                'device': name,
+                'orientation': 'landscape' if landscape else 'portrait',
+                'width': width,
+                'height': height,
+                'viewport_width': viewport_width,
+                'viewport_height': viewport_height,
+            })
+    return rows
+
+
+def analyze(rows, grid=96):
+    """Evaluate every row at once; returns the rows with metrics and flags added.
+
+    Arrays are (configuration, grid row, grid column). Egg positions sample the
+    whole canvas, so the same grid also measures how much of the screen could
+    hold a collectable egg (`coverage`).
+    """
+    import numpy as np
+
+    width = np.array([row['width'] for row in rows], dtype=float)[:, None, None]
+    height = np.array([row['height'] for row in rows], dtype=float)[:, None, None]
+    viewport_width = np.array([row['viewport_width'] for row in rows], dtype=float)
+    viewport_height = np.array([row['viewport_height'] for row in rows], dtype=float)
+    scale = np.minimum(width / DESIGN_WIDTH, height / DESIGN_HEIGHT)
+
+    steps = (np.arange(grid, dtype=float) + 0.5) / grid
+    egg_x = steps[None, None, :] * width
+    egg_y = steps[None, :, None] * height
+    half_width = EGG_SIZE[0] / 2 * scale
+    half_height = EGG_SIZE[1] / 2 * scale
+    offset_x = LENS_OFFSET[0] * scale
+    offset_y = LENS_OFFSET[1] * scale
+    touch_x = egg_x - offset_x
+    touch_y = egg_y - offset_y
+
+    under_hud = np.zeros(egg_x.shape[:1] + (grid, grid), dtype=bool)
+    touches_hud = np.zeros_like(under_hud)
+    covered_touch = np.zeros_like(under_hud)
+    for x, y, w, h in HUD_RECTS:
+        left, top, right, bottom = x * scale, y * scale, (x + w) * scale, (y + h) * scale
+        # The egg is hidden when its rect overlaps the HUD rect
+        under_hud |= ((egg_x + half_width > left) & (egg_x - half_width < right)
+                      & (egg_y + half_height > top) & (egg_y - half_height < bottom))
+        touches_hud |= (touch_x >= left) & (touch_x < right) & (touch_y >= top) & (touch_y < bottom)
+        # eggPlacementArea's exclusion: the HUD rect grown by half an egg, shifted by the lens offset
+        covered_touch |= ((touch_x >= left - half_width) & (touch_x < right + half_width)
+                          & (touch_y >= top - half_height) & (touch_y < bottom + half_height))
+
+    visible = ((egg_x - half_width >= 0) & (egg_x + half_width <= width)
+               & (egg_y - half_height >= 0) & (egg_y + half_height <= height) & ~under_hud)
+    reachable = (touch_x >= 0) & (touch_x <= width) & (touch_y >= 0) & (touch_y <= height) & ~touches_hud
+
+    margin_left, margin_top, margin_right, margin_bottom = (m * scale for m in PLACEMENT_MARGINS)
+    in_bounds = ((egg_x >= margin_left) & (egg_x <= width + offset_x - margin_right)
+                 & (egg_y >= margin_top) & (egg_y <= height + offset_y - margin_bottom))
+    placeable = in_bounds & ~under_hud & ~covered_touch
+
+    good = visible & reachable
+    placeable_count = placeable.sum(axis=(1, 2))
+    broken_count = (placeable & ~good).sum(axis=(1, 2))
+    coverage = good.mean(axis=(1, 2))
+    fit = np.minimum(viewport_width / width[:, 0, 0], viewport_height / height[:, 0, 0])
+    target_css = 2 * CAPTURE_RADIUS * scale[:, 0, 0] * fit
+
+    results = []
+    for index, row in enumerate(rows):
+        flags = []
+        if placeable_count[index] == 0:
+            flags.append('no-room')
+        if broken_count[index]:
+            flags.append('unreachable')
+        if target_css[index] < MIN_TOUCH_TARGET_CSS:
+            flags.append('small-target')
+        results.append(dict(
+            row,
+            scale=float(scale[index, 0, 0]),
+            placeable=float(placeable_count[index]) / (grid * grid),
+            unreachable=int(broken_count[index]),
+            coverage=float(coverage[index]),
+            target_css=float(target_css[index]),
+            flags=flags,
+        ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--devices', help='Playwright deviceDescriptorsSource.json (defaults to the installed copy)')
+    parser.add_argument('--grid', type=int, default=96, help='egg positions per axis')
+    parser.add_argument('--all', action='store_true', help='list every configuration, not just flagged ones')
+    args = parser.parse_args()
+
+    results = analyze(configurations(load_descriptors(args.devices)), args.grid)
+    flagged = [result for result in results if result['flags']]
+    for result in (results if args.all else flagged):
+        print('%-28s %-9s game %4dx%-4d scale %.3f  placeable %5.1f%%  coverage %5.1f%%  target %5.1fpx  %s' % (
+            result['device'], result['orientation'], result['width'], result['height'], result['scale'],
+            100 * result['placeable'], 100 * result['coverage'], result['target_css'],
+            ', '.join(result['flags']) or 'ok',
+        ))
+    print('%d configurations, %d flagged' % (len(results), len(flagged)))
+    if flagged:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Sample window.__perf from a running game so benchmarks and soak tests share one set of numbers.
+
+The game exposes a versioned window.__perf API (PerfProbe in main.js and
+m/main.js). It is inert until enabled. This tool enables it and takes a
+snapshot every --interval seconds. Each snapshot is followed by a reset(), so
+every sample covers one interval. Samples are written as JSON lines and
+summarised at the end.
+
+Other scripts can reuse the pieces without the CLI:
+    enable(page)                      turn the probe on in a Playwright page
+    sample(page, duration, interval)  list of interval snapshots
+    summarize(samples)                percentiles and growth over the run
+
+Usage:
+    python tools/perf_sampler.py [--url http://localhost:8080/?perf] [--mobile]
+                                 [--duration 60] [--interval 1] [--out perf.jsonl]
+
+Requires Playwright (and a server for the game, e.g. `npx http-server -p 8080`).
+"""
+import argparse
+import json
+import time
+
+API_VERSION = 1
+
+SNAPSHOT_AND_RESET = """() => {
+    const snapshot = window.__perf.snapshot();
+    window.__perf.reset();
+    return snapshot;
+}"""
+
+
+def check_version(snapshot):
+    if snapshot.get('version') != API_VERSION:
+        raise RuntimeError('window.__perf version %r, this sampler reads version %d'
+                           % (snapshot.get('version'), API_VERSION))
+
+
+def enable(page, timeout=30000):
+    """Wait for the game and turn the probe on; returns the first (empty) snapshot."""
+    page.wait_for_function('() => window.__perf && window.game && window.game.isBooted', timeout=timeout)
+    page.evaluate('() => window.__perf.enable()')
+    snapshot = page.evaluate(SNAPSHOT_AND_RESET)
+    check_version(snapshot)
+    return snapshot
+
+
+def sample(page, duration, interval=1.0, on_sample=None):
+    """Snapshot every `interval` seconds for `duration` seconds."""
+    samples = []
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        snapshot = page.evaluate(SNAPSHOT_AND_RESET)
+        snapshot['wallTime'] = time.time()
+        samples.append(snapshot)
+        if on_sample:
+            on_sample(snapshot)
+    return samples
+
+
+def percentile(values, fraction):
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    index = min(len(values) - 1, max(0, int(round(fraction * (len(values) - 1)))))
+    return values[index]
+
+
+def summarize(samples):
+    """Reduce interval snapshots to the numbers benchmarks compare.
+
+    Intervals without frames (hidden tab, stalls) are skipped for timings.
+    Growth figures are last minus first. A steadily rising listener or
+    texture count over a soak run is the leak signal.
+    """
+    timed = [s for s in samples if s.get('frames')]
+    summary = {
+        'samples': len(samples),
+        'frameMs': {'p50': percentile([s['frameMs'] for s in timed], 0.5),
+                    'p95': percentile([s['frameMs'] for s in timed], 0.95)},
+        'drawCalls': {'p50': percentile([(s.get('webgl') or {}).get('drawCalls') for s in timed], 0.5),
+                      'p95': percentile([(s.get('webgl') or {}).get('drawCalls') for s in timed], 0.95)},
+        'textureBinds': {'p50': percentile([(s.get('webgl') or {}).get('textureBinds') for s in timed], 0.5)},
+        'scenes': {},
+    }
+
+    keys = sorted({key for s in timed for key, scene in s['scenes'].items() if scene.get('active')})
+    for key in keys:
+        active = [s['scenes'][key] for s in timed if s['scenes'].get(key, {}).get('active')]
+        summary['scenes'][key] = {
+            'updateMs': percentile([scene['updateMs'] for scene in active], 0.5),
+            'renderMs': percentile([scene['renderMs'] for scene in active], 0.5),
+            'maxTweens': max(scene['tweens'] for scene in active),
+        }
+
+    if samples:
+        first, last = samples[0], samples[-1]
+        summary['growth'] = {
+            'listeners': last['listeners']['subscriptions'] - first['listeners']['subscriptions'],
+            'textureMB': last['textures']['estimatedMB'] - first['textures']['estimatedMB'],
+            'videoElements': last['videos']['elements'] - first['videos']['elements'],
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://localhost:8080/?perf')
+    parser.add_argument('--mobile', action='store_true', help='emulate an iPhone 12 (use with the m/ build)')
+    parser.add_argument('--duration', type=float, default=60)
+    parser.add_argument('--interval', type=float, default=1)
+    parser.add_argument('--out', help='write every snapshot here as JSON lines')
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    out = open(args.out, 'w') if args.out else None
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch()
+            context = browser.new_context(**p.devices['iPhone 12']) if args.mobile else browser.new_context()
+            page = context.new_page()
+            page.goto(args.url)
+            enable(page)
+
+            def write(snapshot):
+                if out:
+                    out.write(json.dumps(snapshot) + '\n')
+
+            samples = sample(page, args.duration, args.interval, on_sample=write)
+            browser.close()
+    finally:
+        if out:
+            out.close()
+
+    print(json.dumps(summarize(samples), indent=2))
+
+
+if __name__ == '__main__':
+    main()
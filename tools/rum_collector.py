@@ -0,0 +1,243 @@
+"""Receive RumBeacon batches from the game and report percentiles per device class.
+
+RumBeacon (main.js, m/main.js) sends one JSON batch per flush with
+navigator.sendBeacon when the game is opened with ?rum=/rum. This collector
+is standard library only, so it runs locally and in tests:
+
+    POST /rum      store a batch (text/plain or application/json body, max 64 KB)
+    GET  /report   percentiles per device class as JSON
+    GET  other     files under --static, when given
+
+The game's CSP (connect-src 'self') only lets beacons go to the page's own
+origin, and RumBeacon ignores cross-origin endpoints. So /rum has to be
+served from the same origin as the game:
+    locally        serve the game from the collector with --static
+    deployed       proxy /rum on the web server to the collector, e.g. Apache
+                   `ProxyPass "/rum" "http://127.0.0.1:8787/rum"` or nginx
+                   `location = /rum { proxy_pass http://127.0.0.1:8787; }`
+
+Batches are reduced as they arrive and stored compactly in SQLite:
+    milestones     one row per session and milestone (ms since navigation start)
+    fps            histogram counts summed per device class, build, scene and bucket
+    long_tasks     individual long-task durations, plus a per-session count
+
+Usage:
+    python tools/rum_collector.py [--port 8787] [--db rum.sqlite3] [--static .]
+    python tools/rum_collector.py --db rum.sqlite3 --report
+Then open the game (http://localhost:8787/ with --static .) with ?rum=/rum
+"""
+import argparse
+import functools
+import json
+import math
+import sqlite3
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+MAX_BODY = 64 * 1024
+BATCH_VERSION = 1
+DEVICE_CLASSES = {'desktop', 'tablet', 'phone'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session TEXT PRIMARY KEY, device_class TEXT, build TEXT, batches INTEGER, long_tasks INTEGER
+);
+CREATE TABLE IF NOT EXISTS milestones (
+    session TEXT, device_class TEXT, name TEXT, ms INTEGER, PRIMARY KEY (session, name)
+);
+CREATE TABLE IF NOT EXISTS fps (
+    device_class TEXT, build TEXT, scene TEXT, bucket TEXT, frames INTEGER,
+    PRIMARY KEY (device_class, build, scene, bucket)
+);
+CREATE TABLE IF NOT EXISTS long_tasks (device_class TEXT, ms INTEGER);
+"""
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of `values` (None when empty)."""
+    values = sorted(values)
+    if not values:
+        return None
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+def bucket_labels(edges):
+    """['<10', '10-20', ..., '55+'] for RUM_FPS_BUCKETS = [10, 20, ..., 55]."""
+    labels = ['<%g' % edges[0]] if edges else []
+    labels += ['%g-%g' % (low, high) for low, high in zip(edges, edges[1:])]
+    labels.append('%g+' % edges[-1] if edges else 'all')
+    return labels
+
+
+def histogram_percentile(histogram, fraction):
+    """Bucket label holding the `fraction` point of a {label: frames} histogram in bucket order."""
+    total = sum(histogram.values())
+    if not total:
+        return None
+    target = fraction * total
+    running = 0
+    for label, frames in histogram.items():
+        running += frames
+        if running >= target:
+            return label
+    return label
+
+
+class RumStore:
+    def __init__(self, path=':memory:'):
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.db.executescript(SCHEMA)
+
+    def add(self, batch):
+        """Validate and store one batch; raises ValueError on malformed input."""
+        if not isinstance(batch, dict) or batch.get('v') != BATCH_VERSION:
+            raise ValueError('unsupported batch version')
+        session = str(batch.get('session', ''))[:32]
+        if not session:
+            raise ValueError('missing session')
+        device_class = (batch.get('device') or {}).get('class')
+        if device_class not in DEVICE_CLASSES:
+            device_class = 'unknown'
+        build = str(batch.get('build', 'unknown'))[:16]
+        labels = bucket_labels([float(edge) for edge in batch.get('fpsBuckets') or []])
+        long_tasks = batch.get('longTasks') or {}
+
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT INTO sessions VALUES (?, ?, ?, 1, ?) ON CONFLICT(session) DO UPDATE SET '
+                'batches = batches + 1, long_tasks = long_tasks + excluded.long_tasks',
+                (session, device_class, build, int(long_tasks.get('count', 0))),
+            )
+            for name, ms in (batch.get('milestones') or {}).items():
+                self.db.execute('INSERT OR IGNORE INTO milestones VALUES (?, ?, ?, ?)',
+                                (session, device_class, str(name)[:32], int(ms)))
+            for scene, counts in (batch.get('fps') or {}).items():
+                for label, frames in zip(labels, counts):
+                    self.db.execute(
+                        'INSERT INTO fps VALUES (?, ?, ?, ?, ?) ON CONFLICT(device_class, build, scene, bucket) '
+                        'DO UPDATE SET frames = frames + excluded.frames',
+                        (device_class, build, str(scene)[:32], label, int(frames)),
+                    )
+            self.db.executemany('INSERT INTO long_tasks VALUES (?, ?)',
+                                [(device_class, int(ms)) for ms in (long_tasks.get('durations') or [])[:100]])
+
+    def report(self):
+        """{device_class: {sessions, milestones, fps, longTasks}} with p50/p75/p95."""
+        with self.lock:
+            rows = self.db.execute('SELECT device_class, COUNT(*) FROM sessions GROUP BY device_class').fetchall()
+            report = {device_class: {'sessions': count, 'milestones': {}, 'fps': {}, 'longTasks': {}}
+                      for device_class, count in rows}
+
+            milestones = {}
+            for device_class, name, ms in self.db.execute('SELECT device_class, name, ms FROM milestones'):
+                milestones.setdefault((device_class, name), []).append(ms)
+            for (device_class, name), values in sorted(milestones.items()):
+                report[device_class]['milestones'][name] = {
+                    'count': len(values),
+                    'p50': percentile(values, 0.5), 'p75': percentile(values, 0.75), 'p95': percentile(values, 0.95),
+                }
+
+            # Buckets come back in insertion order, which is bucket order
+            histograms = {}
+            for device_class, scene, label, frames in self.db.execute(
+                    'SELECT device_class, scene, bucket, SUM(frames) FROM fps GROUP BY device_class, scene, bucket '
+                    'ORDER BY device_class, scene, MIN(rowid)'):
+                histograms.setdefault((device_class, scene), {})[label] = frames
+            for (device_class, scene), histogram in histograms.items():
+                report[device_class]['fps'][scene] = {
+                    'frames': sum(histogram.values()),
+                    'histogram': histogram,
+                    # Low percentiles of FPS are the slow frames
+                    'p5': histogram_percentile(histogram, 0.05),
+                    'p50': histogram_percentile(histogram, 0.5),
+                }
+
+            for device_class in report:
+                durations = [ms for (ms,) in self.db.execute(
+                    'SELECT ms FROM long_tasks WHERE device_class = ?', (device_class,))]
+                per_session = [count for (count,) in self.db.execute(
+                    'SELECT long_tasks FROM sessions WHERE device_class = ?', (device_class,))]
+                report[device_class]['longTasks'] = {
+                    'perSessionP50': percentile(per_session, 0.5),
+                    'perSessionP95': percentile(per_session, 0.95),
+                    'durationP50': percentile(durations, 0.5),
+                    'durationP95': percentile(durations, 0.95),
+                }
+            return report
+
+
+def make_server(store, host='127.0.0.1', port=8787, static_root=None):
+    """HTTP server bound to `store`; port 0 picks a free port.
+
+    With `static_root` it also serves those files, so a game opened from this
+    server can beacon to /rum on its own origin.
+    """
+
+    class Handler(SimpleHTTPRequestHandler):
+        def reply(self, status, body=b''):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if self.path.split('?')[0] != '/rum':
+                return self.reply(404)
+            length = int(self.headers.get('Content-Length') or 0)
+            if length > MAX_BODY:
+                return self.reply(413)
+            try:
+                store.add(json.loads(self.rfile.read(length).decode('utf-8')))
+            except (ValueError, TypeError, AttributeError):
+                return self.reply(400)
+            self.reply(204)
+
+        def do_GET(self):
+            if self.path.split('?')[0] == '/report':
+                return self.reply(200, json.dumps(store.report(), indent=2).encode('utf-8'))
+            if static_root is None:
+                return self.reply(404)
+            super().do_GET()
+
+        def do_HEAD(self):
+            if static_root is None:
+                return self.reply(404)
+            super().do_HEAD()
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), functools.partial(Handler, directory=static_root or '.'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--db', default='rum.sqlite3')
+    parser.add_argument('--report', action='store_true', help='print the report for --db and exit')
+    parser.add_argument('--static', help='also serve the game from this directory, on the same origin as /rum')
+    args = parser.parse_args()
+
+    store = RumStore(args.db)
+    if args.report:
+        print(json.dumps(store.report(), indent=2))
+        return
+
+    server = make_server(store, args.host, args.port, args.static)
+    print('Collecting on http://%s:%d/rum (report at /report)' % server.server_address)
+    if args.static:
+        print('Serving %s; open the game with ?rum=/rum' % args.static)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""Cycle MapScene -> SectionHunt -> EggZamRoom -> MapScene and fail on sustained memory growth.
+
+Long classroom sessions die from small per-visit leaks: listeners stacked on
+scene re-entry, a sectionVideo, zoomedView or stamp video that is never
+destroyed, textures that are never released. This soak drives the real game
+(desktop or mobile build) through hundreds of scene cycles in Chromium. After
+each cycle it forces a GC and samples over the Chrome DevTools Protocol:
+
+    heapMB          Performance.getMetrics JSHeapUsedSize
+    domNodes        Performance.getMetrics Nodes
+    listeners       Performance.getMetrics JSEventListeners
+    videoElements   <video> elements in the document
+    textures        keys in the Phaser texture manager
+
+A metric fails when it keeps growing after warm-up (see sustained_growth).
+On failure, heap snapshots from after warm-up and from the end are diffed by
+constructor and written next to the samples. The top growers are quoted in
+the failure, so the leaking object type is named.
+
+Usage:
+    python tools/scene_soak.py [--url http://127.0.0.1:8080/] [--mobile] [--cycles 300]
+                               [--out test-results/soak]
+
+Requires Playwright with Chromium, and a server for the game
+(e.g. `npx http-server -p 8080 -c-1`). Exits 1 when a leak is found.
+"""
+import argparse
+import json
+import os
+
+# metric -> growth (last quarter median minus first) that counts as a leak
+TOLERANCES = {
+    'heapMB': 8.0,
+    'domNodes': 50,
+    'listeners': 25,
+    'videoElements': 1,
+    'textures': 3,
+}
+GAMEPLAY_SCENES = ['MainMenu', 'MapScene', 'SectionHunt', 'EggZamRoom']
+
+# Starts `target` from whichever gameplay scene is running and resolves once it has created
+START_SCENE = """([target, data]) => new Promise((resolve, reject) => {
+    const game = window.game;
+    const current = game.scene.getScenes(true).find(s => %s.includes(s.sys.settings.key));
+    const timer = setTimeout(() => reject(new Error('timed out starting ' + target)), 15000);
+    game.scene.getScene(target).sys.events.once('create', () => {
+        // Let a few frames render so videos and lenses actually start
+        let frames = 20;
+        const tick = () => (--frames > 0 ? requestAnimationFrame(tick) : (clearTimeout(timer), resolve()));
+        requestAnimationFrame(tick);
+    });
+    current.scene.start(target, data);
+})""" % json.dumps(GAMEPLAY_SCENES)
+
+PAGE_COUNTS = """(() => ({
+    videoElements: document.getElementsByTagName('video').length,
+    textures: window.game.textures.getTextureKeys().length
+}))()"""
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def sustained_growth(values, tolerance, warmup=0.2):
+    """Return (leaking, details) for one metric sampled once per cycle.
+
+    The first `warmup` fraction is ignored (caches, lazy textures, JIT). The
+    rest is split into quarters. It leaks when every quarter's median is
+    above the previous one and the total rise exceeds `tolerance`. One-off
+    jumps and GC sawtooth don't count; steady per-cycle growth does.
+    """
+    steady = values[int(len(values) * warmup):]
+    if len(steady) < 8:
+        return False, {'reason': 'not enough samples'}
+    size = len(steady) // 4
+    quarters = [median(steady[i * size:(i + 1) * size]) for i in range(4)]
+    rise = quarters[-1] - quarters[0]
+    rising = all(later > earlier for earlier, later in zip(quarters, quarters[1:]))
+    return rising and rise > tolerance, {
+        'quarters': quarters,
+        'rise': rise,
+        'perCycle': rise / max(1, size * 3),
+    }
+
+
+def heap_summary(snapshot):
+    """{constructor name: [count, self bytes]} from a V8 .heapsnapshot dict."""
+    meta = snapshot['snapshot']['meta']
+    fields = meta['node_fields']
+    width = len(fields)
+    type_index, name_index, size_index = fields.index('type'), fields.index('name'), fields.index('self_size')
+    types = meta['node_types'][type_index]
+    strings = snapshot['strings']
+    nodes = snapshot['nodes']
+
+    summary = {}
+    for offset in range(0, len(nodes), width):
+        node_type = types[nodes[offset + type_index]]
+        if node_type in ('object', 'closure', 'native'):
+            name = strings[nodes[offset + name_index]]
+            if node_type == 'closure':
+                name = '(closure) ' + name
+            entry = summary.setdefault(name, [0, 0])
+            entry[0] += 1
+            entry[1] += nodes[offset + size_index]
+    return summary
+
+
+def diff_summaries(before, after, limit=20):
+    """Constructors sorted by how many more instances `after` holds."""
+    rows = []
+    for name, (count, size) in after.items():
+        old_count, old_size = before.get(name, (0, 0))
+        if count > old_count:
+            rows.append({'name': name, 'countDelta': count - old_count, 'bytesDelta': size - old_size, 'count': count})
+    rows.sort(key=lambda row: (row['countDelta'], row['bytesDelta']), reverse=True)
+    return rows[:limit]
+
+
+def take_heap_snapshot(cdp):
+    chunks = []
+    cdp.on('HeapProfiler.addHeapSnapshotChunk', lambda event: chunks.append(event['chunk']))
+    cdp.send('HeapProfiler.collectGarbage')
+    cdp.send('HeapProfiler.takeHeapSnapshot', {'reportProgress': False})
+    return json.loads(''.join(chunks))
+
+
+def sample_metrics(page, cdp):
+    cdp.send('HeapProfiler.collectGarbage')
+    metrics = {m['name']: m['value'] for m in cdp.send('Performance.getMetrics')['metrics']}
+    counts = cdp.send('Runtime.evaluate', {'expression': PAGE_COUNTS, 'returnByValue': True})['result']['value']
+    return {
+        'heapMB': metrics['JSHeapUsedSize'] / (1024 * 1024),
+        'domNodes': metrics['Nodes'],
+        'listeners': metrics['JSEventListeners'],
+        'videoElements': counts['videoElements'],
+        'textures': counts['textures'],
+    }
+
+
+def run_soak(page, cdp, cycles, out_dir=None, warmup=0.2, log=print):
+    """Drive the cycles on a page that has loaded the game; returns (failures, samples)."""
+    # MainMenu publishes the hunt in create; a saved hunt has already resumed to the map
+    page.wait_for_function("() => window.game && window.game.registry.has('sections')", timeout=60000)
+    sections = page.evaluate("() => window.game.registry.get('sections').map(s => s.name)")
+    page.evaluate("""() => {
+        const game = window.game;
+        if (!game.scene.getScene('MapScene').sys.isActive()) game.scene.getScene('MainMenu').resumeHunt();
+    }""")
+    page.wait_for_function("() => window.game.scene.getScene('MapScene').sys.isActive()", timeout=30000)
+    cdp.send('Performance.enable')
+
+    samples = []
+    baseline = None
+    warmup_cycles = int(cycles * warmup)
+    for cycle in range(cycles):
+        page.evaluate(START_SCENE, ['SectionHunt', {'sectionName': sections[cycle % len(sections)]}])
+        page.evaluate(START_SCENE, ['EggZamRoom', None])
+        page.evaluate(START_SCENE, ['MapScene', None])
+        samples.append(sample_metrics(page, cdp))
+        if cycle == warmup_cycles and out_dir:
+            baseline = heap_summary(take_heap_snapshot(cdp))
+        if cycle % 25 == 0:
+            log('cycle %d: %s' % (cycle, ', '.join('%s=%.1f' % item for item in samples[-1].items())))
+
+    failures = []
+    report = {'cycles': cycles, 'metrics': {}}
+    for metric, tolerance in TOLERANCES.items():
+        leaking, details = sustained_growth([s[metric] for s in samples], tolerance, warmup)
+        report['metrics'][metric] = dict(details, leaking=leaking, tolerance=tolerance)
+        if leaking:
+            failures.append('%s grew %.1f over the run (%.3f per cycle)' % (metric, details['rise'], details['perCycle']))
+
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+        with open(os.path.join(out_dir, 'samples.json'), 'w') as f:
+            json.dump({'report': report, 'samples': samples}, f, indent=1)
+        if failures and baseline is not None:
+            # The worst offender is named by what the heap holds more of than after warm-up
+            growth = diff_summaries(baseline, heap_summary(take_heap_snapshot(cdp)))
+            with open(os.path.join(out_dir, 'heap-diff.json'), 'w') as f:
+                json.dump(growth, f, indent=1)
+            failures.append('top heap growth: ' + ', '.join(
+                '%s +%d' % (row['name'], row['countDelta']) for row in growth[:5]))
+    return failures, samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8080/')
+    parser.add_argument('--mobile', action='store_true', help='emulate an iPhone 12; point --url at the m/ build')
+    parser.add_argument('--cycles', type=int, default=300)
+    parser.add_argument('--out', default=os.path.join('test-results', 'soak'))
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(args=['--autoplay-policy=no-user-gesture-required'])
+        context = browser.new_context(**p.devices['iPhone 12']) if args.mobile else browser.new_context(
+            viewport={'width': 1280, 'height': 720})
+        page = context.new_page()
+        page.goto(args.url)
+        failures, _ = run_soak(page, context.new_cdp_session(page), args.cycles, args.out)
+        browser.close()
+
+    for failure in failures:
+        print('LEAK: ' + failure)
+    print('%d cycles, %s' % (args.cycles, 'leaks found' if failures else 'no sustained growth'))
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env node
+/**
+ * Monte Carlo hunt sessions on hunt-core.js, without a browser.
+ *
+ * Each session generates a hunt from its seed the way MainMenu does (minus
+ * egg placement). The player then visits the sections in random order and
+ * collects every egg. After each section, every found egg goes through
+ * EggZamRoom, where the player picks the right bottle with probability
+ * --accuracy. Wrong guesses return the egg to the pile, as in the game.
+ *
+ * Every session is checked against the rules:
+ *   - section counts sum to the total and stay in the 3-8 band (wider under stress)
+ *   - every egg id is dealt once, and symbols are shared out evenly
+ *   - 'section-complete' fires exactly once per section, on its last egg
+ *   - the final score is total * SCORE_PER_EGG + SCORE_ALL_FOUND
+ * The summary reports distributions for checking balance.
+ *
+ * Usage:
+ *   node tools/simulate_hunts.js [--sessions 10000] [--total 60] [--accuracy 0.7]
+ *                                [--seed sim] [--json] [--workload session.json]
+ *
+ * --workload writes the first session's actions (collects and guesses) as
+ * JSON, for replaying a realistic session in performance benchmarks. Exits 1
+ * if any invariant fails.
+ */
+const fs = require('fs');
+const path = require('path');
+const HuntCore = require('../hunt-core.js');
+
+const ROOT = path.join(__dirname, '..');
+const USAGE = `Usage: node tools/simulate_hunts.js [--sessions 10000] [--total 60] [--accuracy 0.7]
+                                   [--seed sim] [--json] [--workload session.json]`;
+
+function parseArgs(argv) {
+  const args = { sessions: 10000, total: 60, accuracy: 0.7, seed: 'sim', json: false, workload: null };
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i];
+    if (flag === '--help' || flag === '-h') args.help = true;
+    else if (flag === '--json') args.json = true;
+    else if (flag === '--sessions') args.sessions = parseInt(argv[++i], 10);
+    else if (flag === '--total') args.total = parseInt(argv[++i], 10);
+    else if (flag === '--accuracy') args.accuracy = parseFloat(argv[++i]);
+    else if (flag === '--seed') args.seed = argv[++i];
+    else if (flag === '--workload') args.workload = argv[++i];
+    else return { error: `Unknown option ${flag}` };
+  }
+  return args;
+}
+
+// One full session; returns its stats and any broken invariants
+function simulateSession(seed, { sectionNames, symbols, total, accuracy }, actions = null) {
+  const failures = [];
+  const rnd = HuntCore.createRandom(seed);
+  const { sections, eggData } = HuntCore.generateHunt({ rnd, sectionNames, symbols, total });
+  const hunt = new HuntCore.Hunt();
+  hunt.load(sections, eggData, seed);
+
+  const counts = sections.map(section => section.eggs.length);
+  const average = total / sectionNames.length;
+  const min = Math.max(HuntCore.SECTION_MIN_EGGS, Math.floor(average * 0.5));
+  const max = Math.max(HuntCore.SECTION_MAX_EGGS, Math.ceil(average * 1.4));
+  if (counts.reduce((sum, count) => sum + count, 0) !== total) failures.push('section counts do not sum to the total');
+  if (counts.some(count => count < min || count > max)) failures.push(`section count outside [${min}, ${max}]`);
+  if (new Set(eggData.map(egg => egg.eggId)).size !== total) failures.push('egg ids are not unique');
+
+  const symbolUses = new Map();
+  eggData.forEach(egg => symbolUses.set(egg.symbol, (symbolUses.get(egg.symbol) || 0) + 1));
+  const uses = [...symbolUses.values()];
+  if (symbols.length && Math.max(...uses) - Math.min(...uses) > 1) failures.push('symbols are not shared out evenly');
+
+  const player = HuntCore.createRandom(`${seed}:player`);
+  let score = 0;
+  let completions = 0;
+  let guesses = 0;
+  let correct = 0;
+
+  player.shuffle([...sections]).forEach(section => {
+    player.shuffle([...section.eggs]).forEach(eggId => {
+      const record = hunt.collect(eggId);
+      if (!record) {
+        failures.push(`egg ${eggId} could not be collected`);
+        return;
+      }
+      score = HuntCore.collectScore(score, hunt.foundCount, total);
+      if (actions) actions.push({ type: 'collect', eggId, section: section.name });
+      if (hunt.isSectionComplete(section.name)) {
+        completions++;
+        if (hunt.remaining(section.name) !== 0) failures.push(`${section.name} complete with eggs left`);
+      } else if (hunt.remaining(section.name) === 0) {
+        failures.push(`${section.name} empty but not complete`);
+      }
+    });
+
+    // EggZamRoom visit: keep examining until every found egg is categorized
+    for (let egg = hunt.randomUncategorized(player.frac); egg; egg = hunt.randomUncategorized(player.frac)) {
+      const right = player.frac() < accuracy;
+      const guess = (egg.symbol && egg.symbol.category === 'Christian') === right ? 'Christian' : 'Worldly';
+      const isCorrect = HuntCore.isCorrectGuess(egg.symbol, guess);
+      guesses++;
+      if (actions) actions.push({ type: 'guess', eggId: egg.eggId, guess, correct: isCorrect });
+      if (isCorrect) {
+        hunt.categorize(egg.eggId);
+        correct++;
+      } else if (!egg.symbol) {
+        failures.push(`egg ${egg.eggId} has no symbol and can never be categorized`);
+        break;
+      }
+    }
+  });
+
+  if (completions !== sections.length) failures.push(`${completions} section completions for ${sections.length} sections`);
+  const expectedScore = total * HuntCore.SCORE_PER_EGG + HuntCore.SCORE_ALL_FOUND;
+  if (score !== expectedScore) failures.push(`final score ${score}, expected ${expectedScore}`);
+
+  return { counts, guesses, correct, score, failures };
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  if (args.error) {
+    console.error(`${args.error}\n${USAGE}`);
+    process.exitCode = 2;
+    return;
+  }
+  if (args.help) {
+    console.log(USAGE);
+    return;
+  }
+  const sectionNames = JSON.parse(fs.readFileSync(path.join(ROOT, 'assets', 'map', 'map_sections.json'), 'utf8'))
+    .map(section => section.name);
+  const symbols = JSON.parse(fs.readFileSync(path.join(ROOT, 'assets', 'symbols.json'), 'utf8')).symbols;
+  const options = { sectionNames, symbols, total: args.total, accuracy: args.accuracy };
+
+  const countHistogram = {};
+  const sectionTotals = new Array(sectionNames.length).fill(0);
+  let guesses = 0;
+  let failedSessions = 0;
+  const failureSamples = [];
+  const started = process.hrtime.bigint();
+
+  for (let i = 0; i < args.sessions; i++) {
+    const seed = `${args.seed}-${i}`;
+    const actions = i === 0 && args.workload ? [] : null;
+    const result = simulateSession(seed, options, actions);
+    result.counts.forEach((count, index) => {
+      countHistogram[count] = (countHistogram[count] || 0) + 1;
+      sectionTotals[index] += count;
+    });
+    guesses += result.guesses;
+    if (result.failures.length) {
+      failedSessions++;
+      if (failureSamples.length < 5) failureSamples.push({ seed, failures: result.failures });
+    }
+    if (actions) {
+      fs.writeFileSync(args.workload, JSON.stringify({ seed, total: args.total, sections: sectionNames, actions }, null, 2));
+    }
+  }
+
+  const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+  const summary = {
+    sessions: args.sessions,
+    total: args.total,
+    accuracy: args.accuracy,
+    sessionsPerSecond: Math.round(args.sessions / seconds),
+    eggsPerSection: countHistogram,
+    meanEggsBySectionOrder: sectionTotals.map(sum => +(sum / args.sessions).toFixed(3)),
+    meanGuessesPerSession: +(guesses / args.sessions).toFixed(2),
+    failedSessions,
+    failureSamples
+  };
+
+  if (args.json) {
+    console.log(JSON.stringify(summary, null, 2));
+  } else {
+    console.log(`${summary.sessions} sessions of ${summary.total} eggs in ${seconds.toFixed(2)}s (${summary.sessionsPerSecond}/s)`);
+    console.log('Eggs per section:', Object.entries(countHistogram).map(([count, n]) => `${count}: ${n}`).join(', '));
+    console.log('Mean eggs by section order:', summary.meanEggsBySectionOrder.join(' '));
+    console.log(`Mean EggZamRoom guesses per session: ${summary.meanGuessesPerSession} at accuracy ${args.accuracy}`);
+    console.log(`${failedSessions} sessions broke an invariant`);
+    failureSamples.forEach(sample => console.log(`  ${sample.seed}: ${sample.failures.join('; ')}`));
+  }
+  if (failedSessions) process.exitCode = 1;
+}
+
+if (require.main === module) main();
+
+module.exports = { simulateSession };
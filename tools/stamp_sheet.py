@@ -0,0 +1,255 @@
+"""Bake the level-complete stamp video into a sprite-sheet atlas for MapScene.
+
+MapScene used to play assets/video/level-complete.mp4 with a MULTIPLY blend for
+every newly completed section, one video decoder per stamp. This tool samples
+the video with ffmpeg, keys out its light checkerboard backdrop, turns the rest
+of each white-backed frame into real alpha (the inverse of multiplying over
+white) and trims every frame to its stamp. Runs of identical frames collapse
+into one longer frame and the final hold is dropped, since MapScene swaps in
+the static stamp image once the animation ends. The trimmed frames are
+shelf-packed into a Phaser JSON-hash atlas. The stamp's sound is exported as a
+standalone clip because a sprite animation has no audio track.
+
+Outputs (written to assets/ and mirrored into m/assets/):
+    objects/level-complete-sheet.png
+    objects/level-complete-sheet.json
+    audio/level-complete.mp3
+
+Usage:
+    python tools/stamp_sheet.py [--fps 10] [--height 144]
+
+Requires ffmpeg on PATH and Pillow.
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VIDEO = os.path.join(ROOT, 'assets', 'video', 'level-complete.mp4')
+OUTPUT_ROOTS = [os.path.join(ROOT, 'assets'), os.path.join(ROOT, 'm', 'assets')]
+SHEET_NAME = 'level-complete-sheet'
+FRAME_PREFIX = 'stamp-'
+
+# The video's "transparent" backdrop is a grey/white checkerboard: near-neutral
+# pixels at least this light are backdrop, not stamp
+BACKDROP_MIN = 170
+BACKDROP_SPREAD = 16
+
+# Mean per-channel difference below which two frames count as the same frame
+DUPLICATE_TOLERANCE = 0.5
+
+# Blank space between packed frames so linear filtering never bleeds across
+PADDING = 1
+
+
+def unmultiply_white(r, g, b):
+    """Return the RGBA pixel that, drawn over white, looks like (r, g, b).
+
+    MULTIPLY over the map behaves like "ink on white paper": white is invisible
+    and darker pixels cover more. Alpha is the darkest channel's distance from
+    white; colour is recovered from c = 255 - a * (255 - c') / 255.
+    """
+    a = 255 - min(r, g, b)
+    if a == 0:
+        return (0, 0, 0, 0)
+
+    def channel(c):
+        value = 255 - (255 - c) * 255 / a
+        return max(0, min(255, int(round(value))))
+
+    return (channel(r), channel(g), channel(b), a)
+
+
+def is_backdrop(r, g, b):
+    """True for the light, colourless pixels of the checkerboard backdrop."""
+    return min(r, g, b) >= BACKDROP_MIN and max(r, g, b) - min(r, g, b) <= BACKDROP_SPREAD
+
+
+def key_frame(frame):
+    """Convert one RGB video frame into the stamp on a transparent background."""
+    from PIL import Image, ImageChops, ImageFilter
+
+    rgba = Image.new('RGBA', frame.size)
+    rgba.putdata([(0, 0, 0, 0) if is_backdrop(r, g, b) else unmultiply_white(r, g, b)
+                  for r, g, b in frame.convert('RGB').getdata()])
+
+    # Checkerboard edges blur into specks the key misses; an opening clears them
+    alpha = rgba.getchannel('A')
+    solid = alpha.point(lambda a: 255 if a else 0)
+    solid = solid.filter(ImageFilter.MinFilter(3)).filter(ImageFilter.MaxFilter(3))
+    rgba.putalpha(ImageChops.multiply(alpha, solid))
+    return rgba
+
+
+def frame_difference(a, b):
+    """Mean absolute per-channel difference between two equally sized RGBA frames."""
+    from PIL import ImageChops
+
+    histogram = ImageChops.difference(a, b).histogram()
+    total = sum((index % 256) * count for index, count in enumerate(histogram))
+    return total / (a.size[0] * a.size[1] * 4)
+
+
+def collapse_frames(frames, frame_ms, same=None):
+    """Merge runs of matching frames and drop the final hold.
+
+    Returns [(frame, duration_ms), ...]. A run of frames that `same(a, b)` says
+    match becomes its first frame, shown for the whole run; the last run is cut
+    back to a single frame because the static stamp replaces it anyway.
+    """
+    if same is None:
+        same = lambda a, b: frame_difference(a, b) < DUPLICATE_TOLERANCE
+
+    runs = []
+    for frame in frames:
+        if runs and same(runs[-1][0], frame):
+            runs[-1][1] += 1
+        else:
+            runs.append([frame, 1])
+    if runs:
+        runs[-1][1] = 1
+    return [(frame, count * frame_ms) for frame, count in runs]
+
+
+def pack_frames(sizes, padding=PADDING):
+    """Shelf-pack (w, h) rectangles, tallest first, into a roughly square sheet.
+
+    Returns ([(x, y), ...] in input order, (sheet_width, sheet_height)).
+    """
+    if not sizes:
+        return [], (0, 0)
+
+    area = sum((w + padding) * (h + padding) for w, h in sizes)
+    width = max(max(w for w, h in sizes) + padding, int(math.ceil(math.sqrt(area))))
+    order = sorted(range(len(sizes)), key=lambda index: -sizes[index][1])
+
+    positions = [None] * len(sizes)
+    x = y = shelf = 0
+    for index in order:
+        w, h = sizes[index]
+        if x + w + padding > width:
+            x, y, shelf = 0, y + shelf, 0
+        positions[index] = (x, y)
+        x += w + padding
+        shelf = max(shelf, h + padding)
+
+    used_width = max(x + w for (x, y), (w, h) in zip(positions, sizes))
+    used_height = max(y + h for (x, y), (w, h) in zip(positions, sizes))
+    return positions, (used_width, used_height)
+
+
+def atlas_layout(frames, source_size, sheet_size, frame_rate):
+    """Build the Phaser JSON-hash atlas for trimmed frames.
+
+    `frames` is [(sheet_x, sheet_y, trim_box, duration_ms), ...] where trim_box
+    is (left, top, right, bottom) within the untrimmed source frame. Per-frame
+    durations go in meta.durations, indexed like the frame names.
+    """
+    source_width, source_height = source_size
+    entries = {}
+    durations = []
+    for index, (x, y, (left, top, right, bottom), duration) in enumerate(frames):
+        w, h = right - left, bottom - top
+        entries['%s%03d' % (FRAME_PREFIX, index)] = {
+            'frame': {'x': x, 'y': y, 'w': w, 'h': h},
+            'rotated': False,
+            'trimmed': (w, h) != (source_width, source_height),
+            'spriteSourceSize': {'x': left, 'y': top, 'w': w, 'h': h},
+            'sourceSize': {'w': source_width, 'h': source_height},
+        }
+        durations.append(int(round(duration)))
+    return {
+        'frames': entries,
+        'meta': {
+            'image': SHEET_NAME + '.png',
+            'format': 'RGBA8888',
+            'size': {'w': sheet_size[0], 'h': sheet_size[1]},
+            'scale': '1',
+            'frameRate': frame_rate,
+            'durations': durations,
+        },
+    }
+
+
+def extract_frames(video, fps, height, workdir):
+    """Sample the video at `fps`, scaled to `height` px, into numbered PNGs."""
+    pattern = os.path.join(workdir, 'frame-%04d.png')
+    subprocess.run([
+        'ffmpeg', '-v', 'error', '-y', '-i', video,
+        '-vf', 'fps=%d,scale=-2:%d' % (fps, height),
+        pattern,
+    ], check=True)
+    return sorted(glob.glob(os.path.join(workdir, 'frame-*.png')))
+
+
+def extract_audio(video, destination):
+    """Export the stamp's sound so MapScene can play it next to the animation."""
+    subprocess.run([
+        'ffmpeg', '-v', 'error', '-y', '-i', video,
+        '-vn', '-ac', '1', '-b:a', '96k', destination,
+    ], check=True)
+
+
+def build_sheet(frame_paths, fps):
+    """Key, collapse, trim and pack the frames into one RGBA sheet and its atlas."""
+    from PIL import Image
+
+    keyed = [key_frame(Image.open(path)) for path in frame_paths]
+    source_size = keyed[0].size
+    collapsed = collapse_frames(keyed, 1000 / fps)
+
+    # An empty frame still needs a 1x1 region for Phaser to address
+    boxes = [frame.getchannel('A').getbbox() or (0, 0, 1, 1) for frame, duration in collapsed]
+    positions, sheet_size = pack_frames([(right - left, bottom - top) for left, top, right, bottom in boxes])
+
+    sheet = Image.new('RGBA', sheet_size, (0, 0, 0, 0))
+    for (frame, duration), box, position in zip(collapsed, boxes, positions):
+        sheet.paste(frame.crop(box), position)
+
+    atlas = atlas_layout([(x, y, box, duration) for (x, y), box, (frame, duration)
+                          in zip(positions, boxes, collapsed)], source_size, sheet_size, fps)
+    return sheet, atlas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--video', default=VIDEO)
+    parser.add_argument('--fps', type=int, default=10)
+    parser.add_argument('--height', type=int, default=144, help='frame height in px')
+    args = parser.parse_args()
+
+    if shutil.which('ffmpeg') is None:
+        raise SystemExit('ffmpeg is required on PATH')
+
+    with tempfile.TemporaryDirectory() as workdir:
+        frame_paths = extract_frames(args.video, args.fps, args.height, workdir)
+        if not frame_paths:
+            raise SystemExit('ffmpeg produced no frames from %s' % args.video)
+        sheet, atlas = build_sheet(frame_paths, args.fps)
+
+        audio_path = os.path.join(workdir, 'level-complete.mp3')
+        extract_audio(args.video, audio_path)
+
+        for root in OUTPUT_ROOTS:
+            if not os.path.isdir(root):
+                continue
+            objects = os.path.join(root, 'objects')
+            audio = os.path.join(root, 'audio')
+            os.makedirs(objects, exist_ok=True)
+            os.makedirs(audio, exist_ok=True)
+            sheet.save(os.path.join(objects, SHEET_NAME + '.png'), optimize=True)
+            with open(os.path.join(objects, SHEET_NAME + '.json'), 'w') as f:
+                json.dump(atlas, f, indent=2)
+            shutil.copyfile(audio_path, os.path.join(audio, 'level-complete.mp3'))
+
+    print('Baked %d of %d frames into a %dx%d %s.png' % (
+        len(atlas['frames']), len(frame_paths), sheet.size[0], sheet.size[1], SHEET_NAME))
+
+
+if __name__ == '__main__':
+    main()